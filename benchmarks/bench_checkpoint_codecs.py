@@ -0,0 +1,91 @@
+"""
+Benchmark the per-turn overhead of typed checkpoint serialization.
+
+Builds an agent turn result (ResultPrimitive) with M tool-call round trips and
+reports the time to encode it to its stored form, store it as JSON, and
+decode it back, per turn.
+
+Usage:
+    python benchmarks/bench_checkpoint_codecs.py [--turns 1000] [--round-trips 1,5,20]
+"""
+
+import argparse
+import json
+import time
+from datetime import datetime, timezone
+
+from pydantic_ai.messages import (
+    ModelRequest,
+    ModelResponse,
+    TextPart,
+    ToolCallPart,
+    ToolReturnPart,
+    UserPromptPart,
+)
+from pydantic_ai.usage import RunUsage
+
+from tactus.core.checkpoint_codecs import create_default_registry
+from tactus.primitives.result import ResultPrimitive, RestoredRunResult
+
+
+def make_turn(round_trips: int) -> ResultPrimitive:
+    """Build a turn result with the given number of tool-call round trips."""
+    now = datetime.now(timezone.utc)
+    messages = [ModelRequest(parts=[UserPromptPart("Classify the attached ticket", timestamp=now)])]
+    for i in range(round_trips):
+        messages.append(
+            ModelResponse(
+                parts=[ToolCallPart("lookup", {"ticket": i}, tool_call_id=f"call-{i}")],
+                timestamp=now,
+            )
+        )
+        messages.append(
+            ModelRequest(
+                parts=[
+                    ToolReturnPart(
+                        "lookup", {"status": "open", "notes": "x" * 200}, tool_call_id=f"call-{i}"
+                    )
+                ]
+            )
+        )
+    messages.append(ModelResponse(parts=[TextPart("billing")], timestamp=now))
+    usage = RunUsage(input_tokens=500, output_tokens=20, requests=round_trips + 1)
+    return ResultPrimitive(RestoredRunResult(output="billing", messages=messages, run_usage=usage))
+
+
+def bench(registry, turn: ResultPrimitive, turns: int):
+    """Return (encode, store, decode) microseconds per turn."""
+    start = time.perf_counter()
+    for _ in range(turns):
+        encoded = registry.encode(turn)
+    encode_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(turns):
+        stored = json.loads(json.dumps(encoded))
+    store_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(turns):
+        registry.decode(stored)
+    decode_time = time.perf_counter() - start
+
+    return tuple(t / turns * 1e6 for t in (encode_time, store_time, decode_time))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--turns", type=int, default=1000)
+    parser.add_argument("--round-trips", default="1,5,20")
+    args = parser.parse_args()
+
+    registry = create_default_registry()
+    print(f"{'round trips':>11} {'encode us':>10} {'json us':>10} {'decode us':>10}")
+    print("-" * 44)
+    for round_trips in (int(n) for n in args.round_trips.split(",")):
+        encode_us, store_us, decode_us = bench(registry, make_turn(round_trips), args.turns)
+        print(f"{round_trips:>11} {encode_us:>10.1f} {store_us:>10.1f} {decode_us:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
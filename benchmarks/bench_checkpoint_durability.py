@@ -0,0 +1,59 @@
+"""
+Benchmark checkpoint throughput under each durability policy.
+
+Runs a tight loop of trivial checkpoints (the cost profile of Step.checkpoint
+around cheap Lua work) and reports checkpoints per second for every
+combination of storage backend and durability policy.
+
+Usage:
+    python benchmarks/bench_checkpoint_durability.py [--checkpoints 2000]
+"""
+
+import argparse
+import tempfile
+import time
+
+from tactus.adapters.file_storage import FileStorage
+from tactus.adapters.memory import MemoryStorage
+from tactus.core.execution_context import BaseExecutionContext, DURABILITY_POLICIES
+
+
+def run_policy(storage, policy: str, checkpoints: int) -> float:
+    """Run `checkpoints` trivial checkpoints and return checkpoints per second."""
+    context = BaseExecutionContext(
+        procedure_id=f"bench-{policy}",
+        storage_backend=storage,
+        durability=policy,
+        batch_size=100,
+        batch_interval_ms=1000.0,
+    )
+
+    start = time.perf_counter()
+    for i in range(checkpoints):
+        context.checkpoint(lambda i=i: {"iteration": i}, "explicit_checkpoint")
+    context.flush()
+    elapsed = time.perf_counter() - start
+
+    return checkpoints / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--checkpoints", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'storage':<16} {'policy':<12} {'checkpoints/s':>14}")
+    print("-" * 44)
+    for label in ("memory", "file", "file-journal"):
+        for policy in DURABILITY_POLICIES:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                if label == "memory":
+                    storage = MemoryStorage()
+                else:
+                    storage = FileStorage(storage_dir=tmp_dir, journal=label == "file-journal")
+                rate = run_policy(storage, policy, args.checkpoints)
+            print(f"{label:<16} {policy:<12} {rate:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
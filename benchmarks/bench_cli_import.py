@@ -0,0 +1,96 @@
+"""
+Benchmark module import time of CLI commands against budgets.
+
+Runs `tactus version`, `tactus validate` and `tactus run` on a trivial
+procedure in fresh interpreters under `python -X importtime` and sums the
+cumulative import time of the top-level imports. Each command is run
+several times and the fastest run is compared with its budget; the script
+exits with status 1 if any command is over budget, so it can guard against
+regressions (e.g. a module-level import of the runtime in the CLI).
+
+Usage:
+    python benchmarks/bench_cli_import.py [--repeat 5] [--scale 1.0]
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+SOURCE = """
+main = procedure("main", {
+    input = {},
+    output = {}
+}, function()
+    return {}
+end)
+"""
+
+# Milliseconds of imports allowed per command; `run` necessarily loads the
+# runtime (pydantic-ai and the provider SDKs)
+BUDGETS_MS = {
+    "version": 250,
+    "validate": 600,
+    "run": 1500,
+}
+
+# "import time: <self us> | <cumulative us> | <indent><module>"; top-level
+# imports have no indent beyond the separating space
+_TOP_LEVEL = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \| (\S.*)$")
+
+_LAUNCHER = "import sys; from tactus.cli.app import main; sys.argv[0] = 'tactus'; main()"
+
+
+def import_time_ms(args, cwd: str) -> float:
+    """Return the top-level cumulative import time of one CLI invocation."""
+    env = {**os.environ, "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY", "sk-bench")}
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _LAUNCHER, *args],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    total_us = 0
+    for line in completed.stderr.splitlines():
+        match = _TOP_LEVEL.match(line)
+        if match:
+            total_us += int(match.group(1))
+    return total_us / 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="Multiply the budgets (for slower machines)"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        procedure = Path(tmp_dir) / "trivial.tac"
+        procedure.write_text(SOURCE)
+        commands = {
+            "version": ["version"],
+            "validate": ["validate", str(procedure)],
+            "run": ["run", str(procedure)],
+        }
+
+        over_budget = False
+        print(f"{'command':<10} {'import ms':>10} {'budget ms':>10}")
+        print("-" * 32)
+        for name, command in commands.items():
+            elapsed = min(import_time_ms(command, tmp_dir) for _ in range(args.repeat))
+            budget = BUDGETS_MS[name] * args.scale
+            flag = "" if elapsed <= budget else "  OVER BUDGET"
+            over_budget = over_budget or bool(flag)
+            print(f"{name:<10} {elapsed:>10.0f} {budget:>10.0f}{flag}")
+
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Benchmark ConfigManager.load_cascade with 0, 3 and 10 config files.
+
+Builds a project whose procedure sits in nested directories, with a
+.tactus/config.yml at the root and in some of the directories, plus a
+sidecar file, so the cascade reads the given number of files. Each file
+holds --keys settings, some nested. Loads are timed:
+
+- uncached: every load reads, parses and merges the files, as before the cache;
+- cached: the files are stat'ed and the merged config is reused.
+
+Usage:
+    python benchmarks/bench_config_cascade.py [--loads 2000] [--keys 20]
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+from tactus.core.config_manager import ConfigCache, ConfigManager
+
+DEPTH = 10
+
+
+def make_config(index: int, keys: int) -> dict:
+    config = {f"setting_{index}_{key}": f"value {key}" for key in range(keys)}
+    config["tool_paths"] = [f"./tools_{index}"]
+    config["mcp_servers"] = {
+        f"server_{index}": {"command": "python", "args": ["-m", "server"], "env": {"LEVEL": "1"}}
+    }
+    return config
+
+
+def build_project(root: Path, files: int, keys: int) -> Path:
+    """Create a procedure whose cascade reads `files` config files; returns its path."""
+    directory = root
+    directories = []
+    for level in range(DEPTH):
+        directory = directory / f"level{level}"
+        directories.append(directory)
+    directory.mkdir(parents=True)
+    procedure = directory / "procedure.tac"
+    procedure.write_text("-- Benchmark")
+
+    paths = []
+    if files:
+        paths.append(procedure.parent / "procedure.tac.yml")
+    if files > 1:
+        paths.append(root / ".tactus" / "config.yml")
+    paths.extend(d / ".tactus" / "config.yml" for d in directories[: files - len(paths)])
+    for index, path in enumerate(paths):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(yaml.dump(make_config(index, keys)))
+        stat = path.stat()
+        # Old enough to be cached
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**10))
+    return procedure
+
+
+def time_loads(procedure: Path, loads: int, manager_factory) -> list:
+    times = []
+    for _ in range(loads):
+        start = time.perf_counter()
+        manager_factory().load_cascade(procedure)
+        times.append((time.perf_counter() - start) * 1e6)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--loads", type=int, default=2000)
+    parser.add_argument("--keys", type=int, default=20)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    cwd = os.getcwd()
+    print(f"{args.loads} loads, {args.keys} settings per file, procedure {DEPTH} levels deep")
+    print(f"{'files':>5} {'loading':<10} {'mean us':>9} {'p50 us':>9}")
+    print("-" * 36)
+    for files in (0, 3, 10):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            procedure = build_project(root, files, args.keys)
+            os.chdir(root)
+            try:
+                cached = ConfigCache()
+                runs = {
+                    "uncached": time_loads(
+                        procedure, args.loads, lambda: ConfigManager(use_cache=False)
+                    ),
+                    "cached": time_loads(
+                        procedure, args.loads, lambda: ConfigManager(cache=cached)
+                    ),
+                }
+            finally:
+                os.chdir(cwd)
+        for label, times in runs.items():
+            print(
+                f"{files:>5} {label:<10} {statistics.mean(times):>9.1f}"
+                f" {statistics.median(times):>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
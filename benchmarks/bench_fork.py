@@ -0,0 +1,78 @@
+"""
+Benchmark forking a procedure against the length of its history.
+
+Writes a procedure with N checkpoints (each holding a ~1 KB result) and
+measures fork_procedure at the end of its log, for in-memory, document-mode
+and journaled FileStorage (which write the kept entries) and SQLiteStorage
+(which only inserts a procedures row pointing at the source).
+
+Usage:
+    python benchmarks/bench_fork.py [--sizes 100 1000 10000] [--forks 10]
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from tactus.adapters.file_storage import FileStorage
+from tactus.adapters.memory import MemoryStorage
+from tactus.adapters.sqlite_storage import SQLiteStorage
+from tactus.protocols.models import CheckpointEntry
+
+
+def make_storage(label: str, tmp_dir: str):
+    """Create the storage backend for a benchmark label."""
+    if label == "memory":
+        return MemoryStorage()
+    if label == "sqlite":
+        return SQLiteStorage(db_path=str(Path(tmp_dir) / "bench.db"))
+    return FileStorage(storage_dir=tmp_dir, journal=label == "file-journal")
+
+
+def populate(storage, checkpoints: int) -> None:
+    """Save a procedure with `checkpoints` entries in one go."""
+    metadata = storage.load_procedure_metadata("bench")
+    payload = {"messages": ["lorem ipsum dolor sit amet " * 4] * 8}
+    metadata.execution_log = [
+        CheckpointEntry(
+            position=i,
+            type="agent_turn",
+            result=payload,
+            timestamp=datetime.now(timezone.utc),
+            duration_ms=1.0,
+        )
+        for i in range(checkpoints)
+    ]
+    metadata.replay_index = checkpoints
+    storage.save_procedure_metadata("bench", metadata)
+
+
+def measure_fork(storage, checkpoints: int, forks: int) -> float:
+    """Return milliseconds per fork of the whole log."""
+    start = time.perf_counter()
+    for i in range(forks):
+        storage.fork_procedure("bench", checkpoints, f"bench-fork-{i}")
+    return (time.perf_counter() - start) * 1000 / forks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--forks", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'storage':<14} {'checkpoints':>11} {'fork ms':>10}")
+    print("-" * 37)
+    for checkpoints in args.sizes:
+        for label in ("memory", "file", "file-journal", "sqlite"):
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                storage = make_storage(label, tmp_dir)
+                populate(storage, checkpoints)
+                fork_ms = measure_fork(storage, checkpoints, args.forks)
+            print(f"{label:<14} {checkpoints:>11,} {fork_ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
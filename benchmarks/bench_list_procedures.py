@@ -0,0 +1,60 @@
+"""
+Benchmark finding waiting procedures in file storage.
+
+Creates N procedures (1% of them WAITING_FOR_HUMAN) and compares listing them
+through the status index with scanning and reading every procedure file.
+
+Usage:
+    python benchmarks/bench_list_procedures.py [--procedures 10000]
+"""
+
+import argparse
+import tempfile
+import time
+
+from tactus.adapters.file_storage import FileStorage
+
+
+def scan_directory(storage: FileStorage, status: str) -> list:
+    """Find procedures by opening every procedure file (the pre-index approach)."""
+    found = []
+    for path in storage.storage_dir.glob("*.json"):
+        if storage._read_file(path.stem).get("status") == status:
+            found.append(path.stem)
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--procedures", type=int, default=10000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        storage = FileStorage(storage_dir=tmp_dir)
+        for i in range(args.procedures):
+            status = "WAITING_FOR_HUMAN" if i % 100 == 0 else "COMPLETED"
+            storage.update_procedure_status(f"proc-{i:06d}", status)
+
+        start = time.perf_counter()
+        scanned = scan_directory(storage, "WAITING_FOR_HUMAN")
+        scan_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        listed = []
+        cursor = None
+        while True:
+            page = storage.list_procedures(status="WAITING_FOR_HUMAN", limit=100, cursor=cursor)
+            listed.extend(p.procedure_id for p in page.procedures)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        index_ms = (time.perf_counter() - start) * 1000
+
+    assert sorted(scanned) == listed
+    print(f"{args.procedures} procedures, {len(listed)} waiting")
+    print(f"{'directory scan':<16} {scan_ms:>10.1f} ms")
+    print(f"{'status index':<16} {index_ms:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmark per-run MCP cost with a new server per run versus a persistent pool.
+
+Each run is an agent turn (pydantic-ai TestModel) that lists a server's
+tools and calls one:
+
+- per run: MCPServerManager starts, connects and stops the server;
+- pooled: PooledMCPServerManager takes it from an MCPServerPool, so only
+  the first run starts it.
+
+Then --concurrency runs call a tool that takes --call-seconds on a pool
+with one instance per server and on one with --concurrency instances.
+
+The server is the stub in tests/fixtures/stub_mcp_server.py (no MCP
+library, starts in milliseconds); --fastmcp uses the FastMCP test server
+instead, closer to a real Python server.
+
+Usage:
+    python benchmarks/bench_mcp_pool.py [--runs 50] [--fastmcp]
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from pydantic_ai import Agent
+from pydantic_ai.models.test import TestModel
+
+from tactus.adapters.mcp_manager import MCPServerManager, MCPServerPool, PooledMCPServerManager
+
+FIXTURES = Path(__file__).parent.parent / "tests" / "fixtures"
+
+
+def server_config(fastmcp: bool):
+    if fastmcp:
+        return {"command": sys.executable, "args": [str(FIXTURES / "test_mcp_server.py")]}
+    return {"command": sys.executable, "args": [str(FIXTURES / "stub_mcp_server.py")]}
+
+
+async def one_run(manager, tool: str) -> float:
+    start = time.perf_counter()
+    async with manager:
+        agent = Agent(TestModel(call_tools=[tool]), toolsets=manager.get_toolsets())
+        await agent.run("go")
+    return (time.perf_counter() - start) * 1000
+
+
+async def sequential_runs(runs: int, config: dict, tool: str):
+    per_run = [await one_run(MCPServerManager({"bench": config}), tool) for _ in range(runs)]
+    pool = MCPServerPool()
+    pooled = [
+        await one_run(PooledMCPServerManager(pool, {"bench": config}), tool) for _ in range(runs)
+    ]
+    await pool.aclose()
+    return per_run, pooled
+
+
+async def concurrent_runs(concurrency: int, instances: int, seconds: float) -> float:
+    pool = MCPServerPool(instances_per_server=instances)
+    toolset = pool.toolset("bench", server_config(False))
+    await toolset.call_tool("sleep", {"seconds": 0}, None, None)  # Warm
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(toolset.call_tool("sleep", {"seconds": seconds}, None, None) for _ in range(concurrency))
+    )
+    elapsed = time.perf_counter() - start
+    await pool.aclose()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--fastmcp", action="store_true")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--call-seconds", type=float, default=0.2)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    tool = "bench_add_numbers" if args.fastmcp else "bench_echo"
+    per_run, pooled = asyncio.run(sequential_runs(args.runs, server_config(args.fastmcp), tool))
+
+    server = "FastMCP" if args.fastmcp else "stub"
+    print(f"{args.runs} runs, {server} server: list tools + 1 call per run")
+    print(f"{'servers':<10} {'first ms':>9} {'mean ms':>9} {'p50 ms':>9}")
+    print("-" * 40)
+    for label, times in (("per run", per_run), ("pooled", pooled)):
+        print(
+            f"{label:<10} {times[0]:>9.1f} {statistics.mean(times):>9.1f}"
+            f" {statistics.median(times):>9.1f}"
+        )
+
+    print()
+    print(f"{args.concurrency} concurrent {args.call_seconds}s calls on one pooled server")
+    for instances in (1, args.concurrency):
+        elapsed = asyncio.run(concurrent_runs(args.concurrency, instances, args.call_seconds))
+        print(f"{instances} instance(s): {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
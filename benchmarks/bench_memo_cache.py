@@ -0,0 +1,67 @@
+"""
+Benchmark memoized checkpoints against recomputation.
+
+Runs N procedures that each make the same K "expensive" checkpoints (a sleep
+standing in for an LLM call) and reports wall time with no memo cache, an
+in-memory cache and a SQLite cache.
+
+Usage:
+    python benchmarks/bench_memo_cache.py [--procedures 20] [--calls 10] [--latency-ms 5]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from tactus.adapters.memo_cache import MemoryMemoCache, SQLiteMemoCache
+from tactus.adapters.memory import MemoryStorage
+from tactus.core.execution_context import BaseExecutionContext, compute_input_hash
+
+
+def run(memo_cache, procedures: int, calls: int, latency: float) -> float:
+    """Run the workload and return elapsed seconds."""
+    start = time.perf_counter()
+    for p in range(procedures):
+        context = BaseExecutionContext(
+            procedure_id=f"bench-{p}", storage_backend=MemoryStorage(), memo_cache=memo_cache
+        )
+        for i in range(calls):
+
+            def call(i=i):
+                time.sleep(latency)
+                return {"label": f"class-{i}"}
+
+            context.checkpoint(
+                call,
+                "explicit_checkpoint",
+                input_hash=compute_input_hash("explicit_checkpoint", {"item": i}),
+                memoize=True,
+            )
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--procedures", type=int, default=20)
+    parser.add_argument("--calls", type=int, default=10)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    args = parser.parse_args()
+    latency = args.latency_ms / 1000
+
+    print(f"{'cache':<10} {'seconds':>10}")
+    print("-" * 21)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        caches = {
+            "none": None,
+            "memory": MemoryMemoCache(),
+            "sqlite": SQLiteMemoCache(db_path=str(Path(tmp_dir) / "memo.db")),
+        }
+        for label, cache in caches.items():
+            elapsed = run(cache, args.procedures, args.calls, latency)
+            print(f"{label:<10} {elapsed:>10.3f}")
+        caches["sqlite"].close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmark setup time of MCP servers and dependencies, one at a time versus concurrently.
+
+Starts N stub MCP servers (tests/fixtures/stub_mcp_server.py) that wait
+--server-delay seconds before answering, and creates M fake dependencies
+that take --dependency-delay seconds each. It then compares two ways of
+doing the same setup:
+
+- sequential: one server or dependency after another, as the runtime did;
+- concurrent: MCPServerManager and ResourceFactory.create_all running
+  side by side, as the runtime does now.
+
+Usage:
+    python benchmarks/bench_parallel_init.py [--servers 4] [--dependencies 3]
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+from tactus.adapters.mcp_manager import MCPServerManager
+from tactus.core.dependencies import ResourceFactory, ResourceManager
+
+STUB_SERVER = str(Path(__file__).parent.parent / "tests" / "fixtures" / "stub_mcp_server.py")
+
+
+class FakeResource:
+    async def aclose(self):
+        pass
+
+
+def install_fake_resources(delay: float) -> None:
+    async def create(resource_type, config):
+        await asyncio.sleep(delay)
+        return FakeResource()
+
+    ResourceFactory.create = staticmethod(create)
+
+
+def server_configs(count: int, delay: float):
+    return {
+        f"server{i}": {
+            "command": sys.executable,
+            "args": [STUB_SERVER],
+            "env": {"STUB_MCP_NAME": f"server{i}", "STUB_MCP_STARTUP_DELAY": str(delay)},
+        }
+        for i in range(count)
+    }
+
+
+def dependency_configs(count: int):
+    return {f"dep{i}": {"type": "http_client"} for i in range(count)}
+
+
+async def sequential(servers, dependencies) -> float:
+    start = time.perf_counter()
+    managers = []
+    for name, config in servers.items():
+        managers.append(await MCPServerManager({name: config}).__aenter__())
+    resources = ResourceManager()
+    for name, config in dependencies.items():
+        created = await ResourceFactory.create_all({name: config})
+        await resources.add_resource(name, created[name])
+    elapsed = time.perf_counter() - start
+    assert sum(len(m.get_toolsets()) for m in managers) == len(servers)
+    for manager in managers:
+        await manager.__aexit__(None, None, None)
+    await resources.cleanup()
+    return elapsed
+
+
+async def concurrent(servers, dependencies) -> float:
+    start = time.perf_counter()
+    manager = MCPServerManager(servers)
+    _, created = await asyncio.gather(
+        manager.__aenter__(), ResourceFactory.create_all(dependencies)
+    )
+    elapsed = time.perf_counter() - start
+    assert len(manager.get_toolsets()) == len(servers)
+    assert len(created) == len(dependencies)
+    await manager.__aexit__(None, None, None)
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--servers", type=int, default=4)
+    parser.add_argument("--dependencies", type=int, default=3)
+    parser.add_argument("--server-delay", type=float, default=0.5)
+    parser.add_argument("--dependency-delay", type=float, default=0.3)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    install_fake_resources(args.dependency_delay)
+    servers = server_configs(args.servers, args.server_delay)
+    dependencies = dependency_configs(args.dependencies)
+
+    print(
+        f"{args.servers} MCP servers ({args.server_delay}s start), "
+        f"{args.dependencies} dependencies ({args.dependency_delay}s each)"
+    )
+    print(f"{'setup':<12} {'best s':>8} {'mean s':>8}")
+    print("-" * 30)
+    for label, setup in (("sequential", sequential), ("concurrent", concurrent)):
+        times = [asyncio.run(setup(servers, dependencies)) for _ in range(args.repeat)]
+        print(f"{label:<12} {min(times):>8.3f} {sum(times) / len(times):>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
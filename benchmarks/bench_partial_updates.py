@@ -0,0 +1,87 @@
+"""
+Benchmark status and state updates against the length of the execution log.
+
+Saves a procedure with N checkpoints (each holding a ~1 KB result) and
+measures set_status() and patch_state() through each backend's fast path,
+against the previous load-and-save path, for document-mode and journaled
+FileStorage and for SQLiteStorage.
+
+Usage:
+    python benchmarks/bench_partial_updates.py [--sizes 100 1000 10000] [--updates 50]
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from tactus.adapters.file_storage import FileStorage
+from tactus.adapters.sqlite_storage import SQLiteStorage
+from tactus.protocols.models import CheckpointEntry
+
+
+def make_storage(label: str, tmp_dir: str):
+    """Create the storage backend for a benchmark label."""
+    if label == "sqlite":
+        return SQLiteStorage(db_path=str(Path(tmp_dir) / "bench.db"))
+    return FileStorage(storage_dir=tmp_dir, journal=label == "file-journal")
+
+
+def populate(storage, checkpoints: int) -> None:
+    """Save a procedure with `checkpoints` entries in one go."""
+    metadata = storage.load_procedure_metadata("bench")
+    payload = {"messages": ["lorem ipsum dolor sit amet " * 4] * 8}
+    metadata.execution_log = [
+        CheckpointEntry(
+            position=i,
+            type="agent_turn",
+            result=payload,
+            timestamp=datetime.now(timezone.utc),
+        )
+        for i in range(checkpoints)
+    ]
+    storage.save_procedure_metadata("bench", metadata)
+
+
+def load_and_save(storage, i: int) -> None:
+    """The pre-fast-path update: rewrite the whole procedure."""
+    metadata = storage.load_procedure_metadata("bench")
+    metadata.status = "WAITING_FOR_HUMAN" if i % 2 else "RUNNING"
+    metadata.state = {**metadata.state, "i": i}
+    storage.save_procedure_metadata("bench", metadata)
+
+
+def fast_path(storage, i: int) -> None:
+    storage.set_status("bench", "WAITING_FOR_HUMAN" if i % 2 else "RUNNING")
+    storage.patch_state("bench", {"i": i})
+
+
+def measure(storage, update, updates: int) -> float:
+    """Return milliseconds per update."""
+    start = time.perf_counter()
+    for i in range(updates):
+        update(storage, i)
+    return (time.perf_counter() - start) * 1000 / updates
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--updates", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'storage':<14} {'checkpoints':>11} {'load+save ms':>13} {'fast path ms':>13}")
+    print("-" * 54)
+    for checkpoints in args.sizes:
+        for label in ("file", "file-journal", "sqlite"):
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                storage = make_storage(label, tmp_dir)
+                populate(storage, checkpoints)
+                full_ms = measure(storage, load_and_save, args.updates)
+                fast_ms = measure(storage, fast_path, args.updates)
+            print(f"{label:<14} {checkpoints:>11,} {full_ms:>13.2f} {fast_ms:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark tool plugin loading per run with and without the plugin cache.
+
+Generates --plugins plugin files, each with --tools functions and a
+module-level setup that takes --import-seconds (standing in for a heavy
+import such as pandas, which a plugin pays for when its module runs).
+Each run creates the plugin toolset the way the runtime does:
+
+- no cache: the cache is emptied before every run, so every plugin file is
+  executed again, as the loader did before the cache;
+- cached: plugin modules and tool definitions are reused while the files'
+  mtime and size are unchanged;
+- touched: the files' mtime changes every run but their content does not,
+  so the cache hashes them and still reuses them.
+
+Usage:
+    python benchmarks/bench_plugin_cache.py [--runs 20] [--import-seconds 0.2]
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from tactus.adapters.plugins import PluginCache, PluginLoader
+
+PLUGIN_HEADER = """
+import time
+
+time.sleep({seconds})  # A heavy import
+"""
+
+TOOL = '''
+
+def tool_{plugin}_{index}(text: str, count: int = 1) -> str:
+    """Repeat text a number of times."""
+    return text * count
+'''
+
+
+def write_plugins(directory: Path, plugins: int, tools: int, seconds: float) -> None:
+    for plugin in range(plugins):
+        body = PLUGIN_HEADER.format(seconds=seconds)
+        body += "".join(TOOL.format(plugin=plugin, index=index) for index in range(tools))
+        path = directory / f"plugin_{plugin}.py"
+        path.write_text(body)
+        stat = path.stat()
+        # Old enough not to be re-hashed as a just-written file
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**10))
+
+
+def one_run(directory: Path, cache: PluginCache) -> float:
+    start = time.perf_counter()
+    toolset = PluginLoader(plugin_cache=cache).create_toolset([str(directory)])
+    elapsed = (time.perf_counter() - start) * 1000
+    assert toolset.tools
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--plugins", type=int, default=3)
+    parser.add_argument("--tools", type=int, default=10)
+    parser.add_argument("--import-seconds", type=float, default=0.2)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        directory = Path(tmp_dir)
+        write_plugins(directory, args.plugins, args.tools, args.import_seconds)
+
+        cache = PluginCache()
+        uncached = []
+        for _ in range(args.runs):
+            cache.invalidate()
+            uncached.append(one_run(directory, cache))
+
+        cache = PluginCache()
+        cached = [one_run(directory, cache) for _ in range(args.runs)]
+
+        touched = []
+        for _ in range(args.runs):
+            for path in directory.glob("*.py"):
+                stat = path.stat()
+                os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+            touched.append(one_run(directory, cache))
+
+    print(
+        f"{args.runs} runs, {args.plugins} plugin files x {args.tools} tools, "
+        f"{args.import_seconds}s import per file"
+    )
+    print(f"{'plugins':<10} {'first ms':>9} {'mean ms':>9} {'p50 ms':>9}")
+    print("-" * 40)
+    for label, times in (("no cache", uncached), ("cached", cached), ("touched", touched)):
+        print(
+            f"{label:<10} {times[0]:>9.1f} {statistics.mean(times):>9.1f}"
+            f" {statistics.median(times):>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
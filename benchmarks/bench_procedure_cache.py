@@ -0,0 +1,74 @@
+"""
+Benchmark per-run procedure setup time with the compiled procedure cache.
+
+For each .tac file, repeats the setup every TactusRuntime.execute() call
+performs before running the workflow (create a LuaSandbox, run the source
+against the DSL stubs, validate declarations and build the config) with:
+
+- cold: a new, empty ProcedureCache per run (compiles and validates each time)
+- warm (memory): one ProcedureCache shared by every run, as in a long-running host
+- warm (disk): a new ProcedureCache per run reading a cache directory, as in
+  separate CLI runs with --procedure-cache
+
+Usage:
+    python benchmarks/bench_procedure_cache.py [--runs 200] [files ...]
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from tactus.core.lua_sandbox import LuaSandbox
+from tactus.core.procedure_cache import ProcedureCache
+from tactus.core.runtime import TactusRuntime
+
+DEFAULT_FILES = [
+    "examples/02-basics-simple-logic.tac",
+    "examples/18-feature-lua-tools-inline.tac",
+    "examples/20-bdd-complete.tac",
+]
+
+
+def setup(source: str, cache: ProcedureCache) -> None:
+    """Run the declaration-parsing steps of TactusRuntime.execute()."""
+    runtime = TactusRuntime(procedure_id="bench", procedure_cache=cache)
+    runtime.lua_sandbox = LuaSandbox()
+    runtime.registry = runtime._parse_declarations(source)
+    runtime.config = runtime._registry_to_config(runtime.registry)
+
+
+def measure(source: str, make_cache, runs: int) -> float:
+    """Return microseconds per setup."""
+    start = time.perf_counter()
+    for _ in range(runs):
+        setup(source, make_cache())
+    return (time.perf_counter() - start) * 1e6 / runs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("files", nargs="*", default=DEFAULT_FILES)
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+
+    # Declaration warnings would otherwise be logged on every run
+    logging.disable(logging.WARNING)
+
+    print(f"{'file':<36} {'cold us':>9} {'memory us':>10} {'disk us':>9}")
+    print("-" * 67)
+    for path in args.files:
+        source = Path(path).read_text()
+        shared = ProcedureCache()
+        with tempfile.TemporaryDirectory() as cache_dir:
+            setup(source, shared)
+            setup(source, ProcedureCache(cache_dir=cache_dir))
+            cold = measure(source, ProcedureCache, args.runs)
+            memory = measure(source, lambda: shared, args.runs)
+            disk = measure(source, lambda: ProcedureCache(cache_dir=cache_dir), args.runs)
+        print(f"{Path(path).name:<36} {cold:>9.0f} {memory:>10.0f} {disk:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Benchmark per-turn latency and sockets opened by agents with and without shared provider clients.
+
+Serves an OpenAI-compatible chat completions endpoint on localhost that
+counts the connections it accepts, and runs N sequential single-turn agent
+runs against it (each run creates its agent, as TactusRuntime does) in
+three configurations:
+
+- new client per run: a new provider and HTTP client for every agent (what
+  Bedrock agents did, with boto3 clients);
+- pydantic-ai default: a model string, resolved by pydantic-ai;
+- registry: models from a ProviderRegistry.
+
+Runs share one event loop, as in a long-lived host. With --loop-per-run,
+each run uses its own loop (asyncio.run), as separate CLI invocations do;
+turns that fail are counted as errors.
+
+Usage:
+    python benchmarks/bench_provider_registry.py [--runs 1000] [--loop-per-run]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+from pydantic_ai import Agent
+from pydantic_ai.models.openai import OpenAIChatModel
+from pydantic_ai.providers.openai import OpenAIProvider
+
+from tactus.providers.registry import ProviderRegistry
+
+COMPLETION = json.dumps(
+    {
+        "id": "chatcmpl-bench",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "gpt-4o",
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": "ok"},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+    }
+).encode()
+
+
+class CompletionHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes: without this, delayed ACKs stall
+    # every response on a reused connection
+    disable_nagle_algorithm = True
+    connections = 0
+    lock = threading.Lock()
+
+    def setup(self):
+        # One handler per accepted connection
+        with CompletionHandler.lock:
+            CompletionHandler.connections += 1
+        super().setup()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(COMPLETION)))
+        self.end_headers()
+        self.wfile.write(COMPLETION)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_model_factories(registry: ProviderRegistry):
+    return {
+        "new client per run": lambda: OpenAIChatModel(
+            "gpt-4o", provider=OpenAIProvider(http_client=httpx.AsyncClient())
+        ),
+        "pydantic-ai default": lambda: "openai:gpt-4o",
+        "registry": lambda: registry.get_model("openai:gpt-4o"),
+    }
+
+
+async def run_once(make_model, latencies, errors):
+    agent = Agent(make_model())
+    start = time.perf_counter()
+    try:
+        await agent.run("hello")
+    except Exception:
+        errors.append(1)
+        return
+    latencies.append((time.perf_counter() - start) * 1000)
+
+
+async def run_all(make_model, runs, latencies, errors):
+    for _ in range(runs):
+        await run_once(make_model, latencies, errors)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=1000)
+    parser.add_argument("--loop-per-run", action="store_true")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CompletionHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{server.server_port}/v1"
+    os.environ["OPENAI_API_KEY"] = "sk-bench"
+
+    registry = ProviderRegistry()
+    print(
+        f"{'clients':<20} {'mean ms':>8} {'p50 ms':>8} {'p99 ms':>8} {'sockets':>8} {'errors':>7}"
+    )
+    print("-" * 64)
+    for label, make_model in make_model_factories(registry).items():
+        latencies, errors = [], []
+        CompletionHandler.connections = 0
+        if args.loop_per_run:
+            for _ in range(args.runs):
+                asyncio.run(run_once(make_model, latencies, errors))
+        else:
+            asyncio.run(run_all(make_model, args.runs, latencies, errors))
+        p99 = statistics.quantiles(latencies, n=100)[98] if len(latencies) > 1 else 0.0
+        print(
+            f"{label:<20} {statistics.mean(latencies):>8.2f} {statistics.median(latencies):>8.2f}"
+            f" {p99:>8.2f} {CompletionHandler.connections:>8} {len(errors):>7}"
+        )
+    registry.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark retention sweeps over a store of finished procedures.
+
+Saves N procedures (half COMPLETED, half RUNNING, each with a few ~1 KB
+checkpoints) and measures the time to save them, to load one procedure at
+random, and to delete the expired half with collect_expired, for flat and
+sharded FileStorage and for SQLiteStorage. Reports reclaimed bytes.
+
+Usage:
+    python benchmarks/bench_retention.py [--sizes 1000 10000] [--batch-size 500]
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from tactus.adapters.file_storage import FileStorage
+from tactus.adapters.sqlite_storage import SQLiteStorage
+from tactus.core.garbage_collection import RetentionPolicy, collect_expired
+from tactus.protocols.models import CheckpointEntry, ProcedureMetadata
+
+
+def make_storage(label: str, tmp_dir: str):
+    """Create the storage backend for a benchmark label."""
+    if label == "sqlite":
+        return SQLiteStorage(db_path=str(Path(tmp_dir) / "bench.db"))
+    return FileStorage(storage_dir=tmp_dir, shard=label == "file-sharded")
+
+
+def populate(storage, procedures: int) -> float:
+    """Save the procedures and return the elapsed seconds."""
+    payload = {"messages": ["lorem ipsum dolor sit amet " * 4] * 8}
+    start = time.perf_counter()
+    for i in range(procedures):
+        procedure_id = f"proc-{i:06d}"
+        storage.save_procedure_metadata(
+            procedure_id,
+            ProcedureMetadata(
+                procedure_id=procedure_id,
+                status="COMPLETED" if i % 2 else "RUNNING",
+                execution_log=[
+                    CheckpointEntry(
+                        position=position,
+                        type="agent_turn",
+                        result=payload,
+                        timestamp=datetime.now(timezone.utc),
+                    )
+                    for position in range(4)
+                ],
+            ),
+        )
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    later = datetime.now(timezone.utc) + timedelta(days=1)
+    policy = RetentionPolicy(completed_days=0)
+    print(
+        f"{'storage':<14} {'procedures':>10} {'save ms/proc':>12} {'load ms':>8} "
+        f"{'sweep s':>8} {'deleted':>8} {'reclaimed MiB':>14}"
+    )
+    print("-" * 82)
+    for procedures in args.sizes:
+        for label in ("file", "file-sharded", "sqlite"):
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                storage = make_storage(label, tmp_dir)
+                save_s = populate(storage, procedures)
+
+                procedure_id = f"proc-{random.randrange(procedures):06d}"
+                start = time.perf_counter()
+                make_storage(label, tmp_dir).load_procedure_metadata(procedure_id)
+                load_ms = (time.perf_counter() - start) * 1000
+
+                start = time.perf_counter()
+                report = collect_expired(storage, policy, batch_size=args.batch_size, now=later)
+                sweep_s = time.perf_counter() - start
+            print(
+                f"{label:<14} {procedures:>10,} {save_s / procedures * 1000:>12.3f} "
+                f"{load_ms:>8.2f} {sweep_s:>8.2f} {len(report.deleted):>8,} "
+                f"{report.reclaimed_bytes / 2**20:>14.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Benchmark agent and toolset setup with the schema model cache cold and warm.
+
+Runs a procedure that declares agents with structured outputs and inline Lua
+tools (and does not call them), through TactusRuntime.execute() with
+in-memory storage, and times TactusRuntime._setup_agents() on each run. With
+a cold cache every run builds the output and parameter models again, as
+before the cache; with a warm one they are built on the first run only.
+Also times converting MCP tools with 10-property JSON Schemas.
+
+Usage:
+    python benchmarks/bench_schema_cache.py [--runs 50] [--agents 4] [--tools 6]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+
+from tactus.adapters.mcp import PydanticAIMCPAdapter
+from tactus.adapters.memory import MemoryStorage
+from tactus.core.runtime import TactusRuntime
+from tactus.core.schema_cache import SchemaModelCache
+
+
+def make_source(agents: int, tools: int) -> str:
+    tool_defs = ",\n".join(f"""        {{
+            name = "tool_{t}",
+            description = "Tool {t}",
+            parameters = {{
+                text = {{type = "string", description = "Text", required = true}},
+                count = {{type = "integer", description = "Count", required = true}},
+                ratio = {{type = "number", description = "Ratio", required = true}},
+                flag = {{type = "boolean", description = "Flag", required = true}}
+            }},
+            handler = function(args) return args.text end
+        }}""" for t in range(tools))
+    agent_defs = "\n".join(f"""agent("agent_{a}", {{
+    provider = "openai",
+    model = "gpt-4o-mini",
+    system_prompt = "You extract data.",
+    output_type = {{
+        city = {{type = "string", required = true}},
+        country = {{type = "string", required = true}},
+        population = {{type = "number", required = false}},
+        capital = {{type = "boolean", required = false}},
+        districts = {{type = "array", required = false}},
+        notes = {{type = "object", required = false}}
+    }},
+    tools = {{
+{tool_defs}
+    }},
+    toolsets = {{"done"}}
+}})""" for a in range(agents))
+    return f"""{agent_defs}
+
+main = procedure("main", {{input = {{}}, output = {{}}}}, function()
+    return {{done = true}}
+end)
+"""
+
+
+class TimedRuntime(TactusRuntime):
+    setup_seconds = []
+
+    async def _setup_agents(self, context):
+        start = time.perf_counter()
+        await super()._setup_agents(context)
+        TimedRuntime.setup_seconds.append(time.perf_counter() - start)
+
+
+async def measure_setup(source: str, runs: int, warm: bool) -> float:
+    """Return the mean _setup_agents() time in milliseconds."""
+    TimedRuntime.setup_seconds = []
+    shared = SchemaModelCache()
+    for i in range(runs):
+        runtime = TimedRuntime(
+            procedure_id=f"bench-{i}",
+            storage_backend=MemoryStorage(),
+            schema_cache=shared if warm else SchemaModelCache(),
+        )
+        result = await runtime.execute(source, {}, format="lua")
+        assert result["success"], result
+    # The first warm run fills the cache
+    samples = TimedRuntime.setup_seconds[1:] if warm else TimedRuntime.setup_seconds
+    return sum(samples) * 1000 / len(samples)
+
+
+def measure_mcp(runs: int, tools: int, warm: bool) -> float:
+    """Return milliseconds to convert `tools` MCP tools."""
+    definitions = [
+        {
+            "name": f"mcp_tool_{t}",
+            "description": "An MCP tool",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    f"field_{p}": {"type": ["string", "integer", "number", "boolean"][p % 4]}
+                    for p in range(10)
+                },
+                "required": ["field_0"],
+            },
+        }
+        for t in range(tools)
+    ]
+    shared = SchemaModelCache()
+    start = time.perf_counter()
+    for _ in range(runs):
+        adapter = PydanticAIMCPAdapter(None, schema_cache=shared if warm else SchemaModelCache())
+        for definition in definitions:
+            adapter._convert_mcp_tool_to_pydantic_ai(definition)
+    return (time.perf_counter() - start) * 1000 / runs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--agents", type=int, default=4)
+    parser.add_argument("--tools", type=int, default=6)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    # Agents are created but never called
+    os.environ.setdefault("OPENAI_API_KEY", "sk-bench")
+    source = make_source(args.agents, args.tools)
+
+    print(f"{'setup':<32} {'cold ms':>8} {'warm ms':>8}")
+    print("-" * 50)
+    label = f"_setup_agents ({args.agents}x{args.tools} tools)"
+    cold = asyncio.run(measure_setup(source, args.runs, warm=False))
+    warm = asyncio.run(measure_setup(source, args.runs, warm=True))
+    print(f"{label:<32} {cold:>8.2f} {warm:>8.2f}")
+    label = f"MCP tools ({args.tools}x10 fields)"
+    cold = measure_mcp(args.runs, args.tools, warm=False)
+    warm = measure_mcp(args.runs, args.tools, warm=True)
+    print(f"{label:<32} {cold:>8.2f} {warm:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
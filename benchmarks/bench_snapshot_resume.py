@@ -0,0 +1,90 @@
+"""
+Benchmark resume time against execution history length.
+
+Runs a procedure that checkpoints N times and then suspends for a human,
+then times the resumed run. Without snapshots the resumed run replays all N
+checkpoints through Lua; with Checkpoint.snapshot() it restarts from the
+latest snapshot.
+
+Usage:
+    python benchmarks/bench_snapshot_resume.py [--sizes 100 1000 5000]
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+
+from tactus.adapters.memory import MemoryStorage
+from tactus.core.exceptions import ProcedureWaitingForHuman
+from tactus.core.runtime import TactusRuntime
+from tactus.protocols.models import HITLResponse
+
+SOURCE = """
+main = procedure("main", {
+    input = {steps = {type = "number", default = 100}},
+    output = {total = {type = "number"}}
+}, function()
+    local start = 1
+    if USE_SNAPSHOTS then
+        local saved = Checkpoint.resume()
+        if saved then
+            start = saved.data.next_step
+        end
+    end
+    for i = start, input.steps do
+        State.increment("total", Step.checkpoint(function() return i end))
+        if USE_SNAPSHOTS then
+            Checkpoint.snapshot({next_step = i + 1})
+        end
+    end
+    Human.approve({message = "Finish?"})
+    return {total = State.get("total")}
+end)
+"""
+
+
+class SuspendingHITLHandler:
+    """Suspends the procedure on every request."""
+
+    def request_interaction(self, procedure_id, request):
+        raise ProcedureWaitingForHuman(procedure_id, "msg-1")
+
+
+class ApprovingHITLHandler:
+    """Approves every request."""
+
+    def request_interaction(self, procedure_id, request):
+        return HITLResponse(value=True, responded_at=datetime.now(timezone.utc))
+
+
+async def run(storage, source: str, steps: int, hitl_handler) -> float:
+    """Execute the procedure once and return elapsed milliseconds."""
+    runtime = TactusRuntime(
+        procedure_id="bench", storage_backend=storage, hitl_handler=hitl_handler
+    )
+    start = time.perf_counter()
+    await runtime.execute(source=source, context={"steps": steps}, format="lua")
+    return (time.perf_counter() - start) * 1000
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000])
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    print(f"{'checkpoints':>11} {'snapshots':>10} {'first run ms':>13} {'resume ms':>10}")
+    print("-" * 48)
+    for steps in args.sizes:
+        for use_snapshots in (False, True):
+            source = f"USE_SNAPSHOTS = {'true' if use_snapshots else 'false'}\n{SOURCE}"
+            storage = MemoryStorage()
+            first_ms = await run(storage, source, steps, SuspendingHITLHandler())
+            resume_ms = await run(storage, source, steps, ApprovingHITLHandler())
+            print(f"{steps:>11,} {str(use_snapshots):>10} {first_ms:>13.1f} {resume_ms:>10.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
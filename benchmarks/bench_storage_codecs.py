@@ -0,0 +1,129 @@
+"""
+Benchmark storage codecs for procedure metadata.
+
+Saves and loads an N-entry execution log in FileStorage document mode with
+each codec, and compares against the pre-codec JSON path (pretty-printed
+json.dump with default=str and ISO timestamps). Reports encode (save) and
+decode (load) time and on-disk size.
+
+Usage:
+    python benchmarks/bench_storage_codecs.py [--sizes 1000 10000 100000]
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from tactus.adapters.file_storage import FileStorage
+from tactus.protocols.models import CheckpointEntry, ProcedureMetadata, resolve_result
+
+
+def make_metadata(entries: int) -> ProcedureMetadata:
+    """Build metadata whose results look like small agent/tool outputs."""
+    return ProcedureMetadata(
+        procedure_id="bench",
+        execution_log=[
+            CheckpointEntry(
+                position=i,
+                type="agent_turn",
+                result={
+                    "response": f"Item {i} was classified after reviewing the supplied text.",
+                    "label": "positive" if i % 2 else "negative",
+                    "usage": {"prompt_tokens": 120 + i % 50, "completion_tokens": 30},
+                },
+                timestamp=datetime.now(timezone.utc),
+                duration_ms=12.5,
+                input_hash=f"{i:064x}",
+            )
+            for i in range(entries)
+        ],
+        state={"processed": entries},
+    )
+
+
+def legacy_save(path: Path, metadata: ProcedureMetadata) -> None:
+    """The pre-codec document writer."""
+    data = {
+        "procedure_id": metadata.procedure_id,
+        "execution_log": [
+            {
+                "position": entry.position,
+                "type": entry.type,
+                "result": entry.result,
+                "timestamp": entry.timestamp.isoformat(),
+                "duration_ms": entry.duration_ms,
+                "input_hash": entry.input_hash,
+            }
+            for entry in metadata.execution_log
+        ],
+        "state": metadata.state,
+    }
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2, default=str)
+
+
+def legacy_load(path: Path) -> ProcedureMetadata:
+    """The pre-codec document reader."""
+    with open(path) as f:
+        data = json.load(f)
+    return ProcedureMetadata(
+        procedure_id=data["procedure_id"],
+        execution_log=[
+            CheckpointEntry(
+                position=e["position"],
+                type=e["type"],
+                result=e["result"],
+                timestamp=datetime.fromisoformat(e["timestamp"]),
+                duration_ms=e["duration_ms"],
+                input_hash=e["input_hash"],
+            )
+            for e in data["execution_log"]
+        ],
+        state=data["state"],
+    )
+
+
+def measure(label: str, metadata: ProcedureMetadata, tmp_dir: str) -> tuple:
+    """Return (encode seconds, decode seconds, bytes on disk)."""
+    if label == "legacy-json":
+        path = Path(tmp_dir) / "bench.json"
+        start = time.perf_counter()
+        legacy_save(path, metadata)
+        encoded = time.perf_counter()
+        loaded = legacy_load(path)
+    else:
+        storage = FileStorage(storage_dir=tmp_dir, codec=label)
+        path = storage._get_file_path("bench")
+        start = time.perf_counter()
+        storage.save_procedure_metadata("bench", metadata)
+        encoded = time.perf_counter()
+        loaded = storage.load_procedure_metadata("bench")
+    for entry in loaded.execution_log:
+        resolve_result(entry.result)
+    decoded = time.perf_counter()
+    return encoded - start, decoded - encoded, path.stat().st_size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    args = parser.parse_args()
+
+    print(f"{'entries':>8} {'codec':<12} {'encode ms':>10} {'decode ms':>10} {'size KB':>10}")
+    print("-" * 54)
+    for size in args.sizes:
+        metadata = make_metadata(size)
+        for label in ("legacy-json", "json", "msgpack"):
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                encode, decode, nbytes = measure(label, metadata, tmp_dir)
+            print(
+                f"{size:>8} {label:<12} {encode * 1000:>10.1f} {decode * 1000:>10.1f} "
+                f"{nbytes / 1024:>10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark write-behind persistence.
+
+Runs N checkpoints whose operations take a fixed time (standing in for tool or
+model calls) against file storage, with saves either inline or on an I/O
+thread (write_behind=True), and reports total wall time.
+
+Usage:
+    python benchmarks/bench_write_behind.py [--checkpoints 500] [--latency-ms 2]
+"""
+
+import argparse
+import tempfile
+import time
+
+from tactus.adapters.file_storage import FileStorage
+from tactus.core.execution_context import BaseExecutionContext
+
+
+def run(write_behind: bool, journal: bool, checkpoints: int, latency: float) -> float:
+    """Run the workload and return elapsed seconds."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        context = BaseExecutionContext(
+            procedure_id="bench",
+            storage_backend=FileStorage(storage_dir=tmp_dir, journal=journal),
+            write_behind=write_behind,
+        )
+        start = time.perf_counter()
+        for i in range(checkpoints):
+
+            def operation(i=i):
+                time.sleep(latency)
+                return {"iteration": i, "text": "x" * 200}
+
+            context.checkpoint(operation, "explicit_checkpoint")
+        context.flush()
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--checkpoints", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    args = parser.parse_args()
+    latency = args.latency_ms / 1000
+
+    print(f"{'storage':<14} {'inline s':>10} {'write-behind s':>15}")
+    print("-" * 41)
+    for label, journal in (("file", False), ("file-journal", True)):
+        inline = run(False, journal, args.checkpoints, latency)
+        behind = run(True, journal, args.checkpoints, latency)
+        print(f"{label:<14} {inline:>10.3f} {behind:>15.3f}")
+
+
+if __name__ == "__main__":
+    main()
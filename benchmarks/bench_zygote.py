@@ -0,0 +1,102 @@
+"""
+Benchmark per-command startup of the tactus CLI with and without a zygote.
+
+Runs `tactus version`, `tactus validate` and `tactus run` on a trivial
+procedure as new processes (the way a shell or a job scheduler starts
+them), first with no zygote so that each command imports the runtime
+itself, then with a zygote serving on a temporary socket so that each
+command is forked from a preloaded process. Reports the median wall-clock
+time per command.
+
+Usage:
+    python benchmarks/bench_zygote.py [--runs 10]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SOURCE = """
+main = procedure("main", {
+    input = {},
+    output = {value = {type = "number"}}
+}, function()
+    return {value = 1}
+end)
+"""
+
+
+def median_ms(args, env, cwd: str, runs: int) -> float:
+    """Return the median wall-clock time of a CLI command, in milliseconds."""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, "-m", "tactus.cli.launcher", *args],
+            env=env,
+            cwd=cwd,
+            capture_output=True,
+        )
+        times.append((time.perf_counter() - start) * 1000)
+        assert completed.returncode == 0, completed.stdout.decode() + completed.stderr.decode()
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    # Short directory name: Unix socket paths are limited to about 100 characters
+    with tempfile.TemporaryDirectory(prefix="tz") as tmp_dir:
+        Path(tmp_dir, "trivial.tac").write_text(SOURCE)
+        socket = Path(tmp_dir) / "zygote.sock"
+        env = {
+            **os.environ,
+            "TACTUS_ZYGOTE_SOCKET": str(socket),
+            "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY", "sk-bench"),
+        }
+        commands = {
+            "version": ["version"],
+            "validate": ["validate", "trivial.tac"],
+            "run": ["run", "trivial.tac"],
+        }
+
+        results = {
+            name: [median_ms(command, env, tmp_dir, args.runs)]
+            for name, command in commands.items()
+        }
+
+        start = time.perf_counter()
+        server = subprocess.Popen(
+            [sys.executable, "-m", "tactus.cli.launcher", "zygote"],
+            env=env,
+            cwd=tmp_dir,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            while not socket.exists():
+                if server.poll() is not None:
+                    sys.exit("The zygote exited")
+                time.sleep(0.01)
+            print(f"zygote ready in {(time.perf_counter() - start) * 1000:.0f} ms\n")
+            for name, command in commands.items():
+                results[name].append(median_ms(command, env, tmp_dir, args.runs))
+        finally:
+            server.terminate()
+            server.wait()
+
+    print(f"{'command':<10} {'in-process ms':>14} {'zygote ms':>10} {'speedup':>8}")
+    print("-" * 45)
+    for name, (cold, forked) in results.items():
+        print(f"{name:<10} {cold:>14.0f} {forked:>10.0f} {cold / forked:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
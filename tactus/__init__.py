@@ -7,22 +7,61 @@ backends for storage, HITL, and chat recording.
 
 __version__ = "0.10.0"
 
-# Core exports
-from tactus.core.runtime import TactusRuntime
-from tactus.core.exceptions import (
-    TactusRuntimeError,
-    ProcedureWaitingForHuman,
-    ProcedureConfigError,
-    LuaSandboxError,
-    OutputValidationError,
-)
-
-# Protocol exports
-from tactus.protocols.storage import StorageBackend, ProcedureMetadata
-from tactus.protocols.models import CheckpointEntry
-from tactus.protocols.hitl import HITLHandler, HITLRequest, HITLResponse
-from tactus.protocols.chat_recorder import ChatRecorder, ChatMessage
-from tactus.protocols.config import TactusConfig, ProcedureConfig
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tactus.core.runtime import TactusRuntime
+    from tactus.core.exceptions import (
+        TactusRuntimeError,
+        ProcedureWaitingForHuman,
+        ProcedureConfigError,
+        LuaSandboxError,
+        OutputValidationError,
+    )
+    from tactus.protocols.storage import StorageBackend, ProcedureMetadata
+    from tactus.protocols.models import CheckpointEntry
+    from tactus.protocols.hitl import HITLHandler, HITLRequest, HITLResponse
+    from tactus.protocols.chat_recorder import ChatRecorder, ChatMessage
+    from tactus.protocols.config import TactusConfig, ProcedureConfig
+
+# Exports are imported on first access: importing the runtime loads pydantic-ai
+# and the provider SDKs, which commands like `tactus version` never need
+_LAZY_EXPORTS = {
+    # Core exports
+    "TactusRuntime": "tactus.core.runtime",
+    "TactusRuntimeError": "tactus.core.exceptions",
+    "ProcedureWaitingForHuman": "tactus.core.exceptions",
+    "ProcedureConfigError": "tactus.core.exceptions",
+    "LuaSandboxError": "tactus.core.exceptions",
+    "OutputValidationError": "tactus.core.exceptions",
+    # Protocol exports
+    "StorageBackend": "tactus.protocols.storage",
+    "ProcedureMetadata": "tactus.protocols.storage",
+    "CheckpointEntry": "tactus.protocols.models",
+    "HITLHandler": "tactus.protocols.hitl",
+    "HITLRequest": "tactus.protocols.hitl",
+    "HITLResponse": "tactus.protocols.hitl",
+    "ChatRecorder": "tactus.protocols.chat_recorder",
+    "ChatMessage": "tactus.protocols.chat_recorder",
+    "TactusConfig": "tactus.protocols.config",
+    "ProcedureConfig": "tactus.protocols.config",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     # Version
@@ -4,6 +4,20 @@ Tactus adapters - Built-in implementations of Tactus protocols.
 
 from tactus.adapters.memory import MemoryStorage
 from tactus.adapters.file_storage import FileStorage
+from tactus.adapters.sqlite_storage import SQLiteStorage
+from tactus.adapters.async_storage import ThreadPoolStorage
+from tactus.adapters.codecs import JSONCodec, MsgpackCodec
+from tactus.adapters.memo_cache import MemoryMemoCache, SQLiteMemoCache
 from tactus.adapters.cli_hitl import CLIHITLHandler
 
-__all__ = ["MemoryStorage", "FileStorage", "CLIHITLHandler"]
+__all__ = [
+    "MemoryStorage",
+    "FileStorage",
+    "SQLiteStorage",
+    "ThreadPoolStorage",
+    "JSONCodec",
+    "MsgpackCodec",
+    "MemoryMemoCache",
+    "SQLiteMemoCache",
+    "CLIHITLHandler",
+]
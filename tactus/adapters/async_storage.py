@@ -0,0 +1,175 @@
+"""
+Asynchronous adapter for synchronous storage backends.
+
+ThreadPoolStorage runs any StorageBackend on a bounded pool of I/O threads and
+exposes it as an AsyncStorageBackend, so hosts running many procedures in one
+event loop are not blocked by storage I/O. Operations are queued per procedure and
+run one at a time in submission order, so a save is never overtaken by a
+later save or load of the same procedure, while different procedures proceed
+in parallel.
+"""
+
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from tactus.protocols.models import ProcedureMetadata, ProcedurePage, ProcedureSummary
+from tactus.protocols.storage import StorageBackend, get_status, patch_state, set_status
+
+# Queue key for listings (procedure IDs are never empty)
+_LISTING_LANE = ""
+
+_Job = Tuple[Future, Callable[..., Any], Tuple[Any, ...]]
+
+
+class ThreadPoolStorage:
+    """
+    AsyncStorageBackend running a synchronous backend on I/O threads.
+
+    The wrapped backend must tolerate calls for different procedures from
+    different threads (MemoryStorage, FileStorage and SQLiteStorage do).
+    """
+
+    def __init__(self, backend: StorageBackend, max_workers: int = 4):
+        """
+        Initialize the adapter.
+
+        Args:
+            backend: Synchronous storage backend to wrap
+            max_workers: Maximum number of concurrent storage operations
+        """
+        self.backend = backend
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="tactus-storage"
+        )
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        # Jobs waiting behind the running job of each busy procedure
+        self._lanes: Dict[str, Deque[_Job]] = {}
+
+    def submit(self, procedure_id: str, fn: Callable[..., Any], *args: Any) -> Future:
+        """
+        Queue a call for a procedure and return a future for its result.
+
+        Calls for the same procedure run in submission order, one at a time.
+        """
+        future: Future = Future()
+        with self._lock:
+            lane = self._lanes.get(procedure_id)
+            if lane is not None:
+                lane.append((future, fn, args))
+                return future
+            self._lanes[procedure_id] = deque()
+        self._executor.submit(self._run, procedure_id, future, fn, args)
+        return future
+
+    def _run(
+        self,
+        procedure_id: str,
+        future: Future,
+        fn: Callable[..., Any],
+        args: Tuple[Any, ...],
+    ) -> None:
+        """Run one job, then hand the procedure's next job back to the pool."""
+        if future.set_running_or_notify_cancel():
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+        with self._lock:
+            lane = self._lanes[procedure_id]
+            if not lane:
+                del self._lanes[procedure_id]
+                if not self._lanes:
+                    self._idle.notify_all()
+                return
+            next_future, next_fn, next_args = lane.popleft()
+        # Resubmit rather than loop so a busy procedure cannot monopolize a worker
+        self._executor.submit(self._run, procedure_id, next_future, next_fn, next_args)
+
+    async def _call(self, procedure_id: str, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run a backend call on the pool and await its result."""
+        return await asyncio.wrap_future(self.submit(procedure_id, fn, *args))
+
+    async def load_procedure_metadata(self, procedure_id: str) -> ProcedureMetadata:
+        """Load complete procedure metadata from storage."""
+        return await self._call(procedure_id, self.backend.load_procedure_metadata, procedure_id)
+
+    async def save_procedure_metadata(self, procedure_id: str, metadata: ProcedureMetadata) -> None:
+        """Save complete procedure metadata to storage."""
+        await self._call(procedure_id, self.backend.save_procedure_metadata, procedure_id, metadata)
+
+    async def update_procedure_status(
+        self, procedure_id: str, status: str, waiting_on_message_id: Optional[str] = None
+    ) -> None:
+        """Update procedure status (and optionally waiting message ID)."""
+        await self._call(
+            procedure_id,
+            self.backend.update_procedure_status,
+            procedure_id,
+            status,
+            waiting_on_message_id,
+        )
+
+    async def get_status(self, procedure_id: str) -> ProcedureSummary:
+        """Read a procedure's status without loading its execution log."""
+        return await self._call(procedure_id, get_status, self.backend, procedure_id)
+
+    async def set_status(
+        self, procedure_id: str, status: str, waiting_on_message_id: Optional[str] = None
+    ) -> None:
+        """Set a procedure's status without rewriting its execution log."""
+        await self._call(
+            procedure_id, set_status, self.backend, procedure_id, status, waiting_on_message_id
+        )
+
+    async def patch_state(self, procedure_id: str, updates: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge keys into a procedure's state without rewriting its execution log."""
+        return await self._call(procedure_id, patch_state, self.backend, procedure_id, updates)
+
+    async def get_state(self, procedure_id: str) -> Dict[str, Any]:
+        """Get mutable state dictionary."""
+        return await self._call(procedure_id, self.backend.get_state, procedure_id)
+
+    async def set_state(self, procedure_id: str, state: Dict[str, Any]) -> None:
+        """Set mutable state dictionary."""
+        await self._call(procedure_id, self.backend.set_state, procedure_id, state)
+
+    async def list_procedures(
+        self, status: Optional[str] = None, limit: int = 100, cursor: Optional[str] = None
+    ) -> ProcedurePage:
+        """List procedures from the status index."""
+        # Listings are not tied to one procedure; they share their own queue
+        return await self._call(_LISTING_LANE, self.backend.list_procedures, status, limit, cursor)
+
+    async def delete_procedure(self, procedure_id: str) -> int:
+        """Delete a procedure's metadata, execution log and index entry."""
+        return await self._call(procedure_id, self.backend.delete_procedure, procedure_id)
+
+    async def fork_procedure(self, procedure_id: str, at_position: int, new_id: str) -> None:
+        """Create a new procedure from the first at_position checkpoints of another."""
+        # Queued behind pending saves of the source so the fork sees them
+        await self._call(
+            procedure_id, self.backend.fork_procedure, procedure_id, at_position, new_id
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the I/O threads.
+
+        Args:
+            wait: If True, block until queued operations have finished;
+                otherwise cancel operations that have not started
+        """
+        with self._idle:
+            if wait:
+                self._idle.wait_for(lambda: not self._lanes)
+            else:
+                for lane in self._lanes.values():
+                    for future, _, _ in lane:
+                        future.cancel()
+                    lane.clear()
+        self._executor.shutdown(wait=wait)
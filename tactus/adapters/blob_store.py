@@ -0,0 +1,211 @@
+"""
+Content-addressed blob store for large checkpoint results.
+
+Large results (full LLM transcripts, tool outputs) are written once to
+{root}/{digest[:2]}/{digest} as zlib-compressed JSON, where digest is the
+SHA-256 of the uncompressed JSON. The checkpoint entry then stores only a
+small reference, so rewriting or appending the execution log never copies the
+payload again, and identical results across checkpoints or procedures are
+stored once.
+
+Blobs are not deleted with the procedures that reference them, since other
+checkpoints may share them. sweep() deletes the blobs outside a given set of
+referenced digests; storage backends build that set from their checkpoints
+(see collect_unreferenced_blobs in tactus.core.garbage_collection).
+"""
+
+import hashlib
+import json
+import os
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Set, Tuple
+
+from tactus.protocols.models import LazyResult
+
+# Key marking a stored result as a reference into the blob store
+BLOB_REF_KEY = "$blob"
+# Serialized references are far smaller than this; larger stored results are
+# never references, so they can be skipped without being decoded
+REF_MAX_BYTES = 256
+
+
+class BlobReference(LazyResult):
+    """A checkpoint result held in a BlobStore, fetched on first use."""
+
+    __slots__ = ("store", "digest", "size", "_loaded", "_value")
+
+    def __init__(self, store: "BlobStore", digest: str, size: int):
+        self.store = store
+        self.digest = digest
+        self.size = size
+        self._loaded = False
+        self._value: Any = None
+
+    def load(self) -> Any:
+        """Read and decode the blob (cached after the first call)."""
+        if not self._loaded:
+            self._value = json.loads(self.store.get(self.digest))
+            self._loaded = True
+        return self._value
+
+    def to_ref(self) -> dict:
+        """Return the stored reference form of this blob."""
+        return {BLOB_REF_KEY: self.digest, "size": self.size}
+
+    def __repr__(self) -> str:
+        return f"BlobReference({self.digest[:12]}, size={self.size})"
+
+
+class BlobStore:
+    """
+    Content-addressed store of compressed JSON blobs.
+
+    Writes are atomic (temp file + rename) and idempotent: putting bytes that
+    are already stored is a no-op.
+    """
+
+    def __init__(self, root: str, threshold: int = 64 * 1024, compress_level: int = 6):
+        """
+        Initialize the blob store.
+
+        Args:
+            root: Directory holding the blobs (created lazily on first write)
+            threshold: Serialized size in bytes at or above which results are
+                moved out of the checkpoint entry
+            compress_level: zlib compression level (0-9)
+        """
+        self.root = Path(root).expanduser()
+        self.threshold = threshold
+        self.compress_level = compress_level
+
+    def _get_blob_path(self, digest: str) -> Path:
+        """Get the file path for a blob digest."""
+        return self.root / digest[:2] / digest
+
+    def put(self, data: bytes) -> str:
+        """
+        Store bytes and return their SHA-256 digest.
+
+        Args:
+            data: Uncompressed payload
+
+        Returns:
+            Hex digest identifying the blob
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        blob_path = self._get_blob_path(digest)
+        if blob_path.exists():
+            try:
+                # Newly referenced: keep a concurrent sweep from deleting it
+                os.utime(blob_path)
+                return digest
+            except FileNotFoundError:
+                pass  # Swept meanwhile; write it again
+
+        tmp_path = blob_path.with_name(f"{digest}.{os.getpid()}.tmp")
+        try:
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(zlib.compress(data, self.compress_level))
+            os.replace(tmp_path, blob_path)
+        except (IOError, OSError) as e:
+            raise RuntimeError(f"Failed to write blob {blob_path}: {e}")
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        """
+        Read the uncompressed bytes of a blob.
+
+        Raises:
+            RuntimeError: If the blob is missing or corrupt
+        """
+        blob_path = self._get_blob_path(digest)
+        try:
+            with open(blob_path, "rb") as f:
+                return zlib.decompress(f.read())
+        except (IOError, OSError, zlib.error) as e:
+            raise RuntimeError(f"Failed to read blob {blob_path}: {e}")
+
+    def digests(self) -> Iterator[str]:
+        """Yield the digest of every stored blob."""
+        if not self.root.is_dir():
+            return
+        for shard in self.root.iterdir():
+            if not shard.is_dir():
+                continue
+            for blob_path in shard.iterdir():
+                if not blob_path.name.endswith(".tmp"):
+                    yield blob_path.name
+
+    def sweep(
+        self, referenced: Set[str], min_age_seconds: float = 3600.0, dry_run: bool = False
+    ) -> Tuple[List[str], int]:
+        """
+        Delete blobs that are not referenced.
+
+        Blobs written or re-referenced within min_age_seconds are kept, since
+        the checkpoints referencing them may not have been saved yet.
+
+        Args:
+            referenced: Digests still referenced by stored checkpoints
+            min_age_seconds: Minimum time since a blob was last written
+            dry_run: If True, only report what would be deleted
+
+        Returns:
+            Deleted (or, for dry runs, unreferenced) digests and bytes freed
+        """
+        cutoff = time.time() - min_age_seconds
+        deleted: List[str] = []
+        reclaimed = 0
+        for digest in list(self.digests()):
+            if digest in referenced:
+                continue
+            blob_path = self._get_blob_path(digest)
+            try:
+                info = blob_path.stat()
+                if info.st_mtime > cutoff:
+                    continue
+                if not dry_run:
+                    blob_path.unlink()
+                    reclaimed += info.st_size
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                raise RuntimeError(f"Failed to delete blob {blob_path}: {e}")
+            deleted.append(digest)
+        return deleted, reclaimed
+
+    def externalize(self, result: Any) -> Any:
+        """
+        Convert a checkpoint result to its stored form.
+
+        Results whose JSON encoding reaches the threshold are written to the
+        store and replaced by a reference; smaller results are returned as-is.
+        """
+        if isinstance(result, BlobReference) and result.store.root == self.root:
+            return result.to_ref()
+        if isinstance(result, LazyResult):
+            result = result.load()
+        if result is None or isinstance(result, (bool, int, float)):
+            return result
+
+        data = json.dumps(result, separators=(",", ":"), default=str).encode("utf-8")
+        if len(data) < self.threshold:
+            return result
+        return {BLOB_REF_KEY: self.put(data), "size": len(data)}
+
+    def internalize(self, stored: Any) -> Any:
+        """Convert a stored result back, turning references into BlobReferences."""
+        digest = self.ref_digest(stored)
+        if digest is None:
+            return stored
+        return BlobReference(self, digest, stored.get("size", 0))
+
+    @staticmethod
+    def ref_digest(stored: Any) -> Optional[str]:
+        """Return the digest if a stored result is a blob reference, else None."""
+        if isinstance(stored, dict) and len(stored) == 2 and BLOB_REF_KEY in stored:
+            return stored[BLOB_REF_KEY]
+        return None
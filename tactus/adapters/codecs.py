@@ -0,0 +1,144 @@
+"""
+Storage codecs for Tactus.
+
+- JSONCodec: human-readable JSON (pretty-printed by default), for debugging.
+- MsgpackCodec: compact binary MessagePack encoding (requires the optional
+  ``msgpack`` package: ``pip install tactus[msgpack]``).
+
+Both convert datetimes to float epoch seconds and pydantic models to plain
+data. Values with no faithful encoding are stringified with a warning, or
+rejected when the codec is created with strict=True.
+"""
+
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, Optional, Set, Type, Union
+
+from pydantic import BaseModel
+
+from tactus.protocols.codec import StorageCodec
+from tactus.protocols.models import LazyResult
+
+logger = logging.getLogger(__name__)
+
+# Version of the document layout written by storage backends; bumped when the
+# layout changes (2: float epoch timestamps, codec-encoded documents)
+SCHEMA_VERSION = 2
+
+# Types already warned about, so a procedure checkpointing the same kind of
+# value repeatedly logs once
+_warned_types: Set[type] = set()
+
+
+def _to_plain(value: Any, strict: bool) -> Any:
+    """Convert a value the encoder does not support natively."""
+    if isinstance(value, LazyResult):
+        return value.load()
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if strict:
+        raise TypeError(f"Object of type {type(value).__name__} cannot be stored")
+    if type(value) not in _warned_types:
+        _warned_types.add(type(value))
+        logger.warning(f"Storing {type(value).__name__} value as a string")
+    return str(value)
+
+
+class JSONCodec:
+    """JSON codec (UTF-8 text)."""
+
+    name = "json"
+    extension = ".json"
+    binary = False
+
+    def __init__(self, indent: Optional[int] = 2, strict: bool = False):
+        """
+        Initialize the codec.
+
+        Args:
+            indent: Indentation for pretty-printing (None for compact output)
+            strict: If True, raise on values that cannot be encoded faithfully
+        """
+        self.indent = indent
+        self.strict = strict
+        self._separators = None if indent is not None else (",", ":")
+
+    def encode(self, value: Any) -> bytes:
+        """Encode a document as JSON."""
+        return json.dumps(
+            value,
+            indent=self.indent,
+            separators=self._separators,
+            default=lambda v: _to_plain(v, self.strict),
+        ).encode("utf-8")
+
+    def decode(self, data: bytes) -> Any:
+        """Decode a JSON document."""
+        return json.loads(data)
+
+
+class MsgpackCodec:
+    """MessagePack codec (binary)."""
+
+    name = "msgpack"
+    extension = ".msgpack"
+    binary = True
+
+    def __init__(self, strict: bool = False):
+        """
+        Initialize the codec.
+
+        Args:
+            strict: If True, raise on values that cannot be encoded faithfully
+
+        Raises:
+            RuntimeError: If the msgpack package is not installed
+        """
+        try:
+            import msgpack
+        except ImportError:
+            raise RuntimeError(
+                "The msgpack codec requires the 'msgpack' package "
+                "(install with: pip install tactus[msgpack])"
+            )
+        self.strict = strict
+        self._packer_default = lambda v: _to_plain(v, self.strict)
+        self._msgpack = msgpack
+
+    def encode(self, value: Any) -> bytes:
+        """Encode a document as MessagePack."""
+        return self._msgpack.packb(value, use_bin_type=True, default=self._packer_default)
+
+    def decode(self, data: bytes) -> Any:
+        """Decode a MessagePack document (non-string map keys are preserved)."""
+        return self._msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+CODECS: Dict[str, Type[StorageCodec]] = {
+    JSONCodec.name: JSONCodec,
+    MsgpackCodec.name: MsgpackCodec,
+}
+
+
+def get_codec(codec: Union[str, StorageCodec, None] = None) -> StorageCodec:
+    """
+    Resolve a codec name (or instance) to a codec instance.
+
+    Args:
+        codec: Codec name from CODECS, a codec instance, or None for JSON
+
+    Raises:
+        ValueError: If the name is unknown
+    """
+    if codec is None:
+        return JSONCodec()
+    if not isinstance(codec, str):
+        return codec
+    if codec not in CODECS:
+        raise ValueError(f"Unknown storage codec '{codec}' (expected one of: {', '.join(CODECS)})")
+    return CODECS[codec]()
@@ -1,82 +1,704 @@
 """
 File-based storage backend for Tactus.
 
-Stores procedure metadata and execution log as JSON files on disk.
+Stores procedure metadata and execution log as files on disk, encoded with a
+StorageCodec: pretty-printed JSON by default, or compact binary MessagePack
+(codec="msgpack"). Documents carry a schema_version tag and store timestamps as
+float epoch seconds; files written by older versions (ISO timestamps, no tag)
+still load.
+
+Two layouts are supported:
+
+- Document mode (default): a single {procedure_id}.json (or .msgpack) file
+  holding the complete metadata, rewritten on every save.
+- Journal mode: a small {procedure_id}.json (or .msgpack) header (status,
+  state, replay_index) plus an append-only {procedure_id}.journal file with one
+  compact JSON record per line. Saving after a checkpoint appends one record
+  instead of rewriting the whole execution log, so N checkpoints cost O(N)
+  bytes instead of O(N^2).
+
+With blob_threshold set, results at or above that size are kept in a
+content-addressed BlobStore under {storage_dir}/blobs and the execution log
+holds only a reference, loaded on demand when the checkpoint is replayed.
+
+With shard=True, procedure files live in 256 subdirectories named by the
+first two hex digits of the SHA-256 of the procedure ID
+({storage_dir}/3f/{procedure_id}.json), so no single directory grows past a
+few thousand files. Sharding an existing flat directory moves its files once;
+the directory is marked as sharded and later opens follow that layout.
+
+get_status() reads the status index. set_status(), set_state() and
+patch_state() rewrite only the header of journaled procedures; for
+document-mode procedures they write a small {procedure_id}.header.json (or
+.msgpack) sidecar whose fields override the document's until the next full
+save replaces both.
+
+Procedure status, waiting_on_message_id and updated_at are also kept in a
+StatusIndex ({storage_dir}/index.db) so list_procedures() never scans the
+directory. An existing directory is indexed once when the index is created.
+
+Loading a journaled procedure builds only an index: each journal record keeps
+its result last, so the entry fields are parsed from the start of the line and
+the result is left in place as a JournalResult pointing into a memory map of
+the journal. Results are decoded when replay reaches them.
 """
 
+import hashlib
 import json
+import mmap
+import os
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional, Dict
-from datetime import datetime
+from typing import Any, Callable, Optional, Dict, Iterator, List, Set, Tuple, Union
+from datetime import datetime, timezone
+
+from tactus.adapters.blob_store import REF_MAX_BYTES, BlobReference, BlobStore
+from tactus.adapters.codecs import CODECS, SCHEMA_VERSION, JSONCodec, get_codec
+from tactus.adapters.status_index import StatusIndex
+from tactus.protocols.codec import StorageCodec
+from tactus.protocols.models import (
+    ProcedureMetadata,
+    ProcedurePage,
+    ProcedureSummary,
+    CheckpointEntry,
+    LazyResult,
+)
+
+# Marker stored in the header file of journaled procedures
+JOURNAL_FORMAT = "journal"
+
+# Journal records end with the result: {"op":"append","entry":{...,"result":<value>}}
+_APPEND_PREFIX = b'{"op":"append",'
+_RESULT_KEY = b',"result":'
+_RECORD_SUFFIX = b"}}"
+
+# Journal records are always compact JSON lines (indexed in place on load)
+_JOURNAL_CODEC = JSONCodec(indent=None)
+
+# Status index file inside the storage directory
+_INDEX_FILE = "index.db"
+
+# Sidecar of document-mode procedures holding fields set by partial updates:
+# {procedure_id}.header{codec.extension}
+_HEADER_SUFFIX = ".header"
+_HEADER_FIELDS = ("status", "waiting_on_message_id", "state")
+
+# Marker file of a storage directory using the sharded layout
+_SHARDED_MARKER = ".sharded"
+
+# Number of leading hex digits of the procedure ID hash naming its shard
+_SHARD_DIGITS = 2
+
+# Saves that leave status unchanged refresh the index's updated_at at most this often
+_INDEX_REFRESH_SECONDS = 1.0
+
+
+def _parse_timestamp(value: Union[float, str]) -> datetime:
+    """Parse a stored timestamp (float epoch seconds, or ISO 8601 in older files)."""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return datetime.fromtimestamp(value, tz=timezone.utc)
+
+
+class JournalResult(LazyResult):
+    """A checkpoint result left in place in a memory-mapped journal file."""
+
+    __slots__ = ("_journal", "_start", "_end", "_blobs", "_loaded", "_value")
 
-from tactus.protocols.models import ProcedureMetadata, CheckpointEntry
+    def __init__(self, journal: mmap.mmap, start: int, end: int, blobs: "BlobStore"):
+        self._journal = journal
+        self._start = start
+        self._end = end
+        self._blobs = blobs
+        self._loaded = False
+        self._value: Any = None
+
+    def load(self) -> Any:
+        """Decode the result bytes (cached after the first call)."""
+        if not self._loaded:
+            value = json.loads(self._journal[self._start : self._end])
+            if BlobStore.ref_digest(value) is not None:
+                value = self._blobs.internalize(value).load()
+            self._value = value
+            self._loaded = True
+        return self._value
+
+    def blob_digest(self) -> Optional[str]:
+        """Digest of the blob holding the result (None if stored inline), without reading it."""
+        if self._end - self._start > REF_MAX_BYTES:
+            return None
+        return BlobStore.ref_digest(json.loads(self._journal[self._start : self._end]))
+
+
+@dataclass
+class _JournalInfo:
+    """Bookkeeping for a procedure's journal file."""
+
+    entries: int = 0  # Live checkpoint entries after replaying the journal
+    records: int = 0  # Records physically present in the journal file
 
 
 class FileStorage:
     """
     File-based storage backend.
 
-    Stores each procedure's metadata in a separate JSON file:
-    {storage_dir}/{procedure_id}.json
+    Stores each procedure's metadata in a separate file:
+    {storage_dir}/{procedure_id}{codec.extension}
+
+    In journal mode the execution log lives in an append-only
+    {storage_dir}/{procedure_id}.journal file next to the header.
+
+    With sharding, both live in a {storage_dir}/{shard}/ subdirectory.
     """
 
-    def __init__(self, storage_dir: str = "~/.tactus/storage"):
+    def __init__(
+        self,
+        storage_dir: str = "~/.tactus/storage",
+        journal: bool = False,
+        compact_threshold: int = 1000,
+        blob_threshold: Optional[int] = None,
+        codec: Union[str, StorageCodec, None] = None,
+        shard: Optional[bool] = None,
+    ):
         """
         Initialize file storage.
 
         Args:
             storage_dir: Directory to store procedure files
+            journal: If True, append checkpoints to a per-procedure journal
+                instead of rewriting the full document on every save
+            compact_threshold: Number of superseded journal records (left behind
+                by truncations such as checkpoint_clear_after) tolerated before
+                the journal is rewritten
+            blob_threshold: Serialized result size in bytes at or above which
+                results are moved to the blob store (None disables blobs)
+            codec: Encoding for metadata documents: "json" (default), "msgpack",
+                or a StorageCodec instance
+            shard: If True, store procedure files in hashed subdirectories
+                (moving any flat files there); None follows the directory's
+                existing layout
+
+        Raises:
+            ValueError: If shard is False but the directory is already sharded
         """
         self.storage_dir = Path(storage_dir).expanduser()
         self.storage_dir.mkdir(parents=True, exist_ok=True)
+        marker = self.storage_dir / _SHARDED_MARKER
+        if shard is False and marker.exists():
+            raise ValueError(f"Storage directory {self.storage_dir} uses the sharded layout")
+        self.shard = bool(shard) or marker.exists()
+        # Shard directories known to exist
+        self._shards: Set[str] = set()
+        self.journal = journal
+        self.compact_threshold = compact_threshold
+        self.codec = get_codec(codec)
+        self._journals: Dict[str, _JournalInfo] = {}
+        # Procedures whose documents in other codecs have been cleaned up
+        self._single_format: Set[str] = set()
+        self._index: Optional[StatusIndex] = None
+        # Last (status, waiting_on_message_id, monotonic time) written to the index
+        self._indexed: Dict[str, Tuple[str, Optional[str], float]] = {}
+        self.blobs: Optional[BlobStore] = None
+        if blob_threshold is not None:
+            self.blobs = BlobStore(str(self.storage_dir / "blobs"), threshold=blob_threshold)
+        if self.shard and not marker.exists():
+            self._shard_flat_files()
+
+    def _procedure_dir(self, procedure_id: str) -> Path:
+        """Get the directory holding a procedure's files."""
+        if not self.shard:
+            return self.storage_dir
+        digest = hashlib.sha256(procedure_id.encode("utf-8")).hexdigest()
+        return self.storage_dir / digest[:_SHARD_DIGITS]
+
+    def _ensure_procedure_dir(self, procedure_id: str) -> Path:
+        """Get the directory holding a procedure's files, creating its shard."""
+        directory = self._procedure_dir(procedure_id)
+        if self.shard and directory.name not in self._shards:
+            directory.mkdir(exist_ok=True)
+            self._shards.add(directory.name)
+        return directory
+
+    def _shard_flat_files(self) -> None:
+        """Move procedure files from the top-level directory into their shards."""
+        suffixes = {codec_class.extension for codec_class in CODECS.values()} | {".journal"}
+        try:
+            for path in list(self.storage_dir.iterdir()):
+                if path.suffix in suffixes and path.is_file():
+                    procedure_id = path.stem.removesuffix(_HEADER_SUFFIX)
+                    os.replace(path, self._ensure_procedure_dir(procedure_id) / path.name)
+            # Written last, so an interrupted migration is finished on the next open
+            (self.storage_dir / _SHARDED_MARKER).touch()
+        except OSError as e:
+            raise RuntimeError(f"Failed to shard storage directory {self.storage_dir}: {e}")
+
+    def _procedure_files(self) -> Iterator[Path]:
+        """Yield every procedure document path, in any codec."""
+        extensions = {codec_class.extension for codec_class in CODECS.values()}
+        directories = [self.storage_dir]
+        if self.shard:
+            directories = [
+                path
+                for path in self.storage_dir.iterdir()
+                if len(path.name) == _SHARD_DIGITS and path.is_dir()
+            ]
+        for directory in directories:
+            for path in directory.iterdir():
+                if (
+                    path.suffix in extensions
+                    and not path.stem.endswith(_HEADER_SUFFIX)
+                    and path.is_file()
+                ):
+                    yield path
+
+    def _journal_files(self) -> Iterator[Path]:
+        """Yield every journal path."""
+        directories = [self.storage_dir]
+        if self.shard:
+            directories = [
+                path
+                for path in self.storage_dir.iterdir()
+                if len(path.name) == _SHARD_DIGITS and path.is_dir()
+            ]
+        for directory in directories:
+            yield from directory.glob("*.journal")
 
     def _get_file_path(self, procedure_id: str) -> Path:
         """Get the file path for a procedure."""
-        return self.storage_dir / f"{procedure_id}.json"
+        return self._procedure_dir(procedure_id) / f"{procedure_id}{self.codec.extension}"
+
+    def _other_file_paths(self, procedure_id: str) -> Dict[str, Path]:
+        """Get the paths a procedure's document would have under the other codecs."""
+        directory = self._procedure_dir(procedure_id)
+        return {
+            name: directory / f"{procedure_id}{codec_class.extension}"
+            for name, codec_class in CODECS.items()
+            if codec_class.extension != self.codec.extension
+        }
+
+    def _get_journal_path(self, procedure_id: str) -> Path:
+        """Get the journal file path for a procedure."""
+        return self._procedure_dir(procedure_id) / f"{procedure_id}.journal"
+
+    def _get_header_path(self, procedure_id: str) -> Path:
+        """Get the sidecar header path for a procedure."""
+        return self._procedure_dir(procedure_id) / (
+            f"{procedure_id}{_HEADER_SUFFIX}{self.codec.extension}"
+        )
+
+    def _other_header_paths(self, procedure_id: str) -> Dict[str, Path]:
+        """Get the paths a procedure's sidecar header would have under the other codecs."""
+        directory = self._procedure_dir(procedure_id)
+        return {
+            name: directory / f"{procedure_id}{_HEADER_SUFFIX}{codec_class.extension}"
+            for name, codec_class in CODECS.items()
+            if codec_class.extension != self.codec.extension
+        }
+
+    def _read_header(self, procedure_id: str) -> Optional[dict]:
+        """Read a procedure's sidecar header (None if it has none)."""
+        path = self._get_header_path(procedure_id)
+        codec = self.codec
+        if not path.exists():
+            # Only resolve another codec once its header is found: the msgpack
+            # codec cannot be created without msgpack installed
+            for name, other_path in self._other_header_paths(procedure_id).items():
+                if other_path.exists():
+                    path, codec = other_path, get_codec(name)
+                    break
+            else:
+                return None
+
+        try:
+            with open(path, "rb") as f:
+                return codec.decode(f.read())
+        except (ValueError, IOError) as e:
+            raise RuntimeError(f"Failed to read procedure header {path}: {e}")
+
+    def _write_header(self, procedure_id: str, header: dict) -> None:
+        """Write a procedure's sidecar header (atomically, via a temp file)."""
+        path = self._get_header_path(procedure_id)
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        try:
+            payload = self.codec.encode(header)
+        except (TypeError, ValueError) as e:
+            raise RuntimeError(f"Failed to encode procedure {procedure_id}: {e}")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+            for other_path in self._other_header_paths(procedure_id).values():
+                other_path.unlink(missing_ok=True)
+        except (IOError, OSError) as e:
+            raise RuntimeError(f"Failed to write procedure header {path}: {e}")
+        self._index_status(
+            procedure_id, header.get("status", "RUNNING"), header.get("waiting_on_message_id")
+        )
+
+    def _update_header(self, procedure_id: str, update: Callable[[dict], None]) -> bool:
+        """
+        Apply update() to a procedure's status and state without touching its
+        execution log.
+
+        Journaled procedures have their header rewritten; document-mode
+        procedures get a sidecar header.
+
+        Returns:
+            False if the procedure is not stored yet (nothing was written)
+        """
+        header = self._read_header(procedure_id)
+        if header is None:
+            data = self._read_file(procedure_id)
+            if not data:
+                return False
+            if data.get("format") == JOURNAL_FORMAT:
+                update(data)
+                self._write_file(procedure_id, data)
+                return True
+            header = {field: data[field] for field in _HEADER_FIELDS if field in data}
+        update(header)
+        self._write_header(procedure_id, header)
+        return True
 
     def _read_file(self, procedure_id: str) -> dict:
-        """Read procedure file, return empty dict if not found."""
+        """
+        Read procedure file, return empty dict if not found.
+
+        A document written with a different codec (e.g. before switching from
+        JSON to msgpack) is read with that codec.
+        """
         file_path = self._get_file_path(procedure_id)
+        codec = self.codec
         if not file_path.exists():
-            return {}
+            for name, other_path in self._other_file_paths(procedure_id).items():
+                if other_path.exists():
+                    file_path, codec = other_path, get_codec(name)
+                    break
+            else:
+                return {}
 
         try:
-            with open(file_path, "r") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
+            with open(file_path, "rb") as f:
+                return codec.decode(f.read())
+        except (ValueError, IOError) as e:
             raise RuntimeError(f"Failed to read procedure file {file_path}: {e}")
 
     def _write_file(self, procedure_id: str, data: dict) -> None:
-        """Write procedure data to file."""
+        """Write procedure data to file (atomically, via a temp file)."""
+        self._ensure_procedure_dir(procedure_id)
         file_path = self._get_file_path(procedure_id)
+        tmp_path = file_path.with_name(f"{file_path.name}.tmp")
+
+        try:
+            payload = self.codec.encode({"schema_version": SCHEMA_VERSION, **data})
+        except (TypeError, ValueError) as e:
+            raise RuntimeError(f"Failed to encode procedure {procedure_id}: {e}")
 
         try:
-            with open(file_path, "w") as f:
-                json.dump(data, f, indent=2, default=str)
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, file_path)
+            # The full write supersedes any sidecar header from partial updates
+            self._get_header_path(procedure_id).unlink(missing_ok=True)
+            if procedure_id not in self._single_format:
+                # Drop stale files left by another codec so they are never read
+                paths = [
+                    *self._other_file_paths(procedure_id).values(),
+                    *self._other_header_paths(procedure_id).values(),
+                ]
+                for other_path in paths:
+                    if other_path.exists():
+                        other_path.unlink()
+                self._single_format.add(procedure_id)
         except (IOError, OSError) as e:
             raise RuntimeError(f"Failed to write procedure file {file_path}: {e}")
 
+        self._index_status(
+            procedure_id, data.get("status", "RUNNING"), data.get("waiting_on_message_id")
+        )
+
+    def _get_index(self) -> StatusIndex:
+        """Open the status index, indexing existing procedure files if it is new."""
+        if self._index is None:
+            self._index = StatusIndex(str(self.storage_dir / _INDEX_FILE))
+            if self._index.created:
+                self.rebuild_index()
+        return self._index
+
+    def _index_status(
+        self, procedure_id: str, status: str, waiting_on_message_id: Optional[str]
+    ) -> None:
+        """Record a procedure's status in the index (skipping redundant refreshes)."""
+        now = time.monotonic()
+        last = self._indexed.get(procedure_id)
+        if (
+            last is not None
+            and last[:2] == (status, waiting_on_message_id)
+            and now - last[2] < _INDEX_REFRESH_SECONDS
+        ):
+            return
+        self._get_index().update(procedure_id, status, waiting_on_message_id)
+        self._indexed[procedure_id] = (status, waiting_on_message_id, now)
+
+    def rebuild_index(self) -> int:
+        """
+        Re-index every procedure document in the storage directory.
+
+        Returns:
+            Number of procedures indexed
+        """
+        if self._index is None:
+            self._index = StatusIndex(str(self.storage_dir / _INDEX_FILE))
+        index = self._index
+        count = 0
+        for path in self._procedure_files():
+            data = self._read_file(path.stem)
+            if not data:
+                continue
+            data.update(self._read_header(path.stem) or {})
+            index.update(
+                path.stem,
+                data.get("status", "RUNNING"),
+                data.get("waiting_on_message_id"),
+                updated_at=path.stat().st_mtime,
+            )
+            count += 1
+        return count
+
+    def list_procedures(
+        self, status: Optional[str] = None, limit: int = 100, cursor: Optional[str] = None
+    ) -> ProcedurePage:
+        """List procedures from the status index, without reading procedure files."""
+        return self._get_index().list_procedures(status=status, limit=limit, cursor=cursor)
+
+    def _entry_to_dict(self, entry: CheckpointEntry) -> dict:
+        """Convert a checkpoint entry to its stored dict form."""
+        result = entry.result
+        if self.blobs is not None:
+            result = self.blobs.externalize(result)
+        elif isinstance(result, LazyResult):
+            result = result.load()
+
+        # The result must stay the last key so journal loading can index
+        # records without decoding results
+        return {
+            "position": entry.position,
+            "type": entry.type,
+            "timestamp": entry.timestamp.timestamp(),
+            "duration_ms": entry.duration_ms,
+            "input_hash": entry.input_hash,
+            "result": result,
+        }
+
+    def _entry_from_dict(self, entry_data: dict) -> CheckpointEntry:
+        """Convert a stored dict back to a checkpoint entry."""
+        result = entry_data["result"]
+        if BlobStore.ref_digest(result) is not None:
+            result = self._get_blob_store().internalize(result)
+
+        return CheckpointEntry(
+            position=entry_data["position"],
+            type=entry_data["type"],
+            result=result,
+            timestamp=_parse_timestamp(entry_data["timestamp"]),
+            duration_ms=entry_data.get("duration_ms"),
+            input_hash=entry_data.get("input_hash"),
+        )
+
+    def referenced_blobs(self) -> Set[str]:
+        """
+        Digests of the blobs referenced by any stored checkpoint.
+
+        Reads every procedure's execution log, but no blob contents.
+        """
+        procedure_ids = {path.stem for path in self._procedure_files()}
+        procedure_ids.update(path.stem for path in self._journal_files())
+        referenced: Set[str] = set()
+        for procedure_id in procedure_ids:
+            for entry in self.load_procedure_metadata(procedure_id).execution_log:
+                result = entry.result
+                if isinstance(result, BlobReference):
+                    referenced.add(result.digest)
+                elif isinstance(result, JournalResult):
+                    digest = result.blob_digest()
+                    if digest is not None:
+                        referenced.add(digest)
+        return referenced
+
+    def collect_blobs(
+        self, min_age_seconds: float = 3600.0, dry_run: bool = False
+    ) -> Tuple[List[str], int]:
+        """
+        Delete blobs that no stored checkpoint references (see BlobStore.sweep).
+
+        Returns:
+            Deleted (or, for dry runs, unreferenced) digests and bytes freed
+        """
+        return self._get_blob_store().sweep(self.referenced_blobs(), min_age_seconds, dry_run)
+
+    def _get_blob_store(self) -> BlobStore:
+        """
+        Get the blob store for resolving references.
+
+        References are resolved even if this instance has blobs disabled, so
+        procedures stay readable across configurations.
+        """
+        return self.blobs or BlobStore(str(self.storage_dir / "blobs"))
+
+    def _map_journal(self, journal_path: Path) -> Optional[mmap.mmap]:
+        """
+        Memory-map a journal file read-only, or return None if it is empty.
+
+        A torn final record (from a crash mid-append) is trimmed from the file
+        first so later appends start on a clean line.
+        """
+        try:
+            with open(journal_path, "r+b") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size == 0:
+                    return None
+                journal = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                complete_length = journal.rfind(b"\n") + 1
+                if complete_length < size:
+                    journal.close()
+                    f.truncate(complete_length)
+                    if complete_length == 0:
+                        return None
+                    journal = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                return journal
+        except (IOError, OSError) as e:
+            raise RuntimeError(f"Failed to read journal file {journal_path}: {e}")
+
+    @staticmethod
+    def _index_record(
+        journal: mmap.mmap, start: int, end: int, blobs: BlobStore
+    ) -> Optional[CheckpointEntry]:
+        """
+        Build a checkpoint entry for an append record without decoding its result.
+
+        Returns None for records that cannot be indexed (other ops, or records
+        whose result is not the last key), which the caller decodes in full.
+        """
+        if journal[start : start + len(_APPEND_PREFIX)] != _APPEND_PREFIX:
+            return None
+        # JSON strings escape quotes, so the first match is the result key
+        split = journal.find(_RESULT_KEY, start, end)
+        if split < 0:
+            return None
+
+        entry_data = json.loads((journal[start:split] + _RECORD_SUFFIX).decode("utf-8"))["entry"]
+        if "timestamp" not in entry_data:
+            return None
+
+        return CheckpointEntry(
+            position=entry_data["position"],
+            type=entry_data["type"],
+            result=JournalResult(
+                journal,
+                split + len(_RESULT_KEY),
+                end - len(_RECORD_SUFFIX),
+                blobs,
+            ),
+            timestamp=_parse_timestamp(entry_data["timestamp"]),
+            duration_ms=entry_data.get("duration_ms"),
+            input_hash=entry_data.get("input_hash"),
+        )
+
+    def _read_journal(self, procedure_id: str) -> List[CheckpointEntry]:
+        """
+        Replay a procedure's journal into an execution log index.
+
+        Entry results are JournalResults that decode from the memory-mapped
+        journal on first use.
+        """
+        journal_path = self._get_journal_path(procedure_id)
+        execution_log: List[CheckpointEntry] = []
+        records = 0
+
+        journal = self._map_journal(journal_path) if journal_path.exists() else None
+        if journal is not None:
+            blobs = self._get_blob_store()
+            start = 0
+            length = len(journal)
+            while start < length:
+                end = journal.find(b"\n", start)
+                line_start, start = start, end + 1
+                if end == line_start:
+                    continue
+                try:
+                    entry = self._index_record(journal, line_start, end, blobs)
+                    if entry is not None:
+                        records += 1
+                        execution_log.append(entry)
+                        continue
+
+                    record = json.loads(journal[line_start:end])
+                except (json.JSONDecodeError, KeyError) as e:
+                    raise RuntimeError(f"Corrupt record in journal file {journal_path}: {e}")
+                records += 1
+                if record["op"] == "append":
+                    execution_log.append(self._entry_from_dict(record["entry"]))
+                elif record["op"] == "truncate":
+                    del execution_log[record["length"] :]
+
+        self._journals[procedure_id] = _JournalInfo(entries=len(execution_log), records=records)
+        return execution_log
+
+    def _append_journal(self, procedure_id: str, records: List[dict]) -> None:
+        """Append records to a procedure's journal, one JSON document per line."""
+        self._ensure_procedure_dir(procedure_id)
+        journal_path = self._get_journal_path(procedure_id)
+        payload = b"".join(_JOURNAL_CODEC.encode(record) + b"\n" for record in records)
+
+        try:
+            with open(journal_path, "ab") as f:
+                f.write(payload)
+        except (IOError, OSError) as e:
+            raise RuntimeError(f"Failed to append to journal file {journal_path}: {e}")
+
+    def compact(self, procedure_id: str, metadata: Optional[ProcedureMetadata] = None) -> None:
+        """
+        Rewrite a procedure's journal so it holds only the live execution log.
+
+        Args:
+            procedure_id: Unique procedure identifier
+            metadata: Already-loaded metadata to compact from (avoids a reload)
+        """
+        if metadata is None:
+            metadata = self.load_procedure_metadata(procedure_id)
+
+        self._ensure_procedure_dir(procedure_id)
+        journal_path = self._get_journal_path(procedure_id)
+        tmp_path = journal_path.with_suffix(".journal.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                for entry in metadata.execution_log:
+                    record = {"op": "append", "entry": self._entry_to_dict(entry)}
+                    f.write(_JOURNAL_CODEC.encode(record) + b"\n")
+            os.replace(tmp_path, journal_path)
+        except (IOError, OSError) as e:
+            raise RuntimeError(f"Failed to compact journal file {journal_path}: {e}")
+
+        entries = len(metadata.execution_log)
+        self._journals[procedure_id] = _JournalInfo(entries=entries, records=entries)
+
     def load_procedure_metadata(self, procedure_id: str) -> ProcedureMetadata:
         """Load procedure metadata from file."""
         data = self._read_file(procedure_id)
 
-        if not data:
+        if data.get("format") == JOURNAL_FORMAT or self._get_journal_path(procedure_id).exists():
+            execution_log = self._read_journal(procedure_id)
+        elif not data:
             # Create new metadata
             return ProcedureMetadata(procedure_id=procedure_id)
-
-        # Convert stored execution log back to CheckpointEntry objects
-        execution_log = []
-        for entry_data in data.get("execution_log", []):
-            execution_log.append(
-                CheckpointEntry(
-                    position=entry_data["position"],
-                    type=entry_data["type"],
-                    result=entry_data["result"],
-                    timestamp=datetime.fromisoformat(entry_data["timestamp"]),
-                    duration_ms=entry_data.get("duration_ms"),
-                    input_hash=entry_data.get("input_hash"),
-                )
-            )
+        else:
+            # Convert stored execution log back to CheckpointEntry objects
+            execution_log = [
+                self._entry_from_dict(entry_data) for entry_data in data.get("execution_log", [])
+            ]
+            # Fields set by partial updates since the document was written
+            data.update(self._read_header(procedure_id) or {})
 
         return ProcedureMetadata(
             procedure_id=procedure_id,
@@ -86,49 +708,194 @@ class FileStorage:
             lua_state=data.get("lua_state", {}),
             status=data.get("status", "RUNNING"),
             waiting_on_message_id=data.get("waiting_on_message_id"),
+            parent_id=data.get("parent_id"),
+            parent_position=data.get("parent_position"),
         )
 
     def save_procedure_metadata(self, procedure_id: str, metadata: ProcedureMetadata) -> None:
         """Save procedure metadata to file."""
+        if self.journal:
+            self._save_journaled(procedure_id, metadata)
+            return
+
         # Convert to serializable dict
         data = {
             "procedure_id": metadata.procedure_id,
-            "execution_log": [
-                {
-                    "position": entry.position,
-                    "type": entry.type,
-                    "result": entry.result,
-                    "timestamp": entry.timestamp.isoformat(),
-                    "duration_ms": entry.duration_ms,
-                    "input_hash": entry.input_hash,
-                }
-                for entry in metadata.execution_log
-            ],
+            "execution_log": [self._entry_to_dict(entry) for entry in metadata.execution_log],
             "replay_index": metadata.replay_index,
             "state": metadata.state,
             "lua_state": metadata.lua_state,
             "status": metadata.status,
             "waiting_on_message_id": metadata.waiting_on_message_id,
+            "parent_id": metadata.parent_id,
+            "parent_position": metadata.parent_position,
         }
 
         self._write_file(procedure_id, data)
 
+        # The full document supersedes any journal left over from journal mode
+        journal_path = self._get_journal_path(procedure_id)
+        if journal_path.exists():
+            journal_path.unlink()
+            self._journals.pop(procedure_id, None)
+
+    def _save_journaled(self, procedure_id: str, metadata: ProcedureMetadata) -> None:
+        """
+        Persist metadata by appending new checkpoints to the journal.
+
+        Relies on the execution log only growing at the end or being truncated
+        (which is how BaseExecutionContext mutates it); entries already in the
+        journal are never rewritten.
+        """
+        info = self._journals.get(procedure_id)
+        if info is None:
+            self._read_journal(procedure_id)
+            info = self._journals[procedure_id]
+
+        execution_log = metadata.execution_log
+        records = []
+        if len(execution_log) < info.entries:
+            records.append({"op": "truncate", "length": len(execution_log)})
+            info.entries = len(execution_log)
+        for entry in execution_log[info.entries :]:
+            records.append({"op": "append", "entry": self._entry_to_dict(entry)})
+
+        if records:
+            self._append_journal(procedure_id, records)
+            info.records += len(records)
+            info.entries = len(execution_log)
+
+        if info.records - info.entries > self.compact_threshold:
+            self.compact(procedure_id, metadata)
+
+        header = {
+            "procedure_id": metadata.procedure_id,
+            "format": JOURNAL_FORMAT,
+            "journal_entries": info.entries,
+            "replay_index": metadata.replay_index,
+            "state": metadata.state,
+            "lua_state": metadata.lua_state,
+            "status": metadata.status,
+            "waiting_on_message_id": metadata.waiting_on_message_id,
+            "parent_id": metadata.parent_id,
+            "parent_position": metadata.parent_position,
+        }
+        self._write_file(procedure_id, header)
+
     def update_procedure_status(
         self, procedure_id: str, status: str, waiting_on_message_id: Optional[str] = None
     ) -> None:
-        """Update procedure status."""
-        metadata = self.load_procedure_metadata(procedure_id)
-        metadata.status = status
-        metadata.waiting_on_message_id = waiting_on_message_id
-        self.save_procedure_metadata(procedure_id, metadata)
+        """Update procedure status (see set_status)."""
+        self.set_status(procedure_id, status, waiting_on_message_id)
+
+    def get_status(self, procedure_id: str) -> ProcedureSummary:
+        """Read procedure status from the status index."""
+        summary = self._get_index().get(procedure_id)
+        if summary is not None:
+            return summary
+        return ProcedureSummary(procedure_id=procedure_id, status="RUNNING")
+
+    def set_status(
+        self, procedure_id: str, status: str, waiting_on_message_id: Optional[str] = None
+    ) -> None:
+        """Set procedure status without rewriting the execution log."""
+
+        def update(header: dict) -> None:
+            header["status"] = status
+            header["waiting_on_message_id"] = waiting_on_message_id
+
+        if not self._update_header(procedure_id, update):
+            # Not stored yet: write the whole document
+            metadata = self.load_procedure_metadata(procedure_id)
+            metadata.status = status
+            metadata.waiting_on_message_id = waiting_on_message_id
+            self.save_procedure_metadata(procedure_id, metadata)
 
     def get_state(self, procedure_id: str) -> Dict[str, Any]:
-        """Get mutable state dictionary."""
-        metadata = self.load_procedure_metadata(procedure_id)
-        return metadata.state
+        """Get mutable state dictionary (from the header where there is one)."""
+        header = self._read_header(procedure_id)
+        if header is None:
+            header = self._read_file(procedure_id)
+        return header.get("state", {})
 
     def set_state(self, procedure_id: str, state: Dict[str, Any]) -> None:
-        """Set mutable state dictionary."""
-        metadata = self.load_procedure_metadata(procedure_id)
-        metadata.state = state
-        self.save_procedure_metadata(procedure_id, metadata)
+        """Set mutable state dictionary without rewriting the execution log."""
+        if not self._update_header(procedure_id, lambda header: header.update(state=state)):
+            metadata = self.load_procedure_metadata(procedure_id)
+            metadata.state = state
+            self.save_procedure_metadata(procedure_id, metadata)
+
+    def patch_state(self, procedure_id: str, updates: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge keys into the state dictionary without rewriting the execution log."""
+        merged: Dict[str, Any] = {}
+
+        def update(header: dict) -> None:
+            merged.update(header.get("state", {}))
+            merged.update(updates)
+            header["state"] = merged
+
+        if not self._update_header(procedure_id, update):
+            metadata = self.load_procedure_metadata(procedure_id)
+            metadata.state = {**metadata.state, **updates}
+            self.save_procedure_metadata(procedure_id, metadata)
+            return metadata.state
+        return merged
+
+    def _exists(self, procedure_id: str) -> bool:
+        """Check whether a procedure has a document (in any codec) or a journal."""
+        paths = [
+            self._get_file_path(procedure_id),
+            *self._other_file_paths(procedure_id).values(),
+            self._get_journal_path(procedure_id),
+        ]
+        return any(path.exists() for path in paths)
+
+    def fork_procedure(self, procedure_id: str, at_position: int, new_id: str) -> None:
+        """
+        Create a new procedure from the first at_position checkpoints of another.
+
+        The kept entries are written to the new procedure's own document (or
+        journal); results already in the blob store are shared by reference.
+        """
+        if not self._exists(procedure_id):
+            raise ValueError(f"Procedure {procedure_id} not found")
+        if self._exists(new_id):
+            raise ValueError(f"Procedure {new_id} already exists")
+
+        forked = self.load_procedure_metadata(procedure_id).fork(at_position, new_id)
+        if self.journal:
+            # Write the kept entries in one pass; the header save then has nothing to append
+            self.compact(new_id, forked)
+        self.save_procedure_metadata(new_id, forked)
+
+    def delete_procedure(self, procedure_id: str) -> int:
+        """
+        Delete a procedure's document, journal and index entry.
+
+        Blobs are content-addressed and may be shared, so they are left in
+        place for collect_blobs() (run by `tactus gc`).
+
+        Returns:
+            Total size of the deleted files in bytes
+        """
+        paths = [
+            self._get_file_path(procedure_id),
+            *self._other_file_paths(procedure_id).values(),
+            self._get_journal_path(procedure_id),
+            self._get_header_path(procedure_id),
+            *self._other_header_paths(procedure_id).values(),
+        ]
+        reclaimed = 0
+        try:
+            for path in paths:
+                if path.exists():
+                    reclaimed += path.stat().st_size
+                    path.unlink()
+        except OSError as e:
+            raise RuntimeError(f"Failed to delete procedure {procedure_id}: {e}")
+
+        self._journals.pop(procedure_id, None)
+        self._single_format.discard(procedure_id)
+        self._indexed.pop(procedure_id, None)
+        self._get_index().remove(procedure_id)
+        return reclaimed
@@ -13,20 +13,28 @@ from typing import Any, Dict, List, Optional, Callable
 from pydantic_ai.toolsets import FunctionToolset
 from pydantic import BaseModel, Field, create_model
 
+from tactus.core.schema_cache import SchemaModelCache, default_schema_cache
+
 logger = logging.getLogger(__name__)
 
 
 class LuaToolsAdapter:
     """Adapter to create Pydantic AI toolsets from Lua function definitions."""
 
-    def __init__(self, tool_primitive: Optional[Any] = None):
+    def __init__(
+        self,
+        tool_primitive: Optional[Any] = None,
+        schema_cache: Optional[SchemaModelCache] = None,
+    ):
         """
         Initialize adapter.
 
         Args:
             tool_primitive: Optional ToolPrimitive for call tracking
+            schema_cache: Cache of parameter models (defaults to the process-wide cache)
         """
         self.tool_primitive = tool_primitive
+        self.schema_cache = schema_cache if schema_cache is not None else default_schema_cache()
 
     def create_single_tool_toolset(
         self, tool_name: str, tool_spec: Dict[str, Any]
@@ -131,7 +139,12 @@ class LuaToolsAdapter:
             raise ValueError(f"Tool '{tool_name}' missing handler function")
 
         # Create Pydantic model for parameters
-        param_model = self._create_parameter_model(tool_name, parameters)
+        param_model = self.schema_cache.get_or_create(
+            "lua_tool_params",
+            tool_name,
+            parameters,
+            lambda: self._create_parameter_model(tool_name, parameters),
+        )
 
         # Create async wrapper function
         async def wrapped_tool(**kwargs) -> str:
@@ -9,6 +9,8 @@ from typing import List, Any, Optional, Dict
 from pydantic import create_model, Field
 from pydantic_ai import Tool
 
+from tactus.core.schema_cache import SchemaModelCache, default_schema_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,16 +22,23 @@ class PydanticAIMCPAdapter:
     Pydantic AI Tool instances with dynamically generated Pydantic models.
     """
 
-    def __init__(self, mcp_client: Any, tool_primitive: Optional[Any] = None):
+    def __init__(
+        self,
+        mcp_client: Any,
+        tool_primitive: Optional[Any] = None,
+        schema_cache: Optional[SchemaModelCache] = None,
+    ):
         """
         Initialize MCP adapter.
 
         Args:
             mcp_client: MCP client instance (from fastmcp or similar)
             tool_primitive: Optional ToolPrimitive for recording tool calls
+            schema_cache: Cache of argument models (defaults to the process-wide cache)
         """
         self.mcp_client = mcp_client
         self.tool_primitive = tool_primitive
+        self.schema_cache = schema_cache if schema_cache is not None else default_schema_cache()
         logger.debug("PydanticAIMCPAdapter initialized")
 
     async def load_tools(self) -> List[Tool]:
@@ -119,7 +128,12 @@ class PydanticAIMCPAdapter:
         # Create Pydantic model from JSON Schema
         if input_schema:
             try:
-                args_model = self._json_schema_to_pydantic_model(input_schema, tool_name)
+                args_model = self.schema_cache.get_or_create(
+                    "mcp_args",
+                    tool_name,
+                    input_schema,
+                    lambda: self._json_schema_to_pydantic_model(input_schema, tool_name),
+                )
             except Exception as e:
                 logger.error(
                     f"Failed to create Pydantic model for tool '{tool_name}': {e}", exc_info=True
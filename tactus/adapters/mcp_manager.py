@@ -2,16 +2,24 @@
 MCP Server Manager for Tactus.
 
 Manages multiple MCP server connections using Pydantic AI's native MCPServerStdio.
-Handles lifecycle, tool prefixing, and tool call tracking.
+Handles lifecycle, tool prefixing, and tool call tracking. MCPServerPool keeps
+servers running across procedure runs.
 """
 
+import asyncio
+import hashlib
+import json
 import logging
 import os
 import re
-from contextlib import AsyncExitStack
-from typing import Dict, Any, List
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager
+from typing import Dict, Any, List, Optional
 
 from pydantic_ai.mcp import MCPServerStdio
+from pydantic_ai.toolsets import AbstractToolset
 
 logger = logging.getLogger(__name__)
 
@@ -36,30 +44,83 @@ def substitute_env_vars(value: Any) -> Any:
     return value
 
 
+def _stdio_server(config: Dict[str, Any], process_tool_call=None) -> MCPServerStdio:
+    """Create the (unconnected) stdio client of a server config."""
+    return MCPServerStdio(
+        command=config["command"],
+        args=config.get("args", []),
+        env=config.get("env"),
+        process_tool_call=process_tool_call,  # Tracking hook
+    )
+
+
+async def _hold_connection(server, connected: asyncio.Future, stop: asyncio.Event) -> None:
+    """
+    Connect a server and keep it connected until stop is set.
+
+    The MCP client's context must be exited by the task that entered it,
+    so each server gets a task that does both.
+    """
+    try:
+        async with server:
+            connected.set_result(None)
+            await stop.wait()
+    except Exception as e:
+        if not connected.done():
+            connected.set_exception(e)
+        else:
+            logger.warning(f"Error while disconnecting MCP server: {e}")
+
+
+async def _wait_connected(
+    name: str, task: asyncio.Task, connected: asyncio.Future, timeout: float
+) -> None:
+    """Wait for a server to connect; stop its task if it fails or times out."""
+    try:
+        await asyncio.wait_for(asyncio.shield(connected), timeout)
+    except BaseException as e:
+        # Stopping the server process can take a while: the caller waits for it
+        task.cancel()
+        if isinstance(e, asyncio.TimeoutError):
+            raise TimeoutError(f"MCP server '{name}' did not connect within {timeout}s")
+        raise
+
+
 class MCPServerManager:
     """
     Manages multiple native Pydantic AI MCP servers.
 
     Uses Pydantic AI's MCPServerStdio for stdio transport and automatic
     tool prefixing. Handles connection lifecycle and tool call tracking.
+
+    Servers are started and connected concurrently, so connecting takes as
+    long as the slowest server rather than the sum of all of them. Each
+    server must connect within its 'connect_timeout' config value (seconds,
+    default DEFAULT_CONNECT_TIMEOUT).
     """
 
+    DEFAULT_CONNECT_TIMEOUT = 30.0
+
     def __init__(self, server_configs: Dict[str, Dict[str, Any]], tool_primitive=None):
         """
         Initialize MCP server manager.
 
         Args:
-            server_configs: Dict of {server_name: {command, args, env}}
+            server_configs: Dict of {server_name: {command, args, env, connect_timeout}}
             tool_primitive: Optional ToolPrimitive for recording tool calls
         """
         self.configs = server_configs
         self.tool_primitive = tool_primitive
         self.servers: List[MCPServerStdio] = []
-        self._exit_stack = AsyncExitStack()
+        # One task per server: it holds the connection open
+        self._tasks: List[asyncio.Task] = []
+        self._stop: Optional[asyncio.Event] = None
         logger.info(f"MCPServerManager initialized with {len(server_configs)} server(s)")
 
     async def __aenter__(self):
         """Connect to all configured MCP servers."""
+        self._stop = asyncio.Event()
+        pending = []
         for name, config in self.configs.items():
             try:
                 logger.info(f"Connecting to MCP server '{name}'...")
@@ -68,44 +129,70 @@ class MCPServerManager:
                 config = substitute_env_vars(config)
 
                 # Create base server
-                server = MCPServerStdio(
-                    command=config["command"],
-                    args=config.get("args", []),
-                    env=config.get("env"),
-                    process_tool_call=self._create_trace_callback(name),  # Tracking hook
-                )
+                server = _stdio_server(config, process_tool_call=self._create_trace_callback(name))
 
                 # Wrap with prefix to namespace tools
                 prefixed_server = server.prefixed(name)
-
-                # Connect the prefixed server
-                await self._exit_stack.enter_async_context(prefixed_server)
-                self.servers.append(prefixed_server)
-                logger.info(f"Successfully connected to MCP server '{name}' with prefix '{name}_'")
             except Exception as e:
-                # Check if this is a fileno error (common in test environments)
-                import io
-
-                error_str = str(e)
-                if "fileno" in error_str or isinstance(e, io.UnsupportedOperation):
-                    logger.warning(
-                        f"Failed to connect to MCP server '{name}': {e} "
-                        f"(test environment with redirected streams)"
-                    )
-                else:
-                    logger.error(f"Failed to connect to MCP server '{name}': {e}", exc_info=True)
-                # Don't raise - allow procedure to continue without this MCP server
-                logger.info(f"Continuing without MCP server '{name}'")
+                self._log_connect_error(name, e)
+                continue
+
+            connected = asyncio.get_running_loop().create_future()
+            task = asyncio.create_task(
+                _hold_connection(prefixed_server, connected, self._stop), name=f"mcp-server-{name}"
+            )
+            timeout = config.get("connect_timeout", self.DEFAULT_CONNECT_TIMEOUT)
+            pending.append((name, prefixed_server, task, connected, timeout))
+
+        try:
+            results = await asyncio.gather(
+                *(
+                    _wait_connected(name, task, connected, timeout)
+                    for name, _, task, connected, timeout in pending
+                ),
+                return_exceptions=True,
+            )
+        except BaseException:
+            # Cancelled while connecting: disconnect whatever connected
+            self._tasks = [task for _, _, task, _, _ in pending]
+            await self.__aexit__(None, None, None)
+            raise
+
+        # Keep the configured order
+        self._tasks = [task for _, _, task, _, _ in pending]
+        for (name, prefixed_server, _, _, _), result in zip(pending, results):
+            if isinstance(result, BaseException):
+                self._log_connect_error(name, result)
                 continue
+            self.servers.append(prefixed_server)
+            logger.info(f"Successfully connected to MCP server '{name}' with prefix '{name}_'")
 
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Disconnect from all MCP servers."""
         logger.info("Disconnecting from all MCP servers...")
-        await self._exit_stack.aclose()
+        if self._stop is not None:
+            self._stop.set()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
         logger.info("All MCP servers disconnected")
 
+    def _log_connect_error(self, name: str, e: BaseException) -> None:
+        # Check if this is a fileno error (common in test environments)
+        import io
+
+        error_str = str(e)
+        if "fileno" in error_str or isinstance(e, io.UnsupportedOperation):
+            logger.warning(
+                f"Failed to connect to MCP server '{name}': {e} "
+                f"(test environment with redirected streams)"
+            )
+        else:
+            logger.error(f"Failed to connect to MCP server '{name}': {e}", exc_info=e)
+        # Don't raise - allow procedure to continue without this MCP server
+        logger.info(f"Continuing without MCP server '{name}'")
+
     def _create_trace_callback(self, server_name: str):
         """
         Create a tool call tracing callback for a specific server.
@@ -153,3 +240,358 @@ class MCPServerManager:
             List of MCPServerStdio instances (which are AbstractToolset)
         """
         return self.servers
+
+
+class _PooledInstance:
+    """One running server process of a pool, held open by its own task."""
+
+    def __init__(self, server: MCPServerStdio):
+        self.server = server
+        self.in_flight = 0
+        self.last_used = self.last_checked = time.monotonic()
+        self._stop = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self, name: str, timeout: float) -> None:
+        connected = asyncio.get_running_loop().create_future()
+        self._task = asyncio.create_task(
+            _hold_connection(self.server, connected, self._stop), name=f"mcp-pool-{name}"
+        )
+        try:
+            await _wait_connected(name, self._task, connected, timeout)
+        except BaseException:
+            await asyncio.gather(self._task, return_exceptions=True)
+            raise
+
+    @property
+    def alive(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def stop(self) -> None:
+        self._stop.set()
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+
+
+class _PooledServer:
+    """The instances of one server config on one event loop, and its tool listing."""
+
+    def __init__(self, name: str, config: Dict[str, Any], pool: "MCPServerPool"):
+        self.name = name
+        self.config = config
+        self.pool = pool
+        self.max_instances = config.get("instances", pool.instances_per_server)
+        self.instances: List[_PooledInstance] = []
+        self.tools: Optional[list] = None  # Cached tools/list result
+        self._lock = asyncio.Lock()
+
+    async def list_tools(self) -> list:
+        """The server's tools, listed once and then refreshed by health checks."""
+        if self.tools is None:
+            async with self.acquire() as instance:
+                if self.tools is None:
+                    self.tools = await instance.server.list_tools()
+        return self.tools
+
+    @asynccontextmanager
+    async def acquire(self):
+        """Use the least busy instance, starting one if all are busy (up to max_instances)."""
+        from pydantic_ai.exceptions import ModelRetry
+
+        instance = await self._checkout()
+        try:
+            yield instance
+        except ModelRetry:
+            raise  # The tool failed, not the connection
+        except Exception:
+            # Check the connection before the next call uses it
+            instance.last_checked = 0.0
+            raise
+        finally:
+            instance.in_flight -= 1
+            instance.last_used = time.monotonic()
+
+    async def _checkout(self) -> _PooledInstance:
+        async with self._lock:
+            self.instances = [i for i in self.instances if i.alive]
+            instance = min(self.instances, key=lambda i: i.in_flight, default=None)
+            if instance is not None and instance.in_flight == 0:
+                if time.monotonic() - instance.last_checked > self.pool.health_check_interval:
+                    if not await self._healthy(instance):
+                        self.instances.remove(instance)
+                        await instance.stop()
+                        instance = min(self.instances, key=lambda i: i.in_flight, default=None)
+            if instance is None or (
+                instance.in_flight > 0 and len(self.instances) < self.max_instances
+            ):
+                instance = await self._start_instance()
+            instance.in_flight += 1
+            return instance
+
+    async def _healthy(self, instance: _PooledInstance) -> bool:
+        try:
+            # A round trip that also refreshes the tool listing
+            self.tools = await asyncio.wait_for(
+                instance.server.list_tools(), self.pool.health_check_timeout
+            )
+        except Exception as e:
+            logger.warning(f"MCP server '{self.name}' failed its health check, restarting: {e}")
+            return False
+        instance.last_checked = time.monotonic()
+        return True
+
+    async def _start_instance(self) -> _PooledInstance:
+        logger.info(
+            f"Starting MCP server '{self.name}' (instance {len(self.instances) + 1} "
+            f"of at most {self.max_instances})"
+        )
+        instance = _PooledInstance(_stdio_server(self.config))
+        await instance.start(
+            self.name, self.config.get("connect_timeout", self.pool.connect_timeout)
+        )
+        self.instances.append(instance)
+        self.pool._ensure_reaper()
+        return instance
+
+    async def evict_idle(self, idle_timeout: float) -> None:
+        """Stop the instances unused for idle_timeout seconds."""
+        now = time.monotonic()
+        async with self._lock:
+            idle = [
+                i
+                for i in self.instances
+                if not i.alive or (i.in_flight == 0 and now - i.last_used > idle_timeout)
+            ]
+            self.instances = [i for i in self.instances if i not in idle]
+        for instance in idle:
+            logger.info(f"Stopping idle MCP server '{self.name}'")
+            await instance.stop()
+
+    async def close(self) -> None:
+        async with self._lock:
+            instances, self.instances = self.instances, []
+        await asyncio.gather(*(i.stop() for i in instances))
+
+
+class PooledMCPToolset(AbstractToolset):
+    """
+    A run's view of a pooled MCP server.
+
+    Lists the server's cached tools and calls them on one of its instances;
+    the server is started on first use. Each run gets its own view, with
+    its own tool call hook.
+    """
+
+    def __init__(self, server: _PooledServer, process_tool_call=None, max_retries: int = 1):
+        self._server = server
+        self.process_tool_call = process_tool_call
+        self.max_retries = max_retries
+
+    @property
+    def id(self) -> Optional[str]:
+        return self._server.name
+
+    async def get_tools(self, ctx) -> Dict[str, Any]:
+        from pydantic_ai.mcp import TOOL_SCHEMA_VALIDATOR
+        from pydantic_ai.tools import ToolDefinition
+        from pydantic_ai.toolsets.abstract import ToolsetTool
+
+        try:
+            tools = await self._server.list_tools()
+        except Exception as e:
+            # Like a server that fails to connect: continue without its tools
+            logger.error(f"Failed to list tools of MCP server '{self._server.name}': {e}")
+            return {}
+        return {
+            tool.name: ToolsetTool(
+                toolset=self,
+                tool_def=ToolDefinition(
+                    name=tool.name,
+                    description=tool.description,
+                    parameters_json_schema=tool.inputSchema,
+                    metadata={
+                        "meta": tool.meta,
+                        "annotations": tool.annotations.model_dump() if tool.annotations else None,
+                        "output_schema": tool.outputSchema or None,
+                    },
+                ),
+                max_retries=self.max_retries,
+                args_validator=TOOL_SCHEMA_VALIDATOR,
+            )
+            for tool in tools
+        }
+
+    async def call_tool(self, name: str, tool_args: Dict[str, Any], ctx, tool) -> Any:
+        async with self._server.acquire() as instance:
+            if self.process_tool_call is not None:
+                return await self.process_tool_call(
+                    ctx, instance.server.direct_call_tool, name, tool_args
+                )
+            return await instance.server.direct_call_tool(name, tool_args)
+
+
+class MCPServerPool:
+    """
+    MCP servers kept running across procedure runs.
+
+    Runs that use the same server config (after environment substitution)
+    share its processes instead of starting their own:
+
+    - a server is started on first use (listing or calling its tools), and
+      its tool listing is kept after the first one;
+    - up to instances_per_server processes run per server (config key
+      'instances' overrides it), so concurrent calls are spread over them
+      rather than queued on one stdio pipe;
+    - an instance idle for health_check_interval seconds is checked with a
+      tools/list request before use, and restarted if it fails;
+    - instances unused for idle_timeout seconds are stopped.
+
+    The connections belong to the event loop that opened them, so servers
+    are shared by the runs on one loop, like HTTP clients in
+    ProviderRegistry; they stop when their loop ends. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        instances_per_server: int = 1,
+        idle_timeout: float = 300.0,
+        health_check_interval: float = 30.0,
+        health_check_timeout: float = 5.0,
+        connect_timeout: float = MCPServerManager.DEFAULT_CONNECT_TIMEOUT,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            instances_per_server: Maximum processes per server
+            idle_timeout: Seconds after which an unused instance is stopped
+            health_check_interval: Seconds after which an idle instance is checked before use
+            health_check_timeout: Seconds a health check may take
+            connect_timeout: Default seconds a server may take to start and connect
+        """
+        if instances_per_server < 1:
+            raise ValueError(f"instances_per_server must be at least 1, got {instances_per_server}")
+        if idle_timeout <= 0:
+            raise ValueError(f"idle_timeout must be positive, got {idle_timeout}")
+        self.instances_per_server = instances_per_server
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+        self.connect_timeout = connect_timeout
+        self._lock = threading.Lock()
+        self._per_loop: (
+            "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, _PooledServer]]"
+        ) = weakref.WeakKeyDictionary()
+        self._reapers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Task]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @staticmethod
+    def key(name: str, config: Dict[str, Any]) -> str:
+        """Pool key of a server config."""
+        canonical = json.dumps([name, config], sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def toolset(self, name: str, config: Dict[str, Any], process_tool_call=None):
+        """
+        Return a run's toolset for a server, without starting it.
+
+        Must be called from a running event loop.
+
+        Args:
+            name: Server name
+            config: Server config {command, args, env, connect_timeout, instances},
+                with environment variables substituted
+            process_tool_call: Optional tool call hook of the run
+        """
+        loop = asyncio.get_running_loop()
+        key = self.key(name, config)
+        with self._lock:
+            servers = self._per_loop.setdefault(loop, {})
+            server = servers.get(key)
+            if server is None:
+                server = servers[key] = _PooledServer(name, config, self)
+        return PooledMCPToolset(server, process_tool_call=process_tool_call)
+
+    def __len__(self) -> int:
+        """Number of running server processes."""
+        with self._lock:
+            servers = [s for per_loop in self._per_loop.values() for s in per_loop.values()]
+        return sum(1 for s in servers for i in s.instances if i.alive)
+
+    def _ensure_reaper(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            servers = self._per_loop.get(loop)
+            reaper = self._reapers.get(loop)
+            if servers is not None and (reaper is None or reaper.done()):
+                self._reapers[loop] = loop.create_task(self._reap(servers), name="mcp-pool-reaper")
+
+    async def _reap(self, servers: Dict[str, _PooledServer]) -> None:
+        # Runs while the loop has instances; restarted by the next one
+        while True:
+            await asyncio.sleep(self.idle_timeout / 2)
+            for server in list(servers.values()):
+                await server.evict_idle(self.idle_timeout)
+            if not any(server.instances for server in list(servers.values())):
+                return
+
+    async def aclose(self) -> None:
+        """Stop the servers of the running event loop (others are kept)."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            servers = self._per_loop.pop(loop, {})
+            reaper = self._reapers.pop(loop, None)
+        if reaper is not None:
+            reaper.cancel()
+        await asyncio.gather(*(server.close() for server in servers.values()))
+
+
+class PooledMCPServerManager(MCPServerManager):
+    """
+    MCPServerManager whose servers come from an MCPServerPool.
+
+    Entering it starts nothing (servers start on first use), and exiting it
+    leaves the servers running for later runs.
+    """
+
+    def __init__(
+        self,
+        pool: MCPServerPool,
+        server_configs: Dict[str, Dict[str, Any]],
+        tool_primitive=None,
+    ):
+        super().__init__(server_configs, tool_primitive=tool_primitive)
+        self.pool = pool
+
+    async def __aenter__(self):
+        """Get the run's toolsets of all configured MCP servers."""
+        for name, config in self.configs.items():
+            try:
+                toolset = self.pool.toolset(
+                    name,
+                    substitute_env_vars(config),
+                    process_tool_call=self._create_trace_callback(name),
+                )
+            except Exception as e:
+                self._log_connect_error(name, e)
+                continue
+            self.servers.append(toolset.prefixed(name))
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Release the servers (they keep running in the pool)."""
+        logger.debug(f"Released {len(self.servers)} pooled MCP server(s)")
+
+
+_default_pool: Optional[MCPServerPool] = None
+_default_lock = threading.Lock()
+
+
+def default_mcp_pool() -> MCPServerPool:
+    """Return the pool shared by runtimes that opt into MCP server pooling."""
+    global _default_pool
+    with _default_lock:
+        if _default_pool is None:
+            _default_pool = MCPServerPool()
+        return _default_pool
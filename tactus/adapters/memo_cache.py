@@ -0,0 +1,215 @@
+"""
+Memo cache backends for Tactus.
+
+- MemoryMemoCache: process-local LRU cache (values kept as Python objects).
+- SQLiteMemoCache: persistent cache shared by every procedure and run that
+  points at the same database file. Values are stored as JSON; results that
+  are not JSON-serializable are simply not memoized.
+
+Both evict the least recently used entries beyond max_entries and treat
+entries older than their TTL as missing.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS memo (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    expires_at REAL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_memo_last_used ON memo (last_used);
+"""
+
+# Writes between size checks (COUNT(*) is a full scan); the cache may exceed
+# max_entries by up to this many entries in between
+_EVICT_EVERY = 64
+
+
+class MemoryMemoCache:
+    """
+    In-memory LRU memo cache.
+
+    Results are lost when the process exits; useful for tests and for
+    deduplicating calls within one long-running process.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of results kept (least recently used evicted)
+            ttl_seconds: Default lifetime of a result (None = no expiry)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Look up a memoized result."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Store a result, evicting the least recently used beyond max_entries."""
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        expires_at = time.time() + ttl if ttl is not None else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Remove a result if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all results."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteMemoCache:
+    """
+    Persistent memo cache in a SQLite database.
+
+    Safe to share between processes (WAL journaling); eviction runs
+    periodically on write once the table exceeds max_entries.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "~/.tactus/memo.db",
+        max_entries: int = 100_000,
+        ttl_seconds: Optional[float] = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            db_path: Path to the database file (created if missing)
+            max_entries: Maximum number of results kept (least recently used evicted)
+            ttl_seconds: Default lifetime of a result (None = no expiry)
+        """
+        self.db_path = Path(db_path).expanduser()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._writes = 0
+
+        try:
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to open memo cache {self.db_path}: {e}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Look up a memoized result."""
+        now = time.time()
+        with self._lock:
+            try:
+                with self._conn:
+                    row = self._conn.execute(
+                        "SELECT value, expires_at FROM memo WHERE key = ?", (key,)
+                    ).fetchone()
+                    if row is None:
+                        return default
+                    value, expires_at = row
+                    if expires_at is not None and expires_at <= now:
+                        self._conn.execute("DELETE FROM memo WHERE key = ?", (key,))
+                        return default
+                    self._conn.execute("UPDATE memo SET last_used = ? WHERE key = ?", (now, key))
+            except sqlite3.Error as e:
+                raise RuntimeError(f"Failed to read memo cache {self.db_path}: {e}")
+        return json.loads(value)
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Store a result if it is JSON-serializable."""
+        try:
+            payload = json.dumps(value, separators=(",", ":"))
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Not memoizing result for {key[:12]}: {e}")
+            return
+
+        now = time.time()
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        expires_at = now + ttl if ttl is not None else None
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO memo (key, value, expires_at, last_used) "
+                        "VALUES (?, ?, ?, ?)",
+                        (key, payload, expires_at, now),
+                    )
+                    self._writes += 1
+                    if self._writes % _EVICT_EVERY == 0 or self._writes == 1:
+                        self._evict()
+            except sqlite3.Error as e:
+                raise RuntimeError(f"Failed to write memo cache {self.db_path}: {e}")
+
+    def _evict(self) -> None:
+        """Delete the least recently used entries beyond max_entries (caller holds the lock)."""
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM memo").fetchone()
+        if count > self.max_entries:
+            self._conn.execute(
+                "DELETE FROM memo WHERE key IN "
+                "(SELECT key FROM memo ORDER BY last_used LIMIT ?)",
+                (count - self.max_entries,),
+            )
+
+    def delete(self, key: str) -> None:
+        """Remove a result if present."""
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.execute("DELETE FROM memo WHERE key = ?", (key,))
+            except sqlite3.Error as e:
+                raise RuntimeError(f"Failed to write memo cache {self.db_path}: {e}")
+
+    def clear(self) -> None:
+        """Remove all results."""
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.execute("DELETE FROM memo")
+            except sqlite3.Error as e:
+                raise RuntimeError(f"Failed to write memo cache {self.db_path}: {e}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM memo").fetchone()
+        return count
@@ -5,9 +5,11 @@ Simple implementation that stores all data in memory (RAM).
 Useful for testing and simple CLI workflows that don't need persistence.
 """
 
+import time
+from datetime import datetime, timezone
 from typing import Optional, Any, Dict
 
-from tactus.protocols.models import ProcedureMetadata
+from tactus.protocols.models import ProcedureMetadata, ProcedurePage, ProcedureSummary
 
 
 class MemoryStorage:
@@ -20,6 +22,8 @@ class MemoryStorage:
     def __init__(self):
         """Initialize in-memory storage."""
         self._procedures: Dict[str, ProcedureMetadata] = {}
+        # Last save time of each saved procedure (the status index)
+        self._updated_at: Dict[str, float] = {}
 
     def load_procedure_metadata(self, procedure_id: str) -> ProcedureMetadata:
         """Load procedure metadata from memory."""
@@ -31,6 +35,7 @@ class MemoryStorage:
     def save_procedure_metadata(self, procedure_id: str, metadata: ProcedureMetadata) -> None:
         """Save procedure metadata to memory."""
         self._procedures[procedure_id] = metadata
+        self._updated_at[procedure_id] = time.time()
 
     def update_procedure_status(
         self, procedure_id: str, status: str, waiting_on_message_id: Optional[str] = None
@@ -41,6 +46,32 @@ class MemoryStorage:
         metadata.waiting_on_message_id = waiting_on_message_id
         self.save_procedure_metadata(procedure_id, metadata)
 
+    def get_status(self, procedure_id: str) -> ProcedureSummary:
+        """Read procedure status."""
+        metadata = self._procedures.get(procedure_id)
+        updated_at = self._updated_at.get(procedure_id)
+        return ProcedureSummary(
+            procedure_id=procedure_id,
+            status=metadata.status if metadata else "RUNNING",
+            waiting_on_message_id=metadata.waiting_on_message_id if metadata else None,
+            updated_at=(
+                datetime.fromtimestamp(updated_at, tz=timezone.utc) if updated_at else None
+            ),
+        )
+
+    def set_status(
+        self, procedure_id: str, status: str, waiting_on_message_id: Optional[str] = None
+    ) -> None:
+        """Set procedure status."""
+        self.update_procedure_status(procedure_id, status, waiting_on_message_id)
+
+    def patch_state(self, procedure_id: str, updates: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge keys into the state dictionary."""
+        metadata = self.load_procedure_metadata(procedure_id)
+        metadata.state.update(updates)
+        self.save_procedure_metadata(procedure_id, metadata)
+        return metadata.state
+
     def get_state(self, procedure_id: str) -> Dict[str, Any]:
         """Get mutable state dictionary."""
         metadata = self.load_procedure_metadata(procedure_id)
@@ -51,3 +82,41 @@ class MemoryStorage:
         metadata = self.load_procedure_metadata(procedure_id)
         metadata.state = state
         self.save_procedure_metadata(procedure_id, metadata)
+
+    def list_procedures(
+        self, status: Optional[str] = None, limit: int = 100, cursor: Optional[str] = None
+    ) -> ProcedurePage:
+        """List saved procedures ordered by procedure_id."""
+        procedure_ids = sorted(
+            procedure_id
+            for procedure_id in self._updated_at
+            if (cursor is None or procedure_id > cursor)
+            and (status is None or self._procedures[procedure_id].status == status)
+        )
+        procedures = [
+            ProcedureSummary(
+                procedure_id=procedure_id,
+                status=self._procedures[procedure_id].status,
+                waiting_on_message_id=self._procedures[procedure_id].waiting_on_message_id,
+                updated_at=datetime.fromtimestamp(self._updated_at[procedure_id], tz=timezone.utc),
+            )
+            for procedure_id in procedure_ids[:limit]
+        ]
+        next_cursor = procedures[-1].procedure_id if len(procedure_ids) > limit else None
+        return ProcedurePage(procedures=procedures, next_cursor=next_cursor)
+
+    def delete_procedure(self, procedure_id: str) -> int:
+        """Delete a procedure from memory (no stored bytes to reclaim)."""
+        self._procedures.pop(procedure_id, None)
+        self._updated_at.pop(procedure_id, None)
+        return 0
+
+    def fork_procedure(self, procedure_id: str, at_position: int, new_id: str) -> None:
+        """Create a new procedure sharing the first at_position checkpoints of another."""
+        if procedure_id not in self._updated_at:
+            raise ValueError(f"Procedure {procedure_id} not found")
+        if new_id in self._updated_at:
+            raise ValueError(f"Procedure {new_id} already exists")
+        self.save_procedure_metadata(
+            new_id, self._procedures[procedure_id].fork(at_position, new_id)
+        )
@@ -2,19 +2,164 @@
 Local Python Plugin Loader for Tactus.
 
 Provides lightweight tool loading from local Python files without requiring MCP servers.
+Loaded modules and their tools are kept in a PluginCache, so later runs do not
+execute the plugin files again until they change.
 """
 
+import hashlib
 import logging
 import importlib.util
 import inspect
+import os
 import sys
+import threading
+import time
 from pathlib import Path
-from typing import List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Union
 from pydantic_ai import Tool
 from pydantic_ai.toolsets import FunctionToolset
 
 logger = logging.getLogger(__name__)
 
+# Files modified this close (seconds) to when they were loaded are checked by
+# content: a change within the file system's timestamp resolution keeps the mtime
+_RACY_WINDOW = 2.0
+
+
+def _file_digest(file_path: Path) -> str:
+    return hashlib.sha256(file_path.read_bytes()).hexdigest()
+
+
+class _PluginModule:
+    """A loaded plugin file: its module, tool functions and Tools."""
+
+    def __init__(self, module: Any, functions: List[Callable], stat: os.stat_result, digest: str):
+        self.module = module
+        self.functions = functions
+        self.mtime_ns = stat.st_mtime_ns
+        self.size = stat.st_size
+        self.digest = digest
+        self.loaded_at = time.time()
+        self._tools: Optional[List[Tool]] = None
+
+    def tools(self) -> List[Tool]:
+        """Tools for the functions, built on first use."""
+        if self._tools is None:
+            self._tools = [Tool(function) for function in self.functions]
+        return self._tools
+
+
+class PluginCache:
+    """
+    Process-wide cache of loaded plugin files.
+
+    A file is executed once; later loads return the same module, functions
+    and Tools while the file is unchanged. Changes are detected by
+    modification time and size, and confirmed by a content hash (touching a
+    file does not reload it). Thread-safe.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Path, _PluginModule] = {}
+        self._lock = threading.RLock()
+
+    def load(self, file_path: Union[str, Path]) -> _PluginModule:
+        """
+        Return the loaded plugin file, executing it if it is new or changed.
+
+        Raises:
+            Exception: Whatever executing the file raises (nothing is cached)
+        """
+        file_path = Path(file_path).resolve()
+        with self._lock:
+            stat = file_path.stat()
+            entry = self._entries.get(file_path)
+            if entry is not None and self._is_current(entry, file_path, stat):
+                return entry
+
+            digest = _file_digest(file_path)
+            if entry is not None and entry.digest == digest:
+                # Touched, not changed
+                entry.mtime_ns, entry.size = stat.st_mtime_ns, stat.st_size
+                return entry
+
+            entry = _PluginModule(*self._execute(file_path), stat=stat, digest=digest)
+            self._entries[file_path] = entry
+            logger.debug(f"Loaded plugin module from {file_path}")
+            return entry
+
+    def invalidate(self, path: Union[str, Path, None] = None) -> int:
+        """
+        Drop cached files so they are executed again on next load.
+
+        Args:
+            path: A plugin file, or a directory (drops the files under it);
+                None drops everything
+
+        Returns:
+            Number of files dropped
+        """
+        with self._lock:
+            if path is None:
+                dropped = list(self._entries)
+            else:
+                path = Path(path).resolve()
+                dropped = [p for p in self._entries if p == path or path in p.parents]
+            for file_path in dropped:
+                del self._entries[file_path]
+        return len(dropped)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _is_current(entry: _PluginModule, file_path: Path, stat: os.stat_result) -> bool:
+        if (stat.st_mtime_ns, stat.st_size) != (entry.mtime_ns, entry.size):
+            return False
+        if stat.st_mtime_ns / 1e9 >= entry.loaded_at - _RACY_WINDOW:
+            if _file_digest(file_path) != entry.digest:
+                return False
+            # Unchanged since well after its mtime: stat is enough from now on
+            entry.loaded_at = time.time()
+        return True
+
+    @staticmethod
+    def _execute(file_path: Path):
+        path_hash = hashlib.sha256(str(file_path).encode()).hexdigest()[:12]
+        module_name = f"tactus_plugin_{file_path.stem}_{path_hash}"
+
+        spec = importlib.util.spec_from_file_location(module_name, file_path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Could not load spec for {file_path}")
+
+        module = importlib.util.module_from_spec(spec)
+        # Add to sys.modules so imports work
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            sys.modules.pop(module_name, None)
+            raise
+
+        # Find all public functions in the module
+        functions = [
+            obj
+            for name, obj in inspect.getmembers(module)
+            if PluginLoader._is_valid_tool_function(name, obj, module)
+        ]
+        return module, functions
+
+
+_default_cache: Optional[PluginCache] = None
+
+
+def default_plugin_cache() -> PluginCache:
+    """Return the cache shared by plugin loaders by default."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = PluginCache()
+    return _default_cache
+
 
 class PluginLoader:
     """
@@ -28,15 +173,20 @@ class PluginLoader:
     description, and type hints are used for parameter validation.
     """
 
-    def __init__(self, tool_primitive: Optional[Any] = None):
+    def __init__(
+        self, tool_primitive: Optional[Any] = None, plugin_cache: Optional[PluginCache] = None
+    ):
         """
         Initialize plugin loader.
 
         Args:
             tool_primitive: Optional ToolPrimitive for recording tool calls
+            plugin_cache: Cache of loaded plugin files (defaults to the
+                process-wide cache)
         """
         self.tool_primitive = tool_primitive
-        self.loaded_modules = {}  # Cache loaded modules
+        self.plugin_cache = plugin_cache if plugin_cache is not None else default_plugin_cache()
+        self.loaded_modules = {}  # Modules loaded by this loader
         logger.debug("PluginLoader initialized")
 
     def create_toolset(self, paths: List[str], name: str = "plugin") -> FunctionToolset:
@@ -53,10 +203,14 @@ class PluginLoader:
         Returns:
             FunctionToolset instance containing all loaded tools
         """
-        # Load all functions from paths
-        functions = self._load_all_functions(paths)
+        # Load the (cached) tools of all files in paths
+        tools = []
+        for file_path in self._plugin_files(paths):
+            module = self._load_module(file_path)
+            if module is not None:
+                tools.extend(module.tools())
 
-        if not functions:
+        if not tools:
             logger.warning(f"No functions found in paths: {paths}")
             # Return empty toolset
             return FunctionToolset(tools=[])
@@ -64,11 +218,30 @@ class PluginLoader:
         # Create toolset
         # Note: FunctionToolset doesn't support process_tool_call parameter
         # Tool call tracking needs to be done at Agent level
-        toolset = FunctionToolset(tools=functions)
+        toolset = FunctionToolset(tools=tools)
 
-        logger.info(f"Created FunctionToolset '{name}' with {len(functions)} tool(s)")
+        logger.info(f"Created FunctionToolset '{name}' with {len(tools)} tool(s)")
         return toolset
 
+    def preload(self, paths: List[str]) -> int:
+        """
+        Load the plugin files in specified paths into the plugin cache.
+
+        Later toolsets created from these files reuse them while they are
+        unchanged (e.g. in processes forked from a zygote).
+
+        Args:
+            paths: List of directory paths or file paths to scan
+
+        Returns:
+            Number of plugin files loaded
+        """
+        loaded = 0
+        for file_path in self._plugin_files(paths):
+            if self._load_module(file_path) is not None:
+                loaded += 1
+        return loaded
+
     def load_from_paths(self, paths: List[str]) -> List[Tool]:
         """
         Load tools from specified paths (directories or files).
@@ -108,17 +281,17 @@ class PluginLoader:
         logger.info(f"Loaded {len(all_tools)} tools from {len(paths)} path(s)")
         return all_tools
 
-    def _load_all_functions(self, paths: List[str]) -> List[Callable]:
+    def _plugin_files(self, paths: List[str]) -> List[Path]:
         """
-        Load all functions from specified paths.
+        List the plugin files in specified paths.
 
         Args:
             paths: List of directory paths or file paths to scan
 
         Returns:
-            List of callable functions (not wrapped in Tool)
+            Python files, excluding private ones in directories
         """
-        all_functions = []
+        files = []
 
         for path_str in paths:
             path = Path(path_str).resolve()
@@ -129,39 +302,26 @@ class PluginLoader:
 
             if path.is_file():
                 if path.suffix == ".py":
-                    functions = self._load_functions_from_file(path)
-                    all_functions.extend(functions)
+                    files.append(path)
                 else:
                     logger.warning(f"Skipping non-Python file: {path}")
             elif path.is_dir():
-                functions = self._load_functions_from_directory(path)
-                all_functions.extend(functions)
+                # Skip private modules (e.g., __init__.py)
+                files.extend(p for p in path.glob("*.py") if not p.name.startswith("_"))
             else:
                 logger.warning(f"Path is neither file nor directory: {path}")
 
-        logger.debug(f"Loaded {len(all_functions)} function(s) from {len(paths)} path(s)")
-        return all_functions
-
-    def _load_functions_from_directory(self, directory: Path) -> List[Callable]:
-        """
-        Scan directory for Python files and load functions.
-
-        Args:
-            directory: Directory path to scan
-
-        Returns:
-            List of callable functions
-        """
-        functions = []
-
-        for py_file in directory.glob("*.py"):
-            if py_file.name.startswith("_"):
-                continue
-
-            file_functions = self._load_functions_from_file(py_file)
-            functions.extend(file_functions)
+        return files
 
-        return functions
+    def _load_module(self, file_path: Path) -> Optional[_PluginModule]:
+        """Load a plugin file through the cache; None if it fails."""
+        try:
+            module = self.plugin_cache.load(file_path)
+        except Exception as e:
+            logger.error(f"Failed to load functions from {file_path}: {e}", exc_info=True)
+            return None
+        self.loaded_modules[str(file_path)] = module.module
+        return module
 
     def _load_functions_from_file(self, file_path: Path) -> List[Callable]:
         """
@@ -173,37 +333,12 @@ class PluginLoader:
         Returns:
             List of callable functions
         """
-        functions = []
-
-        try:
-            # Create module name from file path
-            module_name = f"tactus_plugin_{file_path.stem}_{id(file_path)}"
-
-            # Load module dynamically
-            spec = importlib.util.spec_from_file_location(module_name, file_path)
-            if spec is None or spec.loader is None:
-                logger.error(f"Could not load spec for {file_path}")
-                return functions
-
-            module = importlib.util.module_from_spec(spec)
-            sys.modules[module_name] = module
-            spec.loader.exec_module(module)
-
-            # Cache the module
-            self.loaded_modules[str(file_path)] = module
-
-            logger.debug(f"Loaded module from {file_path}")
-
-            # Find all public functions in the module
-            for name, obj in inspect.getmembers(module):
-                if self._is_valid_tool_function(name, obj, module):
-                    functions.append(obj)
-                    logger.debug(f"Found function '{name}' in {file_path.name}")
-
-        except Exception as e:
-            logger.error(f"Failed to load functions from {file_path}: {e}", exc_info=True)
-
-        return functions
+        module = self._load_module(file_path)
+        if module is None:
+            return []
+        for function in module.functions:
+            logger.debug(f"Found function '{function.__name__}' in {file_path.name}")
+        return list(module.functions)
 
     def _create_trace_callback(self, toolset_name: str):
         """
@@ -277,43 +412,18 @@ class PluginLoader:
         """
         tools = []
 
-        try:
-            # Create module name from file path
-            module_name = f"tactus_plugin_{file_path.stem}_{id(file_path)}"
-
-            # Load module dynamically
-            spec = importlib.util.spec_from_file_location(module_name, file_path)
-            if spec is None or spec.loader is None:
-                logger.error(f"Could not load spec for {file_path}")
-                return tools
-
-            module = importlib.util.module_from_spec(spec)
-
-            # Add to sys.modules so imports work
-            sys.modules[module_name] = module
-
-            # Execute module
-            spec.loader.exec_module(module)
-
-            # Cache the module
-            self.loaded_modules[str(file_path)] = module
-
-            logger.debug(f"Loaded module from {file_path}")
-
-            # Find all public functions in the module
-            for name, obj in inspect.getmembers(module):
-                if self._is_valid_tool_function(name, obj, module):
-                    tool = self._create_tool_from_function(obj, name)
-                    if tool:
-                        tools.append(tool)
-                        logger.info(f"Loaded tool '{name}' from {file_path.name}")
-
-        except Exception as e:
-            logger.error(f"Failed to load tools from {file_path}: {e}", exc_info=True)
+        # Wrappers record calls in this loader's tool_primitive, so they are
+        # created per loader; the module comes from the cache
+        for function in self._load_functions_from_file(file_path):
+            tool = self._create_tool_from_function(function, function.__name__)
+            if tool:
+                tools.append(tool)
+                logger.info(f"Loaded tool '{function.__name__}' from {file_path.name}")
 
         return tools
 
-    def _is_valid_tool_function(self, name: str, obj: Any, module: Any) -> bool:
+    @staticmethod
+    def _is_valid_tool_function(name: str, obj: Any, module: Any) -> bool:
         """
         Check if an object is a valid tool function.
 
@@ -0,0 +1,631 @@
+"""
+SQLite storage backend for Tactus.
+
+Stores procedure metadata and the execution log in a single embedded
+database file. Checkpoints are rows keyed by (procedure_id, position), so
+saving after a checkpoint inserts one row instead of rewriting a document.
+
+With blob_threshold set, large results are kept in a content-addressed
+BlobStore in a "{db name}.blobs" directory next to the database, and the
+checkpoint row stores only a reference.
+
+The procedures table doubles as the status index: list_procedures() pages
+through it by (status, procedure_id) without touching checkpoint rows.
+
+Loading a procedure reads only the checkpoint index columns; each result is a
+SQLiteResult fetched by primary key when replay reaches it.
+
+Results and state are encoded with a StorageCodec: compact JSON text by
+default, or MessagePack BLOBs with codec="msgpack". Rows written with either
+encoding stay readable after switching.
+
+Forks are copy-on-write: fork_procedure() inserts one procedures row whose
+base_id/base_length point at the first base_length checkpoints of another
+procedure, and no checkpoint rows are copied. Before a base procedure's log
+is truncated below a fork point or the base is deleted, the checkpoints its
+forks still need are copied into them.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+from tactus.adapters.blob_store import REF_MAX_BYTES, BlobStore
+from tactus.adapters.codecs import JSONCodec, get_codec
+from tactus.adapters.status_index import query_procedure_page
+from tactus.protocols.codec import StorageCodec
+from tactus.protocols.models import (
+    ProcedureMetadata,
+    ProcedurePage,
+    ProcedureSummary,
+    CheckpointEntry,
+    LazyResult,
+    check_fork_position,
+    fork_lua_state,
+    resolve_result,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS procedures (
+    procedure_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL DEFAULT 'RUNNING',
+    waiting_on_message_id TEXT,
+    replay_index INTEGER NOT NULL DEFAULT 0,
+    state TEXT NOT NULL DEFAULT '{}',
+    lua_state TEXT NOT NULL DEFAULT '{}',
+    updated_at REAL NOT NULL,
+    parent_id TEXT,
+    parent_position INTEGER,
+    base_id TEXT,
+    base_length INTEGER NOT NULL DEFAULT 0
+);
+DROP INDEX IF EXISTS idx_procedures_status;
+CREATE INDEX IF NOT EXISTS idx_procedures_status_id ON procedures (status, procedure_id);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    procedure_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    result TEXT,
+    timestamp TEXT NOT NULL,
+    duration_ms REAL,
+    input_hash TEXT,
+    PRIMARY KEY (procedure_id, position)
+) WITHOUT ROWID;
+"""
+
+# Columns added to the procedures table after its first release, with their
+# types, so older databases can be upgraded in place
+_ADDED_PROCEDURE_COLUMNS = {
+    "parent_id": "TEXT",
+    "parent_position": "INTEGER",
+    "base_id": "TEXT",
+    "base_length": "INTEGER NOT NULL DEFAULT 0",
+}
+
+# Created after migration, since older databases lack the base_id column
+_INDEXES = "CREATE INDEX IF NOT EXISTS idx_procedures_base ON procedures (base_id);"
+
+
+class SQLiteResult(LazyResult):
+    """A checkpoint result fetched from its row on first use."""
+
+    __slots__ = ("_storage", "_procedure_id", "_position", "_loaded", "_value")
+
+    def __init__(self, storage: "SQLiteStorage", procedure_id: str, position: int):
+        self._storage = storage
+        self._procedure_id = procedure_id
+        self._position = position
+        self._loaded = False
+        self._value: Any = None
+
+    def load(self) -> Any:
+        """Select and decode the result (cached after the first call)."""
+        if not self._loaded:
+            self._value = self._storage._fetch_result(self._procedure_id, self._position)
+            self._loaded = True
+        return self._value
+
+
+class SQLiteStorage:
+    """
+    SQLite storage backend.
+
+    Uses WAL journaling so readers (e.g. status polling) don't block the
+    writer. A single connection is shared across threads behind a lock.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "~/.tactus/storage.db",
+        blob_threshold: Optional[int] = None,
+        codec: Union[str, StorageCodec, None] = None,
+    ):
+        """
+        Initialize SQLite storage.
+
+        Args:
+            db_path: Path to the database file (created if missing)
+            blob_threshold: Serialized result size in bytes at or above which
+                results are moved to the blob store (None disables blobs)
+            codec: Encoding for results and state: "json" (default), "msgpack",
+                or a StorageCodec instance
+        """
+        self.db_path = Path(db_path).expanduser()
+        self.codec = get_codec(codec) if codec is not None else JSONCodec(indent=None)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._blob_root = str(self.db_path.with_suffix(".blobs"))
+        self.blobs: Optional[BlobStore] = None
+        if blob_threshold is not None:
+            self.blobs = BlobStore(self._blob_root, threshold=blob_threshold)
+
+        try:
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            self._migrate()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to open SQLite storage {self.db_path}: {e}")
+
+    def _migrate(self) -> None:
+        """Add columns missing from a database created by an older version."""
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(procedures)")}
+        with self._conn:
+            for column, column_type in _ADDED_PROCEDURE_COLUMNS.items():
+                if column not in columns:
+                    self._conn.execute(f"ALTER TABLE procedures ADD COLUMN {column} {column_type}")
+            self._conn.executescript(_INDEXES)
+
+    def close(self) -> None:
+        """Close the database connection (unread lazy results become unreadable)."""
+        with self._lock:
+            self._conn.close()
+
+    def _dumps(self, value: Any) -> Union[str, bytes]:
+        """Encode a value with the codec (JSON is stored as TEXT, binary codecs as BLOB)."""
+        data = self.codec.encode(value)
+        return data if self.codec.binary else data.decode("utf-8")
+
+    def _loads(self, stored: Union[str, bytes]) -> Any:
+        """Decode a stored value written with either a text or a binary codec."""
+        if isinstance(stored, bytes):
+            codec = self.codec if self.codec.binary else get_codec("msgpack")
+            return codec.decode(stored)
+        return json.loads(stored)
+
+    def _dump_result(self, result: Any) -> str:
+        """Serialize a checkpoint result, moving large ones to the blob store."""
+        if self.blobs is not None:
+            result = self.blobs.externalize(result)
+        elif isinstance(result, LazyResult):
+            result = result.load()
+        return self._dumps(result)
+
+    def _load_result(self, stored: Optional[Union[str, bytes]]) -> Any:
+        """Deserialize a checkpoint result, deferring blob reads until replay."""
+        if stored is None:
+            return None
+        result = self._loads(stored)
+        if BlobStore.ref_digest(result) is not None:
+            result = (self.blobs or BlobStore(self._blob_root)).internalize(result)
+        return result
+
+    def referenced_blobs(self) -> Set[str]:
+        """Digests of the blobs referenced by any stored checkpoint."""
+        with self._lock:
+            try:
+                rows = self._conn.execute(
+                    "SELECT result FROM checkpoints WHERE LENGTH(result) <= ?", (REF_MAX_BYTES,)
+                ).fetchall()
+            except sqlite3.Error as e:
+                raise RuntimeError(f"Failed to read checkpoint results: {e}")
+        referenced: Set[str] = set()
+        for (stored,) in rows:
+            digest = BlobStore.ref_digest(self._loads(stored))
+            if digest is not None:
+                referenced.add(digest)
+        return referenced
+
+    def collect_blobs(
+        self, min_age_seconds: float = 3600.0, dry_run: bool = False
+    ) -> Tuple[List[str], int]:
+        """
+        Delete blobs that no stored checkpoint references (see BlobStore.sweep).
+
+        Returns:
+            Deleted (or, for dry runs, unreferenced) digests and bytes freed
+        """
+        blobs = self.blobs or BlobStore(self._blob_root)
+        return blobs.sweep(self.referenced_blobs(), min_age_seconds, dry_run)
+
+    def _fetch_result(self, procedure_id: str, position: int) -> Any:
+        """Read one checkpoint result by primary key (following fork bases)."""
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT result FROM checkpoints WHERE procedure_id = ? AND position = ?",
+                    (self._owner(procedure_id, position), position),
+                ).fetchone()
+            except sqlite3.Error as e:
+                raise RuntimeError(
+                    f"Failed to read checkpoint {position} of procedure {procedure_id}: {e}"
+                )
+        if row is None:
+            raise RuntimeError(f"Checkpoint {position} of procedure {procedure_id} not found")
+        return resolve_result(self._load_result(row[0]))
+
+    def _ensure_procedure(self, procedure_id: str) -> None:
+        """Insert an empty procedure row if none exists (caller holds the lock)."""
+        self._conn.execute(
+            "INSERT OR IGNORE INTO procedures (procedure_id, updated_at) VALUES (?, ?)",
+            (procedure_id, time.time()),
+        )
+
+    def _owner(self, procedure_id: str, position: int) -> str:
+        """Find the procedure whose row holds a checkpoint (caller holds the lock)."""
+        while True:
+            row = self._conn.execute(
+                "SELECT base_id, base_length FROM procedures WHERE procedure_id = ?",
+                (procedure_id,),
+            ).fetchone()
+            if row is None or row[0] is None or position >= row[1]:
+                return procedure_id
+            procedure_id = row[0]
+
+    def _segments(self, procedure_id: str) -> List[Tuple[str, int, Optional[int]]]:
+        """
+        Split a procedure's execution log by the procedure whose rows hold it.
+
+        Returns (procedure_id, start, end) position ranges, latest first; end
+        is None for the procedure's own open-ended range. Caller holds the lock.
+        """
+        segments: List[Tuple[str, int, Optional[int]]] = []
+        end: Optional[int] = None
+        current: Optional[str] = procedure_id
+        while current is not None:
+            row = self._conn.execute(
+                "SELECT base_id, base_length FROM procedures WHERE procedure_id = ?",
+                (current,),
+            ).fetchone()
+            base_id, base_length = row if row is not None else (None, 0)
+            start = base_length if base_id is not None else 0
+            if end is None or start < end:
+                segments.append((current, start, end))
+            end = start if end is None else min(end, start)
+            current = base_id
+        return segments
+
+    def _stored_length(self, procedure_id: str) -> int:
+        """Length of a procedure's stored execution log (caller holds the lock)."""
+        (stored,) = self._conn.execute(
+            "SELECT MAX(COALESCE((SELECT MAX(position) + 1 FROM checkpoints "
+            "WHERE procedure_id = ?), 0), COALESCE((SELECT base_length FROM procedures "
+            "WHERE procedure_id = ? AND base_id IS NOT NULL), 0))",
+            (procedure_id, procedure_id),
+        ).fetchone()
+        return stored
+
+    def _detach_forks(self, procedure_id: str, length: int) -> None:
+        """
+        Copy into each fork of a procedure the checkpoints at or beyond length
+        that it shares, so the procedure's log can be truncated to length.
+        Caller holds the lock and a transaction.
+        """
+        forks = self._conn.execute(
+            "SELECT procedure_id, base_length FROM procedures "
+            "WHERE base_id = ? AND base_length > ?",
+            (procedure_id, length),
+        ).fetchall()
+        if not forks:
+            return
+        segments = self._segments(procedure_id)
+        for fork_id, base_length in forks:
+            for source_id, start, end in segments:
+                self._conn.execute(
+                    "INSERT INTO checkpoints (procedure_id, position, type, result, timestamp, "
+                    "duration_ms, input_hash) SELECT ?, position, type, result, timestamp, "
+                    "duration_ms, input_hash FROM checkpoints "
+                    "WHERE procedure_id = ? AND position >= ? AND position < ?",
+                    (
+                        fork_id,
+                        source_id,
+                        max(start, length),
+                        base_length if end is None else min(end, base_length),
+                    ),
+                )
+            self._conn.execute(
+                "UPDATE procedures SET base_length = ?, "
+                "base_id = CASE WHEN ? = 0 THEN NULL ELSE base_id END WHERE procedure_id = ?",
+                (length, length, fork_id),
+            )
+
+    def load_procedure_metadata(self, procedure_id: str) -> ProcedureMetadata:
+        """Load procedure metadata from the database."""
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT status, waiting_on_message_id, replay_index, state, lua_state, "
+                    "parent_id, parent_position FROM procedures WHERE procedure_id = ?",
+                    (procedure_id,),
+                ).fetchone()
+                if row is None:
+                    return ProcedureMetadata(procedure_id=procedure_id)
+
+                checkpoint_rows = []
+                for source_id, start, end in reversed(self._segments(procedure_id)):
+                    checkpoint_rows.extend(
+                        self._conn.execute(
+                            "SELECT position, type, timestamp, duration_ms, input_hash "
+                            "FROM checkpoints WHERE procedure_id = ? AND position >= ? "
+                            "AND position < COALESCE(?, position + 1) ORDER BY position",
+                            (source_id, start, end),
+                        ).fetchall()
+                    )
+            except sqlite3.Error as e:
+                raise RuntimeError(f"Failed to load procedure {procedure_id}: {e}")
+
+        (
+            status,
+            waiting_on_message_id,
+            replay_index,
+            state,
+            lua_state,
+            parent_id,
+            parent_position,
+        ) = row
+        execution_log = [
+            CheckpointEntry(
+                position=position,
+                type=checkpoint_type,
+                result=SQLiteResult(self, procedure_id, position),
+                timestamp=datetime.fromisoformat(timestamp),
+                duration_ms=duration_ms,
+                input_hash=input_hash,
+            )
+            for position, checkpoint_type, timestamp, duration_ms, input_hash in (checkpoint_rows)
+        ]
+
+        return ProcedureMetadata(
+            procedure_id=procedure_id,
+            execution_log=execution_log,
+            replay_index=replay_index,
+            state=self._loads(state),
+            lua_state=self._loads(lua_state),
+            status=status,
+            waiting_on_message_id=waiting_on_message_id,
+            parent_id=parent_id,
+            parent_position=parent_position,
+        )
+
+    def save_procedure_metadata(self, procedure_id: str, metadata: ProcedureMetadata) -> None:
+        """
+        Save procedure metadata to the database.
+
+        Only checkpoints beyond the stored log length are inserted; a shorter
+        log (after checkpoint_clear_after) deletes the trailing rows, after
+        copying any that forks of this procedure still share.
+        """
+        execution_log = metadata.execution_log
+
+        with self._lock:
+            try:
+                with self._conn:
+                    stored = self._stored_length(procedure_id)
+
+                    if len(execution_log) < stored:
+                        self._detach_forks(procedure_id, len(execution_log))
+                        self._conn.execute(
+                            "DELETE FROM checkpoints WHERE procedure_id = ? AND position >= ?",
+                            (procedure_id, len(execution_log)),
+                        )
+                        # Stop sharing the base's checkpoints past the new end
+                        self._conn.execute(
+                            "UPDATE procedures SET base_length = ?, "
+                            "base_id = CASE WHEN ? = 0 THEN NULL ELSE base_id END "
+                            "WHERE procedure_id = ? AND base_length > ?",
+                            (
+                                len(execution_log),
+                                len(execution_log),
+                                procedure_id,
+                                len(execution_log),
+                            ),
+                        )
+                        stored = len(execution_log)
+
+                    self._conn.executemany(
+                        "INSERT INTO checkpoints (procedure_id, position, type, result, "
+                        "timestamp, duration_ms, input_hash) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        [
+                            (
+                                procedure_id,
+                                position,
+                                entry.type,
+                                self._dump_result(entry.result),
+                                entry.timestamp.isoformat(),
+                                entry.duration_ms,
+                                entry.input_hash,
+                            )
+                            for position, entry in enumerate(execution_log[stored:], start=stored)
+                        ],
+                    )
+
+                    self._conn.execute(
+                        "INSERT INTO procedures (procedure_id, status, waiting_on_message_id, "
+                        "replay_index, state, lua_state, updated_at, parent_id, parent_position) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                        "ON CONFLICT (procedure_id) DO UPDATE SET "
+                        "status = excluded.status, "
+                        "waiting_on_message_id = excluded.waiting_on_message_id, "
+                        "replay_index = excluded.replay_index, "
+                        "state = excluded.state, "
+                        "lua_state = excluded.lua_state, "
+                        "updated_at = excluded.updated_at, "
+                        "parent_id = excluded.parent_id, "
+                        "parent_position = excluded.parent_position",
+                        (
+                            procedure_id,
+                            metadata.status,
+                            metadata.waiting_on_message_id,
+                            metadata.replay_index,
+                            self._dumps(metadata.state),
+                            self._dumps(metadata.lua_state),
+                            time.time(),
+                            metadata.parent_id,
+                            metadata.parent_position,
+                        ),
+                    )
+            except sqlite3.Error as e:
+                raise RuntimeError(f"Failed to save procedure {procedure_id}: {e}")
+
+    def update_procedure_status(
+        self, procedure_id: str, status: str, waiting_on_message_id: Optional[str] = None
+    ) -> None:
+        """Update procedure status with a single UPDATE."""
+        with self._lock:
+            try:
+                with self._conn:
+                    self._ensure_procedure(procedure_id)
+                    self._conn.execute(
+                        "UPDATE procedures SET status = ?, waiting_on_message_id = ?, "
+                        "updated_at = ? WHERE procedure_id = ?",
+                        (status, waiting_on_message_id, time.time(), procedure_id),
+                    )
+            except sqlite3.Error as e:
+                raise RuntimeError(f"Failed to update status of procedure {procedure_id}: {e}")
+
+    def get_status(self, procedure_id: str) -> ProcedureSummary:
+        """Read procedure status from its procedures row."""
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT status, waiting_on_message_id, updated_at FROM procedures "
+                    "WHERE procedure_id = ?",
+                    (procedure_id,),
+                ).fetchone()
+            except sqlite3.Error as e:
+                raise RuntimeError(f"Failed to read status of procedure {procedure_id}: {e}")
+        if row is None:
+            return ProcedureSummary(procedure_id=procedure_id, status="RUNNING")
+        status, waiting_on_message_id, updated_at = row
+        return ProcedureSummary(
+            procedure_id=procedure_id,
+            status=status,
+            waiting_on_message_id=waiting_on_message_id,
+            updated_at=datetime.fromtimestamp(updated_at, tz=timezone.utc),
+        )
+
+    def set_status(
+        self, procedure_id: str, status: str, waiting_on_message_id: Optional[str] = None
+    ) -> None:
+        """Set procedure status with a single UPDATE."""
+        self.update_procedure_status(procedure_id, status, waiting_on_message_id)
+
+    def patch_state(self, procedure_id: str, updates: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge keys into the state column in one transaction."""
+        with self._lock:
+            try:
+                with self._conn:
+                    self._ensure_procedure(procedure_id)
+                    (stored,) = self._conn.execute(
+                        "SELECT state FROM procedures WHERE procedure_id = ?", (procedure_id,)
+                    ).fetchone()
+                    state = {**self._loads(stored), **updates}
+                    self._conn.execute(
+                        "UPDATE procedures SET state = ?, updated_at = ? WHERE procedure_id = ?",
+                        (self._dumps(state), time.time(), procedure_id),
+                    )
+            except sqlite3.Error as e:
+                raise RuntimeError(f"Failed to write state of procedure {procedure_id}: {e}")
+        return state
+
+    def get_state(self, procedure_id: str) -> Dict[str, Any]:
+        """Get mutable state dictionary without loading the execution log."""
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT state FROM procedures WHERE procedure_id = ?", (procedure_id,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                raise RuntimeError(f"Failed to read state of procedure {procedure_id}: {e}")
+        return self._loads(row[0]) if row else {}
+
+    def set_state(self, procedure_id: str, state: Dict[str, Any]) -> None:
+        """Set mutable state dictionary without touching the execution log."""
+        with self._lock:
+            try:
+                with self._conn:
+                    self._ensure_procedure(procedure_id)
+                    self._conn.execute(
+                        "UPDATE procedures SET state = ?, updated_at = ? WHERE procedure_id = ?",
+                        (self._dumps(state), time.time(), procedure_id),
+                    )
+            except sqlite3.Error as e:
+                raise RuntimeError(f"Failed to write state of procedure {procedure_id}: {e}")
+
+    def list_procedures(
+        self, status: Optional[str] = None, limit: int = 100, cursor: Optional[str] = None
+    ) -> ProcedurePage:
+        """List procedures from the procedures table, without loading checkpoints."""
+        with self._lock:
+            try:
+                return query_procedure_page(self._conn, status, limit, cursor)
+            except sqlite3.Error as e:
+                raise RuntimeError(f"Failed to list procedures: {e}")
+
+    def fork_procedure(self, procedure_id: str, at_position: int, new_id: str) -> None:
+        """
+        Create a new procedure sharing the first at_position checkpoints of another.
+
+        Inserts a single procedures row; no checkpoint rows are copied.
+        """
+        with self._lock:
+            try:
+                with self._conn:
+                    row = self._conn.execute(
+                        "SELECT lua_state FROM procedures WHERE procedure_id = ?",
+                        (procedure_id,),
+                    ).fetchone()
+                    if row is None:
+                        raise ValueError(f"Procedure {procedure_id} not found")
+                    exists = self._conn.execute(
+                        "SELECT 1 FROM procedures WHERE procedure_id = ?", (new_id,)
+                    ).fetchone()
+                    if exists is not None:
+                        raise ValueError(f"Procedure {new_id} already exists")
+                    check_fork_position(
+                        at_position, self._stored_length(procedure_id), procedure_id
+                    )
+
+                    self._conn.execute(
+                        "INSERT INTO procedures (procedure_id, state, lua_state, updated_at, "
+                        "base_id, base_length) VALUES (?, ?, ?, ?, ?, ?)",
+                        (
+                            new_id,
+                            self._dumps({}),
+                            self._dumps(fork_lua_state(self._loads(row[0]), at_position)),
+                            time.time(),
+                            procedure_id if at_position > 0 else None,
+                            at_position,
+                        ),
+                    )
+            except sqlite3.Error as e:
+                raise RuntimeError(f"Failed to fork procedure {procedure_id}: {e}")
+
+    def delete_procedure(self, procedure_id: str) -> int:
+        """
+        Delete a procedure and its checkpoint rows.
+
+        Forks of the procedure get copies of the checkpoints they share first.
+        Blobs are content-addressed and may be shared, so they are left in
+        place for collect_blobs() (run by `tactus gc`).
+
+        Returns:
+            Size of the deleted row data in bytes (freed pages are reused by
+            later writes; the database file itself only shrinks on VACUUM)
+        """
+        with self._lock:
+            try:
+                with self._conn:
+                    self._detach_forks(procedure_id, 0)
+                    (reclaimed,) = self._conn.execute(
+                        "SELECT COALESCE((SELECT SUM(LENGTH(result) + LENGTH(type) "
+                        "+ LENGTH(timestamp) + COALESCE(LENGTH(input_hash), 0)) FROM checkpoints "
+                        "WHERE procedure_id = ?), 0) + COALESCE((SELECT LENGTH(state) "
+                        "+ LENGTH(lua_state) FROM procedures WHERE procedure_id = ?), 0)",
+                        (procedure_id, procedure_id),
+                    ).fetchone()
+                    self._conn.execute(
+                        "DELETE FROM checkpoints WHERE procedure_id = ?", (procedure_id,)
+                    )
+                    self._conn.execute(
+                        "DELETE FROM procedures WHERE procedure_id = ?", (procedure_id,)
+                    )
+            except sqlite3.Error as e:
+                raise RuntimeError(f"Failed to delete procedure {procedure_id}: {e}")
+        return reclaimed
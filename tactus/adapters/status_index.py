@@ -0,0 +1,168 @@
+"""
+Procedure status index for Tactus storage backends.
+
+Maps procedure_id to status, waiting_on_message_id and updated_at in a small
+SQLite table indexed by (status, procedure_id), so procedures in a given
+status can be listed page by page without opening every procedure document.
+SQLiteStorage keeps these columns in its own procedures table; FileStorage
+keeps a StatusIndex in {storage_dir}/index.db.
+"""
+
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from tactus.protocols.models import ProcedurePage, ProcedureSummary
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS procedures (
+    procedure_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    waiting_on_message_id TEXT,
+    updated_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_procedures_status_id ON procedures (status, procedure_id);
+"""
+
+
+def query_procedure_page(
+    conn: sqlite3.Connection,
+    status: Optional[str] = None,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+) -> ProcedurePage:
+    """
+    Read one page of a procedures table ordered by procedure_id.
+
+    The table must have procedure_id, status, waiting_on_message_id and
+    updated_at (epoch seconds) columns. The cursor is the last procedure_id of
+    the previous page, so pages stay stable while procedures change status.
+    """
+    conditions = []
+    params: list = []
+    if status is not None:
+        conditions.append("status = ?")
+        params.append(status)
+    if cursor is not None:
+        conditions.append("procedure_id > ?")
+        params.append(cursor)
+    where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    rows = conn.execute(
+        "SELECT procedure_id, status, waiting_on_message_id, updated_at FROM procedures"
+        f"{where} ORDER BY procedure_id LIMIT ?",
+        (*params, limit + 1),
+    ).fetchall()
+
+    procedures = [
+        ProcedureSummary(
+            procedure_id=procedure_id,
+            status=row_status,
+            waiting_on_message_id=waiting_on_message_id,
+            updated_at=datetime.fromtimestamp(updated_at, tz=timezone.utc),
+        )
+        for procedure_id, row_status, waiting_on_message_id, updated_at in rows[:limit]
+    ]
+    next_cursor = procedures[-1].procedure_id if len(rows) > limit else None
+    return ProcedurePage(procedures=procedures, next_cursor=next_cursor)
+
+
+class StatusIndex:
+    """Status index stored in its own SQLite database file."""
+
+    def __init__(self, db_path: str):
+        """
+        Open (or create) the index.
+
+        Args:
+            db_path: Path to the index database file
+
+        Attributes:
+            created: True if the database did not exist and the index is empty
+        """
+        self.db_path = Path(db_path).expanduser()
+        self.created = not self.db_path.exists()
+        self._lock = threading.Lock()
+
+        try:
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to open status index {self.db_path}: {e}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def update(
+        self,
+        procedure_id: str,
+        status: str,
+        waiting_on_message_id: Optional[str] = None,
+        updated_at: Optional[float] = None,
+    ) -> None:
+        """Insert or update a procedure's index entry."""
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO procedures "
+                        "(procedure_id, status, waiting_on_message_id, updated_at) "
+                        "VALUES (?, ?, ?, ?)",
+                        (
+                            procedure_id,
+                            status,
+                            waiting_on_message_id,
+                            updated_at if updated_at is not None else time.time(),
+                        ),
+                    )
+            except sqlite3.Error as e:
+                raise RuntimeError(f"Failed to update status index {self.db_path}: {e}")
+
+    def get(self, procedure_id: str) -> Optional[ProcedureSummary]:
+        """Read a procedure's index entry (None if it is not indexed)."""
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT status, waiting_on_message_id, updated_at FROM procedures "
+                    "WHERE procedure_id = ?",
+                    (procedure_id,),
+                ).fetchone()
+            except sqlite3.Error as e:
+                raise RuntimeError(f"Failed to read status index {self.db_path}: {e}")
+        if row is None:
+            return None
+        status, waiting_on_message_id, updated_at = row
+        return ProcedureSummary(
+            procedure_id=procedure_id,
+            status=status,
+            waiting_on_message_id=waiting_on_message_id,
+            updated_at=datetime.fromtimestamp(updated_at, tz=timezone.utc),
+        )
+
+    def remove(self, procedure_id: str) -> None:
+        """Remove a procedure's index entry if present."""
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.execute(
+                        "DELETE FROM procedures WHERE procedure_id = ?", (procedure_id,)
+                    )
+            except sqlite3.Error as e:
+                raise RuntimeError(f"Failed to update status index {self.db_path}: {e}")
+
+    def list_procedures(
+        self, status: Optional[str] = None, limit: int = 100, cursor: Optional[str] = None
+    ) -> ProcedurePage:
+        """List indexed procedures (see query_procedure_page)."""
+        with self._lock:
+            try:
+                return query_procedure_page(self._conn, status, limit, cursor)
+            except sqlite3.Error as e:
+                raise RuntimeError(f"Failed to read status index {self.db_path}: {e}")
@@ -2,6 +2,19 @@
 Tactus CLI module.
 """
 
-from tactus.cli.app import main
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tactus.cli.app import main
 
 __all__ = ["main"]
+
+
+def __getattr__(name):
+    # The application (typer, rich) is only imported when it is used, so that
+    # the launcher can hand commands to a zygote without loading it
+    if name == "main":
+        from tactus.cli.app import main
+
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -14,23 +14,20 @@ os.environ["PYDANTIC_DISABLE_PLUGINS"] = "1"
 
 import asyncio
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 import logging
 import sys
+import uuid
 
 import typer
 from rich.console import Console
 from rich.logging import RichHandler
 from rich.panel import Panel
 from rich.table import Table
-from dotyaml import load_config
 
-from tactus.core import TactusRuntime
-from tactus.core.yaml_parser import ProcedureYAMLParser, ProcedureConfigError
-from tactus.validation import TactusValidator, ValidationMode
-from tactus.adapters.memory import MemoryStorage
-from tactus.adapters.file_storage import FileStorage
-from tactus.adapters.cli_hitl import CLIHITLHandler
+# Tactus modules are imported inside the commands that use them, so that each
+# command only pays for what it loads (the runtime alone pulls in pydantic-ai
+# and the provider SDKs)
 
 # Setup rich console for pretty output
 console = Console()
@@ -56,6 +53,8 @@ def load_tactus_config():
     config_path = Path.cwd() / ".tactus" / "config.yml"
 
     if config_path.exists():
+        from dotyaml import load_config
+
         try:
             # Load config without prefix - this means top-level keys become env vars directly
             # e.g., openai_api_key in YAML -> OPENAI_API_KEY env var
@@ -118,14 +117,86 @@ def setup_logging(verbose: bool = False):
     )
 
 
+def _create_storage_backend(
+    storage: str,
+    storage_path: Optional[Path],
+    journal: bool = False,
+    codec: str = "json",
+    shard: Optional[bool] = None,
+):
+    """
+    Create a storage backend from CLI options.
+
+    File storage defaults to .tac/storage and SQLite to .tac/storage/tactus.db
+    under the current directory.
+
+    Raises:
+        ValueError: If the backend or codec is unknown
+        RuntimeError: If the backend cannot be opened
+    """
+    from tactus.adapters.file_storage import FileStorage
+    from tactus.adapters.memory import MemoryStorage
+    from tactus.adapters.sqlite_storage import SQLiteStorage
+
+    if storage == "memory":
+        return MemoryStorage()
+    if storage == "file":
+        if not storage_path:
+            storage_path = Path.cwd() / ".tac" / "storage"
+        else:
+            # Ensure storage_path is a directory path, not a file path
+            storage_path = Path(storage_path)
+            if storage_path.is_file():
+                storage_path = storage_path.parent
+        return FileStorage(storage_dir=str(storage_path), journal=journal, codec=codec, shard=shard)
+    if storage == "sqlite":
+        if not storage_path:
+            storage_path = Path.cwd() / ".tac" / "storage" / "tactus.db"
+        else:
+            # A directory gets the default database file name
+            storage_path = Path(storage_path)
+            if storage_path.is_dir():
+                storage_path = storage_path / "tactus.db"
+        return SQLiteStorage(db_path=str(storage_path), codec=codec)
+    raise ValueError(f"Unknown storage backend: {storage}")
+
+
 @app.command()
 def run(
     workflow_file: Path = typer.Argument(..., help="Path to workflow file (.tac)"),
-    storage: str = typer.Option("memory", help="Storage backend: memory, file"),
-    storage_path: Optional[Path] = typer.Option(None, help="Path for file storage"),
+    storage: str = typer.Option("memory", help="Storage backend: memory, file, sqlite"),
+    storage_path: Optional[Path] = typer.Option(None, help="Path for file or sqlite storage"),
+    journal: bool = typer.Option(
+        False, "--journal", help="Append checkpoints to a journal (file storage only)"
+    ),
+    codec: str = typer.Option("json", help="Encoding for file or sqlite storage: json, msgpack"),
+    shard: bool = typer.Option(
+        False,
+        "--shard",
+        help="Store procedure files in hashed subdirectories (file storage only)",
+    ),
+    durability: Optional[str] = typer.Option(
+        None, help="When to persist checkpoints: always, batch, on_suspend"
+    ),
+    write_behind: bool = typer.Option(
+        False, "--write-behind", help="Save checkpoints on an I/O thread while the procedure runs"
+    ),
+    memo_cache: Optional[Path] = typer.Option(
+        None, help="SQLite file caching results of memoized agents, models and steps"
+    ),
+    procedure_cache: Optional[Path] = typer.Option(
+        None, help="Directory caching compiled procedures across runs"
+    ),
+    reload_plugins: bool = typer.Option(
+        False, "--reload-plugins", help="Execute tool plugin files again instead of reusing them"
+    ),
     openai_api_key: Optional[str] = typer.Option(
         None, envvar="OPENAI_API_KEY", help="OpenAI API key"
     ),
+    fork_from: Optional[str] = typer.Option(
+        None,
+        help="Rerun a stored procedure from a checkpoint position, as <procedure_id>@<position>",
+    ),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose logging"),
     param: Optional[list[str]] = typer.Option(None, help="Parameters in format key=value"),
 ):
@@ -140,11 +211,37 @@ def run(
         # Run with file storage
         tactus run workflow.tac --storage file --storage-path ./data
 
+        # Run with SQLite storage (single database file)
+        tactus run workflow.tac --storage sqlite --storage-path ./data/tactus.db
+
+        # Run with journaled file storage (append-only checkpoint log)
+        tactus run workflow.tac --storage file --journal
+
+        # Store checkpoints in compact binary form
+        tactus run workflow.tac --storage file --codec msgpack
+
+        # Share memoized agent/model results across runs
+        tactus run workflow.tac --memo-cache ~/.tactus/memo.db
+
+        # Reuse the compiled procedure on later runs
+        tactus run workflow.tac --procedure-cache ~/.tactus/procedures
+
+        # Execute tool plugin files again (e.g. after editing a module they import)
+        tactus run workflow.tac --reload-plugins
+
+        # Replay the first 3 checkpoints of an earlier run, then execute live
+        tactus run workflow.tac --storage sqlite --fork-from cli-workflow@3
+
         # Pass parameters
         tactus run workflow.tac --param task="Analyze data" --param count=5
     """
     setup_logging(verbose)
 
+    from tactus.adapters.cli_hitl import CLIHITLHandler
+    from tactus.adapters.memo_cache import SQLiteMemoCache
+    from tactus.core.procedure_cache import ProcedureCache
+    from tactus.core.runtime import TactusRuntime
+
     # Check if file exists
     if not workflow_file.exists():
         console.print(f"[red]Error:[/red] Workflow file not found: {workflow_file}")
@@ -156,6 +253,18 @@ def run(
     # Read workflow file
     source_content = workflow_file.read_text()
 
+    # Parse fork point
+    fork_point = None
+    if fork_from:
+        source_id, _, position = fork_from.rpartition("@")
+        if not source_id or not position.isdigit():
+            console.print(
+                f"[red]Error:[/red] Invalid --fork-from: {fork_from} "
+                "(expected <procedure_id>@<position>)"
+            )
+            raise typer.Exit(1)
+        fork_point = (source_id, int(position))
+
     # Parse parameters
     context = {}
     if param:
@@ -169,21 +278,26 @@ def run(
             context[key] = value
 
     # Setup storage backend
-    if storage == "memory":
-        storage_backend = MemoryStorage()
-    elif storage == "file":
-        if not storage_path:
-            storage_path = Path.cwd() / ".tac" / "storage"
-        else:
-            # Ensure storage_path is a directory path, not a file path
-            storage_path = Path(storage_path)
-            if storage_path.is_file():
-                storage_path = storage_path.parent
-        storage_backend = FileStorage(storage_dir=str(storage_path))
-    else:
-        console.print(f"[red]Error:[/red] Unknown storage backend: {storage}")
+    try:
+        storage_backend = _create_storage_backend(
+            storage, storage_path, journal, codec, shard=shard or None
+        )
+    except (ValueError, RuntimeError) as e:
+        console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1)
 
+    # Procedure ID (a new one when forking a stored procedure)
+    procedure_id = f"cli-{workflow_file.stem}"
+    if fork_point:
+        source_id, position = fork_point
+        procedure_id = f"{source_id}-fork-{uuid.uuid4().hex[:8]}"
+        try:
+            storage_backend.fork_procedure(source_id, position, procedure_id)
+        except (ValueError, RuntimeError) as e:
+            console.print(f"[red]Error:[/red] {e}")
+            raise typer.Exit(1)
+        console.print(f"Forked {source_id} at position {position} as [bold]{procedure_id}[/bold]")
+
     # Setup HITL handler
     hitl_handler = CLIHITLHandler(console=console)
 
@@ -205,6 +319,33 @@ def run(
     # Get MCP servers from merged config
     mcp_servers = merged_config.get("mcp_servers", {})
 
+    # Checkpoint durability policy: CLI option > config
+    durability_config = durability or merged_config.get("durability")
+    if write_behind:
+        if isinstance(durability_config, str):
+            durability_config = {"policy": durability_config}
+        durability_config = {**(durability_config or {}), "write_behind": True}
+
+    # Memo cache: CLI option > config (a path, or {path, max_entries, ttl_seconds})
+    memo_cache_config = merged_config.get("memo_cache") or {}
+    if isinstance(memo_cache_config, str):
+        memo_cache_config = {"path": memo_cache_config}
+    if memo_cache:
+        memo_cache_config = {**memo_cache_config, "path": str(memo_cache)}
+    memo_cache_backend = None
+    if memo_cache_config.get("path"):
+        memo_cache_backend = SQLiteMemoCache(
+            db_path=memo_cache_config["path"],
+            max_entries=memo_cache_config.get("max_entries", 100_000),
+            ttl_seconds=memo_cache_config.get("ttl_seconds"),
+        )
+
+    # Compiled procedure cache directory: CLI option > config
+    procedure_cache_dir = procedure_cache or merged_config.get("procedure_cache")
+    procedure_cache_backend = (
+        ProcedureCache(cache_dir=str(procedure_cache_dir)) if procedure_cache_dir else None
+    )
+
     # Override context params with CLI params (CLI takes precedence)
     if param:
         # Merge: CLI params override config params
@@ -224,7 +365,6 @@ def run(
     logging.getLogger("tactus.primitives").setLevel(logging.WARNING)
 
     # Create runtime
-    procedure_id = f"cli-{workflow_file.stem}"
     runtime = TactusRuntime(
         procedure_id=procedure_id,
         storage_backend=storage_backend,
@@ -235,6 +375,10 @@ def run(
         openai_api_key=api_key,
         log_handler=log_handler,
         tool_paths=tool_paths,
+        external_config={"durability": durability_config} if durability_config else None,
+        memo_cache=memo_cache_backend,
+        procedure_cache=procedure_cache_backend,
+        reload_plugins=reload_plugins,
     )
 
     # Execute procedure
@@ -301,6 +445,9 @@ def validate(
     """
     setup_logging(verbose)
 
+    from tactus.core.yaml_parser import ProcedureYAMLParser, ProcedureConfigError
+    from tactus.validation import TactusValidator, ValidationMode
+
     # Check if file exists
     if not workflow_file.exists():
         console.print(f"[red]Error:[/red] Workflow file not found: {workflow_file}")
@@ -991,6 +1138,129 @@ def _display_pydantic_eval_results(report):
         console.print(f"  Duration: {avg_duration:.2f}s")
 
 
+@app.command()
+def ps(
+    storage: str = typer.Option("file", help="Storage backend: file, sqlite"),
+    storage_path: Optional[Path] = typer.Option(None, help="Path for file or sqlite storage"),
+    status: Optional[str] = typer.Option(
+        None, help="Only show procedures in this status (e.g. WAITING_FOR_HUMAN)"
+    ),
+    limit: int = typer.Option(50, help="Maximum number of procedures to show"),
+    cursor: Optional[str] = typer.Option(None, help="Continue a previous listing"),
+    ids_only: bool = typer.Option(False, "--ids", help="Print procedure IDs only"),
+):
+    """
+    List stored procedures and their status.
+
+    Examples:
+
+        # Procedures waiting for a human response
+        tactus ps --status WAITING_FOR_HUMAN
+
+        # Page through a SQLite store
+        tactus ps --storage sqlite --limit 100 --cursor <next cursor>
+    """
+    try:
+        storage_backend = _create_storage_backend(storage, storage_path)
+        page = storage_backend.list_procedures(status=status, limit=limit, cursor=cursor)
+    except (ValueError, RuntimeError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    if ids_only:
+        for summary in page.procedures:
+            print(summary.procedure_id)
+        return
+
+    table = Table(title="Procedures")
+    table.add_column("Procedure ID", style="cyan")
+    table.add_column("Status", style="magenta")
+    table.add_column("Waiting On")
+    table.add_column("Updated")
+    for summary in page.procedures:
+        table.add_row(
+            summary.procedure_id,
+            summary.status,
+            summary.waiting_on_message_id or "",
+            summary.updated_at.astimezone().strftime("%Y-%m-%d %H:%M:%S"),
+        )
+    console.print(table)
+
+    if page.next_cursor:
+        console.print(f"More procedures: [bold]--cursor {page.next_cursor}[/bold]")
+
+
+@app.command()
+def gc(
+    storage: str = typer.Option("file", help="Storage backend: file, sqlite"),
+    storage_path: Optional[Path] = typer.Option(None, help="Path for file or sqlite storage"),
+    completed_days: Optional[float] = typer.Option(
+        None, help="Delete COMPLETED procedures not updated for this many days"
+    ),
+    failed_days: Optional[float] = typer.Option(
+        None, help="Delete FAILED procedures not updated for this many days"
+    ),
+    batch_size: int = typer.Option(500, help="Procedures read per deletion batch"),
+    blob_min_age: float = typer.Option(
+        3600.0, help="Keep unreferenced blobs written less than this many seconds ago"
+    ),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Show what would be deleted"),
+):
+    """
+    Delete stored records that can no longer be resumed or replayed.
+
+    With --completed-days or --failed-days, first deletes finished procedures
+    older than that (RUNNING and WAITING_FOR_HUMAN procedures never expire).
+    Then removes sub-procedure records orphaned by their parents (the parent
+    was deleted or completed, or its execution log no longer reaches the call),
+    and finally blob store entries no remaining checkpoint references.
+
+    Examples:
+
+        # Preview, then collect
+        tactus gc --dry-run
+        tactus gc --storage sqlite --storage-path ~/.tactus/storage.db
+
+        # Keep completed procedures for a week and failed ones for a month
+        tactus gc --completed-days 7 --failed-days 30
+    """
+    from tactus.core.garbage_collection import (
+        RetentionPolicy,
+        collect_expired,
+        collect_orphaned_children,
+        collect_unreferenced_blobs,
+    )
+
+    try:
+        policy = RetentionPolicy(completed_days=completed_days, failed_days=failed_days)
+        storage_backend = _create_storage_backend(storage, storage_path)
+        report = collect_expired(storage_backend, policy, batch_size=batch_size, dry_run=dry_run)
+        orphaned = collect_orphaned_children(storage_backend, dry_run=dry_run)
+        # A dry run deleted nothing, so it cannot tell which blobs those
+        # deletions would free; it reports the blobs unreferenced already
+        blobs = collect_unreferenced_blobs(
+            storage_backend, min_age_seconds=blob_min_age, dry_run=dry_run
+        )
+    except (ValueError, RuntimeError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    action = "Would delete" if dry_run else "Deleted"
+    if policy.max_ages():
+        for procedure_id in report.deleted:
+            console.print(f"  {procedure_id}")
+        reclaimed = "" if dry_run else f", reclaimed {report.reclaimed_bytes:,} bytes"
+        console.print(f"{action} {len(report.deleted)} expired procedure(s){reclaimed}")
+
+    for procedure_id in orphaned:
+        console.print(f"  {procedure_id}")
+    console.print(f"{action} {len(orphaned)} orphaned sub-procedure record(s)")
+
+    if blobs.deleted:
+        reclaimed = "" if dry_run else f", reclaimed {blobs.reclaimed_bytes:,} bytes"
+        console.print(f"{action} {len(blobs.deleted)} unreferenced blob(s){reclaimed}")
+
+
 @app.command()
 def version():
     """Show Tactus version."""
@@ -999,6 +1269,50 @@ def version():
     console.print(f"Tactus version: [bold]{__version__}[/bold]")
 
 
+@app.command()
+def zygote(
+    socket_path: Optional[Path] = typer.Option(
+        None,
+        "--socket",
+        help="Socket to serve on (default: $TACTUS_ZYGOTE_SOCKET or ~/.tactus/zygote.sock)",
+    ),
+    tools: Optional[List[Path]] = typer.Option(
+        None,
+        "--tools",
+        help="Tool plugin file or directory to preload (repeatable)",
+    ),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Log every command served"),
+):
+    """
+    Serve tactus commands from a preloaded process, for fast startup.
+
+    While it runs, `tactus` commands started with the same socket (and the
+    same Python and Tactus version) are forked from this process instead of
+    importing the runtime again. Stop it with Ctrl-C.
+
+    Plugin files preloaded with --tools are reused by `tactus run` while they
+    are unchanged; run with --reload-plugins to execute them again.
+    """
+    from tactus.cli import zygote as zygote_server
+
+    setup_logging(verbose)
+    if not verbose:
+        logging.getLogger("tactus.cli.zygote").setLevel(logging.WARNING)
+
+    path = socket_path or zygote_server.socket_path()
+    try:
+        zygote_server.serve(
+            path,
+            ready=lambda: console.print(f"[green]Zygote serving at {path}[/green]"),
+            tool_paths=[str(p) for p in tools] if tools else None,
+        )
+    except KeyboardInterrupt:
+        console.print("Zygote stopped")
+    except RuntimeError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+
 @app.command()
 def ide(
     port: Optional[int] = typer.Option(None, help="Backend port (auto-detected if not specified)"),
@@ -1144,8 +1458,11 @@ def main():
             "validate",
             "test",
             "eval",
+            "ps",
+            "gc",
             "version",
             "ide",
+            "zygote",
         ]:
             # Check if it's a file that exists
             potential_file = Path(first_arg)
@@ -0,0 +1,27 @@
+"""
+Entry point of the `tactus` command.
+
+Hands the command to a running zygote (see tactus.cli.zygote) when there is
+one, and otherwise runs it in this process. Kept free of heavy imports so
+that handing a command over costs no more than starting Python.
+"""
+
+import sys
+
+
+def main():
+    """Run a tactus command, in the zygote if one is serving."""
+    if len(sys.argv) < 2 or sys.argv[1] != "zygote":
+        from tactus.cli.zygote import run_in_zygote
+
+        exit_code = run_in_zygote(sys.argv[1:])
+        if exit_code is not None:
+            sys.exit(exit_code)
+
+    from tactus.cli.app import main as app_main
+
+    app_main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,392 @@
+"""
+Fork-server ("zygote") for fast CLI startup.
+
+`tactus zygote` starts a server that imports the runtime, pydantic-ai and the
+provider SDKs once, then listens on a Unix socket. When the socket exists,
+the `tactus` command sends it its arguments, working directory, environment
+and standard streams, and the server forks a child that runs the command as
+if it had been started directly: the child writes to the caller's stdout and
+stderr file descriptors, reads its stdin, and its exit code becomes the
+caller's. Signals received by the caller (Ctrl-C) are forwarded to the child.
+Without a server, or when it runs a different Python or Tactus version, the
+command runs in-process as usual.
+
+The socket is ~/.tactus/zygote.sock, or TACTUS_ZYGOTE_SOCKET if set. It is
+created readable and writable by its owner only. Since the client hands over
+its environment (API keys included), it only connects to a socket owned by
+the same user in a directory no other user can write to, and the server only
+serves clients running as its own user. Forking needs a POSIX system;
+elsewhere the command always runs in-process.
+
+Wire format: every message is a 4-byte big-endian length followed by a JSON
+object. The client's first message carries its stdin, stdout and stderr
+file descriptors (SCM_RIGHTS). The server replies {"pid": N} once the child
+is running (or {"error": "..."} to refuse), and the child sends
+{"exit_code": N} when the command finishes.
+"""
+
+import json
+import logging
+import os
+import signal
+import socket
+import stat
+import struct
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SOCKET_ENV = "TACTUS_ZYGOTE_SOCKET"
+
+# Modules imported by the server before it forks (optional ones are skipped
+# when not installed)
+PRELOAD_MODULES = [
+    "tactus.cli.app",
+    "tactus.core.runtime",
+    "tactus.validation",
+    "tactus.adapters.cli_hitl",
+    "tactus.adapters.cli_log",
+    "tactus.adapters.file_storage",
+    "tactus.adapters.sqlite_storage",
+    "tactus.adapters.memo_cache",
+    "tactus.core.config_manager",
+]
+OPTIONAL_PRELOAD_MODULES = [
+    "pydantic_ai.models.openai",
+    "pydantic_ai.models.anthropic",
+    "pydantic_ai.models.bedrock",
+    "pydantic_ai.models.google",
+]
+
+_HEADER = struct.Struct(">I")
+_STREAMS = (0, 1, 2)
+_FORWARDED_SIGNALS = ("SIGINT", "SIGTERM", "SIGHUP", "SIGQUIT")
+# Seconds a client may take to send its request
+_HANDSHAKE_TIMEOUT = 5.0
+
+
+def socket_path() -> Path:
+    """Path of the zygote socket (TACTUS_ZYGOTE_SOCKET or ~/.tactus/zygote.sock)."""
+    configured = os.environ.get(SOCKET_ENV)
+    if configured:
+        return Path(configured)
+    return Path.home() / ".tactus" / "zygote.sock"
+
+
+def is_supported() -> bool:
+    """Whether this platform can run commands in a zygote."""
+    return hasattr(os, "fork") and hasattr(socket, "AF_UNIX") and hasattr(socket, "send_fds")
+
+
+def _untrusted_reason(path: Path) -> Optional[str]:
+    """Why the socket at path may belong to another user (None if it is ours)."""
+    uid = os.getuid()
+    info = os.stat(path)
+    if not stat.S_ISSOCK(info.st_mode):
+        return "not a socket"
+    if info.st_uid != uid:
+        return f"owned by uid {info.st_uid}"
+    parent = os.stat(Path(os.path.realpath(path)).parent)
+    if parent.st_uid != uid:
+        return f"its directory is owned by uid {parent.st_uid}"
+    if parent.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        return "its directory is writable by other users"
+    return None
+
+
+def _peer_uid(conn: socket.socket) -> Optional[int]:
+    """User ID of the process at the other end of conn (None if unknown)."""
+    if hasattr(socket, "SO_PEERCRED"):
+        creds = conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+        _, uid, _ = struct.unpack("3i", creds)
+        return uid
+    if hasattr(os, "getpeereid"):  # pragma: no cover - BSD and macOS
+        return os.getpeereid(conn.fileno())[0]
+    return None
+
+
+def _identity() -> Dict[str, str]:
+    """What the client and server must agree on to share a process image."""
+    from tactus import __version__
+
+    return {"version": __version__, "executable": sys.executable}
+
+
+def _recv_exactly(conn: socket.socket, size: int) -> bytes:
+    data = b""
+    while len(data) < size:
+        chunk = conn.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("Connection closed")
+        data += chunk
+    return data
+
+
+def _send_message(conn: socket.socket, message: Dict[str, Any], fds: List[int] = ()) -> None:
+    payload = json.dumps(message).encode("utf-8")
+    header = _HEADER.pack(len(payload))
+    if fds:
+        socket.send_fds(conn, [header], list(fds))
+    else:
+        conn.sendall(header)
+    conn.sendall(payload)
+
+
+def _recv_message(conn: socket.socket) -> Dict[str, Any]:
+    (size,) = _HEADER.unpack(_recv_exactly(conn, _HEADER.size))
+    return json.loads(_recv_exactly(conn, size))
+
+
+def _recv_request(conn: socket.socket):
+    """Receive a client request and the file descriptors sent with it."""
+    header, fds, _, _ = socket.recv_fds(conn, _HEADER.size, len(_STREAMS))
+    if len(header) < _HEADER.size:
+        header += _recv_exactly(conn, _HEADER.size - len(header))
+    (size,) = _HEADER.unpack(header)
+    return json.loads(_recv_exactly(conn, size)), fds
+
+
+def run_in_zygote(args: List[str]) -> Optional[int]:
+    """
+    Run a CLI command in the zygote, if one is serving.
+
+    Args:
+        args: Command-line arguments (without the program name)
+
+    Returns:
+        The command's exit code, or None if no compatible zygote is
+        available (the command has not run; run it in-process)
+    """
+    if not is_supported():
+        return None
+    path = socket_path()
+    if not path.exists():
+        return None
+    try:
+        reason = _untrusted_reason(path)
+    except OSError as e:
+        logger.debug(f"Zygote at {path} unavailable: {e}")
+        return None
+    if reason is not None:
+        logger.warning(f"Not using the zygote socket at {path}: {reason}")
+        return None
+
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.connect(str(path))
+        request = {
+            **_identity(),
+            "argv": args,
+            "cwd": os.getcwd(),
+            "env": dict(os.environ),
+        }
+        _send_message(conn, request, _STREAMS)
+        reply = _recv_message(conn)
+    except (OSError, ValueError) as e:
+        logger.debug(f"Zygote at {path} unavailable: {e}")
+        conn.close()
+        return None
+    if "pid" not in reply:
+        logger.debug(f"Zygote at {path} refused the command: {reply.get('error')}")
+        conn.close()
+        return None
+
+    # The command is running in the child from here on: never fall back
+    pid = reply["pid"]
+
+    def forward(signum, frame):
+        try:
+            os.kill(pid, signum)
+        except ProcessLookupError:
+            pass
+
+    for name in _FORWARDED_SIGNALS:
+        if hasattr(signal, name):
+            signal.signal(getattr(signal, name), forward)
+    try:
+        return int(_recv_message(conn)["exit_code"])
+    except (OSError, ValueError, KeyError):
+        # The child died without reporting (e.g. killed by a signal)
+        return 1
+    finally:
+        conn.close()
+
+
+def _run_child(conn: socket.socket, request: Dict[str, Any], fds: List[int]) -> None:
+    """Run a command in a forked child, as the client's process would have."""
+    import io
+
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+    # Adopt the client's standard streams, working directory and environment
+    for target, fd in zip(_STREAMS, fds):
+        os.dup2(fd, target)
+        os.close(fd)
+    sys.stdin = io.TextIOWrapper(io.FileIO(0, "r", closefd=False))
+    sys.stdout = io.TextIOWrapper(
+        io.FileIO(1, "w", closefd=False), line_buffering=os.isatty(1), write_through=True
+    )
+    sys.stderr = io.TextIOWrapper(
+        io.FileIO(2, "w", closefd=False), line_buffering=True, write_through=True
+    )
+    os.chdir(request["cwd"])
+    os.environ.clear()
+    os.environ.update(request["env"])
+    sys.argv = ["tactus", *request["argv"]]
+    # Let the command configure logging as it would in a new process
+    logging.getLogger().handlers.clear()
+
+    from rich.console import Console
+
+    import tactus.cli.app as cli
+
+    # The console detects the terminal and color support when it is created
+    cli.console = Console()
+
+    exit_code = 0
+    try:
+        cli.main()
+    except SystemExit as e:
+        if isinstance(e.code, int):
+            exit_code = e.code
+        elif e.code is not None:
+            print(e.code, file=sys.stderr)
+            exit_code = 1
+    except KeyboardInterrupt:
+        exit_code = 130
+    except BaseException:
+        import traceback
+
+        traceback.print_exc()
+        exit_code = 1
+    finally:
+        for stream in (sys.stdout, sys.stderr):
+            try:
+                stream.flush()
+            except Exception:
+                pass
+    try:
+        _send_message(conn, {"exit_code": exit_code})
+    except OSError:
+        pass
+    os._exit(exit_code)
+
+
+def _handle(conn: socket.socket, listener: socket.socket) -> None:
+    """Read one request and fork a child to run it."""
+    fds: List[int] = []
+    try:
+        peer_uid = _peer_uid(conn)
+        if peer_uid is not None and peer_uid != os.getuid():
+            logger.warning(f"Refused a client running as uid {peer_uid}")
+            return
+        conn.settimeout(_HANDSHAKE_TIMEOUT)
+        request, fds = _recv_request(conn)
+        conn.settimeout(None)
+        identity = _identity()
+        mismatch = [key for key, value in identity.items() if request.get(key) != value]
+        if mismatch:
+            _send_message(conn, {"error": f"Different {', '.join(mismatch)}"})
+            return
+        if len(fds) != len(_STREAMS):
+            _send_message(conn, {"error": "Standard streams were not sent"})
+            return
+
+        pid = os.fork()
+        if pid == 0:
+            listener.close()
+            _run_child(conn, request, fds)
+        _send_message(conn, {"pid": pid})
+        logger.info(f"Forked {pid} for: tactus {' '.join(request['argv'])}")
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Zygote request failed: {e}")
+    finally:
+        for fd in fds:
+            os.close(fd)
+        conn.close()
+
+
+def preload(tool_paths: Optional[List[str]] = None) -> None:
+    """
+    Import the modules every command would otherwise import on startup.
+
+    Args:
+        tool_paths: Tool plugin files or directories to load into the
+            plugin cache, so children reuse them while they are unchanged
+    """
+    import importlib
+
+    for module in PRELOAD_MODULES:
+        importlib.import_module(module)
+    for module in OPTIONAL_PRELOAD_MODULES:
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            logger.debug(f"Not preloading {module}: not installed")
+
+    # Children start with a warm sandbox (copied on fork)
+    from tactus.core.lua_sandbox import default_sandbox_pool
+
+    default_sandbox_pool().prewarm(1)
+
+    if tool_paths:
+        from tactus.adapters.plugins import PluginLoader
+
+        loaded = PluginLoader().preload(tool_paths)
+        logger.info(f"Preloaded {loaded} tool plugin file(s)")
+
+
+def serve(path: Optional[Path] = None, ready=None, tool_paths: Optional[List[str]] = None) -> None:
+    """
+    Serve CLI commands from a preloaded process until interrupted.
+
+    Args:
+        path: Socket path (defaults to socket_path())
+        ready: Called once the socket is listening
+        tool_paths: Tool plugin files or directories to preload
+    """
+    if not is_supported():
+        raise RuntimeError("The zygote needs fork() and Unix sockets (POSIX systems)")
+    path = Path(path) if path else socket_path()
+    preload(tool_paths)
+
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if path.exists():
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(path))
+        except OSError:
+            path.unlink()  # Left behind by a server that is gone
+        else:
+            raise RuntimeError(f"A zygote is already serving at {path}")
+        finally:
+            probe.close()
+
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)
+    try:
+        listener.bind(str(path))
+    finally:
+        os.umask(old_umask)
+    listener.listen(64)
+    # Children are not waited for: their clients report their exit codes
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    # Stopping the server removes its socket
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    logger.info(f"Zygote serving at {path}")
+    if ready is not None:
+        ready()
+    try:
+        while True:
+            conn, _ = listener.accept()
+            _handle(conn, listener)
+    finally:
+        listener.close()
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
@@ -2,19 +2,55 @@
 Tactus core - Runtime execution engine and core components.
 """
 
-from tactus.core.runtime import TactusRuntime
-from tactus.core.execution_context import (
-    ExecutionContext,
-    BaseExecutionContext,
-    InMemoryExecutionContext,
-)
-from tactus.core.lua_sandbox import LuaSandbox, LuaSandboxError
-from tactus.core.yaml_parser import ProcedureYAMLParser, ProcedureConfigError
-from tactus.core.output_validator import OutputValidator, OutputValidationError
-from tactus.core.exceptions import (
-    TactusRuntimeError,
-    ProcedureWaitingForHuman,
-)
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tactus.core.runtime import TactusRuntime
+    from tactus.core.execution_context import (
+        ExecutionContext,
+        BaseExecutionContext,
+        InMemoryExecutionContext,
+    )
+    from tactus.core.lua_sandbox import LuaSandbox, LuaSandboxError
+    from tactus.core.yaml_parser import ProcedureYAMLParser, ProcedureConfigError
+    from tactus.core.output_validator import OutputValidator, OutputValidationError
+    from tactus.core.exceptions import (
+        TactusRuntimeError,
+        ProcedureWaitingForHuman,
+    )
+
+# Imported on first access, so that importing a submodule (the registry, the
+# exceptions) does not load the runtime and pydantic-ai
+_LAZY_EXPORTS = {
+    "TactusRuntime": "tactus.core.runtime",
+    "ExecutionContext": "tactus.core.execution_context",
+    "BaseExecutionContext": "tactus.core.execution_context",
+    "InMemoryExecutionContext": "tactus.core.execution_context",
+    "LuaSandbox": "tactus.core.lua_sandbox",
+    "LuaSandboxError": "tactus.core.lua_sandbox",
+    "ProcedureYAMLParser": "tactus.core.yaml_parser",
+    "ProcedureConfigError": "tactus.core.yaml_parser",
+    "OutputValidator": "tactus.core.output_validator",
+    "OutputValidationError": "tactus.core.output_validator",
+    "TactusRuntimeError": "tactus.core.exceptions",
+    "ProcedureWaitingForHuman": "tactus.core.exceptions",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     "TactusRuntime",
@@ -0,0 +1,244 @@
+"""
+Typed checkpoint serialization for Tactus.
+
+Checkpoint results are stored by backends that only understand plain data
+(JSON, MessagePack, SQLite). CheckpointCodecRegistry converts the rich values
+returned by checkpointed operations into a tagged plain form before they are
+recorded, and rebuilds them on replay or memo hits:
+
+    {"$type": "<tag>", "value": <plain data>}
+
+Built-in codecs cover ResultPrimitive (agent turn results), pydantic-ai
+messages, RunUsage and pydantic models (including agent output types).
+Plain data passes through unchanged, except dicts that have a "$type" key of
+their own, which are wrapped under the "dict" tag so they are not mistaken
+for tagged values. Values of other types are left as they are for the
+storage codec to handle.
+"""
+
+import dataclasses
+import importlib
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+TYPE_KEY = "$type"
+VALUE_KEY = "value"
+# Tag of plain dicts that contain TYPE_KEY themselves
+DICT_TAG = "dict"
+
+_PLAIN_TYPES = (str, int, float, bool, type(None))
+
+Encoder = Callable[["CheckpointCodecRegistry", Any], Any]
+Decoder = Callable[["CheckpointCodecRegistry", Any], Any]
+
+
+class CheckpointCodecRegistry:
+    """Registry of tagged codecs for checkpoint results."""
+
+    def __init__(self):
+        # Codecs keyed by exact type, for encoding
+        self._by_type: Dict[type, Tuple[str, Encoder]] = {}
+        # Decoders keyed by tag
+        self._by_tag: Dict[str, Decoder] = {DICT_TAG: _decode_dict}
+        # Pydantic models that may not be importable by name (e.g. generated
+        # output types), keyed by "module:qualname"
+        self._models: Dict[str, Type[BaseModel]] = {}
+
+    def register(self, tag: str, cls: type, encode: Encoder, decode: Decoder) -> None:
+        """
+        Register a codec for values of exactly type cls.
+
+        Args:
+            tag: Name stored with encoded values (must be unique)
+            cls: Type handled by the codec (subclasses need their own registration)
+            encode: Converts a value to plain data; may call registry.encode()
+            decode: Rebuilds a value from plain data; may call registry.decode()
+        """
+        self._by_type[cls] = (tag, encode)
+        self._by_tag[tag] = decode
+
+    def register_model(self, model: Type[BaseModel]) -> None:
+        """Make a pydantic model class rebuildable even if it cannot be imported by name."""
+        self._models[_model_path(model)] = model
+
+    def scoped(self) -> "CheckpointCodecRegistry":
+        """
+        Create a registry with this registry's codecs and models.
+
+        Models registered with the new registry are not added to this one, so
+        an execution context using its own scoped registry releases the output
+        models registered during its run along with it.
+        """
+        scoped = CheckpointCodecRegistry()
+        scoped._by_type.update(self._by_type)
+        scoped._by_tag.update(self._by_tag)
+        scoped._models.update(self._models)
+        return scoped
+
+    def encode(self, value: Any) -> Any:
+        """Convert a value to its stored form."""
+        if isinstance(value, _PLAIN_TYPES):
+            return value
+        if isinstance(value, dict):
+            encoded = {key: self.encode(item) for key, item in value.items()}
+            if TYPE_KEY in value:
+                return {TYPE_KEY: DICT_TAG, VALUE_KEY: encoded}
+            return encoded
+        if isinstance(value, (list, tuple)):
+            return [self.encode(item) for item in value]
+
+        codec = self._by_type.get(type(value))
+        if codec is not None:
+            tag, encode = codec
+            return {TYPE_KEY: tag, VALUE_KEY: encode(self, value)}
+        if isinstance(value, BaseModel):
+            return {TYPE_KEY: "pydantic.model", VALUE_KEY: _encode_model(self, value)}
+        return value
+
+    def decode(self, value: Any) -> Any:
+        """Rebuild a value from its stored form."""
+        if isinstance(value, dict):
+            tag = value.get(TYPE_KEY)
+            if tag is not None and len(value) == 2 and VALUE_KEY in value:
+                decode = self._by_tag.get(tag)
+                if decode is None:
+                    logger.warning(
+                        f"No checkpoint codec registered for '{tag}'; returning raw data"
+                    )
+                    return value[VALUE_KEY]
+                return decode(self, value[VALUE_KEY])
+            return {key: self.decode(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self.decode(item) for item in value]
+        return value
+
+    def find_model(self, path: str) -> Optional[Type[BaseModel]]:
+        """Resolve a "module:qualname" model path to a registered or importable class."""
+        model = self._models.get(path)
+        if model is not None:
+            return model
+        module_name, _, qualname = path.partition(":")
+        try:
+            obj: Any = importlib.import_module(module_name)
+            for part in qualname.split("."):
+                obj = getattr(obj, part)
+        except (ImportError, AttributeError, ValueError):
+            return None
+        if isinstance(obj, type) and issubclass(obj, BaseModel):
+            self._models[path] = obj
+            return obj
+        return None
+
+
+def _decode_dict(registry: CheckpointCodecRegistry, value: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: registry.decode(item) for key, item in value.items()}
+
+
+def _model_path(model: Type[BaseModel]) -> str:
+    return f"{model.__module__}:{model.__qualname__}"
+
+
+def _encode_model(registry: CheckpointCodecRegistry, value: BaseModel) -> Dict[str, Any]:
+    return {"model": _model_path(type(value)), "data": value.model_dump(mode="json")}
+
+
+def _decode_model(registry: CheckpointCodecRegistry, value: Dict[str, Any]) -> Any:
+    model = registry.find_model(value["model"])
+    if model is None:
+        # The class is gone (or was generated at runtime and not registered):
+        # the data is still usable as a dict
+        logger.warning(f"Cannot rebuild model {value['model']}; returning its data as a dict")
+        return value["data"]
+    return model.model_validate(value["data"])
+
+
+def _encode_datetime(registry: CheckpointCodecRegistry, value: datetime) -> str:
+    return value.isoformat()
+
+
+def _decode_datetime(registry: CheckpointCodecRegistry, value: str) -> datetime:
+    return datetime.fromisoformat(value)
+
+
+def _register_pydantic_ai(registry: CheckpointCodecRegistry) -> None:
+    """Register codecs for pydantic-ai messages, usage and agent results."""
+    from pydantic_ai.messages import ModelMessagesTypeAdapter, ModelRequest, ModelResponse
+    from pydantic_ai.usage import RunUsage
+
+    from tactus.primitives.result import ResultPrimitive, RestoredRunResult
+
+    def encode_messages(messages):
+        return ModelMessagesTypeAdapter.dump_python(list(messages), mode="json")
+
+    def encode_message(registry, value):
+        return encode_messages([value])[0]
+
+    def decode_message(registry, value):
+        return ModelMessagesTypeAdapter.validate_python([value])[0]
+
+    def encode_usage(registry, value):
+        return dataclasses.asdict(value)
+
+    def decode_usage(registry, value):
+        return RunUsage(**value)
+
+    def encode_result(registry, value):
+        run = value._result
+        encoded = {
+            "output": registry.encode(run.output),
+            # Only this turn's messages: the earlier conversation is already in
+            # previous checkpoints, and storing it again would grow every turn
+            "messages": encode_messages(run.new_messages()),
+            "usage": encode_usage(registry, run.usage()),
+        }
+        streamed_text = getattr(value, "_streamed_text", None)
+        if streamed_text:
+            encoded["streamed_text"] = streamed_text
+        return encoded
+
+    def decode_result(registry, value):
+        result = ResultPrimitive(
+            RestoredRunResult(
+                output=registry.decode(value["output"]),
+                messages=ModelMessagesTypeAdapter.validate_python(value["messages"]),
+                run_usage=decode_usage(registry, value["usage"]),
+            )
+        )
+        if value.get("streamed_text"):
+            result._streamed_text = value["streamed_text"]
+        return result
+
+    registry.register("pydantic_ai.message", ModelRequest, encode_message, decode_message)
+    registry.register("pydantic_ai.message", ModelResponse, encode_message, decode_message)
+    registry.register("pydantic_ai.usage", RunUsage, encode_usage, decode_usage)
+    registry.register("tactus.result", ResultPrimitive, encode_result, decode_result)
+
+
+def create_default_registry() -> CheckpointCodecRegistry:
+    """Create a registry with the built-in codecs."""
+    registry = CheckpointCodecRegistry()
+    # The generic pydantic model codec is applied by isinstance(), so only its
+    # decoder is registered by tag
+    registry._by_tag["pydantic.model"] = _decode_model
+    registry.register("datetime", datetime, _encode_datetime, _decode_datetime)
+    try:
+        _register_pydantic_ai(registry)
+    except ImportError:
+        logger.debug("pydantic-ai not available; agent result codecs not registered")
+    return registry
+
+
+_default_registry: Optional[CheckpointCodecRegistry] = None
+
+
+def default_registry() -> CheckpointCodecRegistry:
+    """Return the shared registry used by execution contexts by default."""
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = create_default_registry()
+    return _default_registry
@@ -6,13 +6,130 @@ Implements cascading configuration from multiple sources with clear priority ord
 
 import logging
 import os
+import threading
+import time
 import yaml
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Callable, Dict, Any, Optional, List, Tuple
 from copy import deepcopy
 
 logger = logging.getLogger(__name__)
 
+# Files modified this recently may change again within the same mtime tick;
+# cascades that read them are not cached
+_RACY_WINDOW = 2.0
+
+Sources = List[Tuple[str, Dict[str, Any]]]
+Stamp = Tuple[Tuple[str, Optional[int], Optional[int]], ...]
+
+
+def _stamp(paths: List[str]) -> Stamp:
+    """(path, mtime_ns, size) for each path; None for missing files."""
+    stamp = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            stamp.append((path, None, None))
+        else:
+            stamp.append((path, stat.st_mtime_ns, stat.st_size))
+    return tuple(stamp)
+
+
+def _copy_config(value: Any) -> Any:
+    """Copy parsed YAML (dicts, lists and scalars); much faster than deepcopy."""
+    if isinstance(value, dict):
+        return {key: _copy_config(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_config(item) for item in value]
+    return value
+
+
+class ConfigCache:
+    """
+    Parsed and merged configuration cascades, reused while their files are unchanged.
+
+    A cascade is keyed by the working directory, the configuration taken from
+    environment variables and the (path, mtime, size) of every file it may
+    read, including the ones that do not exist yet. Each lookup stats those
+    files, so an edited, created or deleted file is picked up by the next load.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Cascades kept; the least recently used is dropped first
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, Tuple[Sources, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(
+        self,
+        env_config: Dict[str, Any],
+        candidates: List[str],
+        loader: Callable[[], Tuple[Sources, Dict[str, Any]]],
+    ) -> Tuple[Sources, Dict[str, Any]]:
+        """
+        Return the cached cascade for a procedure, or call loader() and cache it.
+
+        Args:
+            env_config: Configuration taken from environment variables
+            candidates: Every config file the cascade may read
+            loader: Reads and merges the cascade; returns (sources, merged)
+
+        Returns:
+            (sources, merged config); the merged config is a copy the caller may modify
+        """
+        stamp = _stamp(candidates)
+        key = (os.getcwd(), repr(sorted(env_config.items())), stamp)
+        with self._lock:
+            if key in self._entries:
+                return self._hit(key)
+
+        # The stamp was taken before reading: a file changed meanwhile has a
+        # newer one, so the next lookup misses
+        sources, merged = loader()
+        newest = max((mtime for _, mtime, _ in stamp if mtime is not None), default=0)
+        if newest / 1e9 < time.time() - _RACY_WINDOW:
+            with self._lock:
+                self._entries[key] = (sources, merged)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return list(sources), _copy_config(merged)
+
+    def _hit(self, key: tuple) -> Tuple[Sources, Dict[str, Any]]:
+        self._entries.move_to_end(key)
+        sources, merged = self._entries[key]
+        return list(sources), _copy_config(merged)
+
+    def invalidate(self) -> int:
+        """Drop every cached cascade; returns how many were dropped."""
+        with self._lock:
+            dropped = len(self._entries)
+            self._entries.clear()
+        return dropped
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_default_cache: Optional[ConfigCache] = None
+
+
+def default_config_cache() -> ConfigCache:
+    """Return the cache shared by configuration managers by default."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ConfigCache()
+    return _default_cache
+
 
 class ConfigManager:
     """
@@ -27,9 +144,19 @@ class ConfigManager:
     6. Environment variables (fallback)
     """
 
-    def __init__(self):
-        """Initialize configuration manager."""
+    def __init__(self, cache: Optional[ConfigCache] = None, use_cache: bool = True):
+        """
+        Initialize configuration manager.
+
+        Args:
+            cache: Cache of loaded cascades (defaults to the process-wide cache)
+            use_cache: Set to False to read the files on every load
+        """
         self.loaded_configs = []  # Track loaded configs for debugging
+        if use_cache:
+            self.cache = cache if cache is not None else default_config_cache()
+        else:
+            self.cache = None
 
     def load_cascade(self, procedure_path: Path) -> Dict[str, Any]:
         """
@@ -41,10 +168,39 @@ class ConfigManager:
         Returns:
             Merged configuration dictionary
         """
+        env_config = self._load_from_environment()
+
+        def load():
+            configs = self._load_sources(procedure_path, env_config)
+            return configs, self._merge_configs([c[1] for c in configs])
+
+        if self.cache is None:
+            configs, merged = load()
+        else:
+            configs, merged = self.cache.load(
+                env_config, self._candidate_files(procedure_path), load
+            )
+
+        # Store for debugging
+        self.loaded_configs = configs
+
+        logger.info(f"Merged configuration from {len(configs)} source(s)")
+        return merged
+
+    def _load_sources(self, procedure_path: Path, env_config: Dict[str, Any]) -> Sources:
+        """
+        Read the configuration sources of a procedure, lowest priority first.
+
+        Args:
+            procedure_path: Path to the .tac procedure file
+            env_config: Configuration taken from environment variables
+
+        Returns:
+            List of (source label, config) tuples
+        """
         configs = []
 
         # 1. Environment variables (lowest priority)
-        env_config = self._load_from_environment()
         if env_config:
             configs.append(("environment", env_config))
             logger.debug("Loaded config from environment variables")
@@ -82,14 +238,33 @@ class ConfigManager:
                 configs.append(("sidecar", sidecar_config))
                 logger.info(f"Loaded sidecar config: {sidecar_path}")
 
-        # Store for debugging
-        self.loaded_configs = configs
+        return configs
 
-        # Merge all configs (later configs override earlier ones)
-        merged = self._merge_configs([c[1] for c in configs])
+    def _candidate_files(self, procedure_path: Path) -> List[str]:
+        """
+        List every config file load_cascade() may read, whether it exists or not.
 
-        logger.info(f"Merged configuration from {len(configs)} source(s)")
-        return merged
+        Args:
+            procedure_path: Path to the .tac procedure file
+
+        Returns:
+            Config file paths
+        """
+        cwd = os.path.realpath(os.getcwd())
+        candidates = [os.path.join(cwd, ".tactus", "config.yml")]
+
+        # Directory configs from the procedure's directory up to cwd (or root)
+        procedure = os.fspath(procedure_path)
+        current = os.path.realpath(os.path.dirname(os.path.abspath(procedure)))
+        parent = os.path.dirname(current)
+        while current != parent and current != cwd:
+            candidates.append(os.path.join(current, ".tactus", "config.yml"))
+            current, parent = parent, os.path.dirname(parent)
+
+        candidates.append(procedure + ".yml")
+        if procedure_path.suffix == ".tac":
+            candidates.append(os.fspath(procedure_path.with_suffix(".yml")))
+        return candidates
 
     def _find_sidecar_config(self, tac_path: Path) -> Optional[Path]:
         """
@@ -5,12 +5,16 @@ This module provides the infrastructure for declaring, creating, and managing
 external dependencies (HTTP clients, databases, caches) that procedures need.
 """
 
+import asyncio
 from enum import Enum
 from typing import Dict, Any
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Default time limit, in seconds, for creating one dependency
+DEFAULT_CREATE_TIMEOUT = 30.0
+
 
 class ResourceType(Enum):
     """Supported dependency resource types."""
@@ -110,27 +114,71 @@ class ResourceFactory:
         return redis.from_url(url, encoding="utf-8", decode_responses=True)
 
     @staticmethod
-    async def create_all(dependencies_config: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    async def create_all(
+        dependencies_config: Dict[str, Dict[str, Any]],
+        timeout: float = DEFAULT_CREATE_TIMEOUT,
+    ) -> Dict[str, Any]:
         """
         Create all dependencies from configuration.
 
+        Dependencies are independent of each other, so they are created
+        concurrently: setup takes as long as the slowest one rather than the
+        sum of all of them. Each one must be created within its
+        'connect_timeout' config value (default: timeout). If any of them
+        fails, the others are cancelled, those already created are closed,
+        and the first error is raised.
+
         Args:
             dependencies_config: Dict mapping dependency name to config
+            timeout: Default time limit, in seconds, for creating one dependency
 
         Returns:
             Dict mapping dependency name to created resource
-        """
-        resources = {}
 
+        Raises:
+            ValueError: If a dependency has no 'type' field or an unknown type
+            TimeoutError: If a dependency is not created in time
+        """
         for name, config in dependencies_config.items():
-            resource_type = config.get("type")
-            if not resource_type:
+            if not config.get("type"):
                 raise ValueError(f"Dependency '{name}' missing 'type' field")
 
+        async def create_one(name: str, config: Dict[str, Any]) -> Any:
+            resource_type = config["type"]
+            limit = config.get("connect_timeout", timeout)
             logger.info(f"Creating dependency '{name}' of type '{resource_type}'")
-            resources[name] = await ResourceFactory.create(resource_type, config)
-
-        return resources
+            try:
+                return await asyncio.wait_for(ResourceFactory.create(resource_type, config), limit)
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"Dependency '{name}' was not created within {limit}s")
+
+        names = list(dependencies_config)
+        if not names:
+            return {}
+        tasks = [
+            asyncio.ensure_future(create_one(name, dependencies_config[name])) for name in names
+        ]
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            error = next(
+                (t.exception() for t in tasks if t.done() and not t.cancelled() and t.exception()),
+                None,
+            )
+        except BaseException as e:  # The caller was cancelled
+            error = e
+        if error is None:
+            return {name: task.result() for name, task in zip(names, tasks)}
+
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # Close what was created before the failure
+        partial = ResourceManager()
+        for name, task in zip(names, tasks):
+            if not task.cancelled() and task.exception() is None:
+                await partial.add_resource(name, task.result())
+        await partial.cleanup()
+        raise error
 
 
 class ResourceManager:
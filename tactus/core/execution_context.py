@@ -6,13 +6,111 @@ Uses pluggable storage and HITL handlers via protocols.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Optional, Callable, List, Dict
+from concurrent.futures import Future
+from typing import Any, Optional, Callable, List, Dict, Union
 from datetime import datetime, timezone
+import atexit
+import copy
+import hashlib
+import json
+import logging
+import re
 import time
+import weakref
 
+from tactus.adapters.async_storage import ThreadPoolStorage
+from tactus.core.checkpoint_codecs import CheckpointCodecRegistry, default_registry
 from tactus.protocols.storage import StorageBackend
 from tactus.protocols.hitl import HITLHandler
-from tactus.protocols.models import HITLRequest, HITLResponse, CheckpointEntry
+from tactus.protocols.memo import MemoCache
+from tactus.protocols.models import (
+    HITLRequest,
+    HITLResponse,
+    CheckpointEntry,
+    ProcedureMetadata,
+    resolve_result,
+)
+
+logger = logging.getLogger(__name__)
+
+# Durability policies: when checkpoints are persisted to the storage backend
+DURABILITY_ALWAYS = "always"  # Persist after every checkpoint
+DURABILITY_BATCH = "batch"  # Persist every N checkpoints or T milliseconds
+DURABILITY_ON_SUSPEND = "on_suspend"  # Persist only on HITL suspend, completion, error or exit
+DURABILITY_POLICIES = (DURABILITY_ALWAYS, DURABILITY_BATCH, DURABILITY_ON_SUSPEND)
+
+# Returned by MemoCache.get() on a miss (cached results may be None)
+_MEMO_MISS = object()
+
+# Stored statuses a new context resumes by replaying the execution log. A
+# COMPLETED or FAILED procedure is run again from a fresh log instead, unless
+# the context is created with replay_finished=True.
+RESUMABLE_STATUSES = ("RUNNING", "WAITING_FOR_HUMAN")
+
+# Contexts holding checkpoints that have not reached storage yet, flushed at interpreter exit
+_unflushed_contexts: "weakref.WeakSet[BaseExecutionContext]" = weakref.WeakSet()
+
+
+def compute_input_hash(checkpoint_type: str, inputs: Dict[str, Any]) -> str:
+    """
+    Hash the inputs of a checkpointed operation.
+
+    Inputs are encoded as canonical JSON (sorted keys; values JSON can't
+    represent are stringified), so equal inputs hash equally across runs.
+
+    Args:
+        checkpoint_type: Type of checkpoint (agent_turn, model_predict, ...)
+        inputs: Everything that determines the operation's result
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    canonical = json.dumps(
+        {"type": checkpoint_type, "inputs": inputs},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+# Last ID parts that storage backends give a meaning of their own: FileStorage
+# takes "{procedure_id}.header.json" for the sidecar header of a procedure
+_RESERVED_SLUGS = frozenset({"header"})
+
+
+def child_procedure_id(parent_id: str, key: Union[int, str], name: str) -> str:
+    """
+    Derive the ID of a sub-procedure invocation.
+
+    The ID depends only on the parent, the invocation's place in the parent
+    (its checkpoint position, or a spawn ordinal) and the procedure name, so a
+    resumed parent finds the same child record, with its own execution log,
+    instead of starting the child over.
+
+    Args:
+        parent_id: ID of the invoking procedure
+        key: Checkpoint position of the call (or another stable key, e.g. "spawn0")
+        name: Procedure name or file path
+
+    Returns:
+        ID of the form "{parent_id}.{key}.{name}" (name reduced to a safe file
+        name that no storage backend reserves)
+    """
+    slug = re.sub(r"[^A-Za-z0-9_-]+", "_", name.rsplit("/", 1)[-1].split(".", 1)[0]) or "procedure"
+    if slug in _RESERVED_SLUGS:
+        slug += "_"
+    return f"{parent_id}.{key}.{slug}"
+
+
+@atexit.register
+def _flush_unflushed_contexts() -> None:
+    """Persist pending checkpoints of all live contexts at interpreter exit."""
+    for context in list(_unflushed_contexts):
+        try:
+            context.flush()
+        except Exception as e:
+            logger.warning(f"Failed to flush checkpoints for {context.procedure_id} at exit: {e}")
 
 
 class ExecutionContext(ABC):
@@ -24,13 +122,23 @@ class ExecutionContext(ABC):
     """
 
     @abstractmethod
-    def checkpoint(self, fn: Callable[[], Any], checkpoint_type: str) -> Any:
+    def checkpoint(
+        self,
+        fn: Callable[[], Any],
+        checkpoint_type: str,
+        input_hash: Optional[str] = None,
+        memoize: bool = False,
+        memo_ttl_seconds: Optional[float] = None,
+    ) -> Any:
         """
         Execute fn with position-based checkpointing. On replay, return stored result.
 
         Args:
             fn: Function to execute (should be deterministic)
             checkpoint_type: Type of checkpoint (agent_turn, model_predict, procedure_call, etc.)
+            input_hash: Optional hash of the operation's inputs
+            memoize: Reuse results memoized for the same input_hash, if supported
+            memo_ttl_seconds: Lifetime of a memoized result
 
         Returns:
             Result of fn() on first execution, cached result from execution log on replay
@@ -103,9 +211,18 @@ class BaseExecutionContext(ExecutionContext):
     def __init__(
         self,
         procedure_id: str,
-        storage_backend: StorageBackend,
+        storage_backend: Union[StorageBackend, ThreadPoolStorage],
         hitl_handler: Optional[HITLHandler] = None,
         strict_determinism: bool = False,
+        durability: str = DURABILITY_ALWAYS,
+        batch_size: int = 100,
+        batch_interval_ms: float = 1000.0,
+        memo_cache: Optional[MemoCache] = None,
+        write_behind: bool = False,
+        codecs: Optional[CheckpointCodecRegistry] = None,
+        parent_id: Optional[str] = None,
+        parent_position: Optional[int] = None,
+        replay_finished: bool = False,
     ):
         """
         Initialize base execution context.
@@ -115,33 +232,136 @@ class BaseExecutionContext(ExecutionContext):
             storage_backend: Storage backend for execution log and state
             hitl_handler: Optional HITL handler for human interactions
             strict_determinism: If True, raise errors for non-deterministic operations outside checkpoints
+            durability: When to persist checkpoints: "always" (after every checkpoint),
+                "batch" (every batch_size checkpoints or batch_interval_ms), or
+                "on_suspend" (only on HITL suspend, completion, error or interpreter exit)
+            batch_size: Checkpoints per flush under the "batch" policy
+            batch_interval_ms: Maximum time between flushes under the "batch" policy
+            memo_cache: Optional cache of results shared across procedures, used by
+                checkpoints that opt in with memoize=True
+            write_behind: If True, saves run on a storage I/O thread while the
+                procedure continues. Each save must finish before the next
+                checkpoint is recorded, and all saves finish before a HITL
+                suspend or flush() returns. The context's I/O thread is stopped
+                by close(). Implied when storage_backend is a ThreadPoolStorage
+                (whose pool is then shared and left running).
+            codecs: Registry converting checkpoint results to and from their
+                stored form (a scoped copy of the default registry if None)
+            parent_id: ID of the invoking procedure, if this is a sub-procedure
+            parent_position: Checkpoint position of the invoking call in the parent
+            replay_finished: If True, a COMPLETED or FAILED procedure replays its
+                log like an unfinished one instead of starting over (used for the
+                sub-procedures of a resumed procedure)
         """
+        if durability not in DURABILITY_POLICIES:
+            raise ValueError(
+                f"Unknown durability policy '{durability}' "
+                f"(expected one of: {', '.join(DURABILITY_POLICIES)})"
+            )
+
         self.procedure_id = procedure_id
+        self._writer: Optional[ThreadPoolStorage] = None
+        # Whether close() stops the writer (it is not shared with other contexts)
+        self._owns_writer = False
+        if isinstance(storage_backend, ThreadPoolStorage):
+            self._writer = storage_backend
+            storage_backend = storage_backend.backend
+        elif write_behind:
+            self._writer = ThreadPoolStorage(storage_backend, max_workers=1)
+            self._owns_writer = True
         self.storage = storage_backend
         self.hitl = hitl_handler
         self.strict_determinism = strict_determinism
+        self.durability = durability
+        self.batch_size = batch_size
+        self.batch_interval_ms = batch_interval_ms
+        self.memo_cache = memo_cache
+        # Models registered during the run (agent output types) stay with
+        # this context's registry instead of accumulating in the default one
+        self.codecs = codecs if codecs is not None else default_registry().scoped()
+
+        # Checkpoints recorded since the last flush to storage
+        self._unflushed = 0
+        self._last_flush = time.monotonic()
+        # Save running on the writer's I/O thread (write-behind only)
+        self._pending_write: Optional[Future] = None
 
         # Checkpoint scope tracking for determinism safety
         self._inside_checkpoint = False
 
-        # Load procedure metadata (contains execution_log and replay_index)
+        # Load procedure metadata (contains execution_log and replay_index).
+        # A new context re-runs the procedure from the top, so an unfinished
+        # procedure replays from the first checkpoint (or jumps ahead via
+        # restore_snapshot()); a finished one starts over with an empty log.
         self.metadata = self.storage.load_procedure_metadata(procedure_id)
+        # False if this run starts over instead of continuing an earlier one
+        self.resumed = self.metadata.status in RESUMABLE_STATUSES or replay_finished
+        if not self.resumed:
+            logger.info(
+                f"Procedure {procedure_id} is {self.metadata.status}; "
+                f"starting a new run instead of replaying its log"
+            )
+            self.metadata = ProcedureMetadata(procedure_id=procedure_id)
+        self.metadata.replay_index = 0
+        if parent_id is not None:
+            self.metadata.parent_id = parent_id
+            self.metadata.parent_position = parent_position
 
-    def checkpoint(self, fn: Callable[[], Any], checkpoint_type: str) -> Any:
+    def checkpoint(
+        self,
+        fn: Callable[[], Any],
+        checkpoint_type: str,
+        input_hash: Optional[str] = None,
+        memoize: bool = False,
+        memo_ttl_seconds: Optional[float] = None,
+    ) -> Any:
         """
         Execute fn with position-based checkpointing.
 
         On replay, returns cached result from execution log.
         On first execution, runs fn(), records in log, and returns result.
+        Results are recorded (and memoized) in the stored form produced by
+        self.codecs, and rebuilt from it on replay and memo hits.
+
+        Args:
+            fn: Function to execute
+            checkpoint_type: Type of checkpoint (agent_turn, model_predict, ...)
+            input_hash: Hash of the operation's inputs (see compute_input_hash),
+                recorded in the log and used as the memo cache key
+            memoize: If True and a memo cache is configured, reuse a result
+                previously computed for the same input_hash by any procedure
+            memo_ttl_seconds: Lifetime of the memoized result (cache default if None)
         """
         current_position = self.metadata.replay_index
 
         # Check if we're in replay mode (checkpoint exists at this position)
         if current_position < len(self.metadata.execution_log):
-            # Replay mode: return cached result
+            # Replay mode: return cached result (loading it if stored out of line)
             entry = self.metadata.execution_log[current_position]
+            if input_hash and entry.input_hash and input_hash != entry.input_hash:
+                logger.warning(
+                    f"Checkpoint {current_position} ({checkpoint_type}) replayed with "
+                    f"different inputs than recorded; procedure may be non-deterministic"
+                )
             self.metadata.replay_index += 1
-            return entry.result
+            return self.codecs.decode(resolve_result(entry.result))
+
+        use_memo = memoize and input_hash is not None and self.memo_cache is not None
+        if use_memo:
+            cached = self.memo_cache.get(input_hash, _MEMO_MISS)
+            if cached is not _MEMO_MISS:
+                logger.debug(f"Memo hit for {checkpoint_type} at position {current_position}")
+                self._record(
+                    CheckpointEntry(
+                        position=current_position,
+                        type=checkpoint_type,
+                        result=cached,
+                        timestamp=datetime.now(timezone.utc),
+                        duration_ms=0.0,
+                        input_hash=input_hash,
+                    )
+                )
+                return self.codecs.decode(cached)
 
         # Execute mode: run function with checkpoint scope tracking
         old_checkpoint_flag = self._inside_checkpoint
@@ -151,27 +371,140 @@ class BaseExecutionContext(ExecutionContext):
             start_time = time.time()
             result = fn()
             duration_ms = (time.time() - start_time) * 1000
+            stored_result = self.codecs.encode(result)
 
             # Create checkpoint entry
             entry = CheckpointEntry(
                 position=current_position,
                 type=checkpoint_type,
-                result=result,
+                result=stored_result,
                 timestamp=datetime.now(timezone.utc),
                 duration_ms=duration_ms,
+                input_hash=input_hash,
             )
         finally:
             # Always restore checkpoint flag, even if fn() raises
             self._inside_checkpoint = old_checkpoint_flag
 
-        # Add to execution log
+        self._record(entry)
+        if use_memo:
+            try:
+                self.memo_cache.set(input_hash, stored_result, ttl_seconds=memo_ttl_seconds)
+            except Exception as e:
+                # A cache failure must not fail an operation that succeeded
+                logger.warning(f"Failed to memoize {checkpoint_type} result: {e}")
+
+        return result
+
+    def _record(self, entry: CheckpointEntry) -> None:
+        """Append a new checkpoint entry and persist it per the durability policy."""
         self.metadata.execution_log.append(entry)
         self.metadata.replay_index += 1
+        self._persist()
 
-        # Persist metadata
-        self.storage.save_procedure_metadata(self.procedure_id, self.metadata)
+    def _persist(self) -> None:
+        """Record a metadata change and flush it if the durability policy requires."""
+        self._unflushed += 1
 
-        return result
+        if self.durability == DURABILITY_ALWAYS or (
+            self.durability == DURABILITY_BATCH
+            and (
+                self._unflushed >= self.batch_size
+                or (time.monotonic() - self._last_flush) * 1000 >= self.batch_interval_ms
+            )
+        ):
+            if self._writer is not None:
+                self._write_behind()
+            else:
+                self.flush()
+        else:
+            _unflushed_contexts.add(self)
+
+    def _write_behind(self) -> None:
+        """Start saving a copy of the metadata on the I/O thread."""
+        # At most one save in flight: the previous one is durable from here on
+        self._wait_for_write()
+
+        metadata = self.metadata
+        snapshot = ProcedureMetadata.model_construct(
+            **{
+                **dict(metadata),
+                "execution_log": list(metadata.execution_log),
+                "state": copy.deepcopy(metadata.state),
+                "lua_state": copy.deepcopy(metadata.lua_state),
+            }
+        )
+        self._pending_write = self._writer.submit(
+            self.procedure_id, self.storage.save_procedure_metadata, self.procedure_id, snapshot
+        )
+        self._unflushed = 0
+        self._last_flush = time.monotonic()
+        _unflushed_contexts.add(self)
+
+    def _wait_for_write(self) -> None:
+        """Block until the in-flight save (if any) has finished."""
+        pending, self._pending_write = self._pending_write, None
+        if pending is None:
+            return
+        try:
+            pending.result()
+        except Exception as e:
+            # The save did not happen; keep the changes pending for the next flush
+            self._unflushed += 1
+            raise RuntimeError(f"Failed to persist checkpoints for {self.procedure_id}: {e}")
+
+    def flush(self) -> None:
+        """Persist any checkpoints not yet written to the storage backend."""
+        self._wait_for_write()
+        if not self._unflushed:
+            _unflushed_contexts.discard(self)
+            return
+
+        if self._writer is not None:
+            # Queue behind any other work for this procedure on the writer
+            self._writer.submit(
+                self.procedure_id,
+                self.storage.save_procedure_metadata,
+                self.procedure_id,
+                self.metadata,
+            ).result()
+        else:
+            self.storage.save_procedure_metadata(self.procedure_id, self.metadata)
+        self._unflushed = 0
+        self._last_flush = time.monotonic()
+        _unflushed_contexts.discard(self)
+
+    def close(self) -> None:
+        """
+        Flush pending checkpoints and stop the context's storage I/O thread.
+
+        Only a thread created for write_behind is stopped; a ThreadPoolStorage
+        passed as the storage backend keeps running. Later saves (if any) run
+        synchronously.
+        """
+        try:
+            self.flush()
+        finally:
+            if self._owns_writer:
+                self._writer.shutdown()
+                self._writer = None
+                self._owns_writer = False
+
+    def set_status(self, status: str, waiting_on_message_id: Optional[str] = None) -> None:
+        """
+        Record the procedure's status (persisted with the next flush).
+
+        Args:
+            status: RUNNING, WAITING_FOR_HUMAN, COMPLETED or FAILED
+            waiting_on_message_id: Message ID if waiting for a human
+        """
+        metadata = self.metadata
+        if (metadata.status, metadata.waiting_on_message_id) == (status, waiting_on_message_id):
+            return
+        metadata.status = status
+        metadata.waiting_on_message_id = waiting_on_message_id
+        self._unflushed += 1
+        _unflushed_contexts.add(self)
 
     def wait_for_human(
         self,
@@ -193,6 +526,9 @@ class BaseExecutionContext(ExecutionContext):
                 value=default_value, responded_at=datetime.now(timezone.utc), timed_out=True
             )
 
+        # Everything before a suspend point must be durable
+        self.flush()
+
         # Create HITL request
         request = HITLRequest(
             request_type=request_type,
@@ -223,19 +559,77 @@ class BaseExecutionContext(ExecutionContext):
         """Clear all checkpoints (execution log)."""
         self.metadata.execution_log.clear()
         self.metadata.replay_index = 0
-        self.storage.save_procedure_metadata(self.procedure_id, self.metadata)
+        self.metadata.lua_state.pop("snapshot", None)
+        self._unflushed += 1
+        self.flush()
 
     def checkpoint_clear_after(self, position: int) -> None:
         """Clear checkpoint at position and all subsequent ones."""
         # Keep only checkpoints before the given position
         self.metadata.execution_log = self.metadata.execution_log[:position]
         self.metadata.replay_index = min(self.metadata.replay_index, position)
-        self.storage.save_procedure_metadata(self.procedure_id, self.metadata)
+        snapshot = self.latest_snapshot()
+        if snapshot is not None and snapshot["position"] > position:
+            del self.metadata.lua_state["snapshot"]
+        self._unflushed += 1
+        self.flush()
 
     def next_position(self) -> int:
         """Get the next checkpoint position."""
         return self.metadata.replay_index
 
+    def save_snapshot(self, snapshot: Dict[str, Any]) -> bool:
+        """
+        Record a resumable snapshot of procedure state at the current position.
+
+        Only the latest snapshot is kept, in metadata.lua_state["snapshot"].
+        Snapshots taken while replaying are ignored so a resumed run never
+        replaces a later snapshot with an earlier one.
+
+        Args:
+            snapshot: JSON-serializable state needed to continue from here
+
+        Returns:
+            True if the snapshot was recorded
+        """
+        position = self.metadata.replay_index
+        if position < len(self.metadata.execution_log):
+            return False
+
+        self.metadata.lua_state["snapshot"] = {
+            **snapshot,
+            "position": position,
+            "taken_at": datetime.now(timezone.utc).isoformat(),
+        }
+        self._persist()
+        return True
+
+    def latest_snapshot(self) -> Optional[Dict[str, Any]]:
+        """Get the latest snapshot, or None if none was taken."""
+        return self.metadata.lua_state.get("snapshot")
+
+    def restore_snapshot(self) -> Optional[Dict[str, Any]]:
+        """
+        Skip replay ahead to the latest snapshot.
+
+        Checkpoints before the snapshot position are not replayed; the caller
+        is responsible for restoring the snapshot's state and continuing the
+        procedure from the point where it was taken.
+
+        Returns:
+            The snapshot, or None if there is none usable from this position
+        """
+        snapshot = self.latest_snapshot()
+        if snapshot is None:
+            return None
+
+        position = snapshot["position"]
+        if not self.metadata.replay_index <= position <= len(self.metadata.execution_log):
+            return None
+
+        self.metadata.replay_index = position
+        return snapshot
+
     def store_procedure_handle(self, handle: Any) -> None:
         """
         Store async procedure handle.
@@ -248,7 +642,8 @@ class BaseExecutionContext(ExecutionContext):
             self.metadata["async_procedures"] = {}
 
         self.metadata["async_procedures"][handle.procedure_id] = handle.to_dict()
-        self.storage.save_procedure_metadata(self.procedure_id, self.metadata)
+        self._unflushed += 1
+        self.flush()
 
     def get_procedure_handle(self, procedure_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -302,7 +697,8 @@ class BaseExecutionContext(ExecutionContext):
             if status in ("completed", "failed", "cancelled"):
                 handle["completed_at"] = datetime.now(timezone.utc).isoformat()
 
-            self.storage.save_procedure_metadata(self.procedure_id, self.metadata)
+            self._unflushed += 1
+            self.flush()
 
 
 class InMemoryExecutionContext(BaseExecutionContext):
@@ -0,0 +1,319 @@
+"""
+Garbage collection of stored procedure records.
+
+Finished procedures are deleted once they are older than a RetentionPolicy
+allows (by status and last update time). RUNNING and WAITING_FOR_HUMAN
+procedures never expire. collect_expired() deletes in batches of one status
+index page; RetentionSweeper runs it periodically on a background thread in
+long-running hosts.
+
+Sub-procedures invoked with Procedure.run() or Procedure.spawn() keep their
+own records, linked to the invoking procedure by parent_id (and, for run(),
+parent_position). A child record is orphaned when no replay of its parent
+can reach it again:
+
+- the parent record no longer exists (including parents collected in the
+  same sweep, so whole subtrees go together);
+- the parent has COMPLETED;
+- the parent's execution log was rewound to before the call, or the call's
+  position now holds a different kind of checkpoint.
+
+Children of RUNNING, WAITING_FOR_HUMAN or FAILED parents whose call is still
+at the end of the parent's log are kept: resuming the parent resumes them.
+
+Deleting procedures leaves their blob store entries (large results shared by
+content hash) in place. collect_unreferenced_blobs() marks the blobs still
+referenced by any checkpoint and sweeps the rest.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+from tactus.protocols.storage import StorageBackend
+
+logger = logging.getLogger(__name__)
+
+# Checkpoint type recorded by Procedure.run()
+_PROCEDURE_CALL = "procedure_call"
+
+
+def _list_procedure_ids(storage: StorageBackend, page_size: int = 1000) -> List[str]:
+    """Page through the status index and return every procedure ID."""
+    procedure_ids: List[str] = []
+    cursor: Optional[str] = None
+    while True:
+        page = storage.list_procedures(limit=page_size, cursor=cursor)
+        procedure_ids.extend(summary.procedure_id for summary in page.procedures)
+        if page.next_cursor is None:
+            return procedure_ids
+        cursor = page.next_cursor
+
+
+def _is_orphaned(
+    parent_position: Optional[int], parent_status: Optional[str], parent_log: List[str]
+) -> bool:
+    """
+    Check whether a parent's replay can still reach a child record.
+
+    Args:
+        parent_position: The child's parent_position
+        parent_status: The parent's status (None if the parent is gone)
+        parent_log: Checkpoint types of the parent's execution log
+    """
+    if parent_status is None or parent_status == "COMPLETED":
+        return True
+    if parent_position is None:
+        # Spawned children have no checkpoint position to check
+        return False
+    if parent_position > len(parent_log):
+        return True
+    return parent_position < len(parent_log) and parent_log[parent_position] != _PROCEDURE_CALL
+
+
+def collect_orphaned_children(storage: StorageBackend, dry_run: bool = False) -> List[str]:
+    """
+    Delete sub-procedure records that their parents can no longer reach.
+
+    Reads every procedure's metadata once; only parent links, statuses and
+    checkpoint types are kept in memory.
+
+    Args:
+        storage: Storage backend to sweep
+        dry_run: If True, only report what would be deleted
+
+    Returns:
+        IDs of the orphaned records (deleted unless dry_run), children after
+        their parents
+    """
+    existing = set(_list_procedure_ids(storage))
+    # procedure_id -> (parent_id, parent_position), for sub-procedures
+    links: Dict[str, Tuple[str, Optional[int]]] = {}
+    # procedure_id -> (status, checkpoint types), for procedures with children
+    summaries: Dict[str, Tuple[str, List[str]]] = {}
+    for procedure_id in sorted(existing):
+        metadata = storage.load_procedure_metadata(procedure_id)
+        summaries[procedure_id] = (
+            metadata.status,
+            [entry.type for entry in metadata.execution_log],
+        )
+        if metadata.parent_id is not None:
+            links[procedure_id] = (metadata.parent_id, metadata.parent_position)
+    parents = {parent_id for parent_id, _ in links.values()}
+    summaries = {key: value for key, value in summaries.items() if key in parents}
+
+    orphaned: List[str] = []
+    # Repeat until nothing changes: collecting a child orphans its own children
+    changed = True
+    while changed:
+        changed = False
+        for procedure_id, (parent_id, parent_position) in links.items():
+            if procedure_id not in existing:
+                continue
+            parent_status, parent_log = (
+                summaries[parent_id] if parent_id in existing else (None, [])
+            )
+            if _is_orphaned(parent_position, parent_status, parent_log):
+                existing.discard(procedure_id)
+                orphaned.append(procedure_id)
+                changed = True
+
+    if not dry_run:
+        for procedure_id in orphaned:
+            storage.delete_procedure(procedure_id)
+            logger.info(f"Deleted orphaned sub-procedure record {procedure_id}")
+    return orphaned
+
+
+@dataclass
+class RetentionPolicy:
+    """How long finished procedures are kept (None keeps them forever)."""
+
+    completed_days: Optional[float] = None
+    failed_days: Optional[float] = None
+
+    def __post_init__(self):
+        for name in ("completed_days", "failed_days"):
+            days = getattr(self, name)
+            if days is not None and days < 0:
+                raise ValueError(f"{name} must be non-negative, got {days}")
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict]) -> "RetentionPolicy":
+        """Build a policy from a {completed_days, failed_days} config mapping."""
+        config = config or {}
+        unknown = set(config) - {"completed_days", "failed_days"}
+        if unknown:
+            raise ValueError(f"Unknown retention settings: {', '.join(sorted(unknown))}")
+        return cls(**config)
+
+    def max_ages(self) -> Dict[str, timedelta]:
+        """Maximum age of each status that expires."""
+        days = {"COMPLETED": self.completed_days, "FAILED": self.failed_days}
+        return {status: timedelta(days=d) for status, d in days.items() if d is not None}
+
+
+@dataclass
+class CollectionReport:
+    """Outcome of a retention sweep."""
+
+    deleted: List[str] = field(default_factory=list)
+    # Bytes freed by the backend (0 for dry runs and in-memory storage)
+    reclaimed_bytes: int = 0
+
+
+def collect_expired(
+    storage: StorageBackend,
+    policy: RetentionPolicy,
+    batch_size: int = 500,
+    dry_run: bool = False,
+    now: Optional[datetime] = None,
+    between_batches: Optional[Callable[[], bool]] = None,
+) -> CollectionReport:
+    """
+    Delete finished procedures older than the retention policy allows.
+
+    Pages through the status index one status at a time and deletes each
+    page's expired procedures before reading the next, so memory use and the
+    time spent in any one batch stay bounded.
+
+    Args:
+        storage: Storage backend to sweep
+        policy: Retention policy
+        batch_size: Procedures read (and at most deleted) per batch
+        dry_run: If True, only report what would be deleted
+        now: Reference time (defaults to the current time)
+        between_batches: Called after each batch; returning False stops the sweep
+
+    Returns:
+        Deleted (or, for dry runs, expired) procedure IDs and bytes reclaimed
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+    now = now or datetime.now(timezone.utc)
+    report = CollectionReport()
+    for status, max_age in policy.max_ages().items():
+        cutoff = now - max_age
+        cursor: Optional[str] = None
+        while True:
+            page = storage.list_procedures(status=status, limit=batch_size, cursor=cursor)
+            expired = [
+                summary.procedure_id for summary in page.procedures if summary.updated_at < cutoff
+            ]
+            if not dry_run:
+                for procedure_id in expired:
+                    report.reclaimed_bytes += storage.delete_procedure(procedure_id) or 0
+                    logger.debug(f"Deleted expired {status} procedure {procedure_id}")
+            report.deleted.extend(expired)
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+            if between_batches is not None and not between_batches():
+                return report
+    return report
+
+
+def collect_unreferenced_blobs(
+    storage: StorageBackend, min_age_seconds: float = 3600.0, dry_run: bool = False
+) -> CollectionReport:
+    """
+    Delete blobs that no stored checkpoint references.
+
+    Backends without a blob store (no collect_blobs() method) have nothing
+    to collect. Run it after deleting procedures, so their blobs are freed.
+
+    Args:
+        storage: Storage backend to sweep
+        min_age_seconds: Blobs written more recently are kept, since a
+            procedure saving concurrently may not have recorded its reference yet
+        dry_run: If True, only report what would be deleted
+
+    Returns:
+        Deleted (or, for dry runs, unreferenced) blob digests and bytes reclaimed
+    """
+    collect_blobs = getattr(storage, "collect_blobs", None)
+    if collect_blobs is None:
+        return CollectionReport()
+    deleted, reclaimed = collect_blobs(min_age_seconds=min_age_seconds, dry_run=dry_run)
+    if deleted and not dry_run:
+        logger.info(f"Deleted {len(deleted)} unreferenced blob(s), reclaimed {reclaimed} bytes")
+    return CollectionReport(deleted=deleted, reclaimed_bytes=reclaimed)
+
+
+class RetentionSweeper:
+    """
+    Applies a retention policy periodically on a daemon thread.
+
+    Each sweep deletes expired procedures in batches, pausing between
+    batches so a large backlog does not monopolize the storage backend.
+    """
+
+    def __init__(
+        self,
+        storage: StorageBackend,
+        policy: RetentionPolicy,
+        interval_seconds: float = 3600.0,
+        batch_size: int = 500,
+        pause_seconds: float = 0.1,
+    ):
+        """
+        Initialize the sweeper (call start() to run it).
+
+        Args:
+            storage: Storage backend to sweep
+            policy: Retention policy
+            interval_seconds: Time between the start of consecutive sweeps
+            batch_size: Procedures read per batch
+            pause_seconds: Pause between batches
+        """
+        if interval_seconds <= 0:
+            raise ValueError(f"interval_seconds must be positive, got {interval_seconds}")
+        self.storage = storage
+        self.policy = policy
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self.pause_seconds = pause_seconds
+        self.last_report: Optional[CollectionReport] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def sweep(self) -> CollectionReport:
+        """Run one sweep now and return its report."""
+        report = collect_expired(
+            self.storage,
+            self.policy,
+            batch_size=self.batch_size,
+            between_batches=lambda: not self._stop.wait(self.pause_seconds),
+        )
+        self.last_report = report
+        if report.deleted:
+            logger.info(
+                f"Retention sweep deleted {len(report.deleted)} procedure(s), "
+                f"reclaimed {report.reclaimed_bytes} bytes"
+            )
+        return report
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.sweep()
+            except Exception as e:
+                logger.warning(f"Retention sweep failed: {e}")
+            self._stop.wait(self.interval_seconds)
+
+    def start(self) -> None:
+        """Start sweeping in the background (the first sweep runs immediately)."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="tactus-retention", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop sweeping; an in-progress sweep ends after its current batch."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
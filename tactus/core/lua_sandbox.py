@@ -9,7 +9,8 @@ Provides a sandboxed Lua runtime with:
 """
 
 import logging
-from typing import Dict, Any, Optional
+import threading
+from typing import Dict, Any, List, Optional
 
 try:
     import lupa
@@ -22,6 +23,77 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Runs before the dangerous modules are removed (it keeps private references
+# to debug.getmetatable/setmetatable, which user code cannot reach). Returns
+# capture(), which snapshots the environment and returns reset() and verify()
+# closures: reset() restores the globals, the library tables they point to and
+# the string metatable to the snapshot; verify() checks that they match it.
+_BASELINE_LUA = """
+local next, type, rawget, rawset, rawequal = next, type, rawget, rawset, rawequal
+local getmetatable, setmetatable = debug.getmetatable, debug.setmetatable
+local collectgarbage = collectgarbage
+local G = _G
+
+local function copy(t)
+    local saved = {}
+    for k, v in next, t do saved[k] = v end
+    return saved
+end
+
+local function restore(t, saved)
+    setmetatable(t, nil)
+    for k in next, t do
+        if rawget(saved, k) == nil then rawset(t, k, nil) end
+    end
+    for k, v in next, saved do rawset(t, k, v) end
+end
+
+local function matches(t, saved)
+    if getmetatable(t) ~= nil then return false end
+    for k, v in next, t do
+        if not rawequal(rawget(saved, k), v) then return false end
+    end
+    for k, v in next, saved do
+        if not rawequal(rawget(t, k), v) then return false end
+    end
+    return true
+end
+
+return function()
+    local globals = copy(G)
+    local tables = {}
+    for _, v in next, globals do
+        if type(v) == "table" and not rawequal(v, G) then tables[v] = copy(v) end
+    end
+    local string_meta = getmetatable("")
+    local string_meta_saved = copy(string_meta)
+
+    local function restore_all()
+        restore(G, globals)
+        for t, saved in next, tables do restore(t, saved) end
+        setmetatable("", string_meta)
+        restore(string_meta, string_meta_saved)
+    end
+
+    local function reset()
+        restore_all()
+        -- Collecting may run finalizers left by the previous run: restore again
+        collectgarbage("collect")
+        restore_all()
+    end
+
+    local function verify()
+        if not matches(G, globals) then return false end
+        for t, saved in next, tables do
+            if not matches(t, saved) then return false end
+        end
+        return rawequal(getmetatable(""), string_meta) and matches(string_meta, string_meta_saved)
+    end
+
+    return reset, verify
+end
+"""
+
 
 class LuaSandboxError(Exception):
     """Raised when Lua sandbox setup or execution fails."""
@@ -49,6 +121,7 @@ class LuaSandbox:
 
         # Create Lua runtime with safety restrictions
         self.lua = LuaRuntime(unpack_returned_tuples=True, attribute_filter=self._attribute_filter)
+        capture_baseline = self.lua.execute(_BASELINE_LUA)
 
         # Remove dangerous modules
         self._remove_dangerous_modules()
@@ -56,8 +129,37 @@ class LuaSandbox:
         # Setup safe globals
         self._setup_safe_globals()
 
+        # Snapshot the clean environment for reset()
+        self._reset_environment, self._verify_environment = capture_baseline()
+        self.runs = 0
+
         logger.info("Lua sandbox initialized successfully")
 
+    def reset(self, strict_determinism: bool = False) -> bool:
+        """
+        Restore the environment the sandbox had when it was created.
+
+        Removes every global added by earlier runs (primitives, DSL stubs,
+        user globals), restores replaced globals, library tables and the
+        string metatable, and detaches the execution context.
+
+        Args:
+            strict_determinism: Determinism mode for the next run
+
+        Returns:
+            True if the environment was verified to match the clean one
+            (if not, the sandbox should be discarded)
+        """
+        try:
+            self._reset_environment()
+            clean = bool(self._verify_environment())
+        except lupa.LuaError as e:
+            logger.warning(f"Lua sandbox reset failed: {e}")
+            return False
+        self.execution_context = None
+        self.strict_determinism = strict_determinism
+        return clean
+
     def _attribute_filter(self, obj, attr_name, is_setting):
         """
         Filter attribute access to prevent dangerous operations.
@@ -347,3 +449,79 @@ class LuaSandbox:
                 pass
 
         return result
+
+
+class LuaSandboxPool:
+    """
+    Pool of preinitialized Lua sandboxes reused across runs.
+
+    acquire() hands out an idle sandbox (or creates one); release() resets it
+    and keeps it for a later run if the reset verified clean. Sandboxes are
+    retired after max_uses runs. Thread-safe; each checked-out sandbox is
+    used by one runtime at a time.
+    """
+
+    def __init__(self, max_idle: int = 4, max_uses: int = 100):
+        """
+        Initialize the pool.
+
+        Args:
+            max_idle: Maximum number of idle sandboxes kept
+            max_uses: Runs after which a sandbox is discarded instead of reused
+        """
+        if max_idle < 0:
+            raise ValueError(f"max_idle must be non-negative, got {max_idle}")
+        if max_uses < 1:
+            raise ValueError(f"max_uses must be at least 1, got {max_uses}")
+        self.max_idle = max_idle
+        self.max_uses = max_uses
+        self._idle: List[LuaSandbox] = []
+        self._lock = threading.Lock()
+
+    def prewarm(self, count: Optional[int] = None) -> None:
+        """Create idle sandboxes up to count (default max_idle)."""
+        count = self.max_idle if count is None else min(count, self.max_idle)
+        while len(self._idle) < count:
+            sandbox = LuaSandbox()
+            with self._lock:
+                self._idle.append(sandbox)
+
+    def acquire(self, strict_determinism: bool = False) -> LuaSandbox:
+        """Check out a clean sandbox."""
+        with self._lock:
+            sandbox = self._idle.pop() if self._idle else None
+        if sandbox is None:
+            return LuaSandbox(strict_determinism=strict_determinism)
+        sandbox.strict_determinism = strict_determinism
+        return sandbox
+
+    def release(self, sandbox: LuaSandbox) -> None:
+        """Return a sandbox after a run; it is reset, and kept if it verified clean."""
+        sandbox.runs += 1
+        if sandbox.runs >= self.max_uses or len(self._idle) >= self.max_idle:
+            return
+        if not sandbox.reset():
+            logger.warning("Discarding Lua sandbox whose environment could not be restored")
+            return
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(sandbox)
+
+    def clear(self) -> None:
+        """Discard all idle sandboxes."""
+        with self._lock:
+            self._idle.clear()
+
+    def __len__(self) -> int:
+        return len(self._idle)
+
+
+_default_pool: Optional[LuaSandboxPool] = None
+
+
+def default_sandbox_pool() -> LuaSandboxPool:
+    """Return the sandbox pool shared by runtimes by default."""
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = LuaSandboxPool()
+    return _default_pool
@@ -0,0 +1,200 @@
+"""
+Compiled procedure cache for Tactus.
+
+Every TactusRuntime.execute() call creates a fresh LuaSandbox and runs the
+.tac source against the DSL stubs to collect its declarations. The
+declarations hold Lua functions (procedure bodies, tool handlers, prompt
+functions) that belong to the sandbox that created them, so the registry
+itself cannot be shared between runs: the chunk must run again in each new
+sandbox. What does not depend on the sandbox is cached here, keyed by a hash
+of the source, the Tactus version and the Lua version:
+
+- the compiled Lua chunk (bytecode from string.dump), so later runs load it
+  instead of compiling the source again;
+- the outcome of declaration validation (its warnings), so later runs skip
+  validating declarations that are known to be valid.
+
+Only sources whose declarations validated are cached. ProcedureCache keeps
+entries in a process-local LRU and, with a cache_dir, also on disk so that
+separate CLI runs start warm. Lua bytecode is not verified when it is loaded:
+only point cache_dir at a directory that no one else can write to.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import platform
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional
+
+try:
+    import lupa
+    from lupa import LuaRuntime
+
+    LUPA_AVAILABLE = True
+except ImportError:
+    LUPA_AVAILABLE = False
+    LuaRuntime = None
+
+logger = logging.getLogger(__name__)
+
+_ENTRY_SUFFIX = ".luac"
+
+# Lua bytecode only loads into the Lua version (and architecture) that wrote it
+_BYTECODE_VERSION = (
+    f"lua{'.'.join(map(str, lupa.LUA_VERSION))}-{platform.machine()}" if LUPA_AVAILABLE else ""
+)
+
+
+@dataclass
+class CompiledProcedure:
+    """A compiled .tac source and what is known about its declarations."""
+
+    key: str
+    # Lua bytecode of the whole source (loads in any sandbox of the same Lua version)
+    bytecode: bytes
+    # Declaration validation warnings (None until the declarations have validated)
+    warnings: Optional[List[str]] = field(default=None)
+
+    @property
+    def validated(self) -> bool:
+        return self.warnings is not None
+
+
+class ProcedureCache:
+    """
+    Cache of compiled procedure sources.
+
+    Thread-safe; one instance is normally shared by every runtime in a
+    process (see default_procedure_cache()).
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_entries: int = 256):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for persistent entries (None = in memory only)
+            max_entries: Maximum number of entries kept in memory (least recently
+                used evicted; entries on disk are kept)
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CompiledProcedure]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Compiles sources without running them (created on first use)
+        self._compiler: Optional[LuaRuntime] = None
+
+    def key(self, source: str) -> str:
+        """Cache key of a source: hashes the source and the Tactus and Lua versions."""
+        from tactus import __version__
+
+        digest = hashlib.sha256(f"{__version__}\0{_BYTECODE_VERSION}\0".encode())
+        digest.update(source.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, source: str) -> Optional[CompiledProcedure]:
+        """Look up the compiled form of a source (in memory, then on disk)."""
+        key = self.key(source)
+        with self._lock:
+            procedure = self._entries.get(key)
+            if procedure is not None:
+                self._entries.move_to_end(key)
+                return procedure
+        procedure = self._read_entry(key)
+        if procedure is not None:
+            self._remember(procedure)
+        return procedure
+
+    def compile(self, source: str) -> Optional[CompiledProcedure]:
+        """
+        Compile a source to bytecode (the result is not stored until put()).
+
+        Returns:
+            The compiled source, or None if it does not compile (run the source
+            itself to get the usual error) or lupa is not available
+        """
+        if not LUPA_AVAILABLE:
+            return None
+        with self._lock:
+            if self._compiler is None:
+                # encoding=None so that string.dump() returns bytes
+                self._compiler = LuaRuntime(encoding=None)
+            try:
+                chunk = self._compiler.compile(source.encode("utf-8"))
+                bytecode = self._compiler.globals().string.dump(chunk)
+            except lupa.LuaError:
+                return None
+        return CompiledProcedure(key=self.key(source), bytecode=bytecode)
+
+    def put(self, procedure: CompiledProcedure) -> None:
+        """Store a validated procedure in memory and, with a cache_dir, on disk."""
+        if not procedure.validated:
+            raise ValueError(f"Cannot cache procedure {procedure.key}: it has not been validated")
+        self._remember(procedure)
+        self._write_entry(procedure)
+
+    def clear(self) -> None:
+        """Remove all entries kept in memory (entries on disk are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remember(self, procedure: CompiledProcedure) -> None:
+        with self._lock:
+            self._entries[procedure.key] = procedure
+            self._entries.move_to_end(procedure.key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _get_entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{_ENTRY_SUFFIX}"
+
+    def _read_entry(self, key: str) -> Optional[CompiledProcedure]:
+        """Read an entry from disk: a JSON header line followed by the bytecode."""
+        if self.cache_dir is None:
+            return None
+        try:
+            with open(self._get_entry_path(key), "rb") as f:
+                warnings = json.loads(f.readline())["warnings"]
+                bytecode = f.read()
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable procedure cache entry {key}: {e}")
+            return None
+        return CompiledProcedure(key=key, bytecode=bytecode, warnings=warnings)
+
+    def _write_entry(self, procedure: CompiledProcedure) -> None:
+        # The cache is an optimization: failing to persist an entry is not an error
+        if self.cache_dir is None:
+            return
+        path = self._get_entry_path(procedure.key)
+        tmp_path = path.with_name(f"{procedure.key}.{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(json.dumps({"warnings": procedure.warnings}).encode("utf-8") + b"\n")
+                f.write(procedure.bytecode)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write procedure cache entry {path}: {e}")
+
+
+_default_cache: Optional[ProcedureCache] = None
+
+
+def default_procedure_cache() -> ProcedureCache:
+    """Return the in-memory cache shared by runtimes by default."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ProcedureCache()
+    return _default_cache
@@ -61,6 +61,7 @@ class AgentDeclaration(BaseModel):
     disable_streaming: bool = (
         False  # Disable streaming for models that don't support tools in streaming mode
     )
+    memoize: Union[bool, dict[str, Any]] = False  # Reuse turn results via the memo cache
 
     model_config = ConfigDict(extra="allow")
 
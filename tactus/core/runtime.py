@@ -9,23 +9,38 @@ Orchestrates:
 5. Workflow execution
 """
 
+import asyncio
 import io
 import logging
 import time
 import uuid
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, Optional, Union
 
 from tactus.core.registry import ProcedureRegistry, RegistryBuilder
 from tactus.core.dsl_stubs import create_dsl_stubs, lua_table_to_dict
 from tactus.core.template_resolver import TemplateResolver
 from tactus.core.message_history_manager import MessageHistoryManager
-from tactus.core.lua_sandbox import LuaSandbox, LuaSandboxError
+from tactus.core.lua_sandbox import (
+    LuaSandbox,
+    LuaSandboxError,
+    LuaSandboxPool,
+    default_sandbox_pool,
+)
+from tactus.core.procedure_cache import ProcedureCache, default_procedure_cache
+from tactus.core.schema_cache import SchemaModelCache, default_schema_cache
+from tactus.providers.registry import ProviderRegistry, default_provider_registry
 from tactus.core.output_validator import OutputValidator, OutputValidationError
 from tactus.core.execution_context import BaseExecutionContext
 from tactus.core.exceptions import ProcedureWaitingForHuman, TactusRuntimeError
 from tactus.protocols.storage import StorageBackend
 from tactus.protocols.hitl import HITLHandler
 from tactus.protocols.chat_recorder import ChatRecorder
+from tactus.protocols.memo import MemoCache
+
+if TYPE_CHECKING:
+    from tactus.adapters.async_storage import ThreadPoolStorage
+    from tactus.adapters.mcp_manager import MCPServerPool
+    from tactus.adapters.plugins import PluginCache
 
 # For backwards compatibility with YAML
 try:
@@ -67,7 +82,7 @@ class TactusRuntime:
     def __init__(
         self,
         procedure_id: str,
-        storage_backend: Optional[StorageBackend] = None,
+        storage_backend: Optional[Union[StorageBackend, "ThreadPoolStorage"]] = None,
         hitl_handler: Optional[HITLHandler] = None,
         chat_recorder: Optional[ChatRecorder] = None,
         mcp_server=None,
@@ -79,13 +94,26 @@ class TactusRuntime:
         recursion_depth: int = 0,
         tool_paths: Optional[list] = None,
         external_config: Optional[Dict[str, Any]] = None,
+        memo_cache: Optional[MemoCache] = None,
+        parent_procedure_id: Optional[str] = None,
+        parent_position: Optional[int] = None,
+        procedure_cache: Optional[ProcedureCache] = None,
+        sandbox_pool: Optional[LuaSandboxPool] = None,
+        provider_registry: Optional[ProviderRegistry] = None,
+        schema_cache: Optional[SchemaModelCache] = None,
+        mcp_pool: Optional["MCPServerPool"] = None,
+        plugin_cache: Optional["PluginCache"] = None,
+        reload_plugins: bool = False,
+        replay_finished: bool = False,
     ):
         """
         Initialize the Tactus runtime.
 
         Args:
             procedure_id: Unique procedure identifier
-            storage_backend: Storage backend for checkpoints and state
+            storage_backend: Storage backend for checkpoints and state; a
+                ThreadPoolStorage saves on its I/O threads, shared by every run
+                (and sub-procedure) given the same instance
             hitl_handler: Handler for human-in-the-loop interactions
             chat_recorder: Optional chat recorder for conversation logging
             mcp_server: DEPRECATED - use mcp_servers instead
@@ -96,6 +124,28 @@ class TactusRuntime:
             skip_agents: If True, skip agent setup and execution (for testing)
             tool_paths: Optional list of paths to scan for local Python tool plugins
             external_config: Optional external config (from .tac.yml) to merge with DSL config
+            memo_cache: Optional memo cache shared across procedures, used by agents,
+                models and checkpoints declared with memoize = true
+            parent_procedure_id: ID of the invoking procedure, for sub-procedures
+            parent_position: Checkpoint position of the invoking Procedure.run() call
+            procedure_cache: Cache of compiled .tac sources (defaults to the
+                process-wide in-memory cache)
+            sandbox_pool: Pool the Lua sandbox is checked out from for each run
+                (defaults to the process-wide pool)
+            provider_registry: Registry of shared LLM provider clients used by
+                agents (defaults to the process-wide registry)
+            schema_cache: Cache of the pydantic models built for agent outputs
+                and tool parameters (defaults to the process-wide cache)
+            mcp_pool: Optional pool that keeps MCP servers running across runs
+                (e.g. default_mcp_pool()); without it, each run starts and stops
+                its MCP servers
+            plugin_cache: Cache of loaded tool plugin files (defaults to the
+                process-wide cache)
+            reload_plugins: If True, execute tool plugin files again instead of
+                reusing the cached modules
+            replay_finished: If True, a COMPLETED or FAILED procedure replays its
+                checkpoints instead of running again from scratch (set for the
+                sub-procedures of a resumed procedure)
         """
         self.procedure_id = procedure_id
         self.storage_backend = storage_backend
@@ -111,6 +161,25 @@ class TactusRuntime:
         self.skip_agents = skip_agents
         self.recursion_depth = recursion_depth
         self.external_config = external_config or {}
+        self.memo_cache = memo_cache
+        self.parent_procedure_id = parent_procedure_id
+        self.parent_position = parent_position
+        self.replay_finished = replay_finished
+        self.procedure_cache = (
+            procedure_cache if procedure_cache is not None else default_procedure_cache()
+        )
+        self.sandbox_pool = sandbox_pool if sandbox_pool is not None else default_sandbox_pool()
+        self.provider_registry = (
+            provider_registry if provider_registry is not None else default_provider_registry()
+        )
+        self.schema_cache = schema_cache if schema_cache is not None else default_schema_cache()
+        self.mcp_pool = mcp_pool
+        if plugin_cache is None:
+            from tactus.adapters.plugins import default_plugin_cache
+
+            plugin_cache = default_plugin_cache()
+        self.plugin_cache = plugin_cache
+        self.reload_plugins = reload_plugins
 
         # Will be initialized during setup
         self.config: Optional[Dict[str, Any]] = None  # Legacy YAML support
@@ -183,9 +252,7 @@ class TactusRuntime:
             # 0. Setup Lua sandbox FIRST (needed for both YAML and Lua DSL)
             logger.info("Step 0: Setting up Lua sandbox")
             strict_determinism = self.external_config.get("strict_determinism", False)
-            self.lua_sandbox = LuaSandbox(
-                execution_context=None, strict_determinism=strict_determinism
-            )
+            self.lua_sandbox = self.sandbox_pool.acquire(strict_determinism=strict_determinism)
 
             # 0b. For Lua DSL, inject placeholder primitives BEFORE parsing
             # so they're available in the procedure function's closure
@@ -273,12 +340,27 @@ class TactusRuntime:
 
             # 6. Create execution context
             logger.info("Step 6: Creating execution context")
+            # durability may be a policy name or
+            # {policy, batch_size, batch_interval_ms, write_behind}
+            durability_config = self.external_config.get("durability") or {}
+            if isinstance(durability_config, str):
+                durability_config = {"policy": durability_config}
             self.execution_context = BaseExecutionContext(
                 procedure_id=self.procedure_id,
                 storage_backend=self.storage_backend,
                 hitl_handler=self.hitl_handler,
                 strict_determinism=strict_determinism,
+                durability=durability_config.get("policy", "always"),
+                batch_size=durability_config.get("batch_size", 100),
+                batch_interval_ms=durability_config.get("batch_interval_ms", 1000.0),
+                memo_cache=self.memo_cache,
+                write_behind=durability_config.get("write_behind", False),
+                parent_id=self.parent_procedure_id,
+                parent_position=self.parent_position,
+                replay_finished=self.replay_finished,
             )
+            # A resumed procedure is running again (persisted with the first flush)
+            self.execution_context.set_status("RUNNING")
             logger.debug("BaseExecutionContext created")
 
             # 6b. Attach execution context to sandbox for determinism checking
@@ -290,7 +372,6 @@ class TactusRuntime:
             hitl_config = self.config.get("hitl", {})
             self.human_primitive = HumanPrimitive(self.execution_context, hitl_config)
             self.step_primitive = StepPrimitive(self.execution_context)
-            self.checkpoint_primitive = CheckpointPrimitive(self.execution_context)
             self.log_primitive = LogPrimitive(
                 procedure_id=self.procedure_id, log_handler=self.log_handler
             )
@@ -301,6 +382,13 @@ class TactusRuntime:
             self.stage_primitive = StagePrimitive(
                 declared_stages=declared_stages, lua_sandbox=self.lua_sandbox
             )
+            self.checkpoint_primitive = CheckpointPrimitive(
+                self.execution_context,
+                lua_sandbox=self.lua_sandbox,
+                state_primitive=self.state_primitive,
+                stage_primitive=self.stage_primitive,
+                iterations_primitive=self.iterations_primitive,
+            )
             self.json_primitive = JsonPrimitive(lua_sandbox=self.lua_sandbox)
             self.retry_primitive = RetryPrimitive()
             self.file_primitive = FilePrimitive(execution_context=self.execution_context)
@@ -315,9 +403,15 @@ class TactusRuntime:
             )
             logger.debug("HITL, checkpoint, message history, and procedure primitives initialized")
 
-            # 7.5. Initialize toolset registry
-            logger.info("Step 7.5: Initializing toolset registry")
-            await self._initialize_toolsets()
+            # 7.5. Initialize toolset registry and user dependencies. They are
+            # independent: MCP servers start while dependencies connect.
+            logger.info("Step 7.5: Initializing toolset registry and dependencies")
+            results = await asyncio.gather(
+                self._initialize_toolsets(), self._initialize_dependencies(), return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
 
             # 7.6. Initialize named procedure callables
             logger.info("Step 7.6: Initializing named procedure callables")
@@ -419,6 +513,7 @@ class TactusRuntime:
                 )
                 self.log_handler.log(summary_event)
 
+            self._set_procedure_status("COMPLETED")
             return {
                 "success": True,
                 "procedure_id": self.procedure_id,
@@ -445,7 +540,7 @@ class TactusRuntime:
                     if hasattr(agent_primitive, "flush_recordings"):
                         await agent_primitive.flush_recordings()
 
-            # Note: Procedure status updated by execution context
+            self._set_procedure_status("WAITING_FOR_HUMAN", getattr(e, "pending_message_id", None))
             # Chat session stays active for resume
 
             return {
@@ -459,6 +554,7 @@ class TactusRuntime:
 
         except ProcedureConfigError as e:
             logger.error(f"Configuration error: {e}")
+            self._set_procedure_status("FAILED")
             # Flush recordings even on error
             if self.chat_recorder and session_id:
                 try:
@@ -495,6 +591,7 @@ class TactusRuntime:
 
         except LuaSandboxError as e:
             logger.error(f"Lua execution error: {e}")
+            self._set_procedure_status("FAILED")
 
             # Apply error_prompt if specified (future: inject to agent for explanation)
             if self.config and self.config.get("error_prompt"):
@@ -538,6 +635,7 @@ class TactusRuntime:
 
         except Exception as e:
             logger.error(f"Unexpected error: {e}", exc_info=True)
+            self._set_procedure_status("FAILED")
 
             # Apply error_prompt if specified (future: inject to agent for explanation)
             if self.config and self.config.get("error_prompt"):
@@ -580,6 +678,14 @@ class TactusRuntime:
             }
 
         finally:
+            # Persist checkpoints deferred by the durability policy
+            # (completion, HITL suspend and errors all pass through here)
+            if self.execution_context:
+                try:
+                    self.execution_context.close()
+                except Exception as e:
+                    logger.warning(f"Error flushing checkpoints: {e}")
+
             # Cleanup: Disconnect from MCP servers
             if self.mcp_manager:
                 try:
@@ -595,6 +701,21 @@ class TactusRuntime:
                     logger.info("Cleaned up user dependencies")
                 except Exception as e:
                     logger.warning(f"Error cleaning up dependencies: {e}")
+                # The next execute() creates its own
+                self.dependency_manager = None
+                self.user_dependencies = {}
+
+            # Cleanup: Return the sandbox to the pool (it is reset before reuse)
+            if self.lua_sandbox:
+                self.sandbox_pool.release(self.lua_sandbox)
+                self.lua_sandbox = None
+
+    def _set_procedure_status(
+        self, status: str, waiting_on_message_id: Optional[str] = None
+    ) -> None:
+        """Record the final status of this run (saved by the flush in execute())."""
+        if self.execution_context:
+            self.execution_context.set_status(status, waiting_on_message_id)
 
     async def _initialize_primitives(self):
         """Initialize all primitive objects."""
@@ -650,6 +771,10 @@ class TactusRuntime:
         """
         from pydantic_ai.toolsets import FunctionToolset
 
+        if self.reload_plugins:
+            dropped = self.plugin_cache.invalidate()
+            logger.info(f"Reloading tool plugins ({dropped} cached file(s) dropped)")
+
         # 1. Register built-in "done" toolset (always available)
         try:
             # Create done function that integrates with tool_primitive and stop_primitive
@@ -695,11 +820,16 @@ class TactusRuntime:
         # 3. Register MCP toolsets by server name
         if self.mcp_servers:
             try:
-                from tactus.adapters.mcp_manager import MCPServerManager
+                from tactus.adapters.mcp_manager import MCPServerManager, PooledMCPServerManager
 
-                self.mcp_manager = MCPServerManager(
-                    self.mcp_servers, tool_primitive=self.tool_primitive
-                )
+                if self.mcp_pool is not None:
+                    self.mcp_manager = PooledMCPServerManager(
+                        self.mcp_pool, self.mcp_servers, tool_primitive=self.tool_primitive
+                    )
+                else:
+                    self.mcp_manager = MCPServerManager(
+                        self.mcp_servers, tool_primitive=self.tool_primitive
+                    )
                 await self.mcp_manager.__aenter__()
 
                 # Get toolsets from MCP manager
@@ -733,7 +863,9 @@ class TactusRuntime:
             try:
                 from tactus.adapters.plugins import PluginLoader
 
-                plugin_loader = PluginLoader(tool_primitive=self.tool_primitive)
+                plugin_loader = PluginLoader(
+                    tool_primitive=self.tool_primitive, plugin_cache=self.plugin_cache
+                )
                 plugin_toolset = plugin_loader.create_toolset(self.tool_paths, name="plugin")
                 self.toolset_registry["plugin"] = plugin_toolset
                 logger.info(f"Registered plugin toolset from {len(self.tool_paths)} path(s)")
@@ -760,7 +892,9 @@ class TactusRuntime:
             try:
                 from tactus.adapters.lua_tools import LuaToolsAdapter
 
-                lua_adapter = LuaToolsAdapter(tool_primitive=self.tool_primitive)
+                lua_adapter = LuaToolsAdapter(
+                    tool_primitive=self.tool_primitive, schema_cache=self.schema_cache
+                )
 
                 for tool_name, tool_spec in self.registry.lua_tools.items():
                     try:
@@ -862,7 +996,9 @@ class TactusRuntime:
             try:
                 from tactus.adapters.lua_tools import LuaToolsAdapter
 
-                lua_adapter = LuaToolsAdapter(tool_primitive=self.tool_primitive)
+                lua_adapter = LuaToolsAdapter(
+                    tool_primitive=self.tool_primitive, schema_cache=self.schema_cache
+                )
                 return lua_adapter.create_lua_toolset(name, definition)
             except ImportError as e:
                 logger.error(f"Could not import LuaToolsAdapter: {e}")
@@ -877,7 +1013,9 @@ class TactusRuntime:
 
             from tactus.adapters.plugins import PluginLoader
 
-            plugin_loader = PluginLoader(tool_primitive=self.tool_primitive)
+            plugin_loader = PluginLoader(
+                tool_primitive=self.tool_primitive, plugin_cache=self.plugin_cache
+            )
             return plugin_loader.create_toolset(paths, name=name)
 
         elif toolset_type == "mcp":
@@ -1011,7 +1149,10 @@ class TactusRuntime:
         return result
 
     async def _initialize_dependencies(self):
-        """Initialize user-declared dependencies from registry."""
+        """Initialize user-declared dependencies from registry (once per run)."""
+        # Already created for this run (reset when the run's cleanup closes them)
+        if self.dependency_manager is not None:
+            return
         # Only initialize if registry exists and has dependencies
         if not self.registry or not self.registry.dependencies:
             logger.debug("No dependencies declared in procedure")
@@ -1156,7 +1297,9 @@ class TactusRuntime:
                         try:
                             from tactus.adapters.lua_tools import LuaToolsAdapter
 
-                            lua_adapter = LuaToolsAdapter(tool_primitive=self.tool_primitive)
+                            lua_adapter = LuaToolsAdapter(
+                                tool_primitive=self.tool_primitive, schema_cache=self.schema_cache
+                            )
                             inline_tools_toolset = lua_adapter.create_inline_tools_toolset(
                                 agent_name, inline_tool_specs
                             )
@@ -1243,8 +1386,13 @@ class TactusRuntime:
             # Prefer output_type (aligned with pydantic-ai)
             if agent_config.get("output_type"):
                 try:
-                    result_type = self._create_pydantic_model_from_output_type(
-                        agent_config["output_type"], f"{agent_name}Output"
+                    result_type = self.schema_cache.get_or_create(
+                        "agent_output_type",
+                        f"{agent_name}Output",
+                        agent_config["output_type"],
+                        lambda: self._create_pydantic_model_from_output_type(
+                            agent_config["output_type"], f"{agent_name}Output"
+                        ),
                     )
                     logger.info(f"Using agent output_type schema for '{agent_name}'")
                 except Exception as e:
@@ -1253,8 +1401,13 @@ class TactusRuntime:
                 # Fallback to output_schema for backward compatibility
                 output_schema = agent_config["output_schema"]
                 try:
-                    result_type = self._create_output_model_from_schema(
-                        output_schema, f"{agent_name}Output"
+                    result_type = self.schema_cache.get_or_create(
+                        "agent_output",
+                        f"{agent_name}Output",
+                        output_schema,
+                        lambda: self._create_output_model_from_schema(
+                            output_schema, f"{agent_name}Output"
+                        ),
                     )
                     logger.info(f"Created structured output model for agent '{agent_name}'")
                 except Exception as e:
@@ -1262,8 +1415,13 @@ class TactusRuntime:
             elif self.config.get("outputs"):
                 # Use procedure-level output schema
                 try:
-                    result_type = self._create_output_model_from_schema(
-                        self.config["outputs"], f"{agent_name}Output"
+                    result_type = self.schema_cache.get_or_create(
+                        "agent_output",
+                        f"{agent_name}Output",
+                        self.config["outputs"],
+                        lambda: self._create_output_model_from_schema(
+                            self.config["outputs"], f"{agent_name}Output"
+                        ),
                     )
                     logger.info(f"Using procedure-level output schema for agent '{agent_name}'")
                 except Exception as e:
@@ -1304,6 +1462,8 @@ class TactusRuntime:
                 message_history_filter=message_history_filter,
                 user_dependencies=self.user_dependencies if self.user_dependencies else None,
                 execution_context=self.execution_context,
+                memoize=agent_config.get("memoize", False),
+                provider_registry=self.provider_registry,
             )
 
             self.agents[agent_name] = agent_primitive
@@ -1640,6 +1800,9 @@ class TactusRuntime:
 
                     logger.info("Named 'main' procedure execution completed successfully")
                     return result
+                except ProcedureWaitingForHuman:
+                    # Suspension is not a failure; let execute() report it
+                    raise
                 except Exception as e:
                     logger.error(f"Named 'main' procedure execution failed: {e}")
                     raise LuaSandboxError(f"Named 'main' procedure execution failed: {e}")
@@ -1794,12 +1957,21 @@ class TactusRuntime:
         for name, stub in stubs.items():
             sandbox.set_global(name, stub)
 
-        # Execute file - declarations self-register
+        # Execute file - declarations self-register. A cached compiled chunk
+        # skips compiling the source, and validating declarations known to be valid
+        cached = self.procedure_cache.get(source)
+        compiled = cached or self.procedure_cache.compile(source)
         try:
-            sandbox.execute(source)
+            sandbox.execute(compiled.bytecode if compiled else source)
         except LuaSandboxError as e:
             raise TactusRuntimeError(f"Failed to parse DSL: {e}")
 
+        if cached is not None:
+            logger.debug(f"Using cached compiled procedure {cached.key[:12]}")
+            for warning in cached.warnings:
+                logger.warning(warning)
+            return builder.registry
+
         # Validate and return registry
         result = builder.validate()
         if not result.valid:
@@ -1809,6 +1981,10 @@ class TactusRuntime:
         for warning in result.warnings:
             logger.warning(warning.message)
 
+        if compiled is not None:
+            compiled.warnings = [warning.message for warning in result.warnings]
+            self.procedure_cache.put(compiled)
+
         return result.registry
 
     def _registry_to_config(self, registry: ProcedureRegistry) -> Dict[str, Any]:
@@ -1851,6 +2027,7 @@ class TactusRuntime:
                     "toolsets": agent.tools,
                     "max_turns": agent.max_turns,
                     "disable_streaming": agent.disable_streaming,
+                    "memoize": agent.memoize,
                 }
                 # Include inline tool definitions if present
                 if hasattr(agent, "inline_tool_defs") and agent.inline_tool_defs:
@@ -1917,7 +2094,11 @@ class TactusRuntime:
         return config
 
     def _create_runtime_for_procedure(
-        self, procedure_name: str, params: Dict[str, Any]
+        self,
+        procedure_name: str,
+        params: Dict[str, Any],
+        procedure_id: Optional[str] = None,
+        parent_position: Optional[int] = None,
     ) -> "TactusRuntime":
         """
         Create a new runtime instance for a sub-procedure.
@@ -1925,12 +2106,16 @@ class TactusRuntime:
         Args:
             procedure_name: Name or path of the procedure to load
             params: Parameters to pass to the procedure
+            procedure_id: ID for the sub-procedure (see child_procedure_id);
+                a unique ID is generated if None
+            parent_position: Checkpoint position of the invoking call
 
         Returns:
             New TactusRuntime instance
         """
-        # Generate unique ID for sub-procedure
-        sub_procedure_id = f"{self.procedure_id}_{procedure_name}_{uuid.uuid4().hex[:8]}"
+        sub_procedure_id = (
+            procedure_id or f"{self.procedure_id}_{procedure_name}_{uuid.uuid4().hex[:8]}"
+        )
 
         # Create new runtime with incremented depth
         runtime = TactusRuntime(
@@ -1943,11 +2128,23 @@ class TactusRuntime:
             log_handler=self.log_handler,
             skip_agents=self.skip_agents,
             recursion_depth=self.recursion_depth + 1,
+            memo_cache=self.memo_cache,
+            parent_procedure_id=self.procedure_id,
+            parent_position=parent_position,
+            # A resumed procedure replays the children it already ran; a new
+            # run of a finished one runs them again too
+            replay_finished=bool(self.execution_context and self.execution_context.resumed),
+            procedure_cache=self.procedure_cache,
+            sandbox_pool=self.sandbox_pool,
+            provider_registry=self.provider_registry,
+            schema_cache=self.schema_cache,
+            mcp_pool=self.mcp_pool,
+            plugin_cache=self.plugin_cache,
         )
 
         logger.info(
             f"Created runtime for sub-procedure '{procedure_name}' "
-            f"(depth {self.recursion_depth + 1})"
+            f"(id {sub_procedure_id}, depth {self.recursion_depth + 1})"
         )
 
         return runtime
@@ -0,0 +1,157 @@
+"""
+Cache of classes generated from schemas.
+
+Setting up a run builds classes from declarations that rarely change between
+runs:
+
+- the output model of each agent (TactusRuntime);
+- the argument model of each MCP tool, from its JSON Schema (PydanticAIMCPAdapter);
+- the parameter model of each Lua tool (LuaToolsAdapter);
+- the AgentDeps dataclass with the user's dependencies (deps_generator).
+
+Creating a pydantic model builds its core schema and compiles its validator
+and serializer. The class carries them, so a cached class is validated
+without compiling anything again. SchemaModelCache maps a canonical hash of
+(kind, class name, schema) to the class built for it, and to a TypeAdapter
+of the class on request. It keeps the most recently used entries up to
+max_entries. Schemas that cannot be serialized canonically (e.g. containing
+functions) are built every time.
+"""
+
+import dataclasses
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class _Uncacheable(Exception):
+    pass
+
+
+def _canonical(value: Any) -> Any:
+    """JSON form of the non-JSON values found in schemas."""
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json", by_alias=True)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    if isinstance(value, type):
+        return f"{value.__module__}.{value.__qualname__}"
+    raise _Uncacheable(f"{type(value).__name__} values cannot be hashed canonically")
+
+
+def schema_key(kind: str, name: str, schema: Any) -> Optional[str]:
+    """
+    Canonical hash of a schema (key order does not matter).
+
+    Returns:
+        The key, or None if the schema cannot be serialized canonically
+    """
+    try:
+        canonical = json.dumps(
+            [kind, name, schema], sort_keys=True, separators=(",", ":"), default=_canonical
+        )
+    except (_Uncacheable, TypeError, ValueError):
+        return None
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class SchemaModelCache:
+    """
+    Bounded cache of classes built from schemas.
+
+    Thread-safe; one instance is normally shared by every runtime in a
+    process (see default_schema_cache()).
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of classes kept (least recently used evicted)
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        self.max_entries = max_entries
+        # key -> [class, TypeAdapter or None]
+        self._entries: "OrderedDict[str, list]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_create(self, kind: str, name: str, schema: Any, build: Callable[[], type]) -> type:
+        """
+        Return the class built for a schema, building it on first use.
+
+        Args:
+            kind: What the class is for (e.g. "agent_output", "mcp_args"); classes
+                of different kinds are never shared
+            name: Class name (part of the key: it appears in generated JSON Schemas)
+            schema: The declaration the class is built from
+            build: Builds the class; called without the lock held
+
+        Returns:
+            The cached or newly built class
+        """
+        return self._get_entry(kind, name, schema, build)[0]
+
+    def get_type_adapter(self, kind: str, name: str, schema: Any, build: Callable[[], type]):
+        """Return a TypeAdapter of the class built for a schema (both cached)."""
+        from pydantic import TypeAdapter
+
+        key, entry = self._lookup(kind, name, schema, build)
+        if entry is None:
+            return TypeAdapter(build())
+        if entry[1] is None:
+            adapter = TypeAdapter(entry[0])
+            with self._lock:
+                if entry[1] is None:
+                    entry[1] = adapter
+        return entry[1]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get_entry(self, kind, name, schema, build) -> list:
+        key, entry = self._lookup(kind, name, schema, build)
+        return entry if entry is not None else [build(), None]
+
+    def _lookup(self, kind, name, schema, build) -> Tuple[Optional[str], Optional[list]]:
+        key = schema_key(kind, name, schema)
+        if key is None:
+            logger.debug(f"Not caching {kind} class '{name}': schema is not serializable")
+            return None, None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return key, entry
+        entry = [build(), None]
+        with self._lock:
+            # Another thread may have built it meanwhile: keep the first one
+            entry = self._entries.setdefault(key, entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return key, entry
+
+
+_default_cache: Optional[SchemaModelCache] = None
+
+
+def default_schema_cache() -> SchemaModelCache:
+    """Return the cache shared by runtimes and adapters by default."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = SchemaModelCache()
+    return _default_cache
@@ -155,6 +155,41 @@ def _resolve_workspace_path(relative_path: str) -> Path:
     return target
 
 
+def _start_retention_sweeper():
+    """
+    Start a background sweeper for the workspace's procedure storage if a
+    retention period is configured (TACTUS_IDE_RETAIN_COMPLETED_DAYS /
+    TACTUS_IDE_RETAIN_FAILED_DAYS).
+    """
+    from tactus.adapters.file_storage import FileStorage
+    from tactus.core.garbage_collection import RetentionPolicy, RetentionSweeper
+
+    days = {}
+    for key, env_var in (
+        ("completed_days", "TACTUS_IDE_RETAIN_COMPLETED_DAYS"),
+        ("failed_days", "TACTUS_IDE_RETAIN_FAILED_DAYS"),
+    ):
+        value = os.environ.get(env_var)
+        if value:
+            try:
+                days[key] = float(value)
+            except ValueError:
+                raise SystemExit(f"Invalid {env_var}: {value!r}")
+    if not days:
+        return None
+
+    storage_dir = (
+        str(Path(WORKSPACE_ROOT) / ".tac" / "storage") if WORKSPACE_ROOT else "~/.tactus/storage"
+    )
+    interval = float(os.environ.get("TACTUS_IDE_RETENTION_INTERVAL_SECONDS", "3600"))
+    sweeper = RetentionSweeper(
+        FileStorage(storage_dir=storage_dir), RetentionPolicy(**days), interval_seconds=interval
+    )
+    sweeper.start()
+    logger.info(f"Retention sweeper started for {storage_dir}")
+    return sweeper
+
+
 def create_app(initial_workspace: Optional[str] = None, frontend_dist_dir: Optional[str] = None):
     """Create and configure the Flask app.
 
@@ -178,6 +213,9 @@ def create_app(initial_workspace: Optional[str] = None, frontend_dist_dir: Optio
     # Initialize LSP server
     lsp_server = LSPServer()
 
+    # Expire old procedure records while the server runs (opt-in)
+    app.config["RETENTION_SWEEPER"] = _start_retention_sweeper()
+
     @app.route("/health", methods=["GET"])
     def health():
         """Health check endpoint."""
@@ -1513,6 +1551,10 @@ def main() -> None:
     - TACTUS_IDE_PORT: Port to bind to (default: 5001)
     - TACTUS_IDE_WORKSPACE: Initial workspace directory (default: current directory)
     - TACTUS_IDE_LOG_LEVEL: Logging level (default: INFO)
+    - TACTUS_IDE_RETAIN_COMPLETED_DAYS / TACTUS_IDE_RETAIN_FAILED_DAYS: Delete
+      finished procedures in the workspace storage after this many days
+      (default: keep forever)
+    - TACTUS_IDE_RETENTION_INTERVAL_SECONDS: Time between retention sweeps (default: 3600)
     """
     logging.basicConfig(level=os.environ.get("TACTUS_IDE_LOG_LEVEL", "INFO"))
 
@@ -6,15 +6,46 @@ Provides Agent.turn() for executing agent turns with LLM and tools.
 
 import logging
 import asyncio
-from typing import Any, Optional, Dict, List
+from string import Formatter
+from typing import Any, Optional, Dict, List, Union
 from dataclasses import dataclass
+from pydantic import BaseModel
 from pydantic_ai import Agent, RunContext, Tool
 from pydantic_ai.models import ModelMessage
 
-from tactus.primitives.result import ResultPrimitive
+from tactus.core.execution_context import compute_input_hash
+from tactus.primitives.result import ResultPrimitive, RestoredRunResult
 
 logger = logging.getLogger(__name__)
 
+# Message fields that differ between otherwise identical conversations
+_VOLATILE_MESSAGE_KEYS = frozenset(
+    {"timestamp", "usage", "provider_details", "provider_response_id", "model_name"}
+)
+
+
+def _strip_volatile(value: Any) -> Any:
+    """Drop per-call metadata (timestamps, usage) from dumped messages before hashing."""
+    if isinstance(value, dict):
+        return {k: _strip_volatile(v) for k, v in value.items() if k not in _VOLATILE_MESSAGE_KEYS}
+    if isinstance(value, list):
+        return [_strip_volatile(item) for item in value]
+    return value
+
+
+class _DotFormatter(Formatter):
+    """Formatter resolving dotted fields like {state.key} against nested dicts."""
+
+    def get_field(self, field_name, args, kwargs):
+        parts = field_name.split(".")
+        obj = kwargs
+        for part in parts:
+            if isinstance(obj, dict):
+                obj = obj.get(part, "")
+            else:
+                obj = getattr(obj, part, "")
+        return obj, field_name
+
 
 @dataclass
 class AgentDeps:
@@ -62,6 +93,8 @@ class AgentPrimitive:
         user_dependencies: Optional[Dict[str, Any]] = None,
         deps_class: Optional[type] = None,
         execution_context: Optional[Any] = None,
+        memoize: Union[bool, Dict[str, Any]] = False,
+        provider_registry: Optional[Any] = None,
     ):
         """
         Initialize agent primitive.
@@ -82,6 +115,10 @@ class AgentPrimitive:
             result_type: Optional Pydantic model for structured output
             model_settings: Optional dict of model-specific settings (temperature, top_p, etc.)
             execution_context: Optional ExecutionContext for checkpointing
+            memoize: Reuse turn results from the execution context's memo cache
+                when all turn inputs match (True, or {"ttl": seconds})
+            provider_registry: ProviderRegistry the model's provider client is
+                taken from (defaults to the process-wide registry)
         """
         self.name = name
         self.system_prompt_template = system_prompt_template
@@ -103,6 +140,9 @@ class AgentPrimitive:
         self.message_history_filter = message_history_filter
         self.user_dependencies = user_dependencies
         self.execution_context = execution_context
+        self.toolsets = toolsets or []
+        self.memoize = bool(memoize)
+        self.memo_ttl_seconds = memoize.get("ttl") if isinstance(memoize, dict) else None
 
         # Create dependencies (with dynamic class if user dependencies exist)
         if deps_class:
@@ -170,22 +210,15 @@ class AgentPrimitive:
         self.all_tools = all_tools
 
         # Create Pydantic AI Agent with all tools
-        # For Bedrock, we need to create a provider with region_name
-        if provider and provider.lower() == "bedrock":
-            import os
-            from pydantic_ai.models.bedrock import BedrockConverseModel
-            from pydantic_ai.providers.bedrock import BedrockProvider
+        # The model's provider client (connection pool, credentials) is shared
+        # with every other agent using the same provider and credentials
+        if provider_registry is None:
+            from tactus.providers.registry import default_provider_registry
 
-            # Get region from environment (set by config loader)
-            region_name = os.environ.get("AWS_DEFAULT_REGION", "us-east-1")
-
-            # Extract model ID (remove provider prefix if present)
-            model_id = model.split(":", 1)[1] if ":" in model else model
-
-            logger.info(f"Creating Bedrock model '{model_id}' with region: {region_name}")
-            bedrock_provider = BedrockProvider(region_name=region_name)
-            bedrock_model = BedrockConverseModel(model_id, provider=bedrock_provider)
+            provider_registry = default_provider_registry()
+        agent_model = provider_registry.get_model(model, provider)
 
+        if provider and provider.lower() == "bedrock":
             # Pass tools/toolsets to Agent constructor
             # Empty lists are valid, but we only pass them if not empty
             # This avoids Bedrock rejecting requests for models that don't support tools
@@ -203,7 +236,7 @@ class AgentPrimitive:
             if not all_tools and (not toolsets or len(toolsets) == 0 or toolsets is None):
                 logger.info(f"Agent '{name}' created with NO tools/toolsets for Bedrock")
 
-            self.agent = Agent(bedrock_model, **agent_kwargs)
+            self.agent = Agent(agent_model, **agent_kwargs)
         else:
             # For OpenAI and other providers, use default behavior
             # Pydantic AI will use OPENAI_API_KEY from environment by default
@@ -216,50 +249,13 @@ class AgentPrimitive:
             if toolsets is not None:  # Check for None, not emptiness
                 agent_kwargs["toolsets"] = toolsets
 
-            self.agent = Agent(model, **agent_kwargs)
+            self.agent = Agent(agent_model, **agent_kwargs)
 
         # Add dynamic system prompt
         @self.agent.system_prompt
         def dynamic_system_prompt(ctx: RunContext[AgentDeps]) -> str:
             """Generate system prompt dynamically using current state and context."""
-            deps = ctx.deps
-            template = deps.system_prompt_template
-
-            # Build template variables from state and context
-            template_vars = {}
-            if deps.state_primitive:
-                template_vars["state"] = deps.state_primitive.all()
-            if deps.context:
-                template_vars.update(deps.context)
-
-            # Format template with variables (supports dot notation like {state.key})
-            from string import Formatter
-
-            class DotFormatter(Formatter):
-                def get_field(self, field_name, args, kwargs):
-                    parts = field_name.split(".")
-                    obj = kwargs
-                    for part in parts:
-                        if isinstance(obj, dict):
-                            obj = obj.get(part, "")
-                        else:
-                            obj = getattr(obj, part, "")
-                    return obj, field_name
-
-            formatter = DotFormatter()
-            try:
-                prompt = formatter.format(template, **template_vars)
-            except (KeyError, AttributeError) as e:
-                logger.warning(
-                    f"Template variable error in system prompt: {e}, using template as-is"
-                )
-                prompt = template
-
-            # Append output schema guidance if provided
-            if deps.output_schema_guidance:
-                prompt = f"{prompt}\n\n{deps.output_schema_guidance}"
-
-            return prompt
+            return self._render_system_prompt(ctx.deps)
 
         # Conversation history
         self.message_history: List[ModelMessage] = []
@@ -269,6 +265,63 @@ class AgentPrimitive:
             f"AgentPrimitive '{name}' initialized with {len(all_tools)} tools (including 'done')"
         )
 
+    def _render_system_prompt(self, deps: Any) -> str:
+        """Render the system prompt template with current state and context."""
+        template = deps.system_prompt_template
+
+        # Build template variables from state and context
+        template_vars = {}
+        if deps.state_primitive:
+            template_vars["state"] = deps.state_primitive.all()
+        if deps.context:
+            template_vars.update(deps.context)
+
+        # Format template with variables (supports dot notation like {state.key})
+        try:
+            prompt = _DotFormatter().format(template, **template_vars)
+        except (KeyError, AttributeError) as e:
+            logger.warning(f"Template variable error in system prompt: {e}, using template as-is")
+            prompt = template
+
+        # Append output schema guidance if provided
+        if deps.output_schema_guidance:
+            prompt = f"{prompt}\n\n{deps.output_schema_guidance}"
+
+        return prompt
+
+    def _turn_input_hash(self, opts: Optional[Dict[str, Any]]) -> str:
+        """
+        Hash everything that determines the result of a turn.
+
+        Covers the model, rendered system prompt, message history, user input,
+        tools and model settings; per-call metadata such as message timestamps
+        is excluded so identical conversations hash equally across runs.
+        """
+        from pydantic_ai.messages import ModelMessagesTypeAdapter
+
+        turn_tools = self._get_tools_for_turn(opts)
+        tools = turn_tools if turn_tools is not None else self.all_tools
+        output_schema = None
+        if self.result_type is not None and hasattr(self.result_type, "model_json_schema"):
+            output_schema = self.result_type.model_json_schema()
+
+        inputs = {
+            "provider": self.provider,
+            "model": self.model,
+            "system_prompt": self._render_system_prompt(self.deps),
+            "message_history": _strip_volatile(
+                ModelMessagesTypeAdapter.dump_python(self.message_history, mode="json")
+            ),
+            "user_input": self._get_user_input_for_turn(opts),
+            "tools": sorted(tool.name for tool in tools),
+            "toolsets": [
+                getattr(toolset, "id", None) or type(toolset).__name__ for toolset in self.toolsets
+            ],
+            "model_settings": self._get_model_settings_for_turn(opts),
+            "output_schema": output_schema,
+        }
+        return compute_input_hash("agent_turn", inputs)
+
     def turn(self, opts: Optional[Dict[str, Any]] = None) -> ResultPrimitive:
         """
         Execute one agent turn (synchronous wrapper for async Pydantic AI call).
@@ -295,10 +348,44 @@ class AgentPrimitive:
 
         # If execution_context is available, wrap with checkpoint
         if self.execution_context:
-            return self.execution_context.checkpoint(lambda: self._execute_turn(opts), "agent_turn")
+            codecs = getattr(self.execution_context, "codecs", None)
+            if (
+                codecs is not None
+                and isinstance(self.result_type, type)
+                and issubclass(self.result_type, BaseModel)
+            ):
+                # Output models may be generated at runtime, so they can't be
+                # found by import path when a checkpoint is replayed
+                codecs.register_model(self.result_type)
+
+            result = self.execution_context.checkpoint(
+                lambda: self._execute_turn(opts),
+                "agent_turn",
+                # Hashing serializes the whole message history, so only
+                # memoized agents pay for it
+                input_hash=self._turn_input_hash(opts) if self.memoize else None,
+                memoize=self.memoize,
+                memo_ttl_seconds=self.memo_ttl_seconds,
+            )
+            if isinstance(result, ResultPrimitive) and isinstance(
+                result._result, RestoredRunResult
+            ):
+                self._restore_turn(result._result)
+            return result
         else:
             return self._execute_turn(opts)
 
+    def _restore_turn(self, restored: RestoredRunResult) -> None:
+        """
+        Rebuild conversation history from a turn replayed from a checkpoint
+        (or served from the memo cache), as if the turn had just run.
+        """
+        restored.history = list(self.message_history)
+        self.message_history.extend(
+            msg for msg in restored.new_messages() if self._message_has_content(msg)
+        )
+        self._initialized = True
+
     def _execute_turn(self, opts: Optional[Dict[str, Any]] = None) -> ResultPrimitive:
         """Execute the agent turn logic (extracted for checkpointing)."""
         # Emit agent turn started event
@@ -936,6 +1023,10 @@ class AgentPrimitive:
             True if message has content, False if empty
         """
         try:
+            # ModelRequest/ModelResponse carry their content as parts
+            parts = getattr(msg, "parts", None)
+            if parts is not None:
+                return len(parts) > 0
             # Check if message has content attribute
             if hasattr(msg, "content"):
                 content = msg.content
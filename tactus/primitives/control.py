@@ -73,6 +73,16 @@ class IterationsPrimitive:
         logger.debug(f"Iteration incremented to {self._current_iteration}")
         return self._current_iteration
 
+    def restore(self, iteration: int) -> None:
+        """
+        Set the iteration counter (used when resuming from a snapshot).
+
+        Args:
+            iteration: Iteration count captured by current()
+        """
+        self._current_iteration = iteration
+        logger.debug(f"Iterations restored to {iteration}")
+
     def reset(self) -> None:
         """Reset iteration counter (mainly for testing)."""
         self._current_iteration = 0
@@ -6,7 +6,7 @@ that include both framework dependencies and user-declared dependencies.
 """
 
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -38,7 +38,20 @@ def generate_agent_deps_class(user_dependencies: Optional[Dict[str, Any]] = None
 
         return AgentDeps
 
-    logger.debug(f"Generating AgentDeps with user dependencies: {list(user_dependencies.keys())}")
+    # The class only depends on the dependency names, which rarely change between runs
+    from tactus.core.schema_cache import default_schema_cache
+
+    return default_schema_cache().get_or_create(
+        "agent_deps",
+        "GeneratedAgentDeps",
+        list(user_dependencies.keys()),
+        lambda: _make_agent_deps_class(list(user_dependencies.keys())),
+    )
+
+
+def _make_agent_deps_class(dependency_names: List[str]) -> type:
+    """Build the AgentDeps dataclass with the given user dependency fields."""
+    logger.debug(f"Generating AgentDeps with user dependencies: {dependency_names}")
 
     # Create a dynamic class by building the fields dict for dataclass
     # This is necessary because dataclasses need fields to be defined at class creation time
@@ -53,7 +66,7 @@ def generate_agent_deps_class(user_dependencies: Optional[Dict[str, Any]] = None
     ]
 
     # Add user dependency fields (required, no defaults - must be before fields with defaults)
-    for dep_name in user_dependencies.keys():
+    for dep_name in dependency_names:
         fields.append((dep_name, Any))
 
     # Add fields with defaults last
@@ -5,7 +5,8 @@ Model primitive for ML inference with automatic checkpointing.
 import logging
 from typing import Any
 
-from tactus.core.execution_context import ExecutionContext
+from tactus.core.dsl_stubs import lua_table_to_dict
+from tactus.core.execution_context import ExecutionContext, compute_input_hash
 
 logger = logging.getLogger(__name__)
 
@@ -21,8 +22,13 @@ class ModelPrimitive:
     - Custom ML inference (any trained model)
 
     Each .predict() call is automatically checkpointed for durability.
+    Models declared with memoize = true (or memoize = {ttl = seconds}) reuse
+    predictions for identical inputs from the execution context's memo cache.
     """
 
+    # Config keys that do not affect predictions
+    _UNHASHED_CONFIG_KEYS = ("memoize", "headers", "timeout")
+
     def __init__(self, model_name: str, config: dict, context: ExecutionContext | None = None):
         """
         Initialize model primitive.
@@ -32,11 +38,15 @@ class ModelPrimitive:
             config: Model configuration dict with:
                 - type: Backend type (http, pytorch, bert, sklearn, etc.)
                 - Backend-specific config (endpoint, path, etc.)
+                - memoize: Optional True or {ttl = seconds} to memoize predictions
             context: Execution context for checkpointing
         """
         self.model_name = model_name
         self.config = config
         self.context = context
+        memoize = config.get("memoize", False)
+        self.memoize = bool(memoize)
+        self.memo_ttl_seconds = memoize.get("ttl") if isinstance(memoize, dict) else None
         self.backend = self._create_backend(config)
 
     def _create_backend(self, config: dict):
@@ -89,12 +99,28 @@ class ModelPrimitive:
             return self.backend.predict_sync(input_data)
 
         # With context - checkpoint the operation
-
         return self.context.checkpoint(
-            fn=lambda: self._execute_predict(input_data),
-            operation_type="model_predict",
+            lambda: self._execute_predict(input_data),
+            "model_predict",
+            input_hash=self._predict_input_hash(input_data),
+            memoize=self.memoize,
+            memo_ttl_seconds=self.memo_ttl_seconds,
         )
 
+    def _predict_input_hash(self, input_data: Any) -> str:
+        """Hash the model identity and prediction input."""
+        config = {
+            key: value
+            for key, value in self.config.items()
+            if key not in self._UNHASHED_CONFIG_KEYS
+        }
+        inputs = {
+            "model": self.model_name,
+            "config": config,
+            "input": lua_table_to_dict(input_data) if hasattr(input_data, "items") else input_data,
+        }
+        return compute_input_hash("model_predict", inputs)
+
     def _execute_predict(self, input_data: Any) -> Any:
         """
         Execute the actual prediction.
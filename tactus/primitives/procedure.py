@@ -6,16 +6,31 @@ for async invocation, along with status tracking and waiting.
 """
 
 import logging
-import uuid
 import asyncio
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional, Dict, List, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 
+from tactus.core.exceptions import ProcedureWaitingForHuman
+from tactus.core.execution_context import child_procedure_id
+
 logger = logging.getLogger(__name__)
 
 
+def _run_coroutine(coro: Any) -> Any:
+    """Run a coroutine to completion from synchronous code."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    # The calling workflow runs on this thread's event loop, which can't be
+    # re-entered: run the coroutine on its own loop in a worker thread
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="tactus-procedure") as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
 @dataclass
 class ProcedureHandle:
     """Handle for tracking async procedure execution."""
@@ -25,6 +40,8 @@ class ProcedureHandle:
     status: str = "running"  # "running", "completed", "failed", "waiting"
     result: Any = None
     error: Optional[str] = None
+    # Message the procedure is waiting on (status "waiting")
+    pending_message_id: Optional[str] = None
     started_at: datetime = field(default_factory=datetime.now)
     completed_at: Optional[datetime] = None
     thread: Optional[threading.Thread] = None
@@ -93,6 +110,9 @@ class ProcedurePrimitive:
         self.current_depth = current_depth
         self.handles: Dict[str, ProcedureHandle] = {}
         self._lock = threading.Lock()
+        # Spawns so far in this run (spawns take no checkpoint position, so
+        # their IDs are keyed by spawn order)
+        self._spawn_count = 0
 
         logger.info(f"ProcedurePrimitive initialized (depth {current_depth}/{max_depth})")
 
@@ -101,7 +121,11 @@ class ProcedurePrimitive:
         Synchronous procedure invocation with auto-checkpointing.
 
         Sub-procedure calls are automatically checkpointed for durability.
-        On replay, the cached result is returned without re-executing.
+        On replay, the cached result is returned without re-executing. The
+        sub-procedure's ID is derived from this procedure's ID and the call's
+        checkpoint position, so if this procedure is resumed before the call
+        completed (e.g. the sub-procedure waited for a human), the
+        sub-procedure resumes from its own checkpoints.
 
         Args:
             name: Procedure name or file path
@@ -122,6 +146,9 @@ class ProcedurePrimitive:
 
         # Normalize params
         params = params or {}
+        parent_id = self.execution_context.procedure_id
+        position = self.execution_context.next_position()
+        procedure_id = child_procedure_id(parent_id, position, name)
 
         # Wrap execution in checkpoint for durability
         def execute_procedure():
@@ -130,43 +157,27 @@ class ProcedurePrimitive:
                 source = self._load_procedure_source(name)
 
                 # Create runtime for sub-procedure
-                runtime = self.runtime_factory(name, params)
-
-                # Execute synchronously (runtime.execute is async, so we need to run it)
-                import asyncio
-
-                try:
-                    loop = asyncio.get_running_loop()
-                    # We're already in an async context, use run_until_complete would fail
-                    # Instead, we need to await it, but we're in a sync function
-                    # Solution: Create a task and wait for it
-                    result = asyncio.create_task(
-                        runtime.execute(source=source, context=params, format="lua")
-                    )
-                    # This won't work in sync context - we need to handle this differently
-                    # For now, use run_until_complete in a new loop
-                    raise RuntimeError("Cannot run nested async in sync context")
-                except RuntimeError:
-                    # No running loop or nested loop issue - create new one
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    result = loop.run_until_complete(
-                        runtime.execute(source=source, context=params, format="lua")
-                    )
-                    loop.close()
+                runtime = self.runtime_factory(
+                    name, params, procedure_id=procedure_id, parent_position=position
+                )
+
+                result = _run_coroutine(
+                    runtime.execute(source=source, context=params, format="lua")
+                )
 
                 # Extract result from execution response
                 if result.get("success"):
                     logger.info(f"Procedure '{name}' completed successfully")
                     return result.get("result")
+                elif result.get("status") == "WAITING_FOR_HUMAN":
+                    # Suspend this procedure too; resuming it resumes the child
+                    raise ProcedureWaitingForHuman(parent_id, result.get("pending_message_id"))
                 else:
                     error_msg = result.get("error", "Unknown error")
                     logger.error(f"Procedure '{name}' failed: {error_msg}")
                     raise ProcedureExecutionError(f"Procedure '{name}' failed: {error_msg}")
 
-            except ProcedureExecutionError:
-                raise
-            except ProcedureRecursionError:
+            except (ProcedureExecutionError, ProcedureRecursionError, ProcedureWaitingForHuman):
                 raise
             except Exception as e:
                 logger.error(f"Error executing procedure '{name}': {e}")
@@ -194,7 +205,10 @@ class ProcedurePrimitive:
             raise ProcedureRecursionError(f"Maximum recursion depth ({self.max_depth}) exceeded")
 
         # Create handle
-        procedure_id = str(uuid.uuid4())
+        with self._lock:
+            spawn_key = f"spawn{self._spawn_count}"
+            self._spawn_count += 1
+        procedure_id = child_procedure_id(self.execution_context.procedure_id, spawn_key, name)
         handle = ProcedureHandle(procedure_id=procedure_id, name=name, status="running")
 
         # Store handle
@@ -220,7 +234,7 @@ class ProcedurePrimitive:
             source = self._load_procedure_source(name)
 
             # Create runtime for sub-procedure
-            runtime = self.runtime_factory(name, params)
+            runtime = self.runtime_factory(name, params, procedure_id=handle.procedure_id)
 
             # Execute in new event loop (thread-safe)
             loop = asyncio.new_event_loop()
@@ -238,6 +252,12 @@ class ProcedurePrimitive:
                     handle.status = "completed"
                     handle.result = result.get("result")
                     logger.info(f"Async procedure '{name}' completed (id: {handle.procedure_id})")
+                elif result.get("status") == "WAITING_FOR_HUMAN":
+                    handle.status = "waiting"
+                    handle.pending_message_id = result.get("pending_message_id")
+                    logger.info(
+                        f"Async procedure '{name}' waiting for human (id: {handle.procedure_id})"
+                    )
                 else:
                     handle.status = "failed"
                     handle.error = result.get("error", "Unknown error")
@@ -278,6 +298,8 @@ class ProcedurePrimitive:
 
         Raises:
             ProcedureExecutionError: If procedure failed
+            ProcedureWaitingForHuman: If the procedure is waiting for a human;
+                this procedure suspends too, and resuming it resumes the child
             TimeoutError: If timeout exceeded
         """
         logger.debug(f"Waiting for procedure {handle.procedure_id}")
@@ -296,6 +318,10 @@ class ProcedurePrimitive:
                 raise ProcedureExecutionError(f"Procedure {handle.name} failed: {handle.error}")
             elif handle.status == "completed":
                 return handle.result
+            elif handle.status == "waiting":
+                raise ProcedureWaitingForHuman(
+                    self.execution_context.procedure_id, handle.pending_message_id
+                )
             else:
                 raise ProcedureExecutionError(
                     f"Procedure {handle.name} in unexpected state: {handle.status}"
@@ -341,7 +367,8 @@ class ProcedurePrimitive:
             handles: List of procedure handles
 
         Returns:
-            First completed handle
+            First completed handle (or one waiting for a human, which will
+            not complete in this run; wait() on it suspends this procedure)
         """
         logger.debug(f"Waiting for any of {len(handles)} procedures")
 
@@ -349,7 +376,7 @@ class ProcedurePrimitive:
             # Check if any completed
             with self._lock:
                 for handle in handles:
-                    if handle.status in ("completed", "failed", "cancelled"):
+                    if handle.status in ("completed", "failed", "cancelled", "waiting"):
                         return handle
 
             # Sleep briefly before checking again
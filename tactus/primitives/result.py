@@ -5,7 +5,7 @@ Provides Lua-accessible interface to RunResult data, usage stats, and messages.
 Aligned with pydantic-ai's RunResult API.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 try:
     from pydantic_ai.result import RunResult
@@ -15,6 +15,51 @@ except ImportError:
     RunResult = Any
     ModelMessage = dict
 
+try:
+    from pydantic_ai.messages import ModelResponse
+except ImportError:
+    ModelResponse = None
+
+
+class RestoredRunResult:
+    """
+    Agent run result rebuilt from a checkpoint.
+
+    Stands in for pydantic-ai's AgentRunResult when a turn is replayed or
+    served from the memo cache, so ResultPrimitive behaves the same either way.
+    Only the turn's own messages are stored; all_messages() also includes the
+    earlier conversation if the agent supplies it via history.
+    """
+
+    def __init__(
+        self,
+        output: Any,
+        messages: List[ModelMessage],
+        run_usage: Any,
+        history: Optional[List[ModelMessage]] = None,
+    ):
+        self.output = output
+        self._messages = messages
+        self._usage = run_usage
+        self.history = history or []
+
+    @property
+    def response(self) -> Any:
+        """The last model response of the turn."""
+        for message in reversed(self._messages):
+            if ModelResponse is not None and isinstance(message, ModelResponse):
+                return message
+        raise ValueError("Restored run has no model response")
+
+    def usage(self) -> Any:
+        return self._usage
+
+    def new_messages(self) -> List[ModelMessage]:
+        return list(self._messages)
+
+    def all_messages(self) -> List[ModelMessage]:
+        return [*self.history, *self._messages]
+
 
 class ResultPrimitive:
     """
@@ -188,6 +188,29 @@ class StagePrimitive:
         """
         return len(self._history)
 
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Capture the current stage and transition history.
+
+        Returns:
+            Dict accepted by restore()
+        """
+        return {
+            "current": self._current_stage,
+            "history": [transition.copy() for transition in self._history],
+        }
+
+    def restore(self, snapshot: Dict[str, Any]) -> None:
+        """
+        Restore stage and history (used when resuming from a snapshot).
+
+        Args:
+            snapshot: Dict captured by snapshot()
+        """
+        self._current_stage = snapshot.get("current")
+        self._history = [transition.copy() for transition in snapshot.get("history", [])]
+        logger.debug(f"Stage restored to {self._current_stage}")
+
     def clear_history(self) -> None:
         """
         Clear stage transition history (mainly for testing).
@@ -147,6 +147,16 @@ class StatePrimitive:
         logger.debug(f"State.all() returning {len(self._state)} keys")
         return self._state.copy()
 
+    def restore(self, state: Dict[str, Any]) -> None:
+        """
+        Replace all state (used when resuming from a snapshot).
+
+        Args:
+            state: State dictionary captured by all()
+        """
+        self._state = dict(state)
+        logger.debug(f"State restored with {len(self._state)} keys")
+
     def clear(self) -> None:
         """Clear all state (mainly for testing)."""
         self._state.clear()
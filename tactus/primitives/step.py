@@ -1,12 +1,17 @@
 """
 Step primitive for checkpointed operations.
 
-Provides checkpoint() for creating explicit checkpoints in procedures.
+Provides checkpoint() for creating explicit checkpoints in procedures, and
+Checkpoint.snapshot()/Checkpoint.resume() for procedures that can restart
+from their latest snapshot instead of replaying their whole history.
 """
 
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 import logging
 
+from tactus.core.dsl_stubs import lua_table_to_dict
+from tactus.core.execution_context import compute_input_hash
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,20 +40,46 @@ class StepPrimitive:
         """
         self.execution_context = execution_context
 
-    def checkpoint(self, fn: Callable[[], Any]) -> Any:
+    def checkpoint(self, fn: Callable[[], Any], opts: Any = None) -> Any:
         """
         Execute function with position-based checkpointing.
 
         Args:
             fn: Function to execute (must be deterministic)
+            opts: Optional table with:
+                - inputs: Values that determine fn's result; hashed into the
+                  checkpoint's input_hash (a closure's captured values cannot
+                  be inspected, so they must be listed here)
+                - memoize: Reuse the result of any earlier checkpoint with the
+                  same inputs from the memo cache (requires inputs)
+                - ttl: Lifetime of the memoized result in seconds
 
         Returns:
             Result of fn() on first execution, cached result on replay
+
+        Example (Lua):
+            local label = Step.checkpoint(function()
+                return Classifier.predict(item.text)
+            end, {inputs = {text = item.text}, memoize = true})
         """
         logger.debug(f"checkpoint() at position {self.execution_context.next_position()}")
 
+        opts = lua_table_to_dict(opts) if opts is not None else {}
+        if not isinstance(opts, dict):
+            # An empty Lua table converts to an empty list
+            opts = {}
+        input_hash = None
+        if "inputs" in opts:
+            input_hash = compute_input_hash("explicit_checkpoint", opts["inputs"])
+
         try:
-            result = self.execution_context.checkpoint(fn, "explicit_checkpoint")
+            result = self.execution_context.checkpoint(
+                fn,
+                "explicit_checkpoint",
+                input_hash=input_hash,
+                memoize=bool(opts.get("memoize")),
+                memo_ttl_seconds=opts.get("ttl"),
+            )
             logger.debug("checkpoint() completed successfully")
             return result
         except Exception as e:
@@ -60,17 +91,45 @@ class CheckpointPrimitive:
     """
     Checkpoint management primitive.
 
-    Provides checkpoint clearing operations for testing.
+    Provides checkpoint clearing operations for testing, and state snapshots
+    for resumable procedures:
+
+        main = procedure("main", {...}, function(input)
+            local saved = Checkpoint.resume()
+            local start = saved and saved.data.next_item or 1
+            for i = start, #input.items do
+                Step.checkpoint(function() return process(input.items[i]) end)
+                Checkpoint.snapshot({next_item = i + 1})
+            end
+        end)
+
+    On resume, checkpoints before the snapshot are skipped rather than
+    replayed, and State, Stage and Iterations are restored.
     """
 
-    def __init__(self, execution_context):
+    def __init__(
+        self,
+        execution_context,
+        lua_sandbox=None,
+        state_primitive=None,
+        stage_primitive=None,
+        iterations_primitive=None,
+    ):
         """
         Initialize Checkpoint primitive.
 
         Args:
             execution_context: ExecutionContext instance
+            lua_sandbox: LuaSandbox for converting snapshot data to Lua tables
+            state_primitive: StatePrimitive captured in snapshots
+            stage_primitive: StagePrimitive captured in snapshots
+            iterations_primitive: IterationsPrimitive captured in snapshots
         """
         self.execution_context = execution_context
+        self.lua_sandbox = lua_sandbox
+        self.state_primitive = state_primitive
+        self.stage_primitive = stage_primitive
+        self.iterations_primitive = iterations_primitive
 
     def clear_all(self) -> None:
         """
@@ -107,3 +166,64 @@ class CheckpointPrimitive:
             print("Next checkpoint will be at position: " .. pos)
         """
         return self.execution_context.next_position()
+
+    def snapshot(self, data: Any = None) -> bool:
+        """
+        Record a snapshot of procedure state at the current position.
+
+        Captures State, Stage and Iterations along with data (anything the
+        procedure needs to continue from here, e.g. a loop index). Snapshots
+        are ignored while replaying, so calling this every iteration is cheap.
+
+        Args:
+            data: Lua table or value to hand back from resume()
+
+        Returns:
+            True if the snapshot was recorded
+
+        Example:
+            Checkpoint.snapshot({stage_index = i})
+        """
+        snapshot = {"data": lua_table_to_dict(data) if data is not None else None}
+        if self.state_primitive:
+            snapshot["state"] = self.state_primitive.all()
+        if self.stage_primitive:
+            snapshot["stage"] = self.stage_primitive.snapshot()
+        if self.iterations_primitive:
+            snapshot["iterations"] = self.iterations_primitive.current()
+
+        position = self.execution_context.next_position()
+        recorded = self.execution_context.save_snapshot(snapshot)
+        if recorded:
+            logger.debug(f"Snapshot recorded at position {position}")
+        return recorded
+
+    def resume(self) -> Optional[Any]:
+        """
+        Restore the latest snapshot and skip replay ahead to it.
+
+        Call at the top of a resumable procedure, before its first checkpoint.
+
+        Returns:
+            Table with data, state, stage, iterations and position fields,
+            or nil if there is no snapshot to resume from
+
+        Example:
+            local saved = Checkpoint.resume()
+            local start = saved and saved.data.stage_index or 1
+        """
+        snapshot = self.execution_context.restore_snapshot()
+        if snapshot is None:
+            return None
+
+        if self.state_primitive and "state" in snapshot:
+            self.state_primitive.restore(snapshot["state"])
+        if self.stage_primitive and "stage" in snapshot:
+            self.stage_primitive.restore(snapshot["stage"])
+        if self.iterations_primitive and "iterations" in snapshot:
+            self.iterations_primitive.restore(snapshot["iterations"])
+
+        logger.info(f"Resuming from snapshot at position {snapshot['position']}")
+        if self.lua_sandbox:
+            return self.lua_sandbox.lua.table_from(snapshot, recursive=True)
+        return snapshot
@@ -165,7 +165,9 @@ class ToolsetPrimitive:
         if not paths:
             raise ValueError(f"Plugin toolset '{name}' must specify 'paths'")
 
-        loader = PluginLoader(tool_primitive=self.runtime.tool_primitive)
+        loader = PluginLoader(
+            tool_primitive=self.runtime.tool_primitive, plugin_cache=self.runtime.plugin_cache
+        )
         toolset = loader.create_toolset(paths, name=name)
         return toolset
 
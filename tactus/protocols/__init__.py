@@ -8,15 +8,21 @@ This module exports all Pydantic models and protocol definitions for Tactus.
 from tactus.protocols.models import (
     CheckpointEntry,
     ProcedureMetadata,
+    ProcedureSummary,
+    ProcedurePage,
     HITLRequest,
     HITLResponse,
     ChatMessage,
+    LazyResult,
+    resolve_result,
 )
 
 # Protocols
-from tactus.protocols.storage import StorageBackend
+from tactus.protocols.storage import StorageBackend, AsyncStorageBackend
 from tactus.protocols.hitl import HITLHandler
 from tactus.protocols.chat_recorder import ChatRecorder
+from tactus.protocols.memo import MemoCache
+from tactus.protocols.codec import StorageCodec
 
 # Configuration
 from tactus.protocols.config import TactusConfig, ProcedureConfig
@@ -25,13 +31,20 @@ __all__ = [
     # Models
     "CheckpointEntry",
     "ProcedureMetadata",
+    "ProcedureSummary",
+    "ProcedurePage",
     "HITLRequest",
     "HITLResponse",
     "ChatMessage",
+    "LazyResult",
+    "resolve_result",
     # Protocols
     "StorageBackend",
+    "AsyncStorageBackend",
     "HITLHandler",
     "ChatRecorder",
+    "MemoCache",
+    "StorageCodec",
     # Config
     "TactusConfig",
     "ProcedureConfig",
@@ -0,0 +1,48 @@
+"""
+Storage codec protocol for Tactus.
+
+A codec turns the plain-data documents built by storage backends (procedure
+metadata, checkpoint results, state) into bytes and back. Backends stay
+responsible for the document layout; codecs only choose the encoding.
+"""
+
+from typing import Any, Protocol
+
+
+class StorageCodec(Protocol):
+    """
+    Protocol for storage codecs.
+
+    Attributes:
+        name: Short identifier used in configuration (e.g. "json", "msgpack")
+        extension: File suffix for documents written with this codec
+        binary: True if encoded bytes are not UTF-8 text
+    """
+
+    name: str
+    extension: str
+    binary: bool
+
+    def encode(self, value: Any) -> bytes:
+        """
+        Encode a document.
+
+        Args:
+            value: Plain data (dicts, lists, strings, numbers, booleans, None)
+
+        Returns:
+            Encoded bytes
+        """
+        ...
+
+    def decode(self, data: bytes) -> Any:
+        """
+        Decode bytes produced by encode().
+
+        Args:
+            data: Encoded bytes
+
+        Returns:
+            The decoded document
+        """
+        ...
@@ -0,0 +1,51 @@
+"""
+Memo cache protocol for Tactus.
+
+A memo cache maps the input hash of a checkpointed operation (agent turn,
+model prediction, explicit checkpoint) to its result, so identical operations
+are not re-run across procedures and runs. Unlike the execution log, entries
+are shared by all procedure IDs.
+"""
+
+from typing import Any, Optional, Protocol
+
+
+class MemoCache(Protocol):
+    """
+    Protocol for memo caches.
+
+    Implementations decide how results are stored and evicted (e.g. LRU with a
+    maximum entry count, per-entry TTL).
+    """
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Look up a memoized result.
+
+        Args:
+            key: Input hash of the operation
+            default: Value returned when the key is missing or expired
+
+        Returns:
+            The cached result, or default
+        """
+        ...
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """
+        Store a result.
+
+        Args:
+            key: Input hash of the operation
+            value: Result to memoize
+            ttl_seconds: Optional lifetime overriding the cache default
+        """
+        ...
+
+    def delete(self, key: str) -> None:
+        """Remove a result if present."""
+        ...
+
+    def clear(self) -> None:
+        """Remove all results."""
+        ...
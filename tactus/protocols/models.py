@@ -2,6 +2,8 @@
 Core Pydantic models used across Tactus protocols.
 """
 
+import copy
+from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
 from pydantic import BaseModel, Field
 from datetime import datetime, timezone
@@ -12,6 +14,27 @@ def utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+class LazyResult(ABC):
+    """
+    Placeholder for a checkpoint result that is stored out of line.
+
+    Storage backends may put a LazyResult in CheckpointEntry.result instead of
+    the value itself; the execution context calls load() when the entry is
+    replayed, so results that are never consumed are never read.
+    """
+
+    @abstractmethod
+    def load(self) -> Any:
+        """Fetch and return the checkpoint result."""
+
+
+def resolve_result(result: Any) -> Any:
+    """Return the concrete value of a checkpoint result, loading it if lazy."""
+    if isinstance(result, LazyResult):
+        return result.load()
+    return result
+
+
 class CheckpointEntry(BaseModel):
     """A single checkpoint entry in the execution log (position-based)."""
 
@@ -50,9 +73,85 @@ class ProcedureMetadata(BaseModel):
     waiting_on_message_id: Optional[str] = Field(
         default=None, description="Message ID if procedure is waiting for human response"
     )
+    parent_id: Optional[str] = Field(
+        default=None, description="ID of the procedure that invoked this one as a sub-procedure"
+    )
+    parent_position: Optional[int] = Field(
+        default=None,
+        description="Checkpoint position of the invoking Procedure.run() call (None if spawned)",
+    )
 
     model_config = {"arbitrary_types_allowed": True}
 
+    def fork(self, at_position: int, procedure_id: str) -> "ProcedureMetadata":
+        """
+        Create a new procedure from the first at_position checkpoints of this one.
+
+        The new procedure replays those checkpoints from cache and executes
+        from at_position on. Checkpoint entries are shared, not copied.
+
+        Args:
+            at_position: Number of checkpoints to keep
+            procedure_id: ID of the new procedure
+
+        Raises:
+            ValueError: If at_position is outside the execution log
+        """
+        check_fork_position(at_position, len(self.execution_log), self.procedure_id)
+        return ProcedureMetadata(
+            procedure_id=procedure_id,
+            execution_log=self.execution_log[:at_position],
+            lua_state=fork_lua_state(self.lua_state, at_position),
+        )
+
+
+def check_fork_position(at_position: int, log_length: int, procedure_id: str) -> None:
+    """Raise ValueError unless a procedure can be forked at at_position."""
+    if not 0 <= at_position <= log_length:
+        raise ValueError(
+            f"Cannot fork procedure {procedure_id} at position {at_position} "
+            f"(it has {log_length} checkpoints)"
+        )
+
+
+def fork_lua_state(lua_state: Dict[str, Any], at_position: int) -> Dict[str, Any]:
+    """
+    Lua state for a procedure forked at at_position.
+
+    State is rebuilt by replaying the kept checkpoints, so only a snapshot
+    taken at or before the fork point (see Checkpoint.snapshot) carries over.
+    """
+    forked = copy.deepcopy(lua_state)
+    snapshot = forked.get("snapshot")
+    if snapshot is not None and snapshot.get("position", 0) > at_position:
+        del forked["snapshot"]
+    return forked
+
+
+class ProcedureSummary(BaseModel):
+    """Status index entry for a procedure (no execution log or state)."""
+
+    procedure_id: str = Field(..., description="Unique procedure identifier")
+    status: str = Field(..., description="Current procedure status")
+    waiting_on_message_id: Optional[str] = Field(
+        default=None, description="Message ID if procedure is waiting for human response"
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        description="When the status or metadata last changed (None if not tracked)",
+    )
+
+
+class ProcedurePage(BaseModel):
+    """One page of a procedure listing."""
+
+    procedures: list[ProcedureSummary] = Field(
+        default_factory=list, description="Procedures ordered by procedure_id"
+    )
+    next_cursor: Optional[str] = Field(
+        default=None, description="Cursor for the next page (None on the last page)"
+    )
+
 
 class HITLResponse(BaseModel):
     """Response from a human interaction."""
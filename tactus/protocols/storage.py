@@ -3,10 +3,43 @@ Storage backend protocol for Tactus.
 
 Defines the interface for persisting procedure state, execution log, and metadata.
 Implementations can use any storage backend (memory, files, databases, etc.).
+
+get_status(), set_status() and patch_state() touch one field without the
+execution log. Backends implement them natively where they can; the
+module-level functions of the same name fall back to a full load and save for
+backends that predate them.
 """
 
 from typing import Protocol, Optional, Any
-from tactus.protocols.models import ProcedureMetadata
+from tactus.protocols.models import ProcedureMetadata, ProcedurePage, ProcedureSummary
+
+
+def _load_status(storage: Any, procedure_id: str) -> ProcedureSummary:
+    """Read a procedure's status by loading its full metadata."""
+    metadata = storage.load_procedure_metadata(procedure_id)
+    return ProcedureSummary(
+        procedure_id=procedure_id,
+        status=metadata.status,
+        waiting_on_message_id=metadata.waiting_on_message_id,
+    )
+
+
+def _save_status(
+    storage: Any, procedure_id: str, status: str, waiting_on_message_id: Optional[str]
+) -> None:
+    """Set a procedure's status by loading and saving its full metadata."""
+    metadata = storage.load_procedure_metadata(procedure_id)
+    metadata.status = status
+    metadata.waiting_on_message_id = waiting_on_message_id
+    storage.save_procedure_metadata(procedure_id, metadata)
+
+
+def _save_state_patch(storage: Any, procedure_id: str, updates: dict[str, Any]) -> dict[str, Any]:
+    """Merge keys into a procedure's state by loading and saving its full metadata."""
+    metadata = storage.load_procedure_metadata(procedure_id)
+    metadata.state = {**metadata.state, **updates}
+    storage.save_procedure_metadata(procedure_id, metadata)
+    return metadata.state
 
 
 class StorageBackend(Protocol):
@@ -64,6 +97,61 @@ class StorageBackend(Protocol):
         """
         ...
 
+    def get_status(self, procedure_id: str) -> ProcedureSummary:
+        """
+        Read a procedure's status without loading its execution log.
+
+        A procedure that was never saved reports RUNNING, matching
+        load_procedure_metadata(). The default implementation loads the
+        full metadata.
+
+        Args:
+            procedure_id: Unique procedure identifier
+
+        Returns:
+            ProcedureSummary (updated_at is None if the backend does not track it)
+        """
+        return _load_status(self, procedure_id)
+
+    def set_status(
+        self, procedure_id: str, status: str, waiting_on_message_id: Optional[str] = None
+    ) -> None:
+        """
+        Set a procedure's status without rewriting its execution log.
+
+        Same effect as update_procedure_status(). The default implementation
+        loads and saves the full metadata.
+
+        Args:
+            procedure_id: Unique procedure identifier
+            status: New status (RUNNING, WAITING_FOR_HUMAN, COMPLETED, FAILED)
+            waiting_on_message_id: Optional message ID if waiting for human
+
+        Raises:
+            StorageError: If update fails
+        """
+        _save_status(self, procedure_id, status, waiting_on_message_id)
+
+    def patch_state(self, procedure_id: str, updates: dict[str, Any]) -> dict[str, Any]:
+        """
+        Merge keys into a procedure's state without rewriting its execution log.
+
+        Top-level keys in updates replace those in the stored state; other
+        keys are kept. The default implementation loads and saves the full
+        metadata.
+
+        Args:
+            procedure_id: Unique procedure identifier
+            updates: State keys to set
+
+        Returns:
+            The updated state dictionary
+
+        Raises:
+            StorageError: If saving fails
+        """
+        return _save_state_patch(self, procedure_id, updates)
+
     def get_state(self, procedure_id: str) -> dict[str, Any]:
         """
         Get mutable state dictionary.
@@ -88,3 +176,142 @@ class StorageBackend(Protocol):
             StorageError: If saving fails
         """
         ...
+
+    def list_procedures(
+        self, status: Optional[str] = None, limit: int = 100, cursor: Optional[str] = None
+    ) -> ProcedurePage:
+        """
+        List procedures from the status index, without loading their metadata.
+
+        Args:
+            status: Only list procedures with this status (None = all)
+            limit: Maximum number of procedures per page
+            cursor: next_cursor of the previous page (None = first page)
+
+        Returns:
+            ProcedurePage ordered by procedure_id
+        """
+        ...
+
+    def delete_procedure(self, procedure_id: str) -> int:
+        """
+        Delete a procedure's metadata, execution log and index entry.
+
+        Deleting a procedure that does not exist is not an error.
+
+        Args:
+            procedure_id: Unique procedure identifier
+
+        Returns:
+            Approximate number of stored bytes freed (0 for in-memory backends)
+
+        Raises:
+            StorageError: If deletion fails
+        """
+        ...
+
+    def fork_procedure(self, procedure_id: str, at_position: int, new_id: str) -> None:
+        """
+        Create a new procedure whose execution log is the first at_position
+        checkpoints of an existing one (see ProcedureMetadata.fork).
+
+        Running the new procedure replays the shared prefix from cache and
+        executes from at_position on. The source procedure is unchanged.
+
+        Args:
+            procedure_id: Procedure to fork
+            at_position: Number of checkpoints to keep (0 to len(execution_log))
+            new_id: ID of the new procedure
+
+        Raises:
+            ValueError: If procedure_id does not exist, new_id already exists,
+                or at_position is outside the execution log
+        """
+        ...
+
+
+class AsyncStorageBackend(Protocol):
+    """
+    Protocol for asynchronous storage backends.
+
+    Same operations as StorageBackend, awaited so that hosts running many
+    procedures in one event loop are not blocked by storage I/O. Operations on
+    the same procedure complete in the order they were issued.
+    """
+
+    async def load_procedure_metadata(self, procedure_id: str) -> ProcedureMetadata:
+        """Load complete procedure metadata from storage."""
+        ...
+
+    async def save_procedure_metadata(self, procedure_id: str, metadata: ProcedureMetadata) -> None:
+        """Save complete procedure metadata to storage."""
+        ...
+
+    async def update_procedure_status(
+        self, procedure_id: str, status: str, waiting_on_message_id: Optional[str] = None
+    ) -> None:
+        """Update procedure status (and optionally waiting message ID)."""
+        ...
+
+    async def get_status(self, procedure_id: str) -> ProcedureSummary:
+        """Read a procedure's status without loading its execution log."""
+        ...
+
+    async def set_status(
+        self, procedure_id: str, status: str, waiting_on_message_id: Optional[str] = None
+    ) -> None:
+        """Set a procedure's status without rewriting its execution log."""
+        ...
+
+    async def patch_state(self, procedure_id: str, updates: dict[str, Any]) -> dict[str, Any]:
+        """Merge keys into a procedure's state without rewriting its execution log."""
+        ...
+
+    async def get_state(self, procedure_id: str) -> dict[str, Any]:
+        """Get mutable state dictionary."""
+        ...
+
+    async def set_state(self, procedure_id: str, state: dict[str, Any]) -> None:
+        """Set mutable state dictionary."""
+        ...
+
+    async def list_procedures(
+        self, status: Optional[str] = None, limit: int = 100, cursor: Optional[str] = None
+    ) -> ProcedurePage:
+        """List procedures from the status index."""
+        ...
+
+    async def delete_procedure(self, procedure_id: str) -> int:
+        """Delete a procedure's metadata, execution log and index entry."""
+        ...
+
+    async def fork_procedure(self, procedure_id: str, at_position: int, new_id: str) -> None:
+        """Create a new procedure from the first at_position checkpoints of another."""
+        ...
+
+
+def get_status(storage: Any, procedure_id: str) -> ProcedureSummary:
+    """Read a procedure's status with the backend's get_status() if it has one."""
+    native = getattr(storage, "get_status", None)
+    if native is not None:
+        return native(procedure_id)
+    return _load_status(storage, procedure_id)
+
+
+def set_status(
+    storage: Any, procedure_id: str, status: str, waiting_on_message_id: Optional[str] = None
+) -> None:
+    """Set a procedure's status with the backend's set_status() if it has one."""
+    native = getattr(storage, "set_status", None)
+    if native is not None:
+        native(procedure_id, status, waiting_on_message_id)
+    else:
+        _save_status(storage, procedure_id, status, waiting_on_message_id)
+
+
+def patch_state(storage: Any, procedure_id: str, updates: dict[str, Any]) -> dict[str, Any]:
+    """Merge keys into a procedure's state with the backend's patch_state() if it has one."""
+    native = getattr(storage, "patch_state", None)
+    if native is not None:
+        return native(procedure_id, updates)
+    return _save_state_patch(storage, procedure_id, updates)
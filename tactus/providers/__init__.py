@@ -9,5 +9,13 @@ from tactus.providers.base import ProviderConfig
 from tactus.providers.openai import OpenAIProvider
 from tactus.providers.bedrock import BedrockProvider
 from tactus.providers.google import GoogleProvider
+from tactus.providers.registry import ProviderRegistry, default_provider_registry
 
-__all__ = ["ProviderConfig", "OpenAIProvider", "BedrockProvider", "GoogleProvider"]
+__all__ = [
+    "ProviderConfig",
+    "OpenAIProvider",
+    "BedrockProvider",
+    "GoogleProvider",
+    "ProviderRegistry",
+    "default_provider_registry",
+]
@@ -0,0 +1,279 @@
+"""
+Process-wide registry of LLM provider clients.
+
+Creating an agent for a model used to create its provider too: a new boto3
+client for every Bedrock agent and a new OpenAI or Anthropic SDK client for
+every other agent, on every run. Each client resolves credentials and opens
+its own connections. ProviderRegistry creates each provider once and hands
+the same one to every agent that uses it. Providers are keyed by:
+
+- provider name (openai, anthropic, bedrock);
+- region or base URL;
+- a fingerprint (hash) of the credentials read from the environment, so
+  that changed credentials get a new client.
+
+Connection pools are bounded (max_connections) for OpenAI and Bedrock; the
+Anthropic provider keeps the client (and pool) its SDK creates. Bedrock
+clients are synchronous and shared by the whole process. The OpenAI and
+Anthropic clients are async HTTP clients, and their connections belong to
+the event loop that opened them. They are therefore shared by the runs on one event
+loop: a host that runs procedures on a long-lived loop reuses connections
+across runs, while `asyncio.run()` per procedure gets new clients for each
+loop. Clients are closed by close(), which the default registry runs at
+interpreter shutdown. Other providers are left to pydantic-ai.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+import weakref
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Environment variables that select a provider's account and endpoint
+CREDENTIAL_VARIABLES = {
+    "openai": ["OPENAI_API_KEY", "OPENAI_BASE_URL", "OPENAI_ORG_ID", "OPENAI_PROJECT_ID"],
+    "anthropic": ["ANTHROPIC_API_KEY", "ANTHROPIC_BASE_URL"],
+    "bedrock": [
+        "AWS_ACCESS_KEY_ID",
+        "AWS_SECRET_ACCESS_KEY",
+        "AWS_SESSION_TOKEN",
+        "AWS_PROFILE",
+        "AWS_ENDPOINT_URL",
+        "AWS_ENDPOINT_URL_BEDROCK_RUNTIME",
+    ],
+}
+# Providers whose clients are async HTTP clients (bound to an event loop)
+_HTTP_PROVIDERS = ("openai", "anthropic")
+
+ProviderKey = Tuple[str, Optional[str], str]
+
+
+def credentials_fingerprint(provider: str) -> str:
+    """Hash of a provider's credential variables (the values themselves are not kept)."""
+    digest = hashlib.sha256(provider.encode())
+    for name in CREDENTIAL_VARIABLES.get(provider, []):
+        digest.update(f"\0{name}={os.environ.get(name, '')}".encode())
+    return digest.hexdigest()[:16]
+
+
+class ProviderRegistry:
+    """
+    Shared pydantic-ai providers with bounded connection pools.
+
+    Thread-safe; one instance is normally shared by every runtime in a
+    process (see default_provider_registry()).
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        timeout: float = 600.0,
+        connect_timeout: float = 5.0,
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            max_connections: Maximum open connections per client
+            max_keepalive_connections: Maximum idle connections kept per HTTP client
+            timeout: Request timeout in seconds
+            connect_timeout: Connection timeout in seconds
+        """
+        if max_connections < 1:
+            raise ValueError(f"max_connections must be at least 1, got {max_connections}")
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self._lock = threading.Lock()
+        # Providers usable from any thread or event loop (Bedrock)
+        self._shared: Dict[ProviderKey, Any] = {}
+        # Providers holding async HTTP clients, per event loop
+        self._per_loop: (
+            "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[ProviderKey, Any]]"
+        ) = weakref.WeakKeyDictionary()
+        self._closed = False
+
+    def key(self, provider: str, region: Optional[str] = None) -> ProviderKey:
+        """Registry key of a provider with the current credentials."""
+        return (provider, region, credentials_fingerprint(provider))
+
+    def get_model(self, model: str, provider: Optional[str] = None):
+        """
+        Create a pydantic-ai model that uses a shared provider.
+
+        Args:
+            model: Model string (e.g. 'openai:gpt-4o' or 'gpt-4o' with provider)
+            provider: Provider name (defaults to the model string's prefix)
+
+        Returns:
+            A pydantic-ai Model, or the model string itself for providers the
+            registry does not manage (pydantic-ai then creates the provider)
+        """
+        prefix, _, model_id = model.partition(":")
+        if not model_id:
+            prefix, model_id = "", model
+        provider_name = (provider or prefix).lower()
+
+        if provider_name == "bedrock":
+            from pydantic_ai.models.bedrock import BedrockConverseModel
+
+            region = os.environ.get("AWS_DEFAULT_REGION", "us-east-1")
+            return BedrockConverseModel(model_id, provider=self.get_provider("bedrock", region))
+
+        if provider_name in _HTTP_PROVIDERS:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                # No loop to bind the client to yet: let pydantic-ai create it
+                return model if prefix else f"{provider_name}:{model_id}"
+            if provider_name == "openai":
+                from pydantic_ai.models.openai import OpenAIChatModel
+
+                return OpenAIChatModel(model_id, provider=self.get_provider("openai"))
+            from pydantic_ai.models.anthropic import AnthropicModel
+
+            return AnthropicModel(model_id, provider=self.get_provider("anthropic"))
+
+        return model if prefix or not provider_name else f"{provider_name}:{model_id}"
+
+    def get_provider(self, provider: str, region: Optional[str] = None):
+        """
+        Return the shared pydantic-ai provider for the current credentials.
+
+        OpenAI and Anthropic providers must be requested from a running event
+        loop; they are shared by the callers on that loop.
+
+        Raises:
+            ValueError: If the provider is not managed by the registry
+            RuntimeError: If the registry is closed, or an HTTP provider is
+                requested outside an event loop
+        """
+        if provider not in CREDENTIAL_VARIABLES:
+            raise ValueError(f"Unknown provider '{provider}'")
+        key = self.key(provider, region)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Provider registry is closed")
+            if provider in _HTTP_PROVIDERS:
+                try:
+                    loop = asyncio.get_running_loop()
+                except RuntimeError:
+                    raise RuntimeError(f"The {provider} provider must be created in an event loop")
+                self._forget_closed_loops()
+                providers = self._per_loop.setdefault(loop, {})
+            else:
+                providers = self._shared
+            instance = providers.get(key)
+            if instance is None:
+                instance = self._create_provider(provider, region)
+                providers[key] = instance
+                logger.debug(f"Created shared {provider} provider (region {region})")
+            return instance
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._shared) + sum(len(p) for p in self._per_loop.values())
+
+    def _forget_closed_loops(self) -> None:
+        # Connections of a closed loop cannot be used (or closed) any more
+        for loop in [loop for loop in self._per_loop if loop.is_closed()]:
+            del self._per_loop[loop]
+
+    def _http_client(self):
+        import httpx
+        from pydantic_ai.models import get_user_agent
+
+        return httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout=self.timeout, connect=self.connect_timeout),
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+            ),
+            headers={"User-Agent": get_user_agent()},
+        )
+
+    def _create_provider(self, provider: str, region: Optional[str]):
+        if provider == "openai":
+            from pydantic_ai.providers.openai import OpenAIProvider
+
+            return OpenAIProvider(http_client=self._http_client())
+        if provider == "anthropic":
+            from pydantic_ai.providers.anthropic import AnthropicProvider
+
+            return AnthropicProvider()
+
+        import boto3
+        from botocore.config import Config
+        from pydantic_ai.providers.bedrock import BedrockProvider
+
+        logger.info(f"Creating Bedrock client with region: {region}")
+        client = boto3.Session(region_name=region).client(
+            "bedrock-runtime",
+            config=Config(
+                read_timeout=float(os.getenv("AWS_READ_TIMEOUT", 300)),
+                connect_timeout=float(os.getenv("AWS_CONNECT_TIMEOUT", 60)),
+                max_pool_connections=self.max_connections,
+            ),
+        )
+        return BedrockProvider(bedrock_client=client)
+
+    async def aclose(self) -> None:
+        """Close the clients of the running event loop (others are kept)."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            providers = self._per_loop.pop(loop, {})
+        for instance in providers.values():
+            await _close_http_provider(instance)
+
+    def close(self) -> None:
+        """Close every client; the registry cannot be used afterwards."""
+        with self._lock:
+            self._closed = True
+            shared = list(self._shared.values())
+            per_loop = [(loop, list(p.values())) for loop, p in self._per_loop.items()]
+            self._shared.clear()
+            self._per_loop.clear()
+        for instance in shared:
+            try:
+                instance.client.close()
+            except Exception as e:
+                logger.debug(f"Failed to close provider client: {e}")
+        for loop, instances in per_loop:
+            # Only an idle loop can run the close; a closed loop took its
+            # connections with it
+            if loop.is_closed() or loop.is_running():
+                continue
+            for instance in instances:
+                try:
+                    loop.run_until_complete(_close_http_provider(instance))
+                except Exception as e:
+                    logger.debug(f"Failed to close provider client: {e}")
+
+
+async def _close_http_provider(instance) -> None:
+    try:
+        await instance.client.close()
+    except Exception as e:
+        logger.debug(f"Failed to close provider client: {e}")
+
+
+_default_registry: Optional[ProviderRegistry] = None
+_default_lock = threading.Lock()
+
+
+def default_provider_registry() -> ProviderRegistry:
+    """Return the registry shared by runtimes by default (closed at interpreter exit)."""
+    global _default_registry
+    with _default_lock:
+        if _default_registry is None:
+            import atexit
+
+            _default_registry = ProviderRegistry()
+            atexit.register(_default_registry.close)
+        return _default_registry
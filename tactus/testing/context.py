@@ -167,8 +167,8 @@ class TactusTestContext:
 
     def _capture_primitives(self) -> None:
         """Capture primitive states after execution."""
-        if not self.runtime or not self.runtime.lua_sandbox:
-            logger.warning("Cannot capture primitives - runtime or sandbox not available")
+        if not self.runtime:
+            logger.warning("Cannot capture primitives - runtime not available")
             return
 
         # Capture Tool primitive
@@ -0,0 +1,112 @@
+"""
+Tests for the thread-pool async storage adapter.
+"""
+
+import asyncio
+import inspect
+import threading
+import time
+
+import pytest
+
+from tactus.adapters.async_storage import ThreadPoolStorage
+from tactus.adapters.memory import MemoryStorage
+from tactus.protocols.storage import AsyncStorageBackend
+
+
+@pytest.fixture
+def storage():
+    storage = ThreadPoolStorage(MemoryStorage(), max_workers=4)
+    yield storage
+    storage.shutdown()
+
+
+def test_implements_async_storage_backend():
+    """Every AsyncStorageBackend operation is a coroutine with the same parameters."""
+    operations = [
+        name
+        for name, member in vars(AsyncStorageBackend).items()
+        if inspect.iscoroutinefunction(member)
+    ]
+    assert "save_procedure_metadata" in operations
+    for name in operations:
+        method = getattr(ThreadPoolStorage, name)
+        assert inspect.iscoroutinefunction(method), name
+        expected = inspect.signature(getattr(AsyncStorageBackend, name)).parameters
+        assert list(inspect.signature(method).parameters) == list(expected), name
+
+
+@pytest.mark.asyncio
+async def test_async_operations_round_trip(storage):
+    """The async methods delegate to the wrapped backend."""
+    metadata = await storage.load_procedure_metadata("proc")
+    metadata.state = {"x": 1}
+    await storage.save_procedure_metadata("proc", metadata)
+    await storage.update_procedure_status("proc", "COMPLETED")
+    await storage.set_state("proc", {"x": 2})
+
+    assert await storage.get_state("proc") == {"x": 2}
+    assert (await storage.load_procedure_metadata("proc")).status == "COMPLETED"
+
+
+def test_calls_for_one_procedure_run_in_order(storage):
+    """Later calls never overtake earlier ones for the same procedure."""
+    order = []
+
+    def record(i):
+        time.sleep(0.002 if i % 2 == 0 else 0)
+        order.append(i)
+
+    futures = [storage.submit("proc", record, i) for i in range(20)]
+    for future in futures:
+        future.result()
+    assert order == list(range(20))
+
+
+def test_procedures_proceed_in_parallel(storage):
+    """A slow operation on one procedure does not block another."""
+    release = threading.Event()
+    blocked = storage.submit("slow", release.wait, 5)
+    assert storage.submit("fast", lambda: "done").result(timeout=1) == "done"
+    assert not blocked.done()
+    release.set()
+    assert blocked.result(timeout=1) is True
+
+
+def test_errors_are_reported_and_do_not_stall_the_queue(storage):
+    """A failing call fails its own future only."""
+
+    def fail():
+        raise OSError("disk full")
+
+    failed = storage.submit("proc", fail)
+    after = storage.submit("proc", lambda: "ok")
+    with pytest.raises(OSError):
+        failed.result()
+    assert after.result() == "ok"
+
+
+@pytest.mark.asyncio
+async def test_event_loop_keeps_running_during_slow_writes():
+    """Awaiting a slow save leaves the loop free for other tasks."""
+
+    class SlowStorage(MemoryStorage):
+        def save_procedure_metadata(self, procedure_id, metadata):
+            time.sleep(0.05)
+            super().save_procedure_metadata(procedure_id, metadata)
+
+    storage = ThreadPoolStorage(SlowStorage())
+    metadata = await storage.load_procedure_metadata("proc")
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    task = asyncio.create_task(ticker())
+    await storage.save_procedure_metadata("proc", metadata)
+    task.cancel()
+    storage.shutdown()
+    assert ticks >= 3
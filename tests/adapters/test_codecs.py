@@ -0,0 +1,61 @@
+"""
+Tests for storage codecs.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import BaseModel
+
+from tactus.adapters.codecs import JSONCodec, MsgpackCodec, get_codec
+
+pytest.importorskip("msgpack")
+
+
+class Summary(BaseModel):
+    title: str
+    score: float
+
+
+@pytest.fixture(params=["json", "msgpack"])
+def codec(request):
+    return get_codec(request.param)
+
+
+def test_round_trip_plain_data(codec):
+    """Plain documents survive encode/decode unchanged."""
+    document = {"a": [1, 2.5, None, True], "b": {"nested": "text"}, "c": ""}
+    assert codec.decode(codec.encode(document)) == document
+
+
+def test_datetimes_and_models_become_plain_data(codec):
+    """Datetimes are stored as epoch seconds and pydantic models as dicts."""
+    moment = datetime(2025, 1, 2, 3, 4, 5, 678000, tzinfo=timezone.utc)
+    decoded = codec.decode(codec.encode({"at": moment, "summary": Summary(title="t", score=1.5)}))
+    assert decoded["at"] == moment.timestamp()
+    assert decoded["summary"] == {"title": "t", "score": 1.5}
+
+
+def test_strict_codec_rejects_unknown_values():
+    """Strict codecs raise instead of stringifying."""
+    for codec in (JSONCodec(strict=True), MsgpackCodec(strict=True)):
+        with pytest.raises(TypeError):
+            codec.encode({"value": object()})
+
+
+def test_msgpack_preserves_integer_keys_and_bytes():
+    """MessagePack keeps types JSON would coerce."""
+    codec = MsgpackCodec()
+    document = {1: "one", "raw": b"\x00\x01"}
+    assert codec.decode(codec.encode(document)) == document
+
+
+def test_msgpack_is_smaller_than_pretty_json():
+    """The binary encoding is more compact than the default JSON output."""
+    document = {"execution_log": [{"position": i, "result": {"n": i}} for i in range(100)]}
+    assert len(MsgpackCodec().encode(document)) < len(JSONCodec().encode(document)) / 2
+
+
+def test_unknown_codec_name():
+    with pytest.raises(ValueError, match="Unknown storage codec"):
+        get_codec("yaml")
@@ -0,0 +1,300 @@
+"""
+Tests for the file-based storage backend.
+"""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from tactus.adapters.file_storage import FileStorage
+from tactus.core.execution_context import BaseExecutionContext
+from tactus.protocols.models import CheckpointEntry, LazyResult, resolve_result
+
+
+def make_entry(position: int, result="value") -> CheckpointEntry:
+    """Create a checkpoint entry for the given position."""
+    return CheckpointEntry(
+        position=position,
+        type="explicit_checkpoint",
+        result=result,
+        timestamp=datetime.now(timezone.utc),
+        duration_ms=1.0,
+    )
+
+
+@pytest.fixture
+def journal_storage(tmp_path):
+    """Create a journaled file storage in a temporary directory."""
+    return FileStorage(storage_dir=str(tmp_path), journal=True)
+
+
+def test_document_mode_round_trip(tmp_path):
+    """Document mode stores the whole execution log in one JSON file."""
+    storage = FileStorage(storage_dir=str(tmp_path))
+    metadata = storage.load_procedure_metadata("proc")
+    metadata.execution_log.append(make_entry(0, {"a": 1}))
+    metadata.state = {"x": 1}
+    storage.save_procedure_metadata("proc", metadata)
+
+    data = json.loads((tmp_path / "proc.json").read_text())
+    assert len(data["execution_log"]) == 1
+    assert not (tmp_path / "proc.journal").exists()
+
+    loaded = storage.load_procedure_metadata("proc")
+    assert loaded.execution_log[0].result == {"a": 1}
+    assert loaded.state == {"x": 1}
+
+
+def test_journal_appends_one_record_per_checkpoint(journal_storage, tmp_path):
+    """Each save appends only the new checkpoints to the journal."""
+    metadata = journal_storage.load_procedure_metadata("proc")
+
+    for position in range(5):
+        metadata.execution_log.append(make_entry(position, f"result-{position}"))
+        journal_storage.save_procedure_metadata("proc", metadata)
+
+    lines = (tmp_path / "proc.journal").read_text().splitlines()
+    assert len(lines) == 5
+    assert json.loads(lines[-1])["entry"]["result"] == "result-4"
+
+    header = json.loads((tmp_path / "proc.json").read_text())
+    assert header["format"] == "journal"
+    assert header["journal_entries"] == 5
+    assert "execution_log" not in header
+
+
+def test_journal_reload_in_new_instance(journal_storage, tmp_path):
+    """A fresh storage instance replays the journal into the execution log."""
+    metadata = journal_storage.load_procedure_metadata("proc")
+    metadata.execution_log.extend([make_entry(0, "a"), make_entry(1, "b")])
+    metadata.status = "WAITING_FOR_HUMAN"
+    metadata.state = {"count": 2}
+    journal_storage.save_procedure_metadata("proc", metadata)
+
+    loaded = FileStorage(storage_dir=str(tmp_path), journal=True).load_procedure_metadata("proc")
+    assert [resolve_result(entry.result) for entry in loaded.execution_log] == ["a", "b"]
+    assert loaded.status == "WAITING_FOR_HUMAN"
+    assert loaded.state == {"count": 2}
+
+
+def test_journal_truncation_and_compaction(tmp_path):
+    """Truncations are journaled and compaction drops superseded records."""
+    storage = FileStorage(storage_dir=str(tmp_path), journal=True, compact_threshold=3)
+    context = BaseExecutionContext(procedure_id="proc", storage_backend=storage)
+
+    for i in range(4):
+        context.checkpoint(lambda i=i: i, "explicit_checkpoint")
+    context.checkpoint_clear_after(1)
+
+    # 4 appends + 1 truncate leave 4 superseded records, crossing the threshold
+    lines = (tmp_path / "proc.journal").read_text().splitlines()
+    assert len(lines) == 1
+    loaded = FileStorage(storage_dir=str(tmp_path), journal=True).load_procedure_metadata("proc")
+    assert [resolve_result(entry.result) for entry in loaded.execution_log] == [0]
+
+    # Below the threshold a truncation is just another appended record
+    context.checkpoint_clear_all()
+    lines = (tmp_path / "proc.journal").read_text().splitlines()
+    assert json.loads(lines[-1]) == {"op": "truncate", "length": 0}
+    assert storage.load_procedure_metadata("proc").execution_log == []
+
+
+def test_journal_ignores_torn_trailing_record(journal_storage, tmp_path):
+    """A partially written final record is dropped and trimmed from the file."""
+    metadata = journal_storage.load_procedure_metadata("proc")
+    metadata.execution_log.append(make_entry(0, "complete"))
+    journal_storage.save_procedure_metadata("proc", metadata)
+
+    with open(tmp_path / "proc.journal", "a") as f:
+        f.write('{"op":"append","entry":{"posi')
+
+    storage = FileStorage(storage_dir=str(tmp_path), journal=True)
+    loaded = storage.load_procedure_metadata("proc")
+    assert [resolve_result(entry.result) for entry in loaded.execution_log] == ["complete"]
+
+    loaded.execution_log.append(make_entry(1, "next"))
+    storage.save_procedure_metadata("proc", loaded)
+    reloaded = FileStorage(storage_dir=str(tmp_path), journal=True).load_procedure_metadata("proc")
+    assert [resolve_result(entry.result) for entry in reloaded.execution_log] == [
+        "complete",
+        "next",
+    ]
+
+
+def test_switching_between_document_and_journal_modes(tmp_path):
+    """Procedures migrate transparently between the two layouts."""
+    document_storage = FileStorage(storage_dir=str(tmp_path))
+    metadata = document_storage.load_procedure_metadata("proc")
+    metadata.execution_log.append(make_entry(0, "doc"))
+    document_storage.save_procedure_metadata("proc", metadata)
+
+    journal_storage = FileStorage(storage_dir=str(tmp_path), journal=True)
+    metadata = journal_storage.load_procedure_metadata("proc")
+    metadata.execution_log.append(make_entry(1, "journal"))
+    journal_storage.save_procedure_metadata("proc", metadata)
+    assert len((tmp_path / "proc.journal").read_text().splitlines()) == 2
+
+    metadata = document_storage.load_procedure_metadata("proc")
+    assert [resolve_result(entry.result) for entry in metadata.execution_log] == ["doc", "journal"]
+    document_storage.save_procedure_metadata("proc", metadata)
+    assert not (tmp_path / "proc.journal").exists()
+    assert len(json.loads((tmp_path / "proc.json").read_text())["execution_log"]) == 2
+
+
+def test_large_results_move_to_blob_store(tmp_path):
+    """Results over the blob threshold are stored once and loaded on replay."""
+    storage = FileStorage(storage_dir=str(tmp_path), journal=True, blob_threshold=1024)
+    big = {"transcript": ["x" * 100] * 50}
+
+    context = BaseExecutionContext(procedure_id="proc", storage_backend=storage)
+    context.checkpoint(lambda: big, "agent_turn")
+    context.checkpoint(lambda: "small", "explicit_checkpoint")
+    context.checkpoint(lambda: big, "agent_turn")
+
+    records = [json.loads(line) for line in (tmp_path / "proc.journal").read_text().splitlines()]
+    assert records[0]["entry"]["result"]["$blob"] == records[2]["entry"]["result"]["$blob"]
+    assert records[1]["entry"]["result"] == "small"
+    assert len([p for p in (tmp_path / "blobs").rglob("*") if p.is_file()]) == 1
+
+    loaded = FileStorage(storage_dir=str(tmp_path)).load_procedure_metadata("proc")
+    assert isinstance(loaded.execution_log[0].result, LazyResult)
+
+    replay = BaseExecutionContext(procedure_id="proc", storage_backend=storage)
+    replay.metadata.replay_index = 0
+    results = [replay.checkpoint(lambda: None, "agent_turn") for _ in range(3)]
+    assert results == [big, "small", big]
+
+
+def test_journal_load_defers_result_decoding(journal_storage, tmp_path):
+    """Loading indexes entries; results are decoded only when resolved."""
+    metadata = journal_storage.load_procedure_metadata("proc")
+    metadata.execution_log.extend([make_entry(0, {"a": [1, 2]}), make_entry(1, "b")])
+    journal_storage.save_procedure_metadata("proc", metadata)
+
+    storage = FileStorage(storage_dir=str(tmp_path), journal=True)
+    loaded = storage.load_procedure_metadata("proc")
+    assert [entry.position for entry in loaded.execution_log] == [0, 1]
+    assert all(isinstance(entry.result, LazyResult) for entry in loaded.execution_log)
+
+    # Compaction replaces the journal; already-indexed results stay readable
+    storage.compact("proc")
+    assert resolve_result(loaded.execution_log[0].result) == {"a": [1, 2]}
+
+
+def test_journal_reads_records_with_result_before_timestamp(tmp_path):
+    """Records written with the result mid-entry are decoded in full."""
+    record = {
+        "op": "append",
+        "entry": {
+            "position": 0,
+            "type": "explicit_checkpoint",
+            "result": {"old": True},
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "duration_ms": 1.0,
+            "input_hash": None,
+        },
+    }
+    (tmp_path / "proc.journal").write_text(json.dumps(record) + "\n")
+
+    loaded = FileStorage(storage_dir=str(tmp_path), journal=True).load_procedure_metadata("proc")
+    assert loaded.execution_log[0].result == {"old": True}
+
+
+def test_msgpack_codec_round_trip_and_schema_version(tmp_path):
+    """Documents written with the msgpack codec are tagged and load back exactly."""
+    msgpack = pytest.importorskip("msgpack")
+    storage = FileStorage(storage_dir=str(tmp_path), codec="msgpack")
+    metadata = storage.load_procedure_metadata("proc")
+    entry = make_entry(0, {"a": [1, 2]})
+    metadata.execution_log.append(entry)
+    metadata.state = {"x": 1}
+    storage.save_procedure_metadata("proc", metadata)
+
+    data = msgpack.unpackb((tmp_path / "proc.msgpack").read_bytes())
+    assert data["schema_version"] == 2
+    assert isinstance(data["execution_log"][0]["timestamp"], float)
+
+    loaded = storage.load_procedure_metadata("proc")
+    assert loaded.execution_log[0].result == {"a": [1, 2]}
+    assert loaded.execution_log[0].timestamp == entry.timestamp
+    assert loaded.state == {"x": 1}
+
+
+def test_switching_codecs_keeps_procedures_readable(tmp_path):
+    """A JSON document is read by a msgpack storage and replaced on its next save."""
+    pytest.importorskip("msgpack")
+    json_storage = FileStorage(storage_dir=str(tmp_path))
+    metadata = json_storage.load_procedure_metadata("proc")
+    metadata.execution_log.append(make_entry(0))
+    json_storage.save_procedure_metadata("proc", metadata)
+
+    msgpack_storage = FileStorage(storage_dir=str(tmp_path), codec="msgpack")
+    metadata = msgpack_storage.load_procedure_metadata("proc")
+    assert len(metadata.execution_log) == 1
+    metadata.execution_log.append(make_entry(1))
+    msgpack_storage.save_procedure_metadata("proc", metadata)
+
+    assert not (tmp_path / "proc.json").exists()
+    assert len(json_storage.load_procedure_metadata("proc").execution_log) == 2
+
+
+def test_reads_iso_timestamps_from_older_documents(tmp_path):
+    """Documents written before schema_version 2 store ISO timestamps."""
+    timestamp = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    (tmp_path / "proc.json").write_text(
+        json.dumps(
+            {
+                "procedure_id": "proc",
+                "execution_log": [
+                    {
+                        "position": 0,
+                        "type": "explicit_checkpoint",
+                        "result": 1,
+                        "timestamp": timestamp.isoformat(),
+                    }
+                ],
+            }
+        )
+    )
+    loaded = FileStorage(storage_dir=str(tmp_path)).load_procedure_metadata("proc")
+    assert loaded.execution_log[0].timestamp == timestamp
+
+
+def test_sharded_layout_spreads_files_over_subdirectories(tmp_path):
+    """Sharded storage keeps procedure files in hashed subdirectories."""
+    storage = FileStorage(storage_dir=str(tmp_path), shard=True, journal=True)
+    for i in range(20):
+        metadata = storage.load_procedure_metadata(f"proc-{i}")
+        metadata.execution_log.append(make_entry(0, i))
+        storage.save_procedure_metadata(f"proc-{i}", metadata)
+
+    assert not list(tmp_path.glob("*.json")) and not list(tmp_path.glob("*.journal"))
+    assert len(list(tmp_path.glob("??/*.json"))) == 20
+    assert len(list(tmp_path.glob("??/*.journal"))) == 20
+    assert len({path.parent for path in tmp_path.glob("??/*.json")}) > 1
+
+    # Reopening follows the directory's layout
+    reopened = FileStorage(storage_dir=str(tmp_path))
+    assert reopened.shard
+    assert resolve_result(reopened.load_procedure_metadata("proc-7").execution_log[0].result) == 7
+    assert reopened.rebuild_index() == 20
+    with pytest.raises(ValueError, match="sharded"):
+        FileStorage(storage_dir=str(tmp_path), shard=False)
+
+
+def test_sharding_moves_flat_files(tmp_path):
+    """Turning sharding on moves an existing flat directory's files into shards."""
+    flat = FileStorage(storage_dir=str(tmp_path), journal=True)
+    metadata = flat.load_procedure_metadata("proc")
+    metadata.execution_log.append(make_entry(0, "kept"))
+    flat.save_procedure_metadata("proc", metadata)
+
+    sharded = FileStorage(storage_dir=str(tmp_path), shard=True, journal=True)
+    assert not (tmp_path / "proc.json").exists() and not (tmp_path / "proc.journal").exists()
+    loaded = sharded.load_procedure_metadata("proc")
+    assert resolve_result(loaded.execution_log[0].result) == "kept"
+    assert [p.procedure_id for p in sharded.list_procedures().procedures] == ["proc"]
+
+    assert sharded.delete_procedure("proc") > 0
+    assert not list(tmp_path.glob("??/proc.*"))
@@ -0,0 +1,139 @@
+"""
+Tests for MCPServerPool: MCP servers kept running across procedure runs.
+
+Uses the stub stdio MCP server in tests/fixtures, which handles one
+request at a time and reports its process ID.
+"""
+
+import asyncio
+import os
+import signal
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from tactus.adapters.mcp_manager import MCPServerPool, PooledMCPServerManager
+
+STUB_SERVER = str(Path(__file__).parent.parent / "fixtures" / "stub_mcp_server.py")
+
+
+def echo_server(**extra):
+    return {"command": sys.executable, "args": [STUB_SERVER], "env": {}, **extra}
+
+
+async def call(toolset, name, **args):
+    return await toolset.call_tool(name, args, None, None)
+
+
+@pytest.mark.asyncio
+async def test_servers_start_on_first_use_and_outlive_runs():
+    from pydantic_ai import Agent
+    from pydantic_ai.models.test import TestModel
+
+    pool = MCPServerPool()
+    calls = []
+
+    class Recorder:
+        def record_call(self, name, args, result):
+            calls.append((name, result))
+
+    try:
+        async with PooledMCPServerManager(pool, {"echo": echo_server()}, Recorder()) as first:
+            assert len(pool) == 0  # Nothing started yet
+            agent = Agent(TestModel(call_tools=["echo_pid"]), toolsets=first.get_toolsets())
+            first_pid = (await agent.run("pid")).output
+            assert len(pool) == 1
+        assert calls and calls[0][0] == "pid"
+
+        # The next run reuses the process and the tool listing
+        async with PooledMCPServerManager(pool, {"echo": echo_server()}) as second:
+            agent = Agent(TestModel(call_tools=["echo_pid"]), toolsets=second.get_toolsets())
+            assert (await agent.run("pid")).output == first_pid
+        assert len(pool) == 1
+
+        # A different config gets its own server
+        other = pool.toolset("echo", echo_server(env={"STUB_MCP_NAME": "other"}))
+        assert await call(other, "echo", text="hi") == "other: hi"
+        assert len(pool) == 2
+    finally:
+        await pool.aclose()
+    assert len(pool) == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_spread_over_instances():
+    pool = MCPServerPool(instances_per_server=3)
+    toolset = pool.toolset("echo", echo_server())
+    try:
+        start = time.perf_counter()
+        await asyncio.gather(*(call(toolset, "sleep", seconds=0.5) for _ in range(3)))
+        # One stdio server would take 1.5s
+        assert time.perf_counter() - start < 1.2
+        assert len(pool) == 3
+
+        # The per-server 'instances' setting overrides the pool's
+        single = pool.toolset("single", echo_server(instances=1))
+        await asyncio.gather(*(call(single, "pid") for _ in range(3)))
+        assert len(pool) == 4
+    finally:
+        await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_dead_servers_are_replaced_and_idle_ones_stopped():
+    pool = MCPServerPool(idle_timeout=0.5, health_check_interval=0, health_check_timeout=2)
+    toolset = pool.toolset("echo", echo_server())
+    try:
+        # A run lists the tools before calling them
+        assert sorted(await toolset.get_tools(None)) == ["echo", "pid", "sleep"]
+        pid = int(await call(toolset, "pid"))
+        os.kill(pid, signal.SIGKILL)
+        await asyncio.sleep(0.1)
+
+        # The health check before the next call finds it dead
+        new_pid = int(await call(toolset, "pid"))
+        assert new_pid != pid
+        assert len(pool) == 1
+
+        await asyncio.sleep(1.2)
+        assert len(pool) == 0  # Idle: stopped
+        assert sorted(await toolset.get_tools(None)) == ["echo", "pid", "sleep"]
+        assert len(pool) == 0  # Listed from the cache
+        assert await call(toolset, "echo", text="back") == "stub: back"
+        assert len(pool) == 1
+    finally:
+        await pool.aclose()
+
+    with pytest.raises(ValueError, match="instances_per_server"):
+        MCPServerPool(instances_per_server=0)
+
+
+@pytest.mark.asyncio
+async def test_runtime_takes_servers_from_the_pool():
+    from tactus.adapters.memory import MemoryStorage
+    from tactus.core.runtime import TactusRuntime
+
+    source = """
+    main = procedure("main", {input = {}, output = {value = {type = "string"}}}, function()
+        return {value = "ok"}
+    end)
+    """
+    pool = MCPServerPool()
+    try:
+        for run in range(2):
+            runtime = TactusRuntime(
+                procedure_id=f"pooled-{run}",
+                storage_backend=MemoryStorage(),
+                mcp_servers={"echo": echo_server()},
+                mcp_pool=pool,
+            )
+            result = await runtime.execute(source=source, context={}, format="lua")
+            assert result["success"] is True, result.get("error")
+            assert isinstance(runtime.mcp_manager, PooledMCPServerManager)
+            assert "echo" in runtime.toolset_registry
+        # No tool was called: no server was started
+        assert len(pool) == 0
+    finally:
+        await pool.aclose()
@@ -0,0 +1,85 @@
+"""
+Tests for the memo cache backends.
+"""
+
+import time
+
+import pytest
+
+from tactus.adapters.memo_cache import MemoryMemoCache, SQLiteMemoCache
+
+MISSING = object()
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cache(request, tmp_path):
+    if request.param == "memory":
+        yield MemoryMemoCache(max_entries=3)
+    else:
+        cache = SQLiteMemoCache(db_path=str(tmp_path / "memo.db"), max_entries=3)
+        yield cache
+        cache.close()
+
+
+def test_get_set_delete_clear(cache):
+    """Stored results are returned until deleted or cleared."""
+    assert cache.get("a", MISSING) is MISSING
+    cache.set("a", {"label": "spam"})
+    cache.set("b", [1, 2])
+    assert cache.get("a") == {"label": "spam"}
+
+    cache.delete("a")
+    assert cache.get("a") is None
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_ttl_expiry(cache):
+    """Expired results are treated as missing."""
+    cache.set("a", 1, ttl_seconds=0.01)
+    cache.set("b", 2)
+    time.sleep(0.02)
+    assert cache.get("a", MISSING) is MISSING
+    assert cache.get("b") == 2
+
+
+def test_memory_cache_evicts_least_recently_used():
+    """Reading an entry protects it from eviction."""
+    cache = MemoryMemoCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert len(cache) == 2
+
+
+def test_sqlite_cache_persists_across_instances(tmp_path):
+    """A second cache on the same file sees earlier results."""
+    db_path = str(tmp_path / "memo.db")
+    first = SQLiteMemoCache(db_path=db_path)
+    first.set("key", {"answer": 42})
+    first.close()
+
+    second = SQLiteMemoCache(db_path=db_path)
+    assert second.get("key") == {"answer": 42}
+    second.close()
+
+
+def test_sqlite_cache_skips_non_json_values(tmp_path):
+    """Results that cannot be encoded are not memoized."""
+    cache = SQLiteMemoCache(db_path=str(tmp_path / "memo.db"))
+    cache.set("key", object())
+    assert cache.get("key", MISSING) is MISSING
+    cache.close()
+
+
+def test_sqlite_cache_evicts_beyond_max_entries(tmp_path):
+    """The table is trimmed back to max_entries on eviction checks."""
+    cache = SQLiteMemoCache(db_path=str(tmp_path / "memo.db"), max_entries=10)
+    for i in range(200):
+        cache.set(f"k{i}", i)
+    assert len(cache) <= 10 + 64
+    assert cache.get("k199") == 199
+    cache.close()
@@ -0,0 +1,161 @@
+"""
+Tests for the status-only and state-only storage operations.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from tactus.adapters.async_storage import ThreadPoolStorage
+from tactus.adapters.file_storage import FileStorage
+from tactus.adapters.memory import MemoryStorage
+from tactus.adapters.sqlite_storage import SQLiteStorage
+from tactus.protocols.models import CheckpointEntry, ProcedureMetadata
+from tactus.protocols.storage import get_status, patch_state, set_status
+
+
+class LegacyStorage:
+    """A backend written before the partial operations existed."""
+
+    def __init__(self):
+        self.inner = MemoryStorage()
+        self.saves = 0
+
+    def load_procedure_metadata(self, procedure_id):
+        return self.inner.load_procedure_metadata(procedure_id)
+
+    def save_procedure_metadata(self, procedure_id, metadata):
+        self.saves += 1
+        self.inner.save_procedure_metadata(procedure_id, metadata)
+
+
+@pytest.fixture(params=["memory", "file", "file-msgpack", "journal", "sqlite", "legacy"])
+def storage(request, tmp_path):
+    if request.param == "memory":
+        yield MemoryStorage()
+    elif request.param == "legacy":
+        yield LegacyStorage()
+    elif request.param == "sqlite":
+        storage = SQLiteStorage(db_path=str(tmp_path / "tactus.db"))
+        yield storage
+        storage.close()
+    else:
+        if request.param == "file-msgpack":
+            pytest.importorskip("msgpack")
+        yield FileStorage(
+            storage_dir=str(tmp_path),
+            journal=request.param == "journal",
+            codec="msgpack" if request.param == "file-msgpack" else "json",
+        )
+
+
+def save_with_log(storage, procedure_id="proc", checkpoints=3):
+    storage.save_procedure_metadata(
+        procedure_id,
+        ProcedureMetadata(
+            procedure_id=procedure_id,
+            state={"a": 1, "b": 2},
+            execution_log=[
+                CheckpointEntry(
+                    position=i,
+                    type="explicit_checkpoint",
+                    result=i,
+                    timestamp=datetime.now(timezone.utc),
+                )
+                for i in range(checkpoints)
+            ],
+        ),
+    )
+
+
+def test_partial_updates_round_trip(storage):
+    save_with_log(storage)
+
+    set_status(storage, "proc", "WAITING_FOR_HUMAN", "msg-1")
+    summary = get_status(storage, "proc")
+    assert (summary.status, summary.waiting_on_message_id) == ("WAITING_FOR_HUMAN", "msg-1")
+
+    assert patch_state(storage, "proc", {"b": 3, "c": 4}) == {"a": 1, "b": 3, "c": 4}
+
+    metadata = storage.load_procedure_metadata("proc")
+    assert metadata.status == "WAITING_FOR_HUMAN"
+    assert metadata.state == {"a": 1, "b": 3, "c": 4}
+    assert len(metadata.execution_log) == 3
+
+    # A full save supersedes the partial updates
+    metadata.status = "COMPLETED"
+    metadata.state = {"done": True}
+    storage.save_procedure_metadata("proc", metadata)
+    reloaded = storage.load_procedure_metadata("proc")
+    assert (reloaded.status, reloaded.state) == ("COMPLETED", {"done": True})
+    assert get_status(storage, "proc").status == "COMPLETED"
+
+
+def test_partial_updates_of_new_procedures(storage):
+    assert get_status(storage, "new").status == "RUNNING"
+    set_status(storage, "new", "FAILED")
+    assert patch_state(storage, "new", {"x": 1}) == {"x": 1}
+    metadata = storage.load_procedure_metadata("new")
+    assert (metadata.status, metadata.state) == ("FAILED", {"x": 1})
+
+
+def test_legacy_backends_fall_back_to_load_and_save():
+    storage = LegacyStorage()
+    save_with_log(storage)
+    set_status(storage, "proc", "COMPLETED")
+    patch_state(storage, "proc", {"x": 1})
+    assert storage.saves == 3
+    assert get_status(storage, "proc").updated_at is None
+
+
+def test_file_storage_partial_updates_leave_the_log_untouched(tmp_path):
+    storage = FileStorage(storage_dir=str(tmp_path))
+    save_with_log(storage)
+    document = (tmp_path / "proc.json").read_bytes()
+
+    storage.set_status("proc", "WAITING_FOR_HUMAN", "msg-1")
+    storage.patch_state("proc", {"b": 3})
+    assert (tmp_path / "proc.json").read_bytes() == document
+    assert (tmp_path / "proc.header.json").exists()
+    assert storage.get_state("proc") == {"a": 1, "b": 3}
+    assert [
+        p.procedure_id for p in storage.list_procedures(status="WAITING_FOR_HUMAN").procedures
+    ] == ["proc"]
+    assert storage.rebuild_index() == 1
+    assert storage.get_status("proc").waiting_on_message_id == "msg-1"
+
+    storage.save_procedure_metadata("proc", storage.load_procedure_metadata("proc"))
+    assert not (tmp_path / "proc.header.json").exists()
+    assert storage.get_state("proc") == {"a": 1, "b": 3}
+
+    assert storage.delete_procedure("proc") > 0
+    assert not list(tmp_path.glob("proc.*"))
+
+
+def test_journaled_partial_updates_rewrite_only_the_header(tmp_path):
+    storage = FileStorage(storage_dir=str(tmp_path), journal=True)
+    save_with_log(storage)
+    journal = (tmp_path / "proc.journal").read_bytes()
+
+    storage.set_status("proc", "COMPLETED")
+    storage.set_state("proc", {"z": 0})
+    assert (tmp_path / "proc.journal").read_bytes() == journal
+    assert not (tmp_path / "proc.header.json").exists()
+
+    metadata = FileStorage(storage_dir=str(tmp_path), journal=True).load_procedure_metadata("proc")
+    assert (metadata.status, metadata.state, len(metadata.execution_log)) == (
+        "COMPLETED",
+        {"z": 0},
+        3,
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_partial_updates():
+    storage = ThreadPoolStorage(LegacyStorage())
+    try:
+        await storage.set_status("proc", "COMPLETED")
+        assert await storage.patch_state("proc", {"x": 1}) == {"x": 1}
+        assert (await storage.get_status("proc")).status == "COMPLETED"
+    finally:
+        storage.shutdown()
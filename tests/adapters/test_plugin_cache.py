@@ -0,0 +1,136 @@
+"""
+Tests for PluginCache: tool plugin files loaded once and reused while unchanged.
+
+Each plugin file appends to a log file when its module code runs, so the
+tests can count how many times it was executed.
+"""
+
+import os
+
+import pytest
+
+from tactus.adapters.plugins import PluginCache, PluginLoader
+
+PLUGIN = """
+with open({log!r}, "a") as log:
+    log.write("loaded\\n")
+
+
+def greet(name: str) -> str:
+    \"\"\"Greet someone.\"\"\"
+    return "{greeting}, " + name
+"""
+
+
+def write_plugin(path, log, greeting="Hello"):
+    path.write_text(PLUGIN.format(log=str(log), greeting=greeting))
+
+
+def executions(log):
+    return len(log.read_text().splitlines()) if log.exists() else 0
+
+
+def set_mtime(path, seconds_ago):
+    """Age a file's mtime, as if it had been written a while ago."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - int(seconds_ago * 1e9)))
+
+
+def test_plugin_files_run_once_while_unchanged(tmp_path):
+    log = tmp_path / "executions.log"
+    tools_dir = tmp_path / "tools"
+    tools_dir.mkdir()
+    plugin = tools_dir / "greeting.py"
+    write_plugin(plugin, log)
+    set_mtime(plugin, 10)
+    cache = PluginCache()
+
+    first = PluginLoader(plugin_cache=cache).create_toolset([str(tools_dir)])
+    second = PluginLoader(plugin_cache=cache).create_toolset([str(plugin)])
+    assert executions(log) == 1
+    assert len(cache) == 1
+    # Tool definitions are reused as well
+    assert first.tools["greet"] is second.tools["greet"]
+
+    # Touched but unchanged: the content hash matches, nothing runs
+    os.utime(plugin)
+    module = cache.load(plugin)
+    assert executions(log) == 1
+    assert module.module.greet("Ada") == "Hello, Ada"
+
+    # Changed: executed again
+    write_plugin(plugin, log, greeting="Hi")
+    assert cache.load(plugin).module.greet("Ada") == "Hi, Ada"
+    assert executions(log) == 2
+
+    # Explicit invalidation, by file or by directory
+    assert cache.invalidate(plugin) == 1
+    cache.load(plugin)
+    assert cache.invalidate(tools_dir) == 1
+    cache.load(plugin)
+    assert executions(log) == 4
+    assert cache.invalidate() == 1
+    assert len(cache) == 0
+
+
+def test_failed_plugin_files_are_not_cached(tmp_path):
+    plugin = tmp_path / "broken.py"
+    plugin.write_text("raise ImportError('missing dependency')\n")
+    cache = PluginCache()
+
+    with pytest.raises(ImportError, match="missing dependency"):
+        cache.load(plugin)
+    assert len(cache) == 0
+
+    # The loader skips it, like any plugin file that fails to load
+    toolset = PluginLoader(plugin_cache=cache).create_toolset([str(plugin)])
+    assert toolset.tools == {}
+
+    log = tmp_path / "executions.log"
+    write_plugin(plugin, log)
+    assert cache.load(plugin).functions[0].__name__ == "greet"
+
+
+def test_preloaded_plugin_files_are_reused(tmp_path):
+    log = tmp_path / "executions.log"
+    tools_dir = tmp_path / "tools"
+    tools_dir.mkdir()
+    write_plugin(tools_dir / "greeting.py", log)
+    set_mtime(tools_dir / "greeting.py", 10)
+    (tools_dir / "broken.py").write_text("raise ImportError('missing dependency')\n")
+    cache = PluginCache()
+
+    assert PluginLoader(plugin_cache=cache).preload([str(tools_dir)]) == 1
+    toolset = PluginLoader(plugin_cache=cache).create_toolset([str(tools_dir)])
+    assert executions(log) == 1
+    assert list(toolset.tools) == ["greet"]
+
+
+@pytest.mark.asyncio
+async def test_runtime_reload_plugins_executes_plugin_files_again(tmp_path):
+    from tactus.adapters.memory import MemoryStorage
+    from tactus.core.runtime import TactusRuntime
+
+    log = tmp_path / "executions.log"
+    plugin = tmp_path / "greeting.py"
+    write_plugin(plugin, log)
+    set_mtime(plugin, 10)
+    cache = PluginCache()
+    source = """
+    main = procedure("main", {input = {}, output = {value = {type = "string"}}}, function()
+        return {value = "ok"}
+    end)
+    """
+
+    for run, reload_plugins in enumerate((False, False, True)):
+        runtime = TactusRuntime(
+            procedure_id=f"plugins-{run}",
+            storage_backend=MemoryStorage(),
+            tool_paths=[str(plugin)],
+            plugin_cache=cache,
+            reload_plugins=reload_plugins,
+        )
+        result = await runtime.execute(source=source, context={}, format="lua")
+        assert result["success"] is True, result.get("error")
+        assert "plugin" in runtime.toolset_registry
+    assert executions(log) == 2
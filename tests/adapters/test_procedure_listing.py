@@ -0,0 +1,111 @@
+"""
+Tests for the procedure status index and list_procedures().
+"""
+
+import pytest
+
+from tactus.adapters.file_storage import FileStorage
+from tactus.adapters.memory import MemoryStorage
+from tactus.adapters.sqlite_storage import SQLiteStorage
+from tactus.core.exceptions import ProcedureWaitingForHuman
+from tactus.core.runtime import TactusRuntime
+
+
+@pytest.fixture(params=["memory", "file", "file-journal", "sqlite"])
+def storage(request, tmp_path):
+    if request.param == "memory":
+        yield MemoryStorage()
+    elif request.param == "sqlite":
+        storage = SQLiteStorage(db_path=str(tmp_path / "tactus.db"))
+        yield storage
+        storage.close()
+    else:
+        yield FileStorage(storage_dir=str(tmp_path), journal=request.param == "file-journal")
+
+
+def save_with_status(storage, procedure_id: str, status: str, message_id=None) -> None:
+    metadata = storage.load_procedure_metadata(procedure_id)
+    metadata.status = status
+    metadata.waiting_on_message_id = message_id
+    storage.save_procedure_metadata(procedure_id, metadata)
+
+
+def test_list_procedures_filters_by_status(storage):
+    """Only procedures with the requested status are listed."""
+    save_with_status(storage, "p1", "RUNNING")
+    save_with_status(storage, "p2", "WAITING_FOR_HUMAN", "msg-2")
+    save_with_status(storage, "p3", "COMPLETED")
+    storage.update_procedure_status("p1", "WAITING_FOR_HUMAN", "msg-1")
+
+    page = storage.list_procedures(status="WAITING_FOR_HUMAN")
+    assert [(p.procedure_id, p.waiting_on_message_id) for p in page.procedures] == [
+        ("p1", "msg-1"),
+        ("p2", "msg-2"),
+    ]
+    assert page.next_cursor is None
+    assert len(storage.list_procedures().procedures) == 3
+
+
+def test_list_procedures_pages_with_cursor(storage):
+    """Pages continue from the cursor until the last page."""
+    for i in range(7):
+        save_with_status(storage, f"proc-{i}", "RUNNING")
+
+    seen = []
+    cursor = None
+    while True:
+        page = storage.list_procedures(status="RUNNING", limit=3, cursor=cursor)
+        seen.extend(p.procedure_id for p in page.procedures)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+    assert seen == [f"proc-{i}" for i in range(7)]
+
+
+def test_file_storage_indexes_existing_directory(tmp_path):
+    """A directory written before the index existed is indexed on first listing."""
+    storage = FileStorage(storage_dir=str(tmp_path))
+    save_with_status(storage, "old", "WAITING_FOR_HUMAN", "msg")
+    storage._index.close()
+    (tmp_path / "index.db").unlink()
+
+    fresh = FileStorage(storage_dir=str(tmp_path))
+    page = fresh.list_procedures(status="WAITING_FOR_HUMAN")
+    assert [p.procedure_id for p in page.procedures] == ["old"]
+
+
+SOURCE = """
+main = procedure("main", {
+    input = {},
+    output = {done = {type = "boolean"}}
+}, function()
+    Step.checkpoint(function() return 1 end)
+    Human.approve({message = "Continue?"})
+    return {done = true}
+end)
+"""
+
+
+class SuspendingHITLHandler:
+    def request_interaction(self, procedure_id, request):
+        raise ProcedureWaitingForHuman(procedure_id, "msg-1")
+
+
+@pytest.mark.asyncio
+async def test_runtime_records_final_status(tmp_path):
+    """Runs leave WAITING_FOR_HUMAN or FAILED in the index."""
+    storage = FileStorage(storage_dir=str(tmp_path))
+    runtime = TactusRuntime(
+        procedure_id="suspended", storage_backend=storage, hitl_handler=SuspendingHITLHandler()
+    )
+    await runtime.execute(source=SOURCE, context={}, format="lua")
+
+    failing = TactusRuntime(procedure_id="failing", storage_backend=storage)
+    await failing.execute(
+        source="main = procedure('main', {}, function() error('x') end)", format="lua"
+    )
+
+    listing = {p.procedure_id: p for p in storage.list_procedures().procedures}
+    assert listing["suspended"].status == "WAITING_FOR_HUMAN"
+    assert listing["suspended"].waiting_on_message_id == "msg-1"
+    assert listing["failing"].status == "FAILED"
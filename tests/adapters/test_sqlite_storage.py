@@ -0,0 +1,167 @@
+"""
+Tests for the SQLite storage backend.
+"""
+
+import sqlite3
+from datetime import datetime, timezone
+
+import pytest
+
+from tactus.adapters.sqlite_storage import SQLiteStorage
+from tactus.core.execution_context import BaseExecutionContext
+from tactus.protocols.models import CheckpointEntry, resolve_result
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Path to a fresh database file."""
+    return tmp_path / "tactus.db"
+
+
+@pytest.fixture
+def storage(db_path):
+    """Create a SQLite storage instance."""
+    storage = SQLiteStorage(db_path=str(db_path))
+    yield storage
+    storage.close()
+
+
+def count_checkpoints(db_path, procedure_id: str) -> int:
+    """Count checkpoint rows directly in the database."""
+    with sqlite3.connect(str(db_path)) as conn:
+        (count,) = conn.execute(
+            "SELECT COUNT(*) FROM checkpoints WHERE procedure_id = ?", (procedure_id,)
+        ).fetchone()
+    return count
+
+
+def test_uses_wal_mode(storage):
+    """The database is opened in WAL journal mode."""
+    (mode,) = storage._conn.execute("PRAGMA journal_mode").fetchone()
+    assert mode == "wal"
+
+
+def test_missing_procedure_returns_new_metadata(storage):
+    """Loading an unknown procedure returns empty metadata."""
+    metadata = storage.load_procedure_metadata("unknown")
+    assert metadata.execution_log == []
+    assert metadata.status == "RUNNING"
+
+
+def test_checkpoints_round_trip(storage, db_path):
+    """Checkpoints are stored as rows and survive a new connection."""
+    context = BaseExecutionContext(procedure_id="proc", storage_backend=storage)
+    context.checkpoint(lambda: {"answer": 42}, "explicit_checkpoint")
+    context.checkpoint(lambda: "second", "agent_turn")
+
+    assert count_checkpoints(db_path, "proc") == 2
+
+    reopened = SQLiteStorage(db_path=str(db_path))
+    metadata = reopened.load_procedure_metadata("proc")
+    results = [resolve_result(entry.result) for entry in metadata.execution_log]
+    reopened.close()
+    assert results == [{"answer": 42}, "second"]
+    assert [entry.type for entry in metadata.execution_log] == [
+        "explicit_checkpoint",
+        "agent_turn",
+    ]
+
+
+def test_save_only_inserts_new_checkpoints(storage, db_path):
+    """Saving an unchanged prefix does not rewrite existing rows."""
+    metadata = storage.load_procedure_metadata("proc")
+    metadata.execution_log.append(
+        CheckpointEntry(
+            position=0, type="explicit_checkpoint", result=1, timestamp=datetime.now(timezone.utc)
+        )
+    )
+    storage.save_procedure_metadata("proc", metadata)
+
+    # Tamper with the stored row; a re-save must leave it alone
+    storage._conn.execute("UPDATE checkpoints SET result = '99' WHERE procedure_id = 'proc'")
+    storage._conn.commit()
+    storage.save_procedure_metadata("proc", metadata)
+
+    assert resolve_result(storage.load_procedure_metadata("proc").execution_log[0].result) == 99
+
+
+def test_clear_after_deletes_trailing_rows(storage, db_path):
+    """Truncating the execution log removes the trailing checkpoint rows."""
+    context = BaseExecutionContext(procedure_id="proc", storage_backend=storage)
+    for i in range(5):
+        context.checkpoint(lambda i=i: i, "explicit_checkpoint")
+
+    context.checkpoint_clear_after(2)
+    assert count_checkpoints(db_path, "proc") == 2
+
+    context.checkpoint(lambda: "new", "explicit_checkpoint")
+    results = [
+        resolve_result(entry.result)
+        for entry in storage.load_procedure_metadata("proc").execution_log
+    ]
+    assert results == [0, 1, "new"]
+
+
+def test_status_and_state_updates(storage):
+    """Status and state updates touch only the procedures table."""
+    context = BaseExecutionContext(procedure_id="proc", storage_backend=storage)
+    context.checkpoint(lambda: "kept", "explicit_checkpoint")
+
+    storage.update_procedure_status("proc", "WAITING_FOR_HUMAN", waiting_on_message_id="msg-1")
+    storage.set_state("proc", {"user": "Alice"})
+
+    metadata = storage.load_procedure_metadata("proc")
+    assert metadata.status == "WAITING_FOR_HUMAN"
+    assert metadata.waiting_on_message_id == "msg-1"
+    assert storage.get_state("proc") == {"user": "Alice"}
+    assert [resolve_result(entry.result) for entry in metadata.execution_log] == ["kept"]
+
+
+def test_state_for_unknown_procedure(storage):
+    """get_state on an unknown procedure returns an empty dict."""
+    assert storage.get_state("unknown") == {}
+    storage.set_state("fresh", {"a": 1})
+    assert storage.get_state("fresh") == {"a": 1}
+
+
+def test_large_results_move_to_blob_store(db_path):
+    """Results over the blob threshold are kept beside the database."""
+    storage = SQLiteStorage(db_path=str(db_path), blob_threshold=1024)
+    big = "y" * 4096
+
+    context = BaseExecutionContext(procedure_id="proc", storage_backend=storage)
+    context.checkpoint(lambda: big, "agent_turn")
+
+    with sqlite3.connect(str(db_path)) as conn:
+        (stored,) = conn.execute("SELECT result FROM checkpoints").fetchone()
+    assert '"$blob"' in stored
+    blob_dir = db_path.with_suffix(".blobs")
+    assert len([p for p in blob_dir.rglob("*") if p.is_file()]) == 1
+
+    replay = BaseExecutionContext(procedure_id="proc", storage_backend=storage)
+    replay.metadata.replay_index = 0
+    assert replay.checkpoint(lambda: None, "agent_turn") == big
+    storage.close()
+
+
+def test_msgpack_codec_stores_blobs(db_path):
+    """With the msgpack codec, results and state are stored as binary BLOBs."""
+    pytest.importorskip("msgpack")
+    storage = SQLiteStorage(db_path=str(db_path), codec="msgpack")
+    context = BaseExecutionContext(procedure_id="proc", storage_backend=storage)
+    context.checkpoint(lambda: {1: "one", "list": [1, 2]}, "explicit_checkpoint")
+    storage.set_state("proc", {"x": 1})
+
+    with sqlite3.connect(str(db_path)) as conn:
+        (result,) = conn.execute("SELECT result FROM checkpoints").fetchone()
+    assert isinstance(result, bytes)
+
+    loaded = storage.load_procedure_metadata("proc")
+    assert resolve_result(loaded.execution_log[0].result) == {1: "one", "list": [1, 2]}
+    assert storage.get_state("proc") == {"x": 1}
+    storage.close()
+
+    # Rows written as BLOBs stay readable with the default JSON codec
+    json_storage = SQLiteStorage(db_path=str(db_path))
+    assert json_storage.get_state("proc") == {"x": 1}
+    json_storage.close()
@@ -126,3 +126,96 @@ end)
 
     result = cli_runner.invoke(app, ["run", str(workflow_file), "--param", "name=TestUser"])
     assert result.exit_code == 0
+
+
+def test_cli_ps_lists_procedures_by_status(cli_runner, tmp_path):
+    """Test that ps lists procedures from the status index."""
+    from tactus.adapters.file_storage import FileStorage
+
+    storage = FileStorage(storage_dir=str(tmp_path))
+    for procedure_id, status in (("a", "RUNNING"), ("b", "WAITING_FOR_HUMAN")):
+        storage.update_procedure_status(procedure_id, status, waiting_on_message_id=None)
+
+    result = cli_runner.invoke(
+        app, ["ps", "--storage-path", str(tmp_path), "--status", "WAITING_FOR_HUMAN", "--ids"]
+    )
+    assert result.exit_code == 0
+    assert result.stdout.split() == ["b"]
+
+
+@pytest.mark.parametrize("command", ["ps", "gc"])
+def test_cli_main_keeps_subcommands_named_like_files(command, tmp_path, monkeypatch):
+    """Test that a file named like a subcommand does not turn it into a run."""
+    import sys
+
+    from tactus.cli import app as app_module
+
+    (tmp_path / command).write_text("")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, "argv", ["tactus", command])
+    monkeypatch.setattr(app_module, "load_tactus_config", lambda: None)
+    monkeypatch.setattr(app_module, "app", lambda: None)
+
+    app_module.main()
+    assert sys.argv == ["tactus", command]
+
+
+def test_cli_gc_deletes_orphaned_children(cli_runner, tmp_path):
+    """Test that gc deletes sub-procedure records of completed parents."""
+    from tactus.adapters.file_storage import FileStorage
+    from tactus.protocols.models import ProcedureMetadata
+
+    storage = FileStorage(storage_dir=str(tmp_path))
+    storage.update_procedure_status("parent", "COMPLETED")
+    storage.save_procedure_metadata(
+        "parent.0.child",
+        ProcedureMetadata(procedure_id="parent.0.child", parent_id="parent", parent_position=0),
+    )
+
+    result = cli_runner.invoke(app, ["gc", "--storage-path", str(tmp_path), "--dry-run"])
+    assert result.exit_code == 0
+    assert "parent.0.child" in result.stdout
+    assert len(storage.list_procedures().procedures) == 2
+
+    result = cli_runner.invoke(app, ["gc", "--storage-path", str(tmp_path)])
+    assert result.exit_code == 0
+    assert [p.procedure_id for p in storage.list_procedures().procedures] == ["parent"]
+
+
+def test_cli_run_fork_from_validates_fork_point(cli_runner, example_workflow_file, tmp_path):
+    """Test that run --fork-from rejects malformed and unknown fork points."""
+    args = ["run", str(example_workflow_file), "--storage", "sqlite"]
+    args += ["--storage-path", str(tmp_path / "tactus.db")]
+
+    result = cli_runner.invoke(app, args + ["--fork-from", "cli-example"])
+    assert result.exit_code == 1
+    assert "Invalid --fork-from" in result.stdout
+
+    result = cli_runner.invoke(app, args + ["--fork-from", "cli-example@3"])
+    assert result.exit_code == 1
+    assert "not found" in result.stdout
+
+
+def test_cli_gc_expires_finished_procedures(cli_runner, tmp_path):
+    """Test that gc --completed-days deletes old completed procedures."""
+    from tactus.adapters.file_storage import FileStorage
+
+    storage = FileStorage(storage_dir=str(tmp_path))
+    storage.update_procedure_status("done", "COMPLETED")
+    storage.update_procedure_status("waiting", "WAITING_FOR_HUMAN", "msg-1")
+
+    args = ["gc", "--storage-path", str(tmp_path), "--completed-days", "0"]
+    result = cli_runner.invoke(app, args)
+    assert result.exit_code == 0
+    assert "Deleted 1 expired procedure(s), reclaimed" in result.stdout
+    assert [p.procedure_id for p in storage.list_procedures().procedures] == ["waiting"]
+
+
+def test_cli_run_procedure_cache_persists_compiled_procedure(
+    cli_runner, example_workflow_file, tmp_path
+):
+    """Test that run --procedure-cache stores the compiled procedure for later runs."""
+    cache_dir = tmp_path / "procedures"
+    args = ["run", str(example_workflow_file), "--procedure-cache", str(cache_dir)]
+    cli_runner.invoke(app, args)
+    assert len(list(cache_dir.glob("*.luac"))) == 1
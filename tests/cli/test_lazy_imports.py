@@ -0,0 +1,40 @@
+"""
+Tests that importing the package and the CLI does not load the runtime.
+"""
+
+import subprocess
+import sys
+
+
+def loaded_modules(code):
+    """Run code in a fresh interpreter and return the names of the loaded modules."""
+    completed = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint('\\n'.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(completed.stdout.split())
+
+
+def test_package_and_cli_import_without_the_runtime():
+    modules = loaded_modules("import tactus, tactus.core, tactus.cli.app")
+    assert "tactus.core.runtime" not in modules
+    assert "pydantic_ai" not in modules
+
+    # Validation needs the registry, not the runtime
+    modules = loaded_modules("import tactus.validation")
+    assert "tactus.core.registry" in modules
+    assert "pydantic_ai" not in modules
+
+
+def test_lazy_exports_resolve_on_access():
+    import tactus
+    import tactus.core
+    from tactus.core.runtime import TactusRuntime
+
+    assert tactus.TactusRuntime is TactusRuntime
+    assert tactus.core.TactusRuntime is TactusRuntime
+    assert set(tactus.__all__) <= set(dir(tactus))
+    for name in tactus.core.__all__:
+        assert getattr(tactus.core, name) is not None
@@ -0,0 +1,158 @@
+"""
+Tests for running CLI commands in a fork-server (zygote).
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from tactus.cli import zygote
+
+pytestmark = pytest.mark.skipif(not zygote.is_supported(), reason="Needs fork and Unix sockets")
+
+SOURCE = """
+main = procedure("main", {
+    input = {},
+    output = {}
+}, function()
+    return {}
+end)
+"""
+
+
+def launch(args, env, cwd, input=None):
+    return subprocess.run(
+        [sys.executable, "-m", "tactus.cli.launcher", *args],
+        env=env,
+        cwd=cwd,
+        input=input,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+
+@pytest.fixture
+def workdir():
+    # Unix socket paths are limited to about 100 characters
+    with tempfile.TemporaryDirectory(prefix="tz") as tmp_dir:
+        yield Path(tmp_dir)
+
+
+@pytest.fixture
+def server(workdir):
+    """A zygote serving on a socket in workdir; yields the client environment."""
+    socket = workdir / "z.sock"
+    env = {**os.environ, zygote.SOCKET_ENV: str(socket), "COLUMNS": "200"}
+    log = open(workdir / "zygote.log", "w")
+    process = subprocess.Popen(
+        [sys.executable, "-m", "tactus.cli.launcher", "zygote", "--verbose"],
+        env=env,
+        cwd=workdir,
+        stdout=log,
+        stderr=subprocess.STDOUT,
+    )
+    deadline = time.monotonic() + 60
+    while not socket.exists():
+        assert process.poll() is None, "zygote exited"
+        assert time.monotonic() < deadline, "zygote did not start"
+        time.sleep(0.05)
+    yield env
+    process.terminate()
+    process.wait(timeout=10)
+    log.close()
+    assert not socket.exists()
+
+
+def test_commands_run_in_the_zygote(server, workdir):
+    (workdir / "ok.tac").write_text(SOURCE)
+    (workdir / "bad.tac").write_text("main = procedure(")
+
+    result = launch(["version"], server, workdir)
+    assert result.returncode == 0
+    assert "Tactus version" in result.stdout
+
+    result = launch(["validate", "ok.tac"], server, workdir)
+    assert result.returncode == 0
+    assert "DSL is valid" in result.stdout
+
+    result = launch(["validate", "bad.tac"], server, workdir)
+    assert result.returncode == 1
+
+    result = launch(["validate", "missing.tac"], server, workdir)
+    assert result.returncode == 1
+    assert "not found" in result.stdout
+
+    assert (workdir / "zygote.log").read_text().count("Forked") == 4
+
+
+def test_client_runs_in_the_zygote_only_when_compatible(server, workdir, monkeypatch):
+    monkeypatch.setenv(zygote.SOCKET_ENV, server[zygote.SOCKET_ENV])
+    identity = zygote._identity()
+    monkeypatch.setattr(zygote, "_identity", lambda: {**identity, "version": "0.0.0"})
+
+    # Refused before anything ran: the caller runs the command itself
+    assert zygote.run_in_zygote(["version"]) is None
+
+
+def test_commands_run_in_process_without_a_zygote(workdir, monkeypatch):
+    socket = workdir / "z.sock"
+    env = {**os.environ, zygote.SOCKET_ENV: str(socket)}
+
+    # No socket
+    result = launch(["version"], env, workdir)
+    assert result.returncode == 0
+    assert "Tactus version" in result.stdout
+
+    # A socket left behind by a server that is gone
+    import socket as sockets
+
+    stale = sockets.socket(sockets.AF_UNIX, sockets.SOCK_STREAM)
+    stale.bind(str(socket))
+    stale.close()
+    monkeypatch.setenv(zygote.SOCKET_ENV, str(socket))
+    assert zygote.run_in_zygote(["version"]) is None
+    result = launch(["version"], env, workdir)
+    assert result.returncode == 0
+    assert "Tactus version" in result.stdout
+
+
+def test_client_only_trusts_sockets_other_users_cannot_replace(workdir, monkeypatch):
+    import socket as sockets
+
+    shared = workdir / "shared"
+    shared.mkdir()
+    shared.chmod(0o777)
+    path = shared / "z.sock"
+    listener = sockets.socket(sockets.AF_UNIX, sockets.SOCK_STREAM)
+    listener.bind(str(path))
+    listener.listen(1)
+    listener.setblocking(False)
+    monkeypatch.setenv(zygote.SOCKET_ENV, str(path))
+    try:
+        assert zygote._untrusted_reason(path) == "its directory is writable by other users"
+        assert zygote.run_in_zygote(["version"]) is None
+        # Nothing was sent: the client never connected
+        with pytest.raises(BlockingIOError):
+            listener.accept()
+
+        shared.chmod(0o700)
+        assert zygote._untrusted_reason(path) is None
+    finally:
+        listener.close()
+
+
+def test_server_knows_the_client_uid():
+    import socket as sockets
+
+    left, right = sockets.socketpair(sockets.AF_UNIX, sockets.SOCK_STREAM)
+    try:
+        assert zygote._peer_uid(left) in (os.getuid(), None)
+    finally:
+        left.close()
+        right.close()
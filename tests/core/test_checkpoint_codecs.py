@@ -0,0 +1,179 @@
+"""Tests for typed checkpoint serialization (tactus.core.checkpoint_codecs)."""
+
+import json
+from datetime import datetime, timezone
+
+from pydantic import BaseModel, create_model
+from pydantic_ai.messages import ModelRequest, ModelResponse, TextPart, UserPromptPart
+from pydantic_ai.models.function import FunctionModel
+from pydantic_ai.usage import RunUsage
+
+from tactus.adapters.file_storage import FileStorage
+from tactus.adapters.memo_cache import SQLiteMemoCache
+from tactus.core.checkpoint_codecs import create_default_registry
+from tactus.core.execution_context import BaseExecutionContext
+from tactus.primitives.agent import AgentPrimitive
+from tactus.primitives.result import ResultPrimitive
+
+
+class Verdict(BaseModel):
+    label: str
+    score: float
+
+
+def _round_trip(registry, value):
+    # Go through JSON to make sure the stored form is plain data
+    return registry.decode(json.loads(json.dumps(registry.encode(value))))
+
+
+def test_plain_data_is_unchanged():
+    registry = create_default_registry()
+    value = {"a": [1, 2.5, "x", None, True], "b": {"c": []}}
+    assert registry.encode(value) == value
+    assert registry.decode(value) == value
+
+
+def test_round_trips_models_messages_and_usage():
+    registry = create_default_registry()
+    messages = [
+        ModelRequest(parts=[UserPromptPart("hi")]),
+        ModelResponse(parts=[TextPart("hello")]),
+    ]
+    value = {
+        "verdict": Verdict(label="ok", score=0.5),
+        "messages": messages,
+        "usage": RunUsage(input_tokens=3, output_tokens=5, requests=1),
+        "at": datetime(2026, 1, 2, tzinfo=timezone.utc),
+    }
+
+    restored = _round_trip(registry, value)
+
+    assert restored["verdict"] == Verdict(label="ok", score=0.5)
+    assert restored["messages"] == messages
+    assert restored["usage"] == RunUsage(input_tokens=3, output_tokens=5, requests=1)
+    assert restored["at"] == datetime(2026, 1, 2, tzinfo=timezone.utc)
+
+
+def test_generated_models_need_registration():
+    registry = create_default_registry()
+    Generated = create_model("Generated", answer=(str, ...))
+
+    # Not importable by name: the data survives as a dict
+    assert _round_trip(registry, Generated(answer="42")) == {"answer": "42"}
+
+    registry.register_model(Generated)
+    assert _round_trip(registry, Generated(answer="42")) == Generated(answer="42")
+
+
+def test_dicts_with_a_type_key_round_trip():
+    registry = create_default_registry()
+    value = {
+        "$type": "tactus.result",
+        "value": {"output": "not a result"},
+        "nested": [{"$type": "datetime", "value": "yesterday"}],
+    }
+    assert _round_trip(registry, value) == value
+    assert _round_trip(registry, {"$type": "custom", "other": 1}) == {"$type": "custom", "other": 1}
+
+
+def test_scoped_registry_keeps_its_models_to_itself():
+    base = create_default_registry()
+    scoped = base.scoped()
+    Generated = create_model("ScopedGenerated", answer=(str, ...))
+
+    scoped.register_model(Generated)
+    assert _round_trip(scoped, Generated(answer="42")) == Generated(answer="42")
+    assert _round_trip(scoped, Verdict(label="ok", score=1.0)) == Verdict(label="ok", score=1.0)
+    path = f"{Generated.__module__}:{Generated.__qualname__}"
+    assert scoped.find_model(path) is Generated
+    assert base.find_model(path) is None
+
+
+def test_unknown_types_pass_through():
+    registry = create_default_registry()
+    marker = object()
+    assert registry.encode(marker) is marker
+
+
+def _make_agent(context, memoize=False):
+    return AgentPrimitive(
+        name="greeter",
+        system_prompt_template="Be brief",
+        initial_message="Hi",
+        model="test",
+        tools=[],
+        tool_primitive=None,
+        stop_primitive=None,
+        iterations_primitive=None,
+        state_primitive=None,
+        context={},
+        disable_streaming=True,
+        execution_context=context,
+        memoize=memoize,
+    )
+
+
+def _counting_model(calls):
+    def reply(messages, info):
+        calls.append(len(messages))
+        return ModelResponse(parts=[TextPart(f"reply {len(calls)}")])
+
+    return FunctionModel(reply)
+
+
+def test_agent_turns_replay_from_file_storage(tmp_path):
+    calls = []
+    storage = FileStorage(storage_dir=str(tmp_path))
+
+    agent = _make_agent(BaseExecutionContext("proc-1", storage))
+    with agent.agent.override(model=_counting_model(calls)):
+        agent.turn()
+        agent.turn({"inject": "More please"})
+    assert calls == [1, 3]
+
+    # Resume from disk: both turns replay without calling the model
+    resumed = _make_agent(BaseExecutionContext("proc-1", FileStorage(storage_dir=str(tmp_path))))
+    with resumed.agent.override(model=_counting_model(calls)):
+        first = resumed.turn()
+        second = resumed.turn({"inject": "More please"})
+
+        assert isinstance(second, ResultPrimitive)
+        assert (first.text, second.text) == ("reply 1", "reply 2")
+        assert second.usage["total_tokens"] > 0
+        assert resumed.message_history == agent.message_history
+        assert len(second.all_messages()) == 4
+
+        # The next live turn continues the restored conversation
+        third = resumed.turn({"inject": "And again"})
+    assert third.text == "reply 3"
+    assert calls == [1, 3, 5]
+
+
+def test_agent_turn_memo_hit_restores_result(tmp_path):
+    calls = []
+    memo_cache = SQLiteMemoCache(db_path=str(tmp_path / "memo.db"))
+
+    for procedure_id in ("proc-a", "proc-b"):
+        context = BaseExecutionContext(
+            procedure_id, FileStorage(storage_dir=str(tmp_path)), memo_cache=memo_cache
+        )
+        agent = _make_agent(context, memoize=True)
+        with agent.agent.override(model=_counting_model(calls)):
+            result = agent.turn()
+        assert result.text == "reply 1"
+        assert len(agent.message_history) == 2
+
+    assert calls == [1]
+
+
+def test_agent_turn_is_hashed_only_when_memoized(tmp_path):
+    calls = []
+    for memoize in (False, True):
+        context = BaseExecutionContext(
+            f"proc-{memoize}", FileStorage(storage_dir=str(tmp_path)), memo_cache=None
+        )
+        agent = _make_agent(context, memoize=memoize)
+        with agent.agent.override(model=_counting_model(calls)):
+            agent.turn()
+        entry = context.metadata.execution_log[0]
+        assert (entry.input_hash is not None) == memoize
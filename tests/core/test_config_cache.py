@@ -0,0 +1,85 @@
+"""
+Tests for ConfigCache: configuration cascades reused while their files are unchanged.
+"""
+
+import os
+
+import pytest
+import yaml
+
+from tactus.core.config_manager import ConfigCache, ConfigManager
+
+
+def write_config(path, config, seconds_ago=10):
+    """Write a config file with an mtime old enough to be cached."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(yaml.dump(config))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - int(seconds_ago * 1e9)))
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """A procedure with a root and a sidecar config; yields (procedure, parse counter)."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.delenv("TOOL_PATHS", raising=False)
+    write_config(tmp_path / ".tactus" / "config.yml", {"tool_paths": ["./root_tools"]})
+    procedure = tmp_path / "procedures" / "main.tac"
+    procedure.parent.mkdir()
+    procedure.write_text("-- Test")
+    write_config(procedure.parent / "main.tac.yml", {"model": "gpt-4o"})
+
+    parses = []
+    load_yaml = ConfigManager._load_yaml_file
+
+    def counting_load(self, path):
+        parses.append(path)
+        return load_yaml(self, path)
+
+    monkeypatch.setattr(ConfigManager, "_load_yaml_file", counting_load)
+    return procedure, parses
+
+
+def test_cascades_are_reused_until_a_file_changes(project, monkeypatch):
+    procedure, parses = project
+    cache = ConfigCache()
+
+    first = ConfigManager(cache=cache).load_cascade(procedure)
+    assert first == {"tool_paths": ["./root_tools"], "model": "gpt-4o"}
+    assert len(parses) == 2
+
+    # Callers get their own copy
+    first["tool_paths"].append("./mine")
+    manager = ConfigManager(cache=cache)
+    assert manager.load_cascade(procedure) == {"tool_paths": ["./root_tools"], "model": "gpt-4o"}
+    assert [label for label, _ in manager.loaded_configs] == ["root", "sidecar"]
+    assert len(parses) == 2
+
+    # An edited file
+    write_config(procedure.parent / "main.tac.yml", {"model": "gpt-4o-mini"}, seconds_ago=5)
+    assert ConfigManager(cache=cache).load_cascade(procedure)["model"] == "gpt-4o-mini"
+    assert len(parses) == 4
+
+    # A new file
+    write_config(procedure.parent / ".tactus" / "config.yml", {"temperature": 0.5})
+    assert ConfigManager(cache=cache).load_cascade(procedure)["temperature"] == 0.5
+    assert len(parses) == 7
+
+    # A different environment
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    assert ConfigManager(cache=cache).load_cascade(procedure)["openai_api_key"] == "sk-test"
+    assert len(parses) == 10
+
+    # Without the cache, every load reads the files
+    ConfigManager(use_cache=False).load_cascade(procedure)
+    assert len(parses) == 13
+
+    # Just-written files are read again until they are old enough
+    (procedure.parent / "main.tac.yml").write_text(yaml.dump({"model": "new"}))
+    for _ in range(2):
+        assert ConfigManager(cache=cache).load_cascade(procedure)["model"] == "new"
+    assert len(parses) == 19
+
+    assert cache.invalidate() == 4  # Stale cascades stay until evicted
+    assert len(cache) == 0
@@ -0,0 +1,264 @@
+"""
+Tests for checkpoint durability policies in BaseExecutionContext.
+"""
+
+import threading
+import time
+
+import pytest
+
+from tactus.adapters.async_storage import ThreadPoolStorage
+from tactus.adapters.memory import MemoryStorage
+from tactus.core.execution_context import BaseExecutionContext
+from tactus.core.exceptions import ProcedureWaitingForHuman
+from tactus.core.runtime import TactusRuntime
+
+
+class CountingStorage(MemoryStorage):
+    """Memory storage that counts metadata saves."""
+
+    def __init__(self):
+        super().__init__()
+        self.saves = 0
+
+    def save_procedure_metadata(self, procedure_id, metadata):
+        self.saves += 1
+        super().save_procedure_metadata(procedure_id, metadata)
+
+
+class SuspendingHITLHandler:
+    """HITL handler that always suspends the procedure."""
+
+    def request_interaction(self, procedure_id, request):
+        raise ProcedureWaitingForHuman(procedure_id, "msg-1")
+
+
+def run_checkpoints(context, count: int) -> None:
+    for i in range(count):
+        context.checkpoint(lambda i=i: i, "explicit_checkpoint")
+
+
+def test_always_persists_every_checkpoint():
+    """The default policy saves after each checkpoint."""
+    storage = CountingStorage()
+    context = BaseExecutionContext(procedure_id="proc", storage_backend=storage)
+    run_checkpoints(context, 5)
+    assert storage.saves == 5
+
+
+def test_batch_persists_every_n_checkpoints():
+    """The batch policy saves once per batch_size checkpoints."""
+    storage = CountingStorage()
+    context = BaseExecutionContext(
+        procedure_id="proc",
+        storage_backend=storage,
+        durability="batch",
+        batch_size=3,
+        batch_interval_ms=60_000,
+    )
+    run_checkpoints(context, 7)
+    assert storage.saves == 2
+
+    context.flush()
+    assert storage.saves == 3
+    assert len(storage.load_procedure_metadata("proc").execution_log) == 7
+
+
+def test_batch_persists_after_interval():
+    """The batch policy also flushes once the interval has elapsed."""
+    storage = CountingStorage()
+    context = BaseExecutionContext(
+        procedure_id="proc",
+        storage_backend=storage,
+        durability="batch",
+        batch_size=1000,
+        batch_interval_ms=0,
+    )
+    run_checkpoints(context, 3)
+    assert storage.saves == 3
+
+
+def test_on_suspend_flushes_before_waiting_for_human():
+    """on_suspend defers saves until a HITL request suspends the procedure."""
+    storage = CountingStorage()
+    context = BaseExecutionContext(
+        procedure_id="proc",
+        storage_backend=storage,
+        hitl_handler=SuspendingHITLHandler(),
+        durability="on_suspend",
+    )
+    run_checkpoints(context, 10)
+    assert storage.saves == 0
+
+    with pytest.raises(ProcedureWaitingForHuman):
+        context.wait_for_human("approval", "Continue?", None, False, None, {})
+
+    assert storage.saves == 1
+    assert len(storage.load_procedure_metadata("proc").execution_log) == 10
+
+    # Nothing new to persist
+    context.flush()
+    assert storage.saves == 1
+
+
+def test_unknown_policy_rejected():
+    """An unknown durability policy is a configuration error."""
+    with pytest.raises(ValueError, match="durability"):
+        BaseExecutionContext(
+            procedure_id="proc", storage_backend=MemoryStorage(), durability="sometimes"
+        )
+
+
+@pytest.mark.asyncio
+async def test_runtime_flushes_on_completion():
+    """The runtime flushes deferred checkpoints when the procedure completes."""
+    source = """
+    main = procedure("main", {
+        input = {},
+        output = {total = {type = "number"}}
+    }, function()
+        local total = 0
+        for i = 1, 20 do
+            total = total + Step.checkpoint(function() return i end)
+        end
+        return {total = total}
+    end)
+    """
+    storage = CountingStorage()
+    runtime = TactusRuntime(
+        procedure_id="durable",
+        storage_backend=storage,
+        external_config={"durability": "on_suspend"},
+    )
+    result = await runtime.execute(source=source, context={}, format="lua")
+
+    assert result["success"] is True
+    assert storage.saves == 1
+    assert len(storage.load_procedure_metadata("durable").execution_log) == 20
+
+
+class SlowStorage(CountingStorage):
+    """Counting storage whose saves take a while."""
+
+    def __init__(self, delay: float):
+        super().__init__()
+        self.delay = delay
+
+    def save_procedure_metadata(self, procedure_id, metadata):
+        time.sleep(self.delay)
+        super().save_procedure_metadata(procedure_id, metadata)
+
+
+def test_write_behind_overlaps_saves_with_the_next_operation():
+    """Each save runs while the following operation executes."""
+    storage = SlowStorage(delay=0.02)
+    context = BaseExecutionContext(procedure_id="proc", storage_backend=storage, write_behind=True)
+
+    start = time.perf_counter()
+    for i in range(5):
+        context.checkpoint(lambda i=i: time.sleep(0.02) or i, "explicit_checkpoint")
+    context.flush()
+    elapsed = time.perf_counter() - start
+
+    assert storage.saves == 5
+    assert len(storage.load_procedure_metadata("proc").execution_log) == 5
+    # Serial execution would take 5 * (0.02 + 0.02) seconds
+    assert elapsed < 0.18
+
+
+def test_write_behind_saves_a_consistent_copy():
+    """Checkpoints recorded after a save was queued are not part of it."""
+    storage = MemoryStorage()
+    context = BaseExecutionContext(procedure_id="proc", storage_backend=storage, write_behind=True)
+    context.checkpoint(lambda: 1, "explicit_checkpoint")
+    context.metadata.state["x"] = 1
+    context._wait_for_write()
+    assert len(storage.load_procedure_metadata("proc").execution_log) == 1
+    assert storage.load_procedure_metadata("proc").state == {}
+
+    context.checkpoint(lambda: 2, "explicit_checkpoint")
+    context.flush()
+    assert storage.load_procedure_metadata("proc").state == {"x": 1}
+
+
+def test_write_behind_reports_failed_saves():
+    """A failed background save surfaces at the next checkpoint."""
+
+    class FailingStorage(MemoryStorage):
+        def save_procedure_metadata(self, procedure_id, metadata):
+            raise OSError("disk full")
+
+    context = BaseExecutionContext(
+        procedure_id="proc", storage_backend=FailingStorage(), write_behind=True
+    )
+    context.checkpoint(lambda: 1, "explicit_checkpoint")
+    with pytest.raises(RuntimeError, match="disk full"):
+        context.checkpoint(lambda: 2, "explicit_checkpoint")
+
+
+def test_write_behind_persists_before_suspending():
+    """Everything is durable when the procedure suspends for a human."""
+    storage = SlowStorage(delay=0.01)
+    context = BaseExecutionContext(
+        procedure_id="proc",
+        storage_backend=storage,
+        hitl_handler=SuspendingHITLHandler(),
+        write_behind=True,
+    )
+    run_checkpoints(context, 3)
+    with pytest.raises(ProcedureWaitingForHuman):
+        context.wait_for_human("approval", "ok?", None, None, None, {})
+    assert len(storage.load_procedure_metadata("proc").execution_log) == 3
+
+
+def storage_threads():
+    return [t for t in threading.enumerate() if t.name.startswith("tactus-storage")]
+
+
+def test_close_stops_the_write_behind_thread():
+    """A context's own I/O thread ends with close(); a shared pool keeps running."""
+    before = len(storage_threads())
+    storage = MemoryStorage()
+    context = BaseExecutionContext(procedure_id="proc", storage_backend=storage, write_behind=True)
+    run_checkpoints(context, 3)
+    context.close()
+    assert len(storage.load_procedure_metadata("proc").execution_log) == 3
+    assert len(storage_threads()) == before
+
+    shared = ThreadPoolStorage(storage)
+    context = BaseExecutionContext(procedure_id="other", storage_backend=shared)
+    run_checkpoints(context, 1)
+    context.close()
+    assert shared.submit("other", lambda: "still running").result() == "still running"
+    shared.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_runtime_saves_through_a_shared_thread_pool_storage():
+    """Runs given a ThreadPoolStorage save on its threads and leave no threads behind."""
+    source = """
+    main = procedure("main", {
+        input = {},
+        output = {total = {type = "number"}}
+    }, function()
+        return {total = Step.checkpoint(function() return 3 end)}
+    end)
+    """
+    storage = CountingStorage()
+    shared = ThreadPoolStorage(storage)
+    for procedure_id in ("first", "second"):
+        runtime = TactusRuntime(procedure_id=procedure_id, storage_backend=shared)
+        result = await runtime.execute(source=source, context={}, format="lua")
+        assert result["success"] is True
+        assert len(storage.load_procedure_metadata(procedure_id).execution_log) == 1
+    shared.shutdown()
+
+    before = len(storage_threads())
+    runtime = TactusRuntime(
+        procedure_id="own",
+        storage_backend=storage,
+        external_config={"durability": {"policy": "always", "write_behind": True}},
+    )
+    result = await runtime.execute(source=source, context={}, format="lua")
+    assert result["success"] is True
+    assert len(storage_threads()) == before
@@ -0,0 +1,111 @@
+"""
+Tests for forking procedures from a checkpoint position (fork_procedure).
+"""
+
+import pytest
+
+from tactus.adapters.file_storage import FileStorage
+from tactus.adapters.memory import MemoryStorage
+from tactus.adapters.sqlite_storage import SQLiteStorage
+from tactus.core.execution_context import BaseExecutionContext
+from tactus.protocols.models import resolve_result
+
+
+@pytest.fixture(params=["memory", "file", "journal", "sqlite"])
+def storage(request, tmp_path):
+    if request.param == "memory":
+        yield MemoryStorage()
+    elif request.param == "sqlite":
+        storage = SQLiteStorage(db_path=str(tmp_path / "tactus.db"))
+        yield storage
+        storage.close()
+    else:
+        yield FileStorage(storage_dir=str(tmp_path), journal=request.param == "journal")
+
+
+def run_checkpoints(storage, procedure_id, values):
+    """Checkpoint each value in order; returns the values seen (replayed or live)."""
+    context = BaseExecutionContext(procedure_id=procedure_id, storage_backend=storage)
+    return [context.checkpoint(lambda v=v: v, "explicit_checkpoint") for v in values]
+
+
+def stored_results(storage, procedure_id):
+    log = storage.load_procedure_metadata(procedure_id).execution_log
+    return [resolve_result(entry.result) for entry in log]
+
+
+def test_fork_replays_prefix_then_runs_live(storage):
+    run_checkpoints(storage, "source", ["a", "b", "c", "d"])
+    storage.fork_procedure("source", 2, "fork")
+
+    forked = storage.load_procedure_metadata("fork")
+    assert forked.status == "RUNNING"
+    assert forked.replay_index == 0
+    assert forked.parent_id is None
+    assert stored_results(storage, "fork") == ["a", "b"]
+
+    # The first two checkpoints replay from the source run; the rest execute
+    assert run_checkpoints(storage, "fork", ["x", "y", "z"]) == ["a", "b", "z"]
+    assert stored_results(storage, "fork") == ["a", "b", "z"]
+    assert stored_results(storage, "source") == ["a", "b", "c", "d"]
+
+    # Forks of forks, and forking at either end of the log
+    storage.fork_procedure("fork", 3, "fork2")
+    assert stored_results(storage, "fork2") == ["a", "b", "z"]
+    storage.fork_procedure("source", 0, "empty")
+    assert stored_results(storage, "empty") == []
+
+
+def test_fork_validates_arguments(storage):
+    run_checkpoints(storage, "source", ["a"])
+    storage.fork_procedure("source", 1, "fork")
+
+    with pytest.raises(ValueError, match="not found"):
+        storage.fork_procedure("missing", 0, "other")
+    with pytest.raises(ValueError, match="already exists"):
+        storage.fork_procedure("source", 0, "fork")
+    with pytest.raises(ValueError, match="position 2"):
+        storage.fork_procedure("source", 2, "other")
+    with pytest.raises(ValueError, match="position -1"):
+        storage.fork_procedure("source", -1, "other")
+
+
+def test_fork_keeps_only_snapshots_before_the_fork_point(storage):
+    context = BaseExecutionContext(procedure_id="source", storage_backend=storage)
+    for i in range(2):
+        context.checkpoint(lambda i=i: i, "explicit_checkpoint")
+    context.save_snapshot({"data": {"next": 2}})
+
+    storage.fork_procedure("source", 2, "at")
+    storage.fork_procedure("source", 1, "before")
+    assert storage.load_procedure_metadata("at").lua_state["snapshot"]["position"] == 2
+    assert "snapshot" not in storage.load_procedure_metadata("before").lua_state
+
+
+def test_sqlite_fork_copies_no_rows_until_the_base_changes(tmp_path):
+    storage = SQLiteStorage(db_path=str(tmp_path / "tactus.db"))
+    run_checkpoints(storage, "source", ["a", "b", "c", "d"])
+    storage.fork_procedure("source", 3, "fork")
+    storage.fork_procedure("fork", 2, "fork2")
+
+    def own_rows(procedure_id):
+        return storage._conn.execute(
+            "SELECT COUNT(*) FROM checkpoints WHERE procedure_id = ?", (procedure_id,)
+        ).fetchone()[0]
+
+    assert own_rows("fork") == 0 and own_rows("fork2") == 0
+
+    # Rewinding the source copies the shared checkpoints past the cut to the fork
+    context = BaseExecutionContext(procedure_id="source", storage_backend=storage)
+    context.checkpoint_clear_after(1)
+    assert own_rows("fork") == 2
+    assert stored_results(storage, "source") == ["a"]
+    assert stored_results(storage, "fork") == ["a", "b", "c"]
+    assert stored_results(storage, "fork2") == ["a", "b"]
+
+    # Deleting the source copies the rest
+    storage.delete_procedure("source")
+    assert own_rows("fork") == 3
+    assert stored_results(storage, "fork") == ["a", "b", "c"]
+    assert stored_results(storage, "fork2") == ["a", "b"]
+    storage.close()
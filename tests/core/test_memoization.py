@@ -0,0 +1,82 @@
+"""
+Tests for cross-run memoization of checkpointed operations.
+"""
+
+import pytest
+
+from tactus.adapters.memo_cache import MemoryMemoCache
+from tactus.adapters.memory import MemoryStorage
+from tactus.core.execution_context import BaseExecutionContext, compute_input_hash
+from tactus.core.runtime import TactusRuntime
+
+
+def test_input_hash_is_stable_and_type_scoped():
+    """Hashes ignore key order but differ by checkpoint type and inputs."""
+    a = compute_input_hash("model_predict", {"x": 1, "y": [1, 2]})
+    assert a == compute_input_hash("model_predict", {"y": [1, 2], "x": 1})
+    assert a != compute_input_hash("explicit_checkpoint", {"x": 1, "y": [1, 2]})
+    assert a != compute_input_hash("model_predict", {"x": 2, "y": [1, 2]})
+
+
+def test_memo_hit_across_procedures():
+    """A second procedure reuses the result instead of calling fn."""
+    cache = MemoryMemoCache()
+    input_hash = compute_input_hash("explicit_checkpoint", {"text": "hello"})
+    calls = []
+
+    def fn():
+        calls.append(1)
+        return {"label": "greeting"}
+
+    for procedure_id in ("first", "second"):
+        context = BaseExecutionContext(
+            procedure_id=procedure_id, storage_backend=MemoryStorage(), memo_cache=cache
+        )
+        result = context.checkpoint(fn, "explicit_checkpoint", input_hash=input_hash, memoize=True)
+        assert result == {"label": "greeting"}
+        entry = context.metadata.execution_log[0]
+        assert entry.input_hash == input_hash
+
+    assert len(calls) == 1
+
+
+def test_memoization_requires_opt_in_and_input_hash():
+    """Checkpoints without memoize=True or an input_hash never touch the cache."""
+    cache = MemoryMemoCache()
+    context = BaseExecutionContext(
+        procedure_id="proc", storage_backend=MemoryStorage(), memo_cache=cache
+    )
+    input_hash = compute_input_hash("explicit_checkpoint", 1)
+    context.checkpoint(lambda: 1, "explicit_checkpoint", input_hash=input_hash)
+    context.checkpoint(lambda: 2, "explicit_checkpoint", memoize=True)
+    assert len(cache) == 0
+
+
+MEMOIZED_SOURCE = """
+main = procedure("main", {
+    input = {},
+    output = {value = {type = "number"}}
+}, function()
+    local value = Step.checkpoint(function()
+        State.increment("calls", 1)
+        return 21 * 2
+    end, {inputs = {question = "answer"}, memoize = true})
+    return {value = value + (State.get("calls") or 0)}
+end)
+"""
+
+
+@pytest.mark.asyncio
+async def test_step_checkpoint_memoizes_across_runs():
+    """Step.checkpoint with memoize=true skips fn in a later procedure."""
+    cache = MemoryMemoCache()
+    results = []
+    for procedure_id in ("run-1", "run-2"):
+        runtime = TactusRuntime(
+            procedure_id=procedure_id, storage_backend=MemoryStorage(), memo_cache=cache
+        )
+        result = await runtime.execute(source=MEMOIZED_SOURCE, context={}, format="lua")
+        assert result["success"] is True
+        results.append(result["result"]["value"])
+
+    assert results == [43, 42]
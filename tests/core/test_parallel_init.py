@@ -0,0 +1,212 @@
+"""
+Tests for concurrent setup of dependencies, MCP servers and toolsets.
+
+Stub MCP servers and fake resources take a set time to start, so a setup
+that runs them concurrently takes about as long as the slowest one, while a
+sequential one takes the sum.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from tactus.adapters.mcp_manager import MCPServerManager
+from tactus.adapters.memory import MemoryStorage
+from tactus.core.dependencies import ResourceFactory
+from tactus.core.runtime import TactusRuntime
+
+STUB_SERVER = str(Path(__file__).parent.parent / "fixtures" / "stub_mcp_server.py")
+DELAY = 0.5
+
+
+class FakeResource:
+    def __init__(self, name):
+        self.name = name
+        self.closed = False
+
+    async def aclose(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_resources(monkeypatch):
+    """Make ResourceFactory create FakeResources after config['delay'] seconds."""
+    created = {}
+
+    async def create(resource_type, config):
+        await asyncio.sleep(config.get("delay", 0))
+        if config.get("fail"):
+            raise ConnectionError(f"cannot reach {config['name']}")
+        created[config["name"]] = FakeResource(config["name"])
+        return created[config["name"]]
+
+    monkeypatch.setattr(ResourceFactory, "create", staticmethod(create))
+    return created
+
+
+def stub_server(name, delay=DELAY, **extra):
+    return {
+        "command": sys.executable,
+        "args": [STUB_SERVER],
+        "env": {"STUB_MCP_NAME": name, "STUB_MCP_STARTUP_DELAY": str(delay)},
+        **extra,
+    }
+
+
+@pytest.mark.asyncio
+async def test_dependencies_are_created_concurrently(fake_resources):
+    config = {
+        name: {"type": "http_client", "name": name, "delay": DELAY}
+        for name in ("api", "db", "cache", "search")
+    }
+
+    start = time.perf_counter()
+    resources = await ResourceFactory.create_all(config)
+    elapsed = time.perf_counter() - start
+
+    assert list(resources) == ["api", "db", "cache", "search"]
+    assert elapsed < 2 * DELAY  # Sequential creation takes 4 * DELAY
+
+
+@pytest.mark.asyncio
+async def test_failed_dependency_setup_closes_created_resources(fake_resources):
+    config = {
+        "api": {"type": "http_client", "name": "api", "delay": 0},
+        "db": {"type": "postgres", "name": "db", "delay": 0.1, "fail": True},
+        "slow": {"type": "redis", "name": "slow", "delay": 30},
+    }
+
+    start = time.perf_counter()
+    with pytest.raises(ConnectionError, match="cannot reach db"):
+        await ResourceFactory.create_all(config)
+    assert time.perf_counter() - start < 5  # The slow one was cancelled
+    assert fake_resources["api"].closed
+    assert "slow" not in fake_resources
+
+    config = {
+        "api": {"type": "http_client", "name": "api", "delay": 0},
+        "slow": {"type": "redis", "name": "slow", "delay": 30, "connect_timeout": 0.1},
+    }
+    with pytest.raises(TimeoutError, match="'slow' was not created within 0.1s"):
+        await ResourceFactory.create_all(config)
+    assert fake_resources["api"].closed
+
+    with pytest.raises(ValueError, match="missing 'type'"):
+        await ResourceFactory.create_all({"api": {"name": "api"}})
+
+
+@pytest.mark.asyncio
+async def test_mcp_servers_connect_concurrently():
+    from pydantic_ai import Agent
+    from pydantic_ai.models.test import TestModel
+
+    configs = {name: stub_server(name) for name in ("alpha", "beta", "gamma")}
+    # Never connects in time: skipped like a server that fails to start
+    configs["stuck"] = stub_server("stuck", delay=30, connect_timeout=DELAY)
+
+    start = time.perf_counter()
+    async with MCPServerManager(configs) as manager:
+        elapsed = time.perf_counter() - start
+        toolsets = manager.get_toolsets()
+        assert [t.prefix for t in toolsets] == ["alpha", "beta", "gamma"]
+        assert elapsed < 3 * DELAY  # Sequential connection takes more than 4 * DELAY
+
+        # The connections are usable from other tasks (agent runs)
+        agent = Agent(TestModel(call_tools=["beta_echo"]), toolsets=toolsets)
+        result = await asyncio.create_task(agent.run("hi"))
+        assert "beta: " in result.output
+
+    assert manager._tasks == []
+
+
+@pytest.mark.asyncio
+async def test_runtime_connects_mcp_servers_while_creating_dependencies(
+    fake_resources, monkeypatch
+):
+    from tactus.core.registry import DependencyDeclaration
+
+    parse = TactusRuntime._parse_declarations
+
+    def parse_with_dependency(self, source):
+        registry = parse(self, source)
+        config = {"type": "http_client", "name": "api", "delay": 2 * DELAY}
+        registry.dependencies["api"] = DependencyDeclaration(
+            name="api", type="http_client", config=config
+        )
+        return registry
+
+    monkeypatch.setattr(TactusRuntime, "_parse_declarations", parse_with_dependency)
+    source = """
+    main = procedure("main", {
+        input = {},
+        output = {value = {type = "string"}}
+    }, function()
+        return {value = "ok"}
+    end)
+    """
+    runtime = TactusRuntime(
+        procedure_id="parallel-init",
+        storage_backend=MemoryStorage(),
+        mcp_servers={"slow": stub_server("slow", delay=2 * DELAY)},
+    )
+
+    start = time.perf_counter()
+    result = await runtime.execute(source=source, context={}, format="lua")
+    elapsed = time.perf_counter() - start
+
+    assert result["success"] is True, result.get("error")
+    assert "slow" in runtime.toolset_registry
+    assert "api" in fake_resources
+    assert elapsed < 3.5 * DELAY  # Sequential setup takes more than 4 * DELAY
+    # Torn down at the end of the run
+    assert fake_resources["api"].closed
+    assert runtime.dependency_manager is None
+    assert runtime.user_dependencies == {}
+
+
+DEPENDENCY_SOURCE = """
+main = procedure("main", {
+    input = {},
+    output = {value = {type = "string"}}
+}, function()
+    return {value = "ok"}
+end)
+"""
+
+
+@pytest.mark.asyncio
+async def test_each_execute_creates_its_own_dependencies(fake_resources, monkeypatch):
+    from tactus.core.registry import DependencyDeclaration
+
+    parse = TactusRuntime._parse_declarations
+
+    def parse_with_dependency(self, source):
+        registry = parse(self, source)
+        config = {"type": "http_client", "name": "api"}
+        registry.dependencies["api"] = DependencyDeclaration(
+            name="api", type="http_client", config=config
+        )
+        return registry
+
+    seen = []
+    initialize = TactusRuntime._initialize_dependencies
+
+    async def record_dependencies(self):
+        await initialize(self)
+        seen.append(self.user_dependencies.get("api"))
+
+    monkeypatch.setattr(TactusRuntime, "_parse_declarations", parse_with_dependency)
+    monkeypatch.setattr(TactusRuntime, "_initialize_dependencies", record_dependencies)
+    runtime = TactusRuntime(procedure_id="twice", storage_backend=MemoryStorage())
+
+    for _ in range(2):
+        result = await runtime.execute(source=DEPENDENCY_SOURCE, context={}, format="lua")
+        assert result["success"] is True, result.get("error")
+
+    first, second = seen[0], seen[-1]
+    assert first is not None and second is not None
+    assert first is not second
+    assert first.closed and second.closed
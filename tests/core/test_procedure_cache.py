@@ -0,0 +1,118 @@
+"""
+Tests for the compiled procedure cache (ProcedureCache).
+"""
+
+import pytest
+
+from tactus.adapters.memory import MemoryStorage
+from tactus.core.procedure_cache import ProcedureCache
+from tactus.core.runtime import TactusRuntime
+
+SOURCE = """
+main = procedure("main", {
+    input = {},
+    output = {value = {type = "number"}}
+}, function()
+    local value = Step.checkpoint(function() return 41 end)
+    return {value = value + 1}
+end)
+"""
+
+FAILING_SOURCE = """
+main = procedure("main", {
+    input = {},
+    output = {}
+}, function()
+    local missing = nil
+    return missing.value
+end)
+"""
+
+
+async def run(source, cache):
+    runtime = TactusRuntime(
+        procedure_id="cached", storage_backend=MemoryStorage(), procedure_cache=cache
+    )
+    return await runtime.execute(source=source, context={}, format="lua")
+
+
+@pytest.mark.asyncio
+async def test_second_run_uses_the_compiled_procedure(monkeypatch):
+    cache = ProcedureCache()
+    compiles = []
+    compile = cache.compile
+    monkeypatch.setattr(cache, "compile", lambda source: compiles.append(1) or compile(source))
+
+    for _ in range(3):
+        result = await run(SOURCE, cache)
+        assert result["success"] is True
+        assert result["result"] == {"value": 42}
+
+    assert len(compiles) == 1
+    assert len(cache) == 1
+    assert cache.get(SOURCE).warnings == [
+        "No specifications defined - consider adding BDD tests using specifications([[...]])"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cache_dir_persists_entries_across_instances(tmp_path):
+    assert (await run(SOURCE, ProcedureCache(cache_dir=str(tmp_path))))["success"] is True
+    assert len(list(tmp_path.glob("*.luac"))) == 1
+
+    warm = ProcedureCache(cache_dir=str(tmp_path))
+    assert warm.get(SOURCE).validated
+    assert (await run(SOURCE, warm))["result"] == {"value": 42}
+
+    # A corrupt entry is ignored
+    next(tmp_path.glob("*.luac")).write_bytes(b"not json\n")
+    assert ProcedureCache(cache_dir=str(tmp_path)).get(SOURCE) is None
+
+
+@pytest.mark.asyncio
+async def test_invalid_sources_are_not_cached():
+    cache = ProcedureCache()
+    no_main = 'helper = procedure("helper", {}, function() end)'
+    syntax_error = "main = procedure("
+
+    for source in (no_main, syntax_error):
+        result = await run(source, cache)
+        assert result["success"] is False
+        assert cache.get(source) is None
+    assert cache.compile(syntax_error) is None
+
+
+@pytest.mark.asyncio
+async def test_cached_procedures_report_errors_with_line_numbers():
+    cache = ProcedureCache()
+    errors = [(await run(FAILING_SOURCE, cache))["error"] for _ in range(2)]
+    assert cache.get(FAILING_SOURCE) is not None
+    assert errors[0] == errors[1]
+    assert ":7:" in errors[1]
+
+
+def test_key_depends_on_source_and_version(monkeypatch):
+    cache = ProcedureCache()
+    key = cache.key(SOURCE)
+    assert cache.key(SOURCE) == key
+    assert cache.key(SOURCE + "\n") != key
+
+    monkeypatch.setattr("tactus.__version__", "0.0.0-test")
+    assert cache.key(SOURCE) != key
+
+
+def test_lru_eviction_and_validation():
+    cache = ProcedureCache(max_entries=2)
+    sources = [f"x = {i}" for i in range(3)]
+    for source in sources:
+        compiled = cache.compile(source)
+        compiled.warnings = []
+        cache.put(compiled)
+    assert len(cache) == 2
+    assert cache.get(sources[0]) is None
+    assert cache.get(sources[2]) is not None
+
+    with pytest.raises(ValueError, match="not been validated"):
+        cache.put(cache.compile("x = 4"))
+    with pytest.raises(ValueError, match="max_entries"):
+        ProcedureCache(max_entries=0)
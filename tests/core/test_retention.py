@@ -0,0 +1,156 @@
+"""
+Tests for TTL-based retention of stored procedures.
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from tactus.adapters.file_storage import FileStorage
+from tactus.adapters.memory import MemoryStorage
+from tactus.adapters.sqlite_storage import SQLiteStorage
+from tactus.core.execution_context import BaseExecutionContext
+from tactus.core.garbage_collection import (
+    RetentionPolicy,
+    RetentionSweeper,
+    collect_expired,
+    collect_unreferenced_blobs,
+)
+from tactus.protocols.models import ProcedureMetadata
+
+
+@pytest.fixture(params=["memory", "file", "sharded", "sqlite"])
+def storage(request, tmp_path):
+    if request.param == "memory":
+        yield MemoryStorage()
+    elif request.param == "sqlite":
+        storage = SQLiteStorage(db_path=str(tmp_path / "tactus.db"))
+        yield storage
+        storage.close()
+    else:
+        yield FileStorage(storage_dir=str(tmp_path), shard=request.param == "sharded")
+
+
+def populate(storage):
+    for status in ("RUNNING", "WAITING_FOR_HUMAN", "COMPLETED", "FAILED"):
+        for i in range(3):
+            procedure_id = f"{status.lower()}-{i}"
+            storage.save_procedure_metadata(
+                procedure_id,
+                ProcedureMetadata(procedure_id=procedure_id, state={"i": i}, status=status),
+            )
+
+
+def remaining(storage):
+    return sorted(summary.procedure_id for summary in storage.list_procedures().procedures)
+
+
+def test_policy_validation():
+    assert RetentionPolicy().max_ages() == {}
+    policy = RetentionPolicy.from_config({"completed_days": 7})
+    assert policy.max_ages() == {"COMPLETED": timedelta(days=7)}
+    with pytest.raises(ValueError, match="non-negative"):
+        RetentionPolicy(failed_days=-1)
+    with pytest.raises(ValueError, match="waiting_days"):
+        RetentionPolicy.from_config({"waiting_days": 1})
+
+
+def test_collect_expired_by_status_and_age(storage):
+    populate(storage)
+    policy = RetentionPolicy(completed_days=7, failed_days=30)
+
+    # Nothing is old enough yet
+    assert collect_expired(storage, policy).deleted == []
+
+    later = datetime.now(timezone.utc) + timedelta(days=10)
+    report = collect_expired(storage, policy, dry_run=True, now=later)
+    assert report.deleted == ["completed-0", "completed-1", "completed-2"]
+    assert report.reclaimed_bytes == 0
+    assert len(remaining(storage)) == 12
+
+    report = collect_expired(storage, policy, batch_size=2, now=later)
+    assert report.deleted == ["completed-0", "completed-1", "completed-2"]
+    if not isinstance(storage, MemoryStorage):
+        assert report.reclaimed_bytes > 0
+
+    # Waiting and running procedures never expire
+    much_later = later + timedelta(days=365)
+    assert len(collect_expired(storage, policy, now=much_later).deleted) == 3
+    assert remaining(storage) == [
+        f"{s}-{i}" for s in ("running", "waiting_for_human") for i in range(3)
+    ]
+
+
+def test_collect_expired_stops_between_batches():
+    storage = MemoryStorage()
+    populate(storage)
+    later = datetime.now(timezone.utc) + timedelta(days=1)
+    report = collect_expired(
+        storage,
+        RetentionPolicy(completed_days=0),
+        batch_size=2,
+        now=later,
+        between_batches=lambda: False,
+    )
+    assert report.deleted == ["completed-0", "completed-1"]
+
+
+def test_sweeper_sweeps_in_background():
+    storage = MemoryStorage()
+    populate(storage)
+    time.sleep(0.01)
+    sweeper = RetentionSweeper(
+        storage, RetentionPolicy(completed_days=0, failed_days=0), interval_seconds=60
+    )
+    sweeper.start()
+    deadline = time.monotonic() + 5
+    while sweeper.last_report is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    sweeper.stop(timeout=5)
+
+    assert len(sweeper.last_report.deleted) == 6
+    assert len(remaining(storage)) == 6
+
+
+@pytest.fixture(params=["file", "journal", "sharded", "sqlite"])
+def blob_storage(request, tmp_path):
+    if request.param == "sqlite":
+        storage = SQLiteStorage(db_path=str(tmp_path / "tactus.db"), blob_threshold=1024)
+        yield storage
+        storage.close()
+    else:
+        yield FileStorage(
+            storage_dir=str(tmp_path),
+            journal=request.param == "journal",
+            shard=request.param == "sharded",
+            blob_threshold=1024,
+        )
+
+
+def test_collect_unreferenced_blobs(blob_storage):
+    shared = {"transcript": ["shared"] * 500}
+    only_deleted = {"transcript": ["deleted"] * 500}
+    for procedure_id, results in (("kept", [shared]), ("deleted", [shared, only_deleted])):
+        context = BaseExecutionContext(procedure_id=procedure_id, storage_backend=blob_storage)
+        for result in results:
+            context.checkpoint(lambda result=result: result, "agent_turn")
+
+    # Blobs just written are protected from a concurrent save
+    assert collect_unreferenced_blobs(blob_storage).deleted == []
+    assert collect_unreferenced_blobs(blob_storage, min_age_seconds=0).deleted == []
+
+    blob_storage.delete_procedure("deleted")
+    preview = collect_unreferenced_blobs(blob_storage, min_age_seconds=0, dry_run=True)
+    assert len(preview.deleted) == 1
+    report = collect_unreferenced_blobs(blob_storage, min_age_seconds=0)
+    assert report.deleted == preview.deleted
+    assert report.reclaimed_bytes > 0
+
+    replay = BaseExecutionContext(procedure_id="kept", storage_backend=blob_storage)
+    assert replay.checkpoint(lambda: None, "agent_turn") == shared
+    assert collect_unreferenced_blobs(blob_storage, min_age_seconds=0).deleted == []
+
+
+def test_collect_unreferenced_blobs_without_a_blob_store():
+    assert collect_unreferenced_blobs(MemoryStorage(), min_age_seconds=0).deleted == []
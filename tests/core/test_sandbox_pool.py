@@ -0,0 +1,124 @@
+"""
+Tests for reusing Lua sandboxes across runs (LuaSandboxPool).
+"""
+
+import pytest
+
+from tactus.adapters.memory import MemoryStorage
+from tactus.core.lua_sandbox import LuaSandbox, LuaSandboxPool
+from tactus.core.runtime import TactusRuntime
+
+POLLUTING_SOURCE = """
+helper = procedure("helper", {input = {}, output = {}}, function() return {} end)
+
+main = procedure("main", {
+    input = {},
+    output = {}
+}, function()
+    leaked = "secret"
+    string.upper = function() return "hijacked" end
+    math.pi = 3
+    getmetatable("").__index = {}
+    setmetatable(_G, {__index = function() return "inherited" end, __metatable = "locked"})
+    setmetatable({}, {__gc = function() late = "finalizer" end})
+    error("the run fails after polluting its environment")
+end)
+"""
+
+INSPECTING_SOURCE = """
+main = procedure("main", {
+    input = {},
+    output = {
+        leaked = {type = "string"},
+        helper = {type = "string"},
+        late = {type = "string"},
+        upper = {type = "string"},
+        method = {type = "string"},
+        pi = {type = "number"},
+        metatable = {type = "boolean"}
+    }
+}, function()
+    return {
+        leaked = tostring(leaked),
+        helper = tostring(helper),
+        late = tostring(late),
+        upper = string.upper("a"),
+        method = ("b"):upper(),
+        pi = math.pi,
+        metatable = getmetatable(_G) == nil
+    }
+end)
+"""
+
+
+async def run(source, pool):
+    runtime = TactusRuntime(
+        procedure_id="pooled", storage_backend=MemoryStorage(), sandbox_pool=pool
+    )
+    return await runtime.execute(source=source, context={}, format="lua")
+
+
+@pytest.mark.asyncio
+async def test_nothing_leaks_between_runs_sharing_a_sandbox(monkeypatch):
+    pool = LuaSandboxPool(max_idle=1)
+    created = []
+    init = LuaSandbox.__init__
+    monkeypatch.setattr(
+        LuaSandbox, "__init__", lambda self, *a, **kw: created.append(self) or init(self, *a, **kw)
+    )
+
+    assert (await run(POLLUTING_SOURCE, pool))["success"] is False
+    result = await run(INSPECTING_SOURCE, pool)
+
+    assert len(created) == 1
+    assert result["success"] is True
+    assert result["result"] == {
+        "leaked": "nil",
+        "helper": "nil",
+        "late": "nil",
+        "upper": "A",
+        "method": "B",
+        "pi": pytest.approx(3.141592653589793),
+        "metatable": True,
+    }
+    assert len(pool) == 1
+
+
+def test_reset_restores_the_clean_environment():
+    sandbox = LuaSandbox(strict_determinism=True)
+    sandbox.execute('table.insert = nil; os = nil; _G.print = "not a function"; x = {}')
+    sandbox.set_execution_context(object())
+
+    assert sandbox.reset() is True
+    assert sandbox.execution_context is None
+    assert sandbox.strict_determinism is False
+    assert sandbox.eval("x") is None
+    assert sandbox.eval("type(table.insert)") == "function"
+    assert sandbox.eval("os.date ~= nil") is True
+    assert sandbox.eval("type(print)") == "function"
+    # Dangerous modules stay removed
+    assert sandbox.eval("io == nil and debug == nil and load == nil") is True
+
+
+def test_pool_reuses_retires_and_discards_sandboxes(monkeypatch):
+    pool = LuaSandboxPool(max_idle=2, max_uses=2)
+    pool.prewarm()
+    assert len(pool) == 2
+
+    first = pool.acquire(strict_determinism=True)
+    assert first.strict_determinism is True
+    pool.release(first)
+    assert pool.acquire() is first
+
+    # Retired after max_uses runs
+    pool.release(first)
+    assert first not in pool._idle
+
+    # Discarded when the reset cannot be verified
+    second = pool.acquire()
+    monkeypatch.setattr(second, "_verify_environment", lambda: False)
+    pool.release(second)
+    assert len(pool) == 0
+
+    with pytest.raises(ValueError, match="max_uses"):
+        LuaSandboxPool(max_uses=0)
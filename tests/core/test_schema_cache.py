@@ -0,0 +1,108 @@
+"""
+Tests for the cache of classes generated from schemas (SchemaModelCache).
+"""
+
+import pytest
+
+from tactus.adapters.lua_tools import LuaToolsAdapter
+from tactus.adapters.mcp import PydanticAIMCPAdapter
+from tactus.core.registry import AgentOutputSchema
+from tactus.core.schema_cache import SchemaModelCache, schema_key
+from tactus.primitives.deps_generator import generate_agent_deps_class
+
+
+def test_classes_are_shared_per_kind_name_and_canonical_schema():
+    cache = SchemaModelCache(max_entries=2)
+    builds = []
+
+    def build():
+        builds.append(1)
+        return type("Model", (), {})
+
+    schema = {"city": {"type": "string", "required": True}, "population": {"type": "number"}}
+    reordered = {"population": {"type": "number"}, "city": {"required": True, "type": "string"}}
+    first = cache.get_or_create("agent_output", "ExtractorOutput", schema, build)
+    assert cache.get_or_create("agent_output", "ExtractorOutput", reordered, build) is first
+    assert len(builds) == 1
+
+    # The class name and the kind are part of the key
+    assert cache.get_or_create("agent_output", "OtherOutput", schema, build) is not first
+    assert schema_key("mcp_args", "ExtractorOutput", schema) != schema_key(
+        "agent_output", "ExtractorOutput", schema
+    )
+
+    # Least recently used entries are evicted
+    assert len(cache) == 2
+    cache.get_or_create("mcp_args", "ExtractorOutput", schema, build)
+    assert len(cache) == 2
+    assert cache.get_or_create("agent_output", "ExtractorOutput", schema, build) is not first
+
+    # Schemas that cannot be hashed canonically are built every time
+    uncacheable = {"handler": lambda args: args}
+    assert schema_key("lua_tool_params", "tool", uncacheable) is None
+    assert cache.get_or_create("lua_tool_params", "tool", uncacheable, build) is not (
+        cache.get_or_create("lua_tool_params", "tool", uncacheable, build)
+    )
+
+    with pytest.raises(ValueError, match="max_entries"):
+        SchemaModelCache(max_entries=0)
+
+
+def test_declaration_models_hash_like_their_fields():
+    declared = AgentOutputSchema(fields={"city": {"name": "city", "type": "string"}})
+    assert schema_key("agent_output_type", "Out", declared) == schema_key(
+        "agent_output_type",
+        "Out",
+        AgentOutputSchema(fields={"city": {"name": "city", "type": "string"}}),
+    )
+    assert schema_key("agent_output_type", "Out", declared) != schema_key(
+        "agent_output_type",
+        "Out",
+        AgentOutputSchema(fields={"city": {"name": "city", "type": "string", "required": True}}),
+    )
+
+
+def test_type_adapter_is_built_once_per_class():
+    from pydantic import create_model
+
+    cache = SchemaModelCache()
+    schema = {"value": {"type": "integer"}}
+    build = lambda: create_model("Args", value=(int, ...))  # noqa: E731
+
+    adapter = cache.get_type_adapter("mcp_args", "Args", schema, build)
+    assert cache.get_type_adapter("mcp_args", "Args", schema, build) is adapter
+    assert adapter.validate_python({"value": "3"}).value == 3
+    assert (
+        adapter.core_schema
+        is cache.get_or_create("mcp_args", "Args", schema, build).__pydantic_core_schema__
+    )
+
+
+def test_adapters_and_deps_reuse_generated_classes():
+    cache = SchemaModelCache()
+    lua = LuaToolsAdapter(schema_cache=cache)
+    spec = {
+        "handler": lambda args: args,
+        "parameters": {"text": {"type": "string", "description": "Text", "required": True}},
+    }
+    lua._create_wrapped_function("uppercase", spec)
+    lua._create_wrapped_function("uppercase", dict(spec))
+    assert len(cache) == 1
+
+    mcp = PydanticAIMCPAdapter(mcp_client=None, schema_cache=cache)
+    tool = {
+        "name": "search",
+        "inputSchema": {
+            "type": "object",
+            "properties": {"query": {"type": "string"}},
+            "required": ["query"],
+        },
+    }
+    assert mcp._convert_mcp_tool_to_pydantic_ai(tool) is not None
+    assert mcp._convert_mcp_tool_to_pydantic_ai(dict(tool)) is not None
+    assert len(cache) == 2
+
+    assert generate_agent_deps_class({"api": object()}) is generate_agent_deps_class(
+        {"api": object()}
+    )
+    assert generate_agent_deps_class({"api": 1}) is not generate_agent_deps_class({"db": 1})
@@ -0,0 +1,165 @@
+"""
+Tests for resumable procedure snapshots (Checkpoint.snapshot / Checkpoint.resume).
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from tactus.adapters.memory import MemoryStorage
+from tactus.core.exceptions import ProcedureWaitingForHuman
+from tactus.core.execution_context import BaseExecutionContext
+from tactus.core.runtime import TactusRuntime
+from tactus.protocols.models import HITLResponse
+
+
+class SuspendingHITLHandler:
+    """HITL handler that always suspends the procedure."""
+
+    def request_interaction(self, procedure_id, request):
+        raise ProcedureWaitingForHuman(procedure_id, "msg-1")
+
+
+class ApprovingHITLHandler:
+    """HITL handler that approves every request."""
+
+    def __init__(self):
+        self.requests = 0
+
+    def request_interaction(self, procedure_id, request):
+        self.requests += 1
+        return HITLResponse(value=True, responded_at=datetime.now(timezone.utc))
+
+
+def test_snapshot_records_position_and_is_ignored_on_replay():
+    """Snapshots are taken at the current position and skipped while replaying."""
+    storage = MemoryStorage()
+    context = BaseExecutionContext(procedure_id="proc", storage_backend=storage)
+    for i in range(3):
+        context.checkpoint(lambda i=i: i, "explicit_checkpoint")
+    assert context.save_snapshot({"data": {"next": 3}}) is True
+
+    resumed = BaseExecutionContext(procedure_id="proc", storage_backend=storage)
+    assert resumed.next_position() == 0
+    assert resumed.save_snapshot({"data": {"next": 0}}) is False
+    assert resumed.latest_snapshot()["data"] == {"next": 3}
+
+
+def test_restore_snapshot_skips_replayed_prefix():
+    """Restoring jumps replay to the snapshot position."""
+    storage = MemoryStorage()
+    context = BaseExecutionContext(procedure_id="proc", storage_backend=storage)
+    for i in range(4):
+        context.checkpoint(lambda i=i: i, "explicit_checkpoint")
+        context.save_snapshot({"data": {"next": i + 1}})
+
+    resumed = BaseExecutionContext(procedure_id="proc", storage_backend=storage)
+    snapshot = resumed.restore_snapshot()
+    assert snapshot["position"] == 4
+    assert resumed.next_position() == 4
+    assert resumed.checkpoint(lambda: "new", "explicit_checkpoint") == "new"
+
+
+def test_clear_after_drops_snapshots_beyond_the_cut():
+    """Truncating the log invalidates snapshots taken after the cut."""
+    context = BaseExecutionContext(procedure_id="proc", storage_backend=MemoryStorage())
+    for i in range(3):
+        context.checkpoint(lambda i=i: i, "explicit_checkpoint")
+    context.save_snapshot({"data": None})
+
+    context.checkpoint_clear_after(1)
+    assert context.latest_snapshot() is None
+    assert context.restore_snapshot() is None
+
+
+RESUMABLE_SOURCE = """
+main = procedure("main", {
+    input = {},
+    output = {total = {type = "number"}, started_at = {type = "number"}}
+}, function()
+    local saved = Checkpoint.resume()
+    local start = 1
+    if saved then
+        start = saved.data.next_item
+    end
+    for i = start, 10 do
+        local value = Step.checkpoint(function() return i end)
+        State.increment("total", value)
+        Checkpoint.snapshot({next_item = i + 1})
+        if i == 5 then
+            Human.approve({message = "Continue?"})
+        end
+    end
+    return {total = State.get("total"), started_at = start}
+end)
+"""
+
+
+@pytest.mark.asyncio
+async def test_runtime_resumes_from_latest_snapshot():
+    """A resumed procedure restarts from its snapshot with State restored."""
+    storage = MemoryStorage()
+    first = TactusRuntime(
+        procedure_id="resumable", storage_backend=storage, hitl_handler=SuspendingHITLHandler()
+    )
+    result = await first.execute(source=RESUMABLE_SOURCE, context={}, format="lua")
+    assert result["status"] == "WAITING_FOR_HUMAN"
+    assert len(storage.load_procedure_metadata("resumable").execution_log) == 5
+
+    handler = ApprovingHITLHandler()
+    second = TactusRuntime(procedure_id="resumable", storage_backend=storage, hitl_handler=handler)
+    result = await second.execute(source=RESUMABLE_SOURCE, context={}, format="lua")
+
+    assert result["success"] is True
+    assert result["result"] == {"total": 55, "started_at": 6}
+    assert handler.requests == 0
+    assert len(storage.load_procedure_metadata("resumable").execution_log) == 10
+
+
+RERUN_SOURCE = """
+main = procedure("main", {
+    input = {run = {type = "number", required = true}},
+    output = {run = {type = "number"}, approved = {type = "boolean"}}
+}, function()
+    local run = Step.checkpoint(function() return input.run end)
+    local approved = Human.approve({message = "Continue?"})
+    return {run = run, approved = approved}
+end)
+"""
+
+
+@pytest.mark.asyncio
+async def test_rerunning_completed_procedure_executes_live():
+    """A COMPLETED procedure is run again instead of replaying cached results."""
+    storage = MemoryStorage()
+    handler = ApprovingHITLHandler()
+    for run in (1, 2):
+        runtime = TactusRuntime(procedure_id="rerun", storage_backend=storage, hitl_handler=handler)
+        result = await runtime.execute(source=RERUN_SOURCE, context={"run": run}, format="lua")
+        assert result["success"] is True
+        assert result["result"]["run"] == run
+        assert storage.load_procedure_metadata("rerun").status == "COMPLETED"
+
+    assert handler.requests == 2
+    # The second run rebuilt the log rather than replaying or appending to it
+    execution_log = storage.load_procedure_metadata("rerun").execution_log
+    assert len(execution_log) == 1
+    assert execution_log[0].result == 2
+
+
+def test_context_resumes_unfinished_procedure_but_not_finished_one():
+    """Only RUNNING and WAITING_FOR_HUMAN procedures replay their log."""
+    storage = MemoryStorage()
+    context = BaseExecutionContext(procedure_id="proc", storage_backend=storage)
+    context.checkpoint(lambda: "first", "explicit_checkpoint")
+    context.set_status("WAITING_FOR_HUMAN", "msg-1")
+    context.flush()
+
+    resumed = BaseExecutionContext(procedure_id="proc", storage_backend=storage)
+    assert resumed.checkpoint(lambda: "live", "explicit_checkpoint") == "first"
+    resumed.set_status("COMPLETED")
+    resumed.flush()
+
+    rerun = BaseExecutionContext(procedure_id="proc", storage_backend=storage)
+    assert len(rerun.metadata.execution_log) == 0
+    assert rerun.checkpoint(lambda: "live", "explicit_checkpoint") == "live"
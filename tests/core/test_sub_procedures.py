@@ -0,0 +1,234 @@
+"""
+Tests for deterministic sub-procedure IDs and orphaned child collection.
+"""
+
+import sqlite3
+from datetime import datetime, timezone
+
+import pytest
+
+from tactus.adapters.file_storage import FileStorage
+from tactus.adapters.memory import MemoryStorage
+from tactus.adapters.sqlite_storage import SQLiteStorage
+from tactus.core.exceptions import ProcedureWaitingForHuman
+from tactus.core.execution_context import child_procedure_id
+from tactus.core.garbage_collection import collect_orphaned_children
+from tactus.core.runtime import TactusRuntime
+from tactus.protocols.models import CheckpointEntry, HITLResponse, ProcedureMetadata
+
+
+class SuspendingHITLHandler:
+    """HITL handler that always suspends the procedure."""
+
+    def request_interaction(self, procedure_id, request):
+        raise ProcedureWaitingForHuman(procedure_id, "msg-1")
+
+
+class ApprovingHITLHandler:
+    """HITL handler that approves every request."""
+
+    def __init__(self):
+        self.requests = 0
+
+    def request_interaction(self, procedure_id, request):
+        self.requests += 1
+        return HITLResponse(value=True, responded_at=datetime.now(timezone.utc))
+
+
+CHILD_SOURCE = """
+main = procedure("main", {
+    input = {},
+    output = {value = {type = "number"}}
+}, function()
+    local value = Step.checkpoint(function() return 41 end)
+    Human.approve({message = "Continue?"})
+    return {value = value + 1}
+end)
+"""
+
+PARENT_SOURCE = """
+main = procedure("main", {
+    input = {},
+    output = {value = {type = "number"}}
+}, function()
+    local result = Procedure.run("{child}", {})
+    return {value = result.value}
+end)
+"""
+
+
+def test_child_procedure_id_is_deterministic():
+    assert child_procedure_id("run-1", 3, "examples/helper.tac") == "run-1.3.helper"
+    assert child_procedure_id("run-1", 3, "helper") == "run-1.3.helper"
+    assert child_procedure_id("run-1", "spawn0", "my tool!") == "run-1.spawn0.my_tool_"
+
+
+def test_child_named_like_a_sidecar_is_listed(tmp_path):
+    """A child named "header" is not taken for a FileStorage sidecar header."""
+    child_id = child_procedure_id("run-1", 0, "header.tac")
+    assert child_id == "run-1.0.header_"
+
+    storage = FileStorage(storage_dir=str(tmp_path))
+    storage.save_procedure_metadata(
+        child_id, ProcedureMetadata(procedure_id=child_id, parent_id="run-1", parent_position=0)
+    )
+    assert storage.rebuild_index() == 1
+    assert [summary.procedure_id for summary in storage.list_procedures().procedures] == [child_id]
+
+
+@pytest.mark.asyncio
+async def test_resumed_parent_resumes_child_then_replays_it(tmp_path):
+    """A child waiting for a human resumes under the same ID; a rerun of the parent reruns it."""
+    child_path = tmp_path / "child.tac"
+    child_path.write_text(CHILD_SOURCE)
+    source = PARENT_SOURCE.replace("{child}", str(child_path))
+    storage = FileStorage(storage_dir=str(tmp_path / "storage"))
+    child_id = child_procedure_id("parent", 0, str(child_path))
+
+    first = TactusRuntime(
+        procedure_id="parent", storage_backend=storage, hitl_handler=SuspendingHITLHandler()
+    )
+    result = await first.execute(source=source, context={}, format="lua")
+    assert result["status"] == "WAITING_FOR_HUMAN"
+
+    child = storage.load_procedure_metadata(child_id)
+    assert (child.parent_id, child.parent_position) == ("parent", 0)
+    assert child.status == "WAITING_FOR_HUMAN"
+    assert [entry.type for entry in child.execution_log] == ["explicit_checkpoint"]
+
+    handler = ApprovingHITLHandler()
+    second = TactusRuntime(procedure_id="parent", storage_backend=storage, hitl_handler=handler)
+    result = await second.execute(source=source, context={}, format="lua")
+    assert result["success"] is True
+    assert result["result"] == {"value": 42}
+    assert handler.requests == 1
+    assert storage.load_procedure_metadata(child_id).status == "COMPLETED"
+    assert len(storage.list_procedures().procedures) == 2
+
+    # Running the finished parent again runs the child again too
+    third = TactusRuntime(procedure_id="parent", storage_backend=storage, hitl_handler=handler)
+    result = await third.execute(source=source, context={}, format="lua")
+    assert result["result"] == {"value": 42}
+    assert handler.requests == 2
+
+
+SPAWNING_PARENT_SOURCE = """
+main = procedure("main", {
+    input = {},
+    output = {value = {type = "number"}}
+}, function()
+    local handle = Procedure.spawn("{child}", {})
+    local result = Procedure.wait(handle)
+    return {value = result.value}
+end)
+"""
+
+
+@pytest.mark.asyncio
+async def test_waiting_for_a_spawned_child_suspends_the_parent(tmp_path):
+    """Procedure.wait() on a child waiting for a human suspends the parent."""
+    child_path = tmp_path / "child.tac"
+    child_path.write_text(CHILD_SOURCE)
+    source = SPAWNING_PARENT_SOURCE.replace("{child}", str(child_path))
+    storage = FileStorage(storage_dir=str(tmp_path / "storage"))
+    child_id = child_procedure_id("parent", "spawn0", str(child_path))
+
+    first = TactusRuntime(
+        procedure_id="parent", storage_backend=storage, hitl_handler=SuspendingHITLHandler()
+    )
+    result = await first.execute(source=source, context={}, format="lua")
+    assert result["status"] == "WAITING_FOR_HUMAN"
+    assert storage.load_procedure_metadata("parent").status == "WAITING_FOR_HUMAN"
+    assert storage.load_procedure_metadata(child_id).status == "WAITING_FOR_HUMAN"
+
+    handler = ApprovingHITLHandler()
+    second = TactusRuntime(procedure_id="parent", storage_backend=storage, hitl_handler=handler)
+    result = await second.execute(source=source, context={}, format="lua")
+    assert result["success"] is True
+    assert result["result"] == {"value": 42}
+    assert handler.requests == 1
+
+
+def save(storage, procedure_id, status="RUNNING", log=(), parent_id=None, parent_position=None):
+    storage.save_procedure_metadata(
+        procedure_id,
+        ProcedureMetadata(
+            procedure_id=procedure_id,
+            status=status,
+            execution_log=[
+                CheckpointEntry(
+                    position=position,
+                    type=checkpoint_type,
+                    result=None,
+                    timestamp=datetime.now(timezone.utc),
+                )
+                for position, checkpoint_type in enumerate(log)
+            ],
+            parent_id=parent_id,
+            parent_position=parent_position,
+        ),
+    )
+
+
+@pytest.fixture(params=["memory", "file", "sqlite"])
+def storage(request, tmp_path):
+    if request.param == "memory":
+        yield MemoryStorage()
+    elif request.param == "sqlite":
+        storage = SQLiteStorage(db_path=str(tmp_path / "tactus.db"))
+        yield storage
+        storage.close()
+    else:
+        yield FileStorage(storage_dir=str(tmp_path))
+
+
+def test_collect_orphaned_children(storage):
+    # Waiting parent: the child at the end of its log will be resumed
+    save(storage, "waiting", "WAITING_FOR_HUMAN", ["explicit_checkpoint"])
+    save(storage, "waiting.1.child", parent_id="waiting", parent_position=1)
+    save(storage, "waiting.spawn0.child", parent_id="waiting")
+    # Rewound parent: the call's position now holds another checkpoint
+    save(storage, "rewound", "FAILED", ["explicit_checkpoint"])
+    save(storage, "rewound.0.child", parent_id="rewound", parent_position=0)
+    # Completed parent: never replayed again
+    save(storage, "done", "COMPLETED", ["procedure_call"])
+    save(storage, "done.0.child", "COMPLETED", ["procedure_call"], "done", 0)
+    save(storage, "done.0.child.0.grandchild", "COMPLETED", [], "done.0.child", 0)
+    # Deleted parent
+    save(storage, "gone.0.child", "WAITING_FOR_HUMAN", parent_id="gone", parent_position=0)
+
+    expected = ["done.0.child", "done.0.child.0.grandchild", "gone.0.child", "rewound.0.child"]
+    assert collect_orphaned_children(storage, dry_run=True) == expected
+    assert len(storage.list_procedures().procedures) == 9
+
+    assert collect_orphaned_children(storage) == expected
+    remaining = [summary.procedure_id for summary in storage.list_procedures().procedures]
+    assert remaining == [
+        "done",
+        "rewound",
+        "waiting",
+        "waiting.1.child",
+        "waiting.spawn0.child",
+    ]
+    assert storage.load_procedure_metadata("done.0.child").execution_log == []
+    assert collect_orphaned_children(storage) == []
+
+
+def test_sqlite_storage_adds_parent_columns_to_old_databases(tmp_path):
+    db_path = tmp_path / "old.db"
+    conn = sqlite3.connect(str(db_path))
+    conn.execute(
+        "CREATE TABLE procedures (procedure_id TEXT PRIMARY KEY, "
+        "status TEXT NOT NULL DEFAULT 'RUNNING', waiting_on_message_id TEXT, "
+        "replay_index INTEGER NOT NULL DEFAULT 0, state TEXT NOT NULL DEFAULT '{}', "
+        "lua_state TEXT NOT NULL DEFAULT '{}', updated_at REAL NOT NULL)"
+    )
+    conn.execute("INSERT INTO procedures (procedure_id, updated_at) VALUES ('old', 0)")
+    conn.commit()
+    conn.close()
+
+    storage = SQLiteStorage(db_path=str(db_path))
+    assert storage.load_procedure_metadata("old").parent_id is None
+    save(storage, "old.0.child", parent_id="old", parent_position=0)
+    assert storage.load_procedure_metadata("old.0.child").parent_position == 0
+    storage.close()
@@ -0,0 +1,103 @@
+"""
+Minimal stdio MCP server for tests that start many servers.
+
+Speaks just enough JSON-RPC (initialize, tools/list, tools/call, ping) to
+serve a few tools without importing an MCP library, so it starts in a few
+milliseconds. Requests are handled one at a time, like many stdio servers.
+
+- echo: returns its text, prefixed with the server name
+- pid: returns the server's process ID
+- sleep: waits the given seconds
+
+Options come from the environment:
+
+- STUB_MCP_STARTUP_DELAY: seconds to wait before answering (a slow server start)
+- STUB_MCP_NAME: server name, included in echo results
+"""
+
+import json
+import os
+import sys
+import time
+
+TOOLS = [
+    {
+        "name": "echo",
+        "description": "Return the given text, prefixed with the server name.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {"text": {"type": "string"}},
+            "required": ["text"],
+        },
+    },
+    {
+        "name": "pid",
+        "description": "Return the server's process ID.",
+        "inputSchema": {"type": "object", "properties": {}},
+    },
+    {
+        "name": "sleep",
+        "description": "Wait the given number of seconds.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {"seconds": {"type": "number"}},
+            "required": ["seconds"],
+        },
+    },
+]
+
+
+def text_result(text: str) -> dict:
+    return {"content": [{"type": "text", "text": text}], "isError": False}
+
+
+def handle(request: dict, name: str):
+    """Return the result of a request, or raise LookupError for unknown methods."""
+    method = request.get("method")
+    params = request.get("params") or {}
+    if method == "initialize":
+        return {
+            "protocolVersion": params.get("protocolVersion", "2025-06-18"),
+            "capabilities": {"tools": {"listChanged": False}},
+            "serverInfo": {"name": name, "version": "1.0.0"},
+        }
+    if method == "ping":
+        return {}
+    if method == "tools/list":
+        return {"tools": TOOLS}
+    if method == "tools/call":
+        tool = params.get("name")
+        arguments = params.get("arguments") or {}
+        if tool == "echo":
+            return text_result(f"{name}: {arguments.get('text', '')}")
+        if tool == "pid":
+            return text_result(str(os.getpid()))
+        if tool == "sleep":
+            time.sleep(float(arguments.get("seconds", 0)))
+            return text_result("done")
+    raise LookupError(method)
+
+
+def main() -> None:
+    time.sleep(float(os.environ.get("STUB_MCP_STARTUP_DELAY", "0")))
+    name = os.environ.get("STUB_MCP_NAME", "stub")
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        if "id" not in request:
+            continue  # Notification
+        try:
+            response = {"jsonrpc": "2.0", "id": request["id"], "result": handle(request, name)}
+        except LookupError:
+            response = {
+                "jsonrpc": "2.0",
+                "id": request["id"],
+                "error": {"code": -32601, "message": f"Method not found: {request.get('method')}"},
+            }
+        sys.stdout.write(json.dumps(response) + "\n")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
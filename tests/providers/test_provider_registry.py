@@ -0,0 +1,70 @@
+"""
+Tests for sharing LLM provider clients across agents and runs (ProviderRegistry).
+"""
+
+import asyncio
+
+import pytest
+
+from tactus.providers.registry import ProviderRegistry, credentials_fingerprint
+
+
+@pytest.fixture(autouse=True)
+def credentials(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-first")
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "AKIAFIRST")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "secret")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-west-2")
+
+
+@pytest.mark.asyncio
+async def test_models_on_one_loop_share_a_provider_per_credentials(monkeypatch):
+    registry = ProviderRegistry(max_connections=7)
+
+    first = registry.get_model("openai:gpt-4o")
+    second = registry.get_model("gpt-4o-mini", provider="openai")
+    assert first.model_name == "gpt-4o"
+    assert second.model_name == "gpt-4o-mini"
+    assert first._provider is second._provider
+    limits = first._provider.client._client._transport._pool
+    assert limits._max_connections == 7
+
+    # Changed credentials get their own client
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-second")
+    assert registry.get_model("openai:gpt-4o")._provider is not first._provider
+    assert len(registry) == 2
+
+    # The fingerprint does not contain the credentials
+    assert "sk-second" not in credentials_fingerprint("openai")
+
+    await registry.aclose()
+    assert len(registry) == 0
+    assert first._provider.client._client.is_closed
+
+
+def test_http_providers_are_per_loop_and_bedrock_is_shared():
+    registry = ProviderRegistry()
+
+    async def build():
+        return registry.get_model("openai:gpt-4o"), registry.get_model(
+            "bedrock:anthropic.claude-3-haiku"
+        )
+
+    first_openai, first_bedrock = asyncio.run(build())
+    second_openai, second_bedrock = asyncio.run(build())
+
+    # A closed loop's connections cannot be reused
+    assert first_openai._provider is not second_openai._provider
+    assert first_bedrock._provider is second_bedrock._provider
+    assert first_bedrock._provider.client.meta.region_name == "us-west-2"
+    assert len(registry) == 1  # Bedrock: the loops, and their clients, are gone
+
+    # Outside a loop, the model is left to pydantic-ai
+    assert registry.get_model("gpt-4o", provider="openai") == "openai:gpt-4o"
+    assert registry.get_model("groq:llama-3") == "groq:llama-3"
+
+    registry.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        registry.get_provider("bedrock", "us-west-2")
+    with pytest.raises(ValueError, match="Unknown provider"):
+        ProviderRegistry().get_provider("groq")